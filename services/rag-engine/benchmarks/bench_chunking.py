@@ -0,0 +1,71 @@
+"""
+문자 기준 vs 토큰 기준 청킹 비교
+
+law_documents.json의 조문을 두 방식으로 청킹하고
+임베딩 모델 토크나이저 기준으로
+- 청크 수
+- 임베딩에 투입되는 토큰 수 (모델 최대 길이로 잘린 뒤)
+- 잘려서 버려지는 토큰 수 (검색 불가능한 꼬리 텍스트)
+를 비교합니다.
+
+사용법:
+    python benchmarks/bench_chunking.py
+"""
+
+import json
+import os
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from src.embeddings import KoreanEmbedder, LawChunker
+
+
+def summarize(label: str, chunks, embedder: KoreanEmbedder) -> None:
+    """청크 목록의 토큰 통계 출력"""
+    counts = embedder.count_tokens([chunk.content for chunk in chunks])
+    limit = embedder.max_tokens
+
+    embedded = sum(min(count, limit) for count in counts)
+    truncated = sum(max(0, count - limit) for count in counts)
+    over_limit = sum(1 for count in counts if count > limit)
+
+    print(
+        f"{label:<12} {len(chunks):>8} {embedded:>12} {truncated:>12} {over_limit:>12}"
+    )
+
+
+def main():
+    json_path = os.path.join(os.path.dirname(__file__), "..", "law_documents.json")
+    with open(json_path, "r", encoding="utf-8") as f:
+        documents = json.load(f)
+
+    embedder = KoreanEmbedder()
+    print(f"모델 최대 토큰 수 (특수 토큰 제외): {embedder.max_tokens}")
+    print(f"조문 수: {len(documents)}")
+
+    chunkers = {
+        "char(512)": LawChunker(),
+        "token": LawChunker.from_embedder(embedder),
+    }
+
+    print("=" * 62)
+    print(f"{'mode':<12} {'chunks':>8} {'embedded':>12} {'truncated':>12} {'over_limit':>12}")
+    print("-" * 62)
+
+    for label, chunker in chunkers.items():
+        chunks = []
+        for doc in documents:
+            metadata = doc.get("metadata", {})
+            chunks.extend(chunker.chunk_article(
+                law_id=metadata.get("law_id", ""),
+                law_name=metadata.get("law_name", ""),
+                article_number=metadata.get("article_number", ""),
+                title=metadata.get("title", ""),
+                content=doc["content"],
+            ))
+        summarize(label, chunks, embedder)
+
+
+if __name__ == "__main__":
+    main()
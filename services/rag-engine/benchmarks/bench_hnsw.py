@@ -0,0 +1,177 @@
+"""
+HNSW ef_search 스윕 벤치마크 (지연시간 vs 정확 재현율)
+
+합성 코퍼스를 결정적 스텁 임베더(HashingEmbedder)로 임베딩해 임시 ChromaDB에 저장한 뒤
+ef_search 값마다 VectorStore.migrate()로 인덱스를 재구축하고
+- 쿼리 지연시간 p50/p95/p99 (쿼리 임베딩 제외, collection.query만)
+- NumPy 전수 비교(정확 top-k) 대비 recall@k
+- 재구축(마이그레이션) 시간
+을 측정합니다. ChromaDB 0.4.x는 ef_search를 컬렉션 생성 시 고정하므로 값마다 재구축이 필요합니다.
+
+사용법:
+    python benchmarks/bench_hnsw.py
+    python benchmarks/bench_hnsw.py --size 20000 --ef 10 32 64 128 256 --M 16 --space cosine
+    python benchmarks/bench_hnsw.py --json hnsw_sweep.json
+"""
+
+import argparse
+import json
+import os
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+import numpy as np
+
+from synthetic import HashingEmbedder, SyntheticCorpus
+from src.embeddings import HNSWConfig, VectorStore
+
+
+def exact_top_k(matrix: np.ndarray, queries: np.ndarray, top_k: int, space: str) -> np.ndarray:
+    """정확 top-k 인덱스 (컬렉션과 같은 거리 공간 기준)"""
+    if space == "l2":
+        scores = -(
+            (queries ** 2).sum(axis=1, keepdims=True)
+            - 2 * queries @ matrix.T
+            + (matrix ** 2).sum(axis=1)
+        )
+    elif space == "cosine":
+        norms = np.linalg.norm(matrix, axis=1)
+        norms[norms == 0] = 1.0
+        scores = queries @ (matrix / norms[:, None]).T
+    else:
+        scores = queries @ matrix.T
+
+    top = np.argpartition(-scores, top_k - 1, axis=1)[:, :top_k]
+    return top
+
+
+def run_sweep(args, workdir: str) -> dict:
+    corpus = SyntheticCorpus(args.size, seed=args.seed)
+    embedder = HashingEmbedder(dimension=args.dimension)
+    chunks = corpus.chunks()
+    ids = [chunk.chunk_id for chunk in chunks]
+
+    start = time.perf_counter()
+    matrix = embedder.embed_documents([chunk.content for chunk in chunks])
+    embed_s = time.perf_counter() - start
+
+    queries = corpus.queries(args.queries)
+    query_matrix = embedder.embed_documents(queries)
+    exact = exact_top_k(matrix, query_matrix, args.top_k, args.space)
+    exact_ids = [{ids[i] for i in row} for row in exact]
+
+    base = HNSWConfig(space=args.space, M=args.M, ef_construction=args.ef_construction, ef_search=args.ef[0])
+    store = VectorStore(
+        collection_name="bench_hnsw",
+        persist_directory=os.path.join(workdir, "chroma"),
+        embedder=embedder,
+        hnsw=base,
+    )
+
+    start = time.perf_counter()
+    batch_size = min(5000, store.client.max_batch_size)
+    for offset in range(0, len(chunks), batch_size):
+        batch = slice(offset, offset + batch_size)
+        store.collection.add(
+            ids=ids[batch],
+            embeddings=matrix[batch].tolist(),
+            documents=[chunk.content for chunk in chunks[batch]],
+        )
+    build_s = time.perf_counter() - start
+
+    rows = []
+    for ef in args.ef:
+        config = HNSWConfig(space=args.space, M=args.M, ef_construction=args.ef_construction, ef_search=ef)
+        rebuild_s = 0.0
+        if store.hnsw != config:
+            start = time.perf_counter()
+            store.migrate(config, batch_size=batch_size)
+            rebuild_s = time.perf_counter() - start
+
+        query_lists = [vector.tolist() for vector in query_matrix]
+        for vector in query_lists[:3]:
+            store.collection.query(query_embeddings=[vector], n_results=args.top_k, include=[])
+
+        latencies_ms = []
+        recalls = []
+        for vector, expected in zip(query_lists, exact_ids):
+            start = time.perf_counter()
+            result = store.collection.query(query_embeddings=[vector], n_results=args.top_k, include=[])
+            latencies_ms.append((time.perf_counter() - start) * 1000)
+            recalls.append(len(expected.intersection(result["ids"][0])) / args.top_k)
+
+        latencies = np.asarray(latencies_ms)
+        rows.append({
+            "ef_search": ef,
+            "recall_at_k": float(np.mean(recalls)),
+            "min_recall": float(np.min(recalls)),
+            "p50_ms": float(np.percentile(latencies, 50)),
+            "p95_ms": float(np.percentile(latencies, 95)),
+            "p99_ms": float(np.percentile(latencies, 99)),
+            "rebuild_seconds": rebuild_s,
+        })
+
+    return {
+        "size": args.size,
+        "dimension": args.dimension,
+        "space": args.space,
+        "M": args.M,
+        "ef_construction": args.ef_construction,
+        "top_k": args.top_k,
+        "queries": len(queries),
+        "embed_seconds": embed_s,
+        "build_seconds": build_s,
+        "sweep": rows,
+    }
+
+
+def print_result(result: dict) -> None:
+    print(f"\n{'=' * 78}")
+    print(
+        f"코퍼스 {result['size']:,}개 (dim {result['dimension']}) | space={result['space']} "
+        f"M={result['M']} ef_construction={result['ef_construction']} | "
+        f"recall@{result['top_k']}, {result['queries']} queries"
+    )
+    print(f"구축: 임베딩 {result['embed_seconds']:.2f}s, 최초 인덱스 {result['build_seconds']:.2f}s")
+    print("-" * 78)
+    print(
+        f"{'ef_search':>9} {'recall':>8} {'min':>6} {'p50(ms)':>9} {'p95(ms)':>9} "
+        f"{'p99(ms)':>9} {'rebuild(s)':>11}"
+    )
+    for row in result["sweep"]:
+        print(
+            f"{row['ef_search']:>9} {row['recall_at_k']:>8.4f} {row['min_recall']:>6.2f} "
+            f"{row['p50_ms']:>9.3f} {row['p95_ms']:>9.3f} {row['p99_ms']:>9.3f} "
+            f"{row['rebuild_seconds']:>11.2f}"
+        )
+
+
+def main():
+    parser = argparse.ArgumentParser(description="HNSW ef_search 스윕 벤치마크")
+    parser.add_argument("--size", type=int, default=10000)
+    parser.add_argument("--dimension", type=int, default=256)
+    parser.add_argument("--queries", type=int, default=200)
+    parser.add_argument("--top-k", type=int, default=10)
+    parser.add_argument("--ef", type=int, nargs="+", default=[10, 16, 32, 64, 128, 256])
+    parser.add_argument("--M", type=int, default=16)
+    parser.add_argument("--ef-construction", type=int, default=200)
+    parser.add_argument("--space", choices=["cosine", "ip", "l2"], default="cosine")
+    parser.add_argument("--seed", type=int, default=7)
+    parser.add_argument("--json", help="결과 JSON 저장 경로")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as workdir:
+        result = run_sweep(args, workdir)
+    print_result(result)
+
+    if args.json:
+        with open(args.json, "w", encoding="utf-8") as f:
+            json.dump(result, f, ensure_ascii=False, indent=2)
+        print(f"\n결과 저장: {args.json}")
+
+
+if __name__ == "__main__":
+    main()
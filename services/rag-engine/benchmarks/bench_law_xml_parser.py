@@ -0,0 +1,134 @@
+"""
+법령 XML 파서 벤치마크
+
+합성 법령 XML(기본 1,000개 조문, 조문당 항 3개 × 호 3개 × 목 2개)에 대해
+- 기존 방식: ET.fromstring + 재귀 탐색(.//tag)
+- 스트리밍 방식: LawXMLStreamParser (iterparse, 처리 요소 즉시 해제)
+의 처리 시간과 tracemalloc 최대 메모리를 비교합니다.
+
+사용법:
+    python benchmarks/bench_law_xml_parser.py
+    python benchmarks/bench_law_xml_parser.py --articles 10000
+"""
+
+import argparse
+import os
+import sys
+import tempfile
+import time
+import tracemalloc
+import xml.etree.ElementTree as ET
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from src.collectors.law_xml_parser import LawXMLStreamParser
+
+
+def build_synthetic_law_xml(num_articles: int) -> str:
+    """조문단위 구조의 합성 법령 XML 생성"""
+    parts = [
+        '<?xml version="1.0" encoding="UTF-8"?><법령><기본정보>',
+        "<법령일련번호>999999</법령일련번호>",
+        "<법령명_한글>합성 수소 안전관리법</법령명_한글>",
+        "<공포일자>20250101</공포일자><시행일자>20250701</시행일자>",
+        "</기본정보><조문>",
+    ]
+
+    for n in range(1, num_articles + 1):
+        parts.append(
+            f"<조문단위><조문번호>{n}</조문번호><조문여부>조문</조문여부>"
+            f"<조문제목>수소충전소 안전기준 {n}</조문제목>"
+            f"<조문내용>제{n}조(수소충전소 안전기준 {n}) 수소충전소를 설치하려는 자는 다음 각 항을 따른다.</조문내용>"
+        )
+        for p, mark in enumerate("①②③", 1):
+            parts.append(
+                f"<항><항번호>{mark}</항번호>"
+                f"<항내용>{mark} 시·도지사의 허가를 받아야 하며 산업통상자원부령으로 정하는 기준에 적합하여야 한다.</항내용>"
+            )
+            for i in range(1, 4):
+                parts.append(f"<호><호번호>{i}.</호번호><호내용>{i}. 고압가스 저장설비 기준 {n}-{p}-{i}</호내용>")
+                for mok in "가나":
+                    parts.append(f"<목><목번호>{mok}.</목번호><목내용>{mok}. 세부 기준</목내용></목>")
+                parts.append("</호>")
+            parts.append("</항>")
+        parts.append("</조문단위>")
+
+    parts.append("</조문></법령>")
+    return "".join(parts)
+
+
+def legacy_parse(xml_text: str) -> dict:
+    """기존 _parse_law_detail 방식 (전체 트리 로드 + 재귀 탐색)"""
+
+    def get_text(element, tag):
+        elem = element.find(f".//{tag}")
+        return elem.text.strip() if elem is not None and elem.text else None
+
+    root = ET.fromstring(xml_text)
+    law_info = {
+        "law_id": get_text(root, "법령일련번호"),
+        "law_name": get_text(root, "법령명한글"),
+        "articles": [],
+    }
+
+    for article in root.findall(".//조문단위"):
+        article_info = {
+            "article_number": get_text(article, "조문번호"),
+            "title": get_text(article, "조문제목"),
+            "content": get_text(article, "조문내용"),
+            "paragraphs": [
+                {
+                    "paragraph_number": get_text(paragraph, "항번호"),
+                    "content": get_text(paragraph, "항내용"),
+                }
+                for paragraph in article.findall(".//항")
+            ],
+        }
+        law_info["articles"].append(article_info)
+
+    return law_info
+
+
+def measure(label: str, func) -> None:
+    """실행 시간 및 최대 메모리 측정"""
+    tracemalloc.start()
+    start = time.perf_counter()
+    count = func()
+    elapsed = time.perf_counter() - start
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    print(f"{label:<32} {elapsed * 1000:>10.1f}ms {peak / 1024 / 1024:>10.2f}MB {count:>8}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="법령 XML 파서 벤치마크")
+    parser.add_argument("--articles", type=int, default=1000, help="합성 조문 수")
+    args = parser.parse_args()
+
+    xml_text = build_synthetic_law_xml(args.articles)
+    print(f"합성 XML: {args.articles}개 조문, {len(xml_text.encode('utf-8')) / 1024 / 1024:.2f}MB")
+    print("=" * 66)
+    print(f"{'parser':<32} {'time':>12} {'peak mem':>12} {'articles':>8}")
+    print("-" * 66)
+
+    with tempfile.NamedTemporaryFile("w", suffix=".xml", encoding="utf-8", delete=False) as tmp:
+        tmp.write(xml_text)
+        xml_path = tmp.name
+
+    try:
+        measure("legacy (fromstring + .//tag)", lambda: len(legacy_parse(xml_text)["articles"]))
+        measure("stream (iterparse, in-memory)", lambda: len(LawXMLStreamParser().parse(xml_text)["articles"]))
+
+        def stream_from_file():
+            # 레코드를 모으지 않고 순회만 → 파일 크기와 무관한 메모리 사용량
+            with open(xml_path, "rb") as f:
+                return sum(1 for _ in LawXMLStreamParser().iter_articles(f))
+
+        measure("stream (iterparse, file, lazy)", stream_from_file)
+    finally:
+        os.unlink(xml_path)
+
+
+if __name__ == "__main__":
+    main()
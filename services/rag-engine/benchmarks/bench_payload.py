@@ -0,0 +1,152 @@
+"""
+/search 응답 페이로드 벤치마크
+
+필드 구성별로
+- 응답 JSON 크기 (평균 KB, gzip 평균 KB)
+- 응답 포맷팅 시간 (retriever 'format' 단계, 하이라이트/스니펫 생성 포함)
+- 직렬화 시간 (SearchResponse 생성 → response_model 검증/직렬화 → JSONResponse 렌더링,
+  /search 엔드포인트와 같은 FastAPI 경로)
+을 측정합니다.
+
+before는 fields를 생략한 기존 응답 형태(content + highlighted_content 전체)입니다.
+코퍼스는 law_documents.json 본문을 이어 붙여 --chunk-chars 길이의 청크로 만듭니다.
+
+사용법:
+    python benchmarks/bench_payload.py
+    python benchmarks/bench_payload.py --size 500 --chunk-chars 2000 --top-k 100 --queries 30
+"""
+
+import argparse
+import asyncio
+import gzip
+import json
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+import numpy as np
+from fastapi.responses import JSONResponse
+from fastapi.routing import serialize_response
+
+from main import Article, SearchResponse, app
+from src.retrieval import HybridRetriever
+from src.retrieval.hybrid_retriever import ARTICLE_FIELDS
+
+BASE_DIR = os.path.join(os.path.dirname(__file__), "..")
+
+FIELD_SETS = {
+    "before (default fields)": None,
+    "all + snippets": list(ARTICLE_FIELDS),
+    "content only": [
+        "id", "law_name", "article_number", "title", "content", "relevance_score",
+    ],
+    "snippets only": [
+        "id", "law_name", "article_number", "title", "snippets", "relevance_score",
+    ],
+}
+
+QUERIES = [
+    "저장탱크", "가연성가스 저장설비", "고압가스 제조 허가", "충전용기 안전점검",
+    "독성가스 기준", "용기 검사", "과태료 부과기준", "시설 기술기준 특례",
+]
+
+
+def build_corpus(size: int, chunk_chars: int):
+    """law_documents.json 본문을 이어 붙여 chunk_chars 길이 청크 생성"""
+    with open(os.path.join(BASE_DIR, "law_documents.json"), "r", encoding="utf-8") as f:
+        source = json.load(f)
+
+    documents = []
+    cursor = 0
+    for i in range(size):
+        parts = []
+        while sum(len(p) for p in parts) < chunk_chars:
+            parts.append(source[cursor % len(source)]["content"])
+            cursor += 1
+        metadata = dict(source[i % len(source)]["metadata"])
+        documents.append({
+            "id": f"doc_{i}",
+            "content": "\n".join(parts)[:chunk_chars],
+            "metadata": metadata,
+        })
+    return documents
+
+
+_SEARCH_ROUTE = next(route for route in app.routes if getattr(route, "path", None) == "/search")
+_LOOP = asyncio.new_event_loop()
+
+
+def serialize(results) -> bytes:
+    """/search 엔드포인트와 같은 경로로 응답 직렬화"""
+    response = SearchResponse(
+        query=results["query"],
+        total_found=results["total_found"],
+        keywords=results.get("keywords", []),
+        relevant_laws=results.get("relevant_laws", []),
+        articles=[Article(**article) for article in results["articles"]],
+        metadata=results["metadata"],
+        next_cursor=results["metadata"].get("next_cursor"),
+    )
+    content = _LOOP.run_until_complete(serialize_response(
+        field=_SEARCH_ROUTE.response_field,
+        response_content=response,
+        exclude_unset=_SEARCH_ROUTE.response_model_exclude_unset,
+    ))
+    return JSONResponse(content).body
+
+
+def measure(retriever: HybridRetriever, queries, top_k: int, fields) -> dict:
+    sizes, gzipped, format_ms, serialize_ms = [], [], [], []
+    for query in queries:
+        results = retriever.search(query, top_k=top_k, fields=fields)
+        format_ms.append(results["metadata"]["stage_times_ms"]["format"])
+
+        start = time.perf_counter()
+        body = serialize(results)
+        serialize_ms.append((time.perf_counter() - start) * 1000)
+
+        sizes.append(len(body))
+        gzipped.append(len(gzip.compress(body)))
+
+    return {
+        "kb": np.mean(sizes) / 1024,
+        "gzip_kb": np.mean(gzipped) / 1024,
+        "format_p50": float(np.percentile(format_ms, 50)),
+        "serialize_p50": float(np.percentile(serialize_ms, 50)),
+        "serialize_p95": float(np.percentile(serialize_ms, 95)),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="/search 응답 페이로드 벤치마크")
+    parser.add_argument("--size", type=int, default=300)
+    parser.add_argument("--chunk-chars", type=int, default=1500)
+    parser.add_argument("--top-k", type=int, default=100)
+    parser.add_argument("--queries", type=int, default=24)
+    args = parser.parse_args()
+
+    retriever = HybridRetriever(vector_store=None, vector_weight=0.0, bm25_weight=1.0)
+    retriever.build_bm25_index(build_corpus(args.size, args.chunk_chars))
+    queries = [QUERIES[i % len(QUERIES)] for i in range(args.queries)]
+
+    # 워밍업
+    for fields in FIELD_SETS.values():
+        measure(retriever, queries[:2], args.top_k, fields)
+
+    print(f"\n{args.size}개 청크 × {args.chunk_chars}자, top_k={args.top_k}, {len(queries)} queries")
+    print(
+        f"{'fields':<30} {'KB':>8} {'gzip KB':>8} {'format p50':>11} "
+        f"{'serialize p50':>14} {'serialize p95':>14}"
+    )
+    for name, fields in FIELD_SETS.items():
+        row = measure(retriever, queries, args.top_k, fields)
+        print(
+            f"{name:<30} {row['kb']:>8.1f} {row['gzip_kb']:>8.1f} {row['format_p50']:>9.2f}ms "
+            f"{row['serialize_p50']:>12.2f}ms {row['serialize_p95']:>12.2f}ms"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,84 @@
+"""
+검색 파이프라인 쿼리당 메모리 벤치마크
+
+후보 깊이(top_k × candidate_multiplier)별로
+- 쿼리당 최대 추가 할당량 (tracemalloc peak - 시작 시점, KB)
+- 쿼리 지연시간 p50/p95 (tracemalloc 미사용 상태)
+를 측정합니다. 벡터 백엔드는 NumPy 전수 비교(ExactVectorStore)입니다.
+
+사용법:
+    python benchmarks/bench_pipeline_memory.py
+    python benchmarks/bench_pipeline_memory.py --size 10000 --top-k 10 50 --queries 50
+"""
+
+import argparse
+import os
+import sys
+import time
+import tracemalloc
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+import numpy as np
+
+from synthetic import ExactVectorStore, HashingEmbedder, SyntheticCorpus
+from src.retrieval import HybridRetriever
+
+
+def measure(retriever: HybridRetriever, queries, top_k: int) -> dict:
+    for query in queries[:3]:
+        retriever.search(query, top_k=top_k)
+
+    latencies = []
+    for query in queries:
+        start = time.perf_counter()
+        retriever.search(query, top_k=top_k)
+        latencies.append((time.perf_counter() - start) * 1000)
+
+    peaks = []
+    tracemalloc.start()
+    try:
+        for query in queries:
+            tracemalloc.reset_peak()
+            baseline = tracemalloc.get_traced_memory()[0]
+            retriever.search(query, top_k=top_k)
+            peaks.append((tracemalloc.get_traced_memory()[1] - baseline) / 1024)
+    finally:
+        tracemalloc.stop()
+
+    return {
+        "top_k": top_k,
+        "candidates": top_k * retriever.candidate_multiplier,
+        "peak_kb_mean": float(np.mean(peaks)),
+        "peak_kb_max": float(np.max(peaks)),
+        "p50_ms": float(np.percentile(latencies, 50)),
+        "p95_ms": float(np.percentile(latencies, 95)),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="검색 파이프라인 쿼리당 메모리 벤치마크")
+    parser.add_argument("--size", type=int, default=10000)
+    parser.add_argument("--top-k", type=int, nargs="+", default=[10, 50, 250])
+    parser.add_argument("--queries", type=int, default=50)
+    parser.add_argument("--seed", type=int, default=7)
+    args = parser.parse_args()
+
+    corpus = SyntheticCorpus(args.size, seed=args.seed)
+    embedder = HashingEmbedder()
+    retriever = HybridRetriever(ExactVectorStore(embedder, corpus.documents))
+    retriever.build_bm25_index(corpus.documents)
+    queries = corpus.queries(args.queries)
+
+    print(f"\n코퍼스 {args.size:,}개 청크, {len(queries)} queries")
+    print(f"{'top_k':>6} {'후보':>6} {'peak KB(mean)':>14} {'peak KB(max)':>13} {'p50(ms)':>9} {'p95(ms)':>9}")
+    for top_k in args.top_k:
+        row = measure(retriever, queries, top_k)
+        print(
+            f"{row['top_k']:>6} {row['candidates']:>6} {row['peak_kb_mean']:>14.1f} "
+            f"{row['peak_kb_max']:>13.1f} {row['p50_ms']:>9.3f} {row['p95_ms']:>9.3f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,211 @@
+"""
+HybridRetriever 확장성 벤치마크
+
+law_documents.json 어휘로 만든 조/항 구조 합성 코퍼스(기본 1k/10k/100k 청크)에 대해
+결정적 스텁 임베더(HashingEmbedder)를 사용해 모델 다운로드 없이
+- 단계별(preprocess, vector, positional, boolean, bm25, substring, fusion, rerank, format)
+  p50/p95/p99 지연시간과 처리량
+- 인덱스 구축 시간 및 코퍼스 크기별 메모리(RSS 증가량)
+를 측정합니다.
+
+사용법:
+    python benchmarks/bench_retrieval.py
+    python benchmarks/bench_retrieval.py --sizes 1000 10000 --queries 100 --vector-backend chroma
+    python benchmarks/bench_retrieval.py --json bench_output.json
+    python benchmarks/bench_retrieval.py --phrases  # 본문에서 뽑은 "두 단어" 구문 쿼리
+    python benchmarks/bench_retrieval.py --boolean  # 기본 쿼리와 같은 단어를 AND로 묶은 불리언 쿼리
+"""
+
+import argparse
+import gc
+import json
+import os
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+import numpy as np
+
+from synthetic import ExactVectorStore, HashingEmbedder, SyntheticCorpus, current_rss_mb
+from src.retrieval import HybridRetriever
+
+STAGES = [
+    "preprocess", "route", "vector", "spelling", "positional", "boolean", "bm25", "substring", "fusion", "rerank",
+    "format", "total",
+]
+
+
+def build_vector_store(backend: str, corpus: SyntheticCorpus, embedder: HashingEmbedder, workdir: str):
+    """벡터 백엔드 구성 (none / exact / chroma)"""
+    if backend == "none":
+        return None
+    if backend == "exact":
+        return ExactVectorStore(embedder, corpus.documents)
+
+    from src.embeddings import VectorStore
+
+    store = VectorStore(
+        collection_name=f"bench_{corpus.size}",
+        persist_directory=os.path.join(workdir, f"chroma_{corpus.size}"),
+        embedder=embedder,
+    )
+    chunks = corpus.chunks()
+    batch_size = min(5000, store.client.max_batch_size)
+    for start in range(0, len(chunks), batch_size):
+        store.collection.add(**store._prepare_chunks(chunks[start:start + batch_size]))
+    return store
+
+
+def percentile_row(name: str, samples_ms) -> dict:
+    samples = np.asarray(samples_ms)
+    mean = float(samples.mean())
+    return {
+        "stage": name,
+        "p50_ms": float(np.percentile(samples, 50)),
+        "p95_ms": float(np.percentile(samples, 95)),
+        "p99_ms": float(np.percentile(samples, 99)),
+        "mean_ms": mean,
+        "ops_per_sec": 1000.0 / mean if mean > 0 else None,
+    }
+
+
+def phrase_queries(corpus: SyntheticCorpus, count: int, seed: int):
+    """문서 본문의 연속 두 단어를 인용 부호로 묶은 구문 쿼리"""
+    rng = np.random.default_rng(seed)
+    queries = []
+    for doc_idx in rng.integers(0, len(corpus.documents), size=count):
+        words = corpus.documents[doc_idx]["content"].split()
+        start = int(rng.integers(0, max(1, len(words) - 1)))
+        queries.append('"' + " ".join(words[start:start + 2]) + '"')
+    return queries
+
+
+def boolean_queries(corpus: SyntheticCorpus, count: int):
+    """기본 쿼리와 같은 단어를 AND로 묶은 불리언 쿼리 (같은 단어의 일반 검색과 비교)"""
+    return [" AND ".join(query.split()) for query in corpus.queries(count)]
+
+
+def run_size(size: int, args, workdir: str) -> dict:
+    """코퍼스 크기 1개에 대한 벤치마크"""
+    gc.collect()
+    rss_start = current_rss_mb()
+
+    start = time.perf_counter()
+    corpus = SyntheticCorpus(size, seed=args.seed)
+    generate_s = time.perf_counter() - start
+    rss_corpus = current_rss_mb()
+
+    embedder = HashingEmbedder()
+
+    start = time.perf_counter()
+    vector_store = build_vector_store(args.vector_backend, corpus, embedder, workdir)
+    vector_build_s = time.perf_counter() - start
+    rss_vector = current_rss_mb()
+
+    retriever = HybridRetriever(
+        vector_store,
+        vector_weight=0.7 if vector_store is not None else 0.0,
+        bm25_weight=0.3 if vector_store is not None else 1.0,
+    )
+
+    start = time.perf_counter()
+    retriever.build_bm25_index(corpus.documents)
+    bm25_build_s = time.perf_counter() - start
+    rss_bm25 = current_rss_mb()
+
+    if args.phrases:
+        queries = phrase_queries(corpus, args.queries, args.seed)
+    elif args.boolean:
+        queries = boolean_queries(corpus, args.queries)
+    else:
+        queries = corpus.queries(args.queries)
+    for query in queries[:3]:
+        retriever.search(query, top_k=args.top_k)
+
+    samples = {stage: [] for stage in STAGES}
+    start = time.perf_counter()
+    for query in queries:
+        response = retriever.search(query, top_k=args.top_k)
+        stage_times = response["metadata"]["stage_times_ms"]
+        for stage in STAGES[:-1]:
+            samples[stage].append(stage_times.get(stage, 0.0))
+        samples["total"].append(response["metadata"]["search_time_ms"])
+    wall_s = time.perf_counter() - start
+
+    return {
+        "size": size,
+        "vector_backend": args.vector_backend,
+        "queries": len(queries),
+        "throughput_qps": len(queries) / wall_s,
+        "build_seconds": {
+            "corpus": generate_s,
+            "vector": vector_build_s,
+            "bm25": bm25_build_s,
+        },
+        "memory_mb": {
+            "corpus": rss_corpus - rss_start,
+            "vector_index": rss_vector - rss_corpus,
+            "bm25_index": rss_bm25 - rss_vector,
+            "rss_total": rss_bm25,
+        },
+        "stages": [percentile_row(stage, samples[stage]) for stage in STAGES],
+    }
+
+
+def print_result(result: dict) -> None:
+    print(f"\n{'=' * 78}")
+    print(
+        f"코퍼스 {result['size']:,}개 청크 | vector={result['vector_backend']} | "
+        f"{result['queries']} queries | {result['throughput_qps']:.1f} qps"
+    )
+    build = result["build_seconds"]
+    memory = result["memory_mb"]
+    print(
+        f"구축: corpus {build['corpus']:.2f}s, vector {build['vector']:.2f}s, bm25 {build['bm25']:.2f}s"
+    )
+    print(
+        f"메모리(RSS 증가): corpus {memory['corpus']:.1f}MB, vector {memory['vector_index']:.1f}MB, "
+        f"bm25 {memory['bm25_index']:.1f}MB (total RSS {memory['rss_total']:.1f}MB)"
+    )
+    print("-" * 78)
+    print(f"{'stage':<12} {'p50(ms)':>10} {'p95(ms)':>10} {'p99(ms)':>10} {'mean(ms)':>10} {'ops/s':>12}")
+    for row in result["stages"]:
+        ops = f"{row['ops_per_sec']:.1f}" if row["ops_per_sec"] is not None else "-"
+        print(
+            f"{row['stage']:<12} {row['p50_ms']:>10.3f} {row['p95_ms']:>10.3f} "
+            f"{row['p99_ms']:>10.3f} {row['mean_ms']:>10.3f} {ops:>12}"
+        )
+
+
+def main():
+    parser = argparse.ArgumentParser(description="HybridRetriever 확장성 벤치마크")
+    parser.add_argument("--sizes", type=int, nargs="+", default=[1000, 10000, 100000])
+    parser.add_argument("--queries", type=int, default=50)
+    parser.add_argument("--top-k", type=int, default=10)
+    parser.add_argument("--seed", type=int, default=7)
+    parser.add_argument(
+        "--vector-backend", choices=["exact", "chroma", "none"], default="exact",
+        help="exact: NumPy 전수 비교, chroma: 임시 ChromaDB, none: BM25 전용"
+    )
+    parser.add_argument("--phrases", action="store_true", help="본문에서 뽑은 인용 부호 구문 쿼리 사용")
+    parser.add_argument("--boolean", action="store_true", help="기본 쿼리 단어를 AND로 묶은 불리언 쿼리 사용")
+    parser.add_argument("--json", help="결과 JSON 저장 경로")
+    args = parser.parse_args()
+
+    results = []
+    with tempfile.TemporaryDirectory() as workdir:
+        for size in args.sizes:
+            result = run_size(size, args, workdir)
+            print_result(result)
+            results.append(result)
+
+    if args.json:
+        with open(args.json, "w", encoding="utf-8") as f:
+            json.dump(results, f, ensure_ascii=False, indent=2)
+        print(f"\n결과 저장: {args.json}")
+
+
+if __name__ == "__main__":
+    main()
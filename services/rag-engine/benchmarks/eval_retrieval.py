@@ -0,0 +1,147 @@
+"""
+검색 품질 대 지연시간 평가
+
+레이블된 쿼리 → 관련 조문 집합(benchmarks/data/eval_queries.json)에 대해
+검색기 설정(가중치, RRF k, 후보 깊이)별로 recall@k, MRR, nDCG@k와 지연시간을 측정하고
+파레토 표를 출력합니다. 성능 최적화가 관련도를 떨어뜨리지 않는지 확인하는 용도입니다.
+
+관련 조문이 코퍼스에 없는 쿼리는 판정 불가로 제외(skipped)됩니다.
+
+사용법:
+    python benchmarks/eval_retrieval.py
+    python benchmarks/eval_retrieval.py --embedder model --k 5
+    python benchmarks/eval_retrieval.py --config "hybrid-k10:0.7:0.3:10:2" --json eval_output.json
+"""
+
+import argparse
+import json
+import os
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from synthetic import ExactVectorStore, HashingEmbedder
+from src.retrieval import HybridRetriever
+from src.retrieval.evaluation import (
+    article_key,
+    evaluate_retriever,
+    load_labeled_queries,
+    pareto_front,
+)
+
+BASE_DIR = os.path.join(os.path.dirname(__file__), "..")
+
+# 이름: (vector_weight, bm25_weight, rrf_k, candidate_multiplier)
+DEFAULT_CONFIGS = {
+    "bm25-only": (0.0, 1.0, 60, 2),
+    "vector-only": (1.0, 0.0, 60, 2),
+    "hybrid-7:3": (0.7, 0.3, 60, 2),
+    "hybrid-5:5": (0.5, 0.5, 60, 2),
+    "hybrid-3:7": (0.3, 0.7, 60, 2),
+    "hybrid-7:3-k10": (0.7, 0.3, 10, 2),
+    "hybrid-7:3-depth1": (0.7, 0.3, 60, 1),
+    "hybrid-7:3-depth4": (0.7, 0.3, 60, 4),
+}
+
+
+def parse_config(spec: str):
+    """'이름:vector_weight:bm25_weight:rrf_k:candidate_multiplier' 형식 파싱"""
+    name, vector_weight, bm25_weight, rrf_k, multiplier = spec.split(":")
+    return name, (float(vector_weight), float(bm25_weight), int(rrf_k), int(multiplier))
+
+
+def load_embedder(kind: str):
+    if kind == "hashing":
+        return HashingEmbedder()
+
+    from src.embeddings import KoreanEmbedder
+    return KoreanEmbedder()
+
+
+def build_retriever(config, documents, vector_store) -> HybridRetriever:
+    vector_weight, bm25_weight, rrf_k, multiplier = config
+    retriever = HybridRetriever(
+        vector_store if vector_weight > 0 else None,
+        vector_weight=vector_weight,
+        bm25_weight=bm25_weight,
+        rrf_k=rrf_k,
+        candidate_multiplier=multiplier,
+    )
+    retriever.build_bm25_index(documents)
+    return retriever
+
+
+def print_table(results, front, k: int) -> None:
+    front_names = {r.name for r in front}
+    print(f"\n{'=' * 92}")
+    print(
+        f"{'config':<20} {'queries':>7} {f'recall@{k}':>10} {'MRR':>8} {f'nDCG@{k}':>9} "
+        f"{'p50(ms)':>9} {'p95(ms)':>9}  pareto"
+    )
+    print("-" * 92)
+    for r in sorted(results, key=lambda r: r.latency_percentile(95)):
+        print(
+            f"{r.name:<20} {r.queries:>7} {r.recall:>10.3f} {r.mrr:>8.3f} {r.ndcg:>9.3f} "
+            f"{r.latency_percentile(50):>9.3f} {r.latency_percentile(95):>9.3f}  "
+            f"{'*' if r.name in front_names else ''}"
+        )
+    if results:
+        print(f"\n판정 불가(코퍼스에 관련 조문 없음): {results[0].skipped}개 쿼리")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="검색 품질 대 지연시간 평가")
+    parser.add_argument("--corpus", default=os.path.join(BASE_DIR, "law_documents.json"))
+    parser.add_argument("--queries", default=os.path.join(os.path.dirname(__file__), "data", "eval_queries.json"))
+    parser.add_argument("--k", type=int, default=10)
+    parser.add_argument(
+        "--embedder", choices=["hashing", "model"], default="hashing",
+        help="hashing: 결정적 스텁 임베더, model: KoreanEmbedder"
+    )
+    parser.add_argument(
+        "--config", action="append",
+        help="추가 설정 '이름:vector_weight:bm25_weight:rrf_k:candidate_multiplier' (지정 시 기본 설정 대체)"
+    )
+    parser.add_argument("--quality", choices=["recall", "mrr", "ndcg"], default="ndcg", help="파레토 품질 축")
+    parser.add_argument("--json", help="결과 JSON 저장 경로")
+    args = parser.parse_args()
+
+    with open(args.corpus, "r", encoding="utf-8") as f:
+        documents = json.load(f)
+    labeled_queries = load_labeled_queries(args.queries)
+    corpus_keys = {
+        article_key(doc["metadata"].get("law_name", ""), doc["metadata"].get("article_number", ""))
+        for doc in documents
+    }
+
+    configs = dict(parse_config(spec) for spec in args.config) if args.config else DEFAULT_CONFIGS
+
+    vector_store = None
+    if any(config[0] > 0 for config in configs.values()):
+        vector_store = ExactVectorStore(load_embedder(args.embedder), documents)
+
+    results = []
+    for name, config in configs.items():
+        retriever = build_retriever(config, documents, vector_store)
+        results.append(evaluate_retriever(name, retriever, labeled_queries, k=args.k, corpus_keys=corpus_keys))
+
+    front = pareto_front(results, quality=args.quality)
+    print_table(results, front, args.k)
+
+    if args.json:
+        output = {
+            "corpus": args.corpus,
+            "embedder": args.embedder,
+            "k": args.k,
+            "configs": {name: list(config) for name, config in configs.items()},
+            "results": [r.summary() for r in results],
+            "pareto": [r.name for r in front],
+            "per_query": {r.name: r.per_query for r in results},
+        }
+        with open(args.json, "w", encoding="utf-8") as f:
+            json.dump(output, f, ensure_ascii=False, indent=2)
+        print(f"결과 저장: {args.json}")
+
+
+if __name__ == "__main__":
+    main()
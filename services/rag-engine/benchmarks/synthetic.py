@@ -0,0 +1,235 @@
+"""
+벤치마크용 합성 법령 코퍼스 및 결정적 스텁 임베더
+
+- law_documents.json의 어휘와 빈도 분포로 조/항 구조의 합성 청크 생성
+- HashingEmbedder: 토큰 해싱 기반 결정적 임베딩 (모델 다운로드 불필요)
+- ExactVectorStore: NumPy 전수 비교 코사인 검색 (VectorStore.search와 같은 반환 형식)
+"""
+
+import json
+import os
+import re
+import zlib
+from collections import Counter
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
+
+from src.embeddings.chunker import LawChunk
+
+BASE_DIR = os.path.join(os.path.dirname(__file__), "..")
+
+_HANGUL_WORD = re.compile(r"[가-힣]{2,}")
+
+# 합성 코퍼스의 법령 구성 (법률/시행령/시행규칙)
+SYNTHETIC_LAWS = [
+    ("H001", "수소경제 육성 및 수소 안전관리에 관한 법률", "법률"),
+    ("H002", "수소경제 육성 및 수소 안전관리에 관한 법률 시행령", "시행령"),
+    ("H003", "수소경제 육성 및 수소 안전관리에 관한 법률 시행규칙", "시행규칙"),
+    ("G001", "고압가스 안전관리법", "법률"),
+    ("G002", "고압가스 안전관리법 시행령", "시행령"),
+    ("G003", "고압가스 안전관리법 시행규칙", "시행규칙"),
+]
+
+PARAGRAPH_MARKS = "①②③④⑤"
+
+
+def load_vocabulary(path: Optional[str] = None) -> Tuple[List[str], np.ndarray]:
+    """law_documents.json에서 한글 어휘와 출현 확률 로드"""
+    path = path or os.path.join(BASE_DIR, "law_documents.json")
+    with open(path, "r", encoding="utf-8") as f:
+        documents = json.load(f)
+
+    counts = Counter(
+        word for doc in documents for word in _HANGUL_WORD.findall(doc["content"])
+    )
+    words = sorted(counts)
+    freqs = np.array([counts[w] for w in words], dtype=np.float64)
+
+    return words, freqs / freqs.sum()
+
+
+class SyntheticCorpus:
+    """조/항 구조의 합성 법령 코퍼스"""
+
+    def __init__(self, size: int, seed: int = 7, vocabulary: Optional[Tuple[List[str], np.ndarray]] = None):
+        """
+        Args:
+            size: 청크 수
+            seed: 난수 시드 (같은 시드 → 같은 코퍼스)
+            vocabulary: (어휘, 확률) — None이면 law_documents.json에서 로드
+        """
+        self.size = size
+        self.rng = np.random.default_rng(seed)
+        self.words, self.probs = vocabulary or load_vocabulary()
+        self.documents = self._generate()
+
+    def _sentence(self, low: int, high: int) -> str:
+        length = int(self.rng.integers(low, high))
+        idx = self.rng.choice(len(self.words), size=length, p=self.probs)
+        return " ".join(self.words[i] for i in idx)
+
+    def _generate(self) -> List[Dict]:
+        documents = []
+        per_law = -(-self.size // len(SYNTHETIC_LAWS))
+
+        for law_idx, (law_id, law_name, law_type) in enumerate(SYNTHETIC_LAWS):
+            for n in range(per_law):
+                if len(documents) >= self.size:
+                    break
+
+                article = n // 3 + 1
+                mark = PARAGRAPH_MARKS[n % 3]
+                title = self._sentence(1, 3)
+                article_number = f"제{article}조"
+                content = f"{article_number}({title}) {mark} {self._sentence(12, 40)}"
+
+                documents.append({
+                    "id": f"{law_id}_{article_number}_{mark}",
+                    "content": content,
+                    "metadata": {
+                        "chunk_id": f"{law_id}_{article_number}_{mark}",
+                        "law_id": law_id,
+                        "law_name": law_name,
+                        "law_type": law_type,
+                        "article_number": article_number,
+                        "paragraph_number": mark,
+                        "title": title,
+                        "chunk_type": "paragraph",
+                    },
+                })
+
+        return documents
+
+    def chunks(self) -> List[LawChunk]:
+        """VectorStore 적재용 LawChunk 목록"""
+        return [
+            LawChunk(
+                chunk_id=doc["id"],
+                law_id=doc["metadata"]["law_id"],
+                law_name=doc["metadata"]["law_name"],
+                article_number=doc["metadata"]["article_number"],
+                paragraph_number=doc["metadata"]["paragraph_number"],
+                title=doc["metadata"]["title"],
+                content=doc["content"],
+                chunk_type=doc["metadata"]["chunk_type"],
+                metadata={"law_type": doc["metadata"]["law_type"]},
+            )
+            for doc in self.documents
+        ]
+
+    def queries(self, count: int, seed: int = 11) -> List[str]:
+        """
+        결정적 쿼리 집합
+
+        - 70%: 문서에서 연속 2~3개 단어 발췌 (적중 쿼리)
+        - 30%: 어휘 분포에서 무작위 2개 단어 (희소/미적중 쿼리 → 폴백 경로)
+        """
+        rng = np.random.default_rng(seed)
+        queries = []
+
+        for i in range(count):
+            if i % 10 < 7:
+                doc = self.documents[int(rng.integers(len(self.documents)))]
+                words = doc["content"].split()[2:]
+                length = int(rng.integers(2, 4))
+                start = int(rng.integers(0, max(1, len(words) - length)))
+                queries.append(" ".join(words[start:start + length]))
+            else:
+                idx = rng.choice(len(self.words), size=2, p=self.probs)
+                queries.append(" ".join(self.words[j] for j in idx))
+
+        return queries
+
+
+class HashingEmbedder:
+    """토큰 해싱 기반 결정적 스텁 임베더 (KoreanEmbedder 인터페이스 호환)"""
+
+    def __init__(self, dimension: int = 256, max_seq_length: int = 128):
+        self.dimension = dimension
+        self.max_seq_length = max_seq_length
+        self.max_tokens = max_seq_length - 2
+        self.model_name = "stub/hashing"
+
+    def embed(self, texts) -> np.ndarray:
+        if isinstance(texts, str):
+            texts = [texts]
+
+        vectors = np.zeros((len(texts), self.dimension), dtype=np.float32)
+        for row, text in enumerate(texts):
+            for token in text.split():
+                h = zlib.crc32(token.encode("utf-8"))
+                vectors[row, h % self.dimension] += 1.0 if h & 0x80000000 else -1.0
+
+        norms = np.linalg.norm(vectors, axis=1, keepdims=True)
+        norms[norms == 0] = 1.0
+        return vectors / norms
+
+    def embed_query(self, query: str) -> np.ndarray:
+        return self.embed(query)[0]
+
+    def embed_documents(self, documents: List[str]) -> np.ndarray:
+        return self.embed(documents)
+
+    def get_embedding_dimension(self) -> int:
+        return self.dimension
+
+    def token_offsets(self, texts: List[str]) -> List[List[Tuple[int, int]]]:
+        return [[m.span() for m in re.finditer(r"\S+", text)] for text in texts]
+
+    def count_tokens(self, texts: List[str]) -> List[int]:
+        return [len(offsets) for offsets in self.token_offsets(texts)]
+
+
+class ExactVectorStore:
+    """NumPy 전수 비교 코사인 검색 (정확도 기준선 / 경량 벡터 백엔드)"""
+
+    def __init__(self, embedder: HashingEmbedder, documents: List[Dict]):
+        self.embedder = embedder
+        self.documents = documents
+        self.matrix = embedder.embed_documents([doc["content"] for doc in documents])
+
+    def _top(self, query: str, top_k: int):
+        scores = self.matrix @ self.embedder.embed_query(query)
+        top_k = min(top_k, len(scores))
+        top = np.argpartition(-scores, top_k - 1)[:top_k]
+        return scores, top[np.argsort(-scores[top])]
+
+    def search_ids(self, query: str, top_k: int = 10, filters: Optional[Dict] = None) -> List[Dict]:
+        scores, top = self._top(query, top_k)
+        return [
+            {
+                "id": self.documents[i]["id"],
+                "distance": float(1 - scores[i]),
+                "similarity_score": float(scores[i]),
+            }
+            for i in top
+        ]
+
+    def search(self, query: str, top_k: int = 10, filters: Optional[Dict] = None) -> List[Dict]:
+        scores, top = self._top(query, top_k)
+
+        return [
+            {
+                "id": self.documents[i]["id"],
+                "content": self.documents[i]["content"],
+                "metadata": self.documents[i]["metadata"],
+                "distance": float(1 - scores[i]),
+                "similarity_score": float(scores[i]),
+            }
+            for i in top
+        ]
+
+
+def current_rss_mb() -> float:
+    """현재 프로세스 RSS (MB, Linux /proc 기준)"""
+    try:
+        with open("/proc/self/status", "r") as f:
+            for line in f:
+                if line.startswith("VmRSS:"):
+                    return int(line.split()[1]) / 1024
+    except OSError:
+        pass
+
+    import resource
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
@@ -13,7 +13,8 @@ logger = logging.getLogger(__name__)
 
 sys.path.insert(0, os.path.dirname(__file__))
 
-from src.embeddings import KoreanEmbedder, LawChunker, LawChunk, VectorStore
+from src.collectors.pdf_cleaner import BoilerplateStripper
+from src.embeddings import KoreanEmbedder, LawChunker, LawChunk, VectorStore, MinHashDeduplicator
 
 try:
     import PyPDF2
@@ -23,8 +24,8 @@ except ImportError:
     sys.exit(1)
 
 
-def extract_text_from_pdf(pdf_path: str) -> str:
-    """PDF에서 텍스트 추출"""
+def extract_pages_from_pdf(pdf_path: str) -> List[str]:
+    """PDF에서 페이지별 텍스트 추출"""
     try:
         with open(pdf_path, "rb") as file:
             pdf_reader = PyPDF2.PdfReader(file)
@@ -33,21 +34,22 @@ def extract_text_from_pdf(pdf_path: str) -> str:
             text_parts = []
             for page_num, page in enumerate(pdf_reader.pages, 1):
                 page_text = page.extract_text()
-                text_parts.append(page_text)
+                if page_text:
+                    text_parts.append(page_text)
 
                 if page_num % 10 == 0:
                     print(f"   진행: {page_num}/{len(pdf_reader.pages)} 페이지")
 
-            return "\n".join(text_parts)
+            return text_parts
     except FileNotFoundError:
         logger.error(f"File not found: {pdf_path}")
-        return ""
+        return []
     except PyPDF2.errors.PdfReadError as e:
         logger.error(f"Failed to read PDF {pdf_path}: {e}")
-        return ""
+        return []
     except Exception as e:
         logger.error(f"Unexpected error reading {pdf_path}: {e}")
-        return ""
+        return []
 
 
 def parse_law_text(text: str, law_name: str, law_id: str) -> List[Dict[str, Any]]:
@@ -130,6 +132,10 @@ def main():
 
     all_chunks = []
 
+    embedder = KoreanEmbedder()
+    chunker = LawChunker.from_embedder(embedder)
+    stripper = BoilerplateStripper()
+
     for pdf_info in pdf_files:
         print(f"\n{'='*60}")
         print(f"📄 {pdf_info['law_name']}")
@@ -141,8 +147,13 @@ def main():
 
         # 1. PDF 텍스트 추출
         print(f"\n1️⃣ PDF 텍스트 추출 중...")
-        text = extract_text_from_pdf(str(pdf_info["path"]))
+        pages, boilerplate = stripper.strip(extract_pages_from_pdf(str(pdf_info["path"])))
+        text = "\n".join(pages)
         print(f"   ✅ {len(text)} 문자 추출")
+        print(
+            f"   🧹 반복 머리말/꼬리말 {boilerplate.lines_removed}줄 제거 "
+            f"({boilerplate.shrink_ratio:.1%} 감소)"
+        )
 
         # 2. 조문 파싱
         print(f"\n2️⃣ 조문 파싱 중...")
@@ -151,7 +162,6 @@ def main():
 
         # 3. 청킹
         print(f"\n3️⃣ 청킹 중...")
-        chunker = LawChunker()
 
         for article in articles:
             chunks = chunker.chunk_article(
@@ -165,12 +175,18 @@ def main():
 
         print(f"   ✅ {len(all_chunks)}개 청크 생성 (누적)")
 
+    # 근사 중복 청크 제거
+    all_chunks, dedup = MinHashDeduplicator().deduplicate(all_chunks)
+    print(
+        f"\n🧹 근사 중복 청크 {dedup.duplicates_removed}개 제거 "
+        f"({dedup.chunks_before} → {dedup.chunks_after}, {dedup.shrink_ratio:.1%} 감소)"
+    )
+
     # 4. 벡터 DB 저장
     print(f"\n{'='*60}")
     print(f"4️⃣ 벡터 DB 저장 중...")
     print(f"{'='*60}")
 
-    embedder = KoreanEmbedder()
     vector_store = VectorStore(collection_name="hydrogen_law", embedder=embedder)
 
     # 기존 데이터 삭제
@@ -6,15 +6,19 @@ LLM 최소화 접근법:
 - 10% 선택적 LLM (사용자 요청 시만)
 """
 
+import asyncio
 import logging
 import os
 import re
+import secrets
 import tempfile
+import time
 from pathlib import Path
 
-from fastapi import FastAPI, HTTPException, UploadFile, File, Form
+from fastapi import FastAPI, HTTPException, UploadFile, File, Form, Header
 from fastapi.middleware.cors import CORSMiddleware
-from pydantic import BaseModel, field_validator
+from fastapi.responses import JSONResponse, PlainTextResponse
+from pydantic import BaseModel, field_validator, model_validator
 from typing import List, Optional, Dict, Any
 import uvicorn
 
@@ -22,13 +26,37 @@ logger = logging.getLogger(__name__)
 
 import chromadb
 
-from src.embeddings import KoreanEmbedder, LawChunker, LawChunk, VectorStore
+from src.collectors.pdf_cleaner import BoilerplateStripper
+from src.embeddings import KoreanEmbedder, LawChunker, LawChunk, VectorStore, HNSWConfig, MinHashDeduplicator
 from src.retrieval import HybridRetriever
+from src.retrieval.hybrid_retriever import ARTICLE_FIELDS
+from src.retrieval.cursor_cache import CursorError
+from src.retrieval.boolean_query import QuerySyntaxError
+from src.retrieval.profiling import profile_call
+from src.retrieval.router import load_law_aliases
+from src.monitoring import REGISTRY, record_corpus_size, record_process_memory, record_search
+from src.monitoring.health import (
+    EngineState,
+    PHASE_BUILDING_INDEX,
+    PHASE_LOADING_DOCUMENTS,
+    PHASE_LOADING_MODEL,
+    PHASE_READY,
+    PHASE_WARMING_UP,
+)
 
 # 전역 변수로 검색 엔진 초기화
 embedder = None
 vector_store = None
 retriever = None
+engine_state = EngineState()
+_init_task = None
+# 업로드(인덱스 재구축) 직렬화 (프로세스 내부 잠금)
+_ingest_lock = asyncio.Lock()
+# fork 서버(serve.py) 워커 여부: 스냅샷 교체가 워커 간에 전파되지 않으므로 업로드 비활성화
+_fork_worker = False
+
+# 준비 완료 전 실행하는 워밍업 쿼리
+WARMUP_QUERY = "수소충전소 설치 기준"
 
 app = FastAPI(
     title="수소법률 RAG 엔진",
@@ -49,35 +77,69 @@ app.add_middleware(
 
 # 요청/응답 모델
 class SearchRequest(BaseModel):
-    query: str
+    query: str = ""
     top_k: int = 10
     filters: Optional[Dict[str, Any]] = None
+    # 페이지네이션: paginate=true면 첫 페이지와 next_cursor 반환,
+    # 이후 cursor만 보내면 top_k 크기의 다음 페이지 반환 (query 생략 가능)
+    paginate: bool = False
+    cursor: Optional[str] = None
+    # 결과 항목 필드 프로젝션 (예: ["id", "title", "snippets"])
+    # 생략 시 기존 필드 전체 (snippets는 요청할 때만 생성)
+    fields: Optional[List[str]] = None
+    # 관리자 전용 프로파일링 (X-Admin-Token 헤더 필요)
+    profile: bool = False
+    cprofile: bool = False
 
     @field_validator("query")
     @classmethod
     def validate_query(cls, v: str) -> str:
         v = v.strip()
-        if not v:
-            raise ValueError("검색어를 입력해주세요")
         if len(v) > 500:
             raise ValueError("검색어는 500자를 초과할 수 없습니다")
         return v
 
+    @model_validator(mode="after")
+    def validate_query_or_cursor(self) -> "SearchRequest":
+        if not self.query and not self.cursor:
+            raise ValueError("검색어를 입력해주세요")
+        return self
+
     @field_validator("top_k")
     @classmethod
     def validate_top_k(cls, v: int) -> int:
         return max(1, min(v, 100))
 
+    @field_validator("fields")
+    @classmethod
+    def validate_fields(cls, v: Optional[List[str]]) -> Optional[List[str]]:
+        if v is None:
+            return v
+        unknown = sorted(set(v) - set(ARTICLE_FIELDS))
+        if unknown:
+            raise ValueError(f"알 수 없는 필드: {', '.join(unknown)}")
+        return v
+
+
+class Snippet(BaseModel):
+    text: str
+    # 본문(content) 기준 문자 오프셋
+    start: int
+    end: int
+    highlights: List[List[int]]
+
 
 class Article(BaseModel):
+    # fields 프로젝션으로 제외된 필드는 응답에서 생략
     id: str
-    law_name: str
-    article_number: str
-    title: str
-    content: str
-    highlighted_content: str
-    related_articles: List[Dict[str, str]]
-    relevance_score: float
+    law_name: Optional[str] = None
+    article_number: Optional[str] = None
+    title: Optional[str] = None
+    content: Optional[str] = None
+    highlighted_content: Optional[str] = None
+    snippets: Optional[List[Snippet]] = None
+    related_articles: Optional[List[Dict[str, str]]] = None
+    relevance_score: Optional[float] = None
 
 
 class SearchResponse(BaseModel):
@@ -87,6 +149,20 @@ class SearchResponse(BaseModel):
     relevant_laws: List[str]
     articles: List[Article]
     metadata: Dict[str, Any]
+    next_cursor: Optional[str] = None
+
+
+class Suggestion(BaseModel):
+    term: str
+    # definition(정의어) / law(법령명·약칭) / title(조문 제목) / term(법률 용어)
+    source: str
+    frequency: int
+
+
+class SuggestResponse(BaseModel):
+    query: str
+    suggestions: List[Suggestion]
+    took_ms: float
 
 
 class ComplianceRequest(BaseModel):
@@ -102,6 +178,17 @@ class ComplianceResponse(BaseModel):
     metadata: Dict[str, Any]
 
 
+def _hnsw_config_from_env() -> HNSWConfig:
+    """환경변수 HNSW 설정 (HNSW_SPACE, HNSW_M, HNSW_EF_CONSTRUCTION, HNSW_EF_SEARCH)"""
+    default = HNSWConfig()
+    return HNSWConfig(
+        space=os.getenv("HNSW_SPACE", default.space),
+        M=int(os.getenv("HNSW_M", default.M)),
+        ef_construction=int(os.getenv("HNSW_EF_CONSTRUCTION", default.ef_construction)),
+        ef_search=int(os.getenv("HNSW_EF_SEARCH", default.ef_search)),
+    )
+
+
 def _load_documents_from_chroma(collection, batch_size: int = 500):
     """ChromaDB 컬렉션에서 문서를 배치로 읽어옵니다."""
     total_docs = collection.count()
@@ -127,9 +214,8 @@ def _load_documents_from_chroma(collection, batch_size: int = 500):
     return documents, total_docs
 
 
-@app.on_event("startup")
-async def startup_event():
-    """서버 시작 시 검색 엔진 초기화"""
+def _initialize_engine() -> None:
+    """검색 엔진 초기화 (모델 로드 → 문서 로드 → 인덱스 구축 → 워밍업)"""
     global embedder, vector_store, retriever
 
     print("=" * 60)
@@ -138,22 +224,32 @@ async def startup_event():
 
     # 1. 임베딩 모델 로드 시도
     print("\n1️⃣ 임베딩 모델 로드 중...")
+    engine_state.set_phase(PHASE_LOADING_MODEL)
     try:
         embedder = KoreanEmbedder()
+        engine_state.embedder_loaded = True
         print("✅ 임베딩 모델 로드 완료")
     except Exception as e:
         embedder = None
+        engine_state.embedder_error = f"{type(e).__name__}: {e}"
         print(f"⚠️ 임베딩 모델 로드 실패 (BM25 전용 모드로 전환): {e}")
 
     # 2. 문서 로드 (ChromaDB 또는 JSON 파일)
     print("2️⃣ 문서 로드 중...")
+    engine_state.set_phase(PHASE_LOADING_DOCUMENTS)
     documents = []
     total_docs = 0
     base_dir = os.path.dirname(__file__)
     chroma_dir = os.path.join(base_dir, "chroma_db")
 
     if embedder is not None:
-        vector_store = VectorStore(collection_name="hydrogen_law", embedder=embedder)
+        # 기존 컬렉션 설정이 다르면 VECTOR_STORE_MIGRATE=1일 때 저장된 임베딩으로 재구축
+        vector_store = VectorStore(
+            collection_name="hydrogen_law",
+            embedder=embedder,
+            hnsw=_hnsw_config_from_env(),
+            migrate=os.getenv("VECTOR_STORE_MIGRATE", "").lower() in ("1", "true")
+        )
         documents, total_docs = _load_documents_from_chroma(vector_store.collection)
     else:
         # BM25 전용 모드: ChromaDB에서 로드 시도
@@ -184,19 +280,28 @@ async def startup_event():
 
     # 3. 검색 엔진 초기화
     print("3️⃣ 검색 엔진 초기화 중...")
+    engine_state.set_phase(PHASE_BUILDING_INDEX)
+    # 법령 약칭 (예: "수소법 제36조" → 조문 정확 조회)
+    law_aliases = load_law_aliases(os.path.join(base_dir, "law_config.yaml"))
     if vector_store is not None:
-        retriever = HybridRetriever(vector_store)
+        new_retriever = HybridRetriever(vector_store, law_aliases=law_aliases)
     else:
-        # BM25 전용 모드에서는 dummy vector_store 없이 retriever 직접 초기화
-        retriever = HybridRetriever.__new__(HybridRetriever)
-        retriever.vector_store = None
-        retriever.vector_weight = 0.0
-        retriever.bm25_weight = 1.0
-        retriever.bm25_index = None
-        retriever.documents = []
-        retriever.document_ids = []
+        # BM25 전용 모드: vector_store 없이 키워드 검색만 사용
+        new_retriever = HybridRetriever(
+            vector_store=None, vector_weight=0.0, bm25_weight=1.0, law_aliases=law_aliases
+        )
 
-    retriever.build_bm25_index(documents)
+    new_retriever.build_bm25_index(documents)
+
+    # 4. 워밍업 쿼리 (모델/인덱스 첫 호출 지연을 트래픽 전에 소모)
+    engine_state.set_phase(PHASE_WARMING_UP)
+    warmup = new_retriever.search(WARMUP_QUERY, top_k=1)
+    engine_state.warmup_ms = warmup["metadata"]["search_time_ms"]
+    engine_state.warmed_up = True
+
+    # 워밍업까지 끝난 뒤에 서비스 대상으로 공개
+    retriever = new_retriever
+    engine_state.set_phase(PHASE_READY)
 
     print(f"\n✅ 초기화 완료!")
     print(f"   문서 수: {total_docs}개")
@@ -205,38 +310,113 @@ async def startup_event():
     print("=" * 60)
 
 
+def _initialize_engine_safely() -> None:
+    try:
+        _initialize_engine()
+    except Exception as e:
+        engine_state.fail(e)
+        logger.critical(f"Engine initialization failed: {e}", exc_info=True)
+
+
+@app.on_event("startup")
+async def startup_event():
+    """
+    서버 시작 시 검색 엔진 초기화
+
+    초기화는 백그라운드 스레드에서 진행하므로 그동안 liveness 프로브는 응답하고
+    readiness 프로브는 준비 완료 전까지 503을 반환합니다.
+    fork 서버(serve.py)로 부모에서 미리 초기화된 워커는 초기화를 건너뜁니다.
+    """
+    global _init_task
+    if engine_state.phase == PHASE_READY:
+        return
+    _init_task = asyncio.create_task(asyncio.to_thread(_initialize_engine_safely))
+
+
+def reopen_after_fork() -> None:
+    """
+    fork된 워커에서 프로세스별 자원 재연결
+
+    임베딩 모델, 문서, BM25 인덱스는 부모와 copy-on-write로 공유하고
+    fork를 넘을 수 없는 ChromaDB 연결만 새로 엽니다.
+    워커별 스냅샷은 다른 워커와 동기화되지 않으므로 /upload는 비활성화합니다.
+    """
+    global _fork_worker
+
+    _fork_worker = True
+    if vector_store is not None:
+        vector_store.reopen()
+
+
 @app.get("/")
 async def root():
-    """헬스 체크"""
+    """서비스 정보"""
     return {
-        "status": "healthy",
+        "status": "ready" if engine_state.phase == PHASE_READY else engine_state.phase,
         "service": "수소법률 RAG 엔진",
         "version": "1.0.0",
         "llm_mode": "minimal (90% search, 10% optional)",
     }
 
 
+@app.get("/health/live")
+async def liveness_probe():
+    """liveness 프로브 (프로세스 응답 여부만 확인)"""
+    return {**engine_state.liveness(), "pid": os.getpid()}
+
+
+@app.get("/health/ready")
+async def readiness_probe():
+    """readiness 프로브 (준비 전에는 503)"""
+    readiness = engine_state.readiness(retriever, vector_store)
+    return JSONResponse(readiness, status_code=200 if readiness["ready"] else 503)
+
+
 @app.get("/health")
 async def health_check():
-    """서비스 상태 확인"""
+    """서비스 상태 확인 (readiness 상세, 항상 200)"""
+    readiness = engine_state.readiness(retriever, vector_store)
     return {
-        "status": "healthy",
-        "dependencies": {
-            "vector_db": "not_initialized",
-            "embedding_model": "not_loaded",
-            "law_database": "not_connected",
-        },
+        "status": "healthy" if readiness["ready"] else "unavailable",
+        **readiness,
     }
 
 
-@app.post("/search", response_model=SearchResponse)
-async def search_laws(request: SearchRequest):
+def _require_admin(token: Optional[str]) -> None:
+    """관리자 토큰 확인 (ADMIN_API_KEY 미설정 시 관리자 기능 비활성)"""
+    admin_key = os.getenv("ADMIN_API_KEY")
+    if not admin_key or not token or not secrets.compare_digest(token, admin_key):
+        raise HTTPException(status_code=403, detail="관리자 권한이 필요합니다")
+
+
+@app.get("/metrics", response_class=PlainTextResponse)
+async def metrics():
+    """Prometheus 텍스트 형식 메트릭"""
+    if vector_store is not None:
+        record_corpus_size("vector", vector_store.collection.count())
+    record_process_memory()
+
+    return PlainTextResponse(REGISTRY.render(), media_type=REGISTRY.CONTENT_TYPE)
+
+
+@app.post("/search", response_model=SearchResponse, response_model_exclude_unset=True)
+async def search_laws(
+    request: SearchRequest,
+    x_admin_token: Optional[str] = Header(default=None),
+):
     """
     법률 검색 (LLM 없이 작동)
 
     하이브리드 검색:
     - 벡터 검색 (의미 기반)
     - BM25 (키워드 기반)
+
+    AND/OR/NOT, 괄호, 인용 부호 구문: "수소충전소 AND (허가 OR 신고) NOT 벌칙"
+    (문법 오류는 400)
+
+    profile=true (관리자): metadata.profile에 단계 트리와 검색기별 후보 수,
+    cprofile=true이면 pstats 상위 함수 요약까지 포함
+    (첫 페이지 검색만 프로파일링하므로 cursor/paginate와 함께 쓰면 400)
     """
     global retriever
 
@@ -245,28 +425,43 @@ async def search_laws(request: SearchRequest):
             status_code=503, detail="검색 엔진이 아직 초기화되지 않았습니다"
         )
 
+    profile = request.profile or request.cprofile
+    if profile:
+        _require_admin(x_admin_token)
+    if request.cprofile and (request.cursor or request.paginate):
+        raise HTTPException(
+            status_code=400, detail="cprofile은 cursor/paginate와 함께 사용할 수 없습니다"
+        )
+
     try:
         # 하이브리드 검색
-        results = retriever.search(request.query, top_k=request.top_k)
-
-        # 응답 변환
-        articles = []
-        for article in results["articles"]:
-            articles.append(
-                Article(
-                    id=article["id"],
-                    law_name=article["law_name"],
-                    article_number=article["article_number"],
-                    title=article["title"],
-                    content=article["content"],
-                    highlighted_content=article.get(
-                        "highlighted_content", article["content"]
-                    ),
-                    related_articles=article.get("related_articles", []),
-                    relevance_score=article["relevance_score"],
+        if request.cursor:
+            try:
+                results = retriever.page(
+                    request.cursor, page_size=request.top_k, fields=request.fields
                 )
+            except CursorError:
+                raise HTTPException(
+                    status_code=410, detail="커서가 만료되었거나 잘못되었습니다. 검색을 다시 실행해주세요"
+                )
+        elif request.cprofile:
+            results, pstats_summary = profile_call(
+                retriever.search, request.query, top_k=request.top_k, profile=True,
+                fields=request.fields
+            )
+            results["metadata"]["profile"]["cprofile"] = pstats_summary
+        else:
+            results = retriever.search(
+                request.query,
+                top_k=request.top_k,
+                profile=profile,
+                paginate=request.paginate,
+                fields=request.fields,
             )
 
+        # 응답 변환 (요청한 필드만 설정 → 나머지는 응답에서 생략)
+        articles = [Article(**article) for article in results["articles"]]
+
         return SearchResponse(
             query=results["query"],
             total_found=results["total_found"],
@@ -274,8 +469,13 @@ async def search_laws(request: SearchRequest):
             relevant_laws=results.get("relevant_laws", []),
             articles=articles,
             metadata=results["metadata"],
+            next_cursor=results["metadata"].get("next_cursor"),
         )
 
+    except HTTPException:
+        raise
+    except QuerySyntaxError as e:
+        raise HTTPException(status_code=400, detail=f"검색어 문법 오류: {e}")
     except (KeyError, ValueError, AttributeError) as e:
         logger.error(f"Search error: {e}", exc_info=True)
         raise HTTPException(status_code=500, detail="검색 처리 중 오류가 발생했습니다")
@@ -284,6 +484,30 @@ async def search_laws(request: SearchRequest):
         raise HTTPException(status_code=500, detail="시스템 오류가 발생했습니다")
 
 
+@app.get("/suggest", response_model=SuggestResponse)
+async def suggest_terms(q: str = "", limit: int = 10):
+    """
+    검색어 자동완성 (접두사 트라이 조회, 모델/BM25 미사용)
+
+    조문 제목, 법령명/약칭, 법률 용어, 정의 조항의 정의어를 코퍼스 빈도순으로 반환
+    """
+    if retriever is None:
+        raise HTTPException(
+            status_code=503, detail="검색 엔진이 아직 초기화되지 않았습니다"
+        )
+
+    start = time.perf_counter()
+    suggestions = retriever.suggest(q[:100], limit=max(1, min(limit, 20)))
+    took = time.perf_counter() - start
+    record_search("suggest", {}, took)
+
+    return SuggestResponse(
+        query=q,
+        suggestions=[Suggestion(**s) for s in suggestions],
+        took_ms=took * 1000,
+    )
+
+
 @app.post("/compliance/check", response_model=ComplianceResponse)
 async def check_compliance(request: ComplianceRequest):
     """
@@ -320,8 +544,8 @@ async def get_law_detail(law_id: str):
     raise HTTPException(status_code=404, detail="법령을 찾을 수 없습니다")
 
 
-def _extract_text_from_pdf(pdf_path: str) -> str:
-    """PDF에서 텍스트 추출"""
+def _extract_pages_from_pdf(pdf_path: str) -> List[str]:
+    """PDF에서 페이지별 텍스트 추출"""
     try:
         import PyPDF2
     except ImportError:
@@ -334,7 +558,7 @@ def _extract_text_from_pdf(pdf_path: str) -> str:
             page_text = page.extract_text()
             if page_text:
                 text_parts.append(page_text)
-        return "\n".join(text_parts)
+        return text_parts
 
 
 def _parse_law_articles(text: str, law_name: str, law_id: str) -> List[Dict[str, Any]]:
@@ -418,29 +642,26 @@ def _store_to_supabase(chunks: List[LawChunk], embeddings) -> Dict[str, int]:
     return {"migrated": migrated, "failed": failed}
 
 
-@app.post("/upload")
-async def upload_law_pdf(
-    file: UploadFile = File(...),
-    law_name: str = Form(...),
-    law_id: str = Form(""),
-):
+def _refresh_index() -> int:
     """
-    법령 PDF 업로드 → 파싱 → 청킹 → 임베딩 → 저장
+    ChromaDB 전체 문서로 새 인덱스 스냅샷을 구축한 뒤 원자적으로 교체
 
-    전체 파이프라인을 자동으로 수행합니다.
+    구축은 서비스 중인 스냅샷과 별도로 진행되며, 진행 중인 검색은 이전 스냅샷으로 끝납니다.
+
+    Returns:
+        새 코퍼스 세대
     """
-    global embedder, vector_store, retriever
+    documents, _ = _load_documents_from_chroma(vector_store.collection)
+    snapshot = retriever.build_snapshot(documents)
+    retriever.swap_snapshot(snapshot)
+    return snapshot.generation
 
-    if not file.filename or not file.filename.lower().endswith(".pdf"):
-        raise HTTPException(status_code=400, detail="PDF 파일만 업로드 가능합니다")
-
-    if embedder is None or vector_store is None:
-        raise HTTPException(status_code=503, detail="RAG 엔진이 초기화되지 않았습니다")
 
+def _ingest_pdf(pdf_bytes: bytes, law_name: str, law_id: str) -> Dict[str, Any]:
+    """PDF 파싱 → 청킹 → 임베딩 → 저장 → 인덱스 교체 (워커 스레드에서 실행)"""
     # 임시 파일로 저장
     with tempfile.NamedTemporaryFile(suffix=".pdf", delete=False) as tmp:
-        content = await file.read()
-        tmp.write(content)
+        tmp.write(pdf_bytes)
         tmp_path = tmp.name
 
     try:
@@ -448,16 +669,17 @@ async def upload_law_pdf(
         if not law_id:
             law_id = re.sub(r"[^a-zA-Z0-9가-힣]", "_", law_name)[:50]
 
-        # 1. PDF 텍스트 추출
-        text = _extract_text_from_pdf(tmp_path)
+        # 1. PDF 텍스트 추출 + 반복 머리말/꼬리말 제거
+        pages, boilerplate = BoilerplateStripper().strip(_extract_pages_from_pdf(tmp_path))
+        text = "\n".join(pages)
         if not text.strip():
             raise HTTPException(status_code=400, detail="PDF에서 텍스트를 추출할 수 없습니다")
 
         # 2. 조문 파싱
         articles = _parse_law_articles(text, law_name, law_id)
 
-        # 3. 청킹
-        chunker = LawChunker()
+        # 3. 청킹 (임베딩 모델 토큰 예산 기준)
+        chunker = LawChunker.from_embedder(embedder)
         all_chunks: List[LawChunk] = []
         for article in articles:
             chunks = chunker.chunk_article(
@@ -475,6 +697,9 @@ async def upload_law_pdf(
                 detail="파싱된 조문이 없습니다. PDF 형식을 확인해주세요."
             )
 
+        # 근사 중복 청크 제거
+        all_chunks, dedup = MinHashDeduplicator().deduplicate(all_chunks)
+
         # 4. 임베딩 생성 + ChromaDB 저장
         vector_store.add_chunks(all_chunks)
 
@@ -483,38 +708,27 @@ async def upload_law_pdf(
         embeddings = embedder.embed_documents(texts)
         supabase_result = _store_to_supabase(all_chunks, embeddings)
 
-        # 6. BM25 인덱스 재구축
-        if retriever is not None:
-            stats = vector_store.get_stats()
-            total_docs = stats["total_documents"]
-            documents = []
-            batch_size = 500
-            offset = 0
-            while offset < total_docs:
-                result = vector_store.collection.get(
-                    limit=batch_size,
-                    offset=offset,
-                    include=["documents", "metadatas"],
-                )
-                if not result["documents"]:
-                    break
-                for doc, metadata in zip(result["documents"], result["metadatas"]):
-                    documents.append({
-                        "id": metadata.get("chunk_id", ""),
-                        "content": doc,
-                        "metadata": metadata,
-                    })
-                offset += batch_size
-            retriever.build_bm25_index(documents)
+        # 6. 새 인덱스 스냅샷 구축 후 교체
+        generation = _refresh_index() if retriever is not None else None
 
         return {
             "status": "success",
             "law_name": law_name,
             "law_id": law_id,
+            "corpus_generation": generation,
             "stats": {
                 "total_text_length": len(text),
                 "articles_found": len(articles),
                 "chunks_created": len(all_chunks),
+                "boilerplate": {
+                    "lines_removed": boilerplate.lines_removed,
+                    "chars_removed": boilerplate.chars_before - boilerplate.chars_after,
+                    "shrink_ratio": round(boilerplate.shrink_ratio, 4),
+                },
+                "dedup": {
+                    "duplicates_removed": dedup.duplicates_removed,
+                    "shrink_ratio": round(dedup.shrink_ratio, 4),
+                },
                 "articles": [
                     {"article_number": a["article_number"], "title": a["title"]}
                     for a in articles[:20]
@@ -526,5 +740,39 @@ async def upload_law_pdf(
         os.unlink(tmp_path)
 
 
+@app.post("/upload")
+async def upload_law_pdf(
+    file: UploadFile = File(...),
+    law_name: str = Form(...),
+    law_id: str = Form(""),
+):
+    """
+    법령 PDF 업로드 → 파싱 → 청킹 → 임베딩 → 저장
+
+    전체 파이프라인을 자동으로 수행합니다.
+    무거운 작업은 워커 스레드에서 실행하여 이벤트 루프(검색 요청)를 막지 않고,
+    업로드는 한 번에 하나씩 처리하여 인덱스 스냅샷이 세대 순서대로 교체되도록 합니다.
+
+    fork 서버 모드(serve.py)에서는 409: 잠금과 스냅샷 교체가 워커 프로세스마다 따로라
+    다른 워커는 이전 인덱스로 계속 응답하므로, load_pdfs_to_rag.py로 적재 후 재시작합니다.
+    """
+    if _fork_worker:
+        raise HTTPException(
+            status_code=409,
+            detail="fork 서버 모드에서는 업로드를 지원하지 않습니다. "
+                   "load_pdfs_to_rag.py로 적재한 뒤 서버를 재시작해주세요",
+        )
+
+    if not file.filename or not file.filename.lower().endswith(".pdf"):
+        raise HTTPException(status_code=400, detail="PDF 파일만 업로드 가능합니다")
+
+    if embedder is None or vector_store is None:
+        raise HTTPException(status_code=503, detail="RAG 엔진이 초기화되지 않았습니다")
+
+    content = await file.read()
+    async with _ingest_lock:
+        return await asyncio.to_thread(_ingest_pdf, content, law_name, law_id)
+
+
 if __name__ == "__main__":
     uvicorn.run("main:app", host="0.0.0.0", port=8000, reload=True)
@@ -0,0 +1,205 @@
+"""
+fork 서버 모드 (모델/인덱스를 워커 간 copy-on-write 공유)
+
+`uvicorn main:app --workers N`은 워커마다 임베딩 모델을 로드하고 BM25 인덱스를
+따로 구축하므로 메모리가 워커 수에 비례합니다. 이 스크립트는
+1. 부모 프로세스에서 모델 로드 → 문서 로드 → BM25 구축 → 워밍업을 한 번만 수행하고
+2. gc.freeze()로 기존 객체를 GC 추적 대상에서 빼 (GC가 페이지를 건드려 복사되는 것 방지)
+3. 리슨 소켓을 연 뒤 워커를 fork하여 읽기 전용 페이지를 공유합니다.
+
+ChromaDB 연결(SQLite)은 fork를 넘을 수 없어 워커마다 다시 엽니다.
+워커가 비정상 종료하면 부모가 같은 초기화 상태에서 다시 fork합니다.
+
+제약: /upload는 409를 반환합니다. 업로드 잠금과 인덱스 스냅샷 교체는 프로세스마다 따로라
+업로드를 처리한 워커만 새 인덱스를 쓰고, 다른 워커와 다시 fork된 워커는 ChromaDB에 새 벡터가
+들어간 뒤에도 부모의 이전 스냅샷으로 응답하며, 워커들이 같은 ChromaDB 디렉터리에 동시에 쓸 수
+있기 때문입니다. 새 법령은 load_pdfs_to_rag.py로 적재한 뒤 서버를 재시작하세요.
+워커별 RSS/PSS는 주기적으로 출력되며, 각 워커의 /metrics(rag_process_memory_bytes)에서도 확인할 수 있습니다.
+
+사용법:
+    python serve.py --workers 4
+    python serve.py --workers 4 --port 8000 --torch-threads 1 --report-interval 60
+"""
+
+import argparse
+import gc
+import os
+import signal
+import socket
+import sys
+import time
+from typing import Dict
+
+sys.path.insert(0, os.path.dirname(__file__))
+
+from src.monitoring import process_memory
+
+
+def _format_mb(value) -> str:
+    return f"{value / 1024 / 1024:8.1f}" if value is not None else "       -"
+
+
+class ForkServer:
+    """사전 초기화된 부모에서 uvicorn 워커를 fork하는 서버"""
+
+    def __init__(
+        self,
+        host: str = "0.0.0.0",
+        port: int = 8000,
+        workers: int = 2,
+        report_interval: float = 60.0,
+        log_level: str = "info"
+    ):
+        self.host = host
+        self.port = port
+        self.workers = workers
+        self.report_interval = report_interval
+        self.log_level = log_level
+
+        self.sock = None
+        self.children: Dict[int, int] = {}  # pid → 워커 번호
+        self.shutting_down = False
+
+    def preload(self) -> None:
+        """부모에서 엔진 초기화 후 GC 동결"""
+        import main
+
+        main._initialize_engine()
+
+        gc.collect()
+        gc.freeze()
+        print(f"🧊 gc.freeze(): {gc.get_freeze_count():,}개 객체 동결 (copy-on-write 공유)")
+
+    def bind(self) -> None:
+        self.sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+        self.sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+        self.sock.bind((self.host, self.port))
+        self.sock.listen(2048)
+        self.sock.set_inheritable(True)
+
+    def spawn(self, worker_id: int) -> None:
+        pid = os.fork()
+        if pid:
+            self.children[pid] = worker_id
+            return
+
+        # 자식 프로세스
+        signal.signal(signal.SIGTERM, signal.SIG_DFL)
+        signal.signal(signal.SIGINT, signal.SIG_DFL)
+        try:
+            self._run_worker()
+            code = 0
+        except BaseException:
+            import traceback
+            traceback.print_exc()
+            code = 1
+        os._exit(code)
+
+    def _run_worker(self) -> None:
+        import uvicorn
+        import main
+
+        main.reopen_after_fork()
+
+        config = uvicorn.Config(main.app, log_level=self.log_level, lifespan="on")
+        uvicorn.Server(config).run(sockets=[self.sock])
+
+    def report_memory(self) -> None:
+        parent = process_memory()
+        print(f"\n{'process':<14} {'pid':>8} {'RSS(MB)':>8} {'PSS(MB)':>8} {'shared':>8} {'private':>8}")
+        rows = [("parent", os.getpid(), parent)]
+        rows += [(f"worker-{wid}", pid, process_memory(pid)) for pid, wid in sorted(self.children.items())]
+        for name, pid, mem in rows:
+            print(
+                f"{name:<14} {pid:>8} {_format_mb(mem.get('rss'))} {_format_mb(mem.get('pss'))} "
+                f"{_format_mb(mem.get('shared'))} {_format_mb(mem.get('private'))}"
+            )
+
+    def _stop(self, signum, frame) -> None:
+        self.shutting_down = True
+
+    def run(self) -> None:
+        self.preload()
+        self.bind()
+
+        signal.signal(signal.SIGTERM, self._stop)
+        signal.signal(signal.SIGINT, self._stop)
+
+        for worker_id in range(self.workers):
+            self.spawn(worker_id)
+        print(f"🚀 {self.workers}개 워커 시작: http://{self.host}:{self.port}")
+
+        next_report = time.monotonic() + min(5.0, self.report_interval)
+        while not self.shutting_down:
+            try:
+                pid, status = os.waitpid(-1, os.WNOHANG)
+            except ChildProcessError:
+                pid, status = 0, 0
+
+            if pid and pid in self.children:
+                worker_id = self.children.pop(pid)
+                print(f"⚠️ worker-{worker_id} (pid {pid}) 종료 (status {status}) → 재시작")
+                self.spawn(worker_id)
+                continue
+
+            if self.report_interval > 0 and time.monotonic() >= next_report:
+                self.report_memory()
+                next_report = time.monotonic() + self.report_interval
+
+            time.sleep(0.5)
+
+        self.shutdown()
+
+    def shutdown(self, timeout: float = 30.0) -> None:
+        print("\n🛑 워커 종료 중...")
+        for pid in list(self.children):
+            try:
+                os.kill(pid, signal.SIGTERM)
+            except ProcessLookupError:
+                pass
+
+        deadline = time.monotonic() + timeout
+        while self.children and time.monotonic() < deadline:
+            try:
+                pid, _ = os.waitpid(-1, os.WNOHANG)
+            except ChildProcessError:
+                break
+            if pid:
+                self.children.pop(pid, None)
+            else:
+                time.sleep(0.1)
+
+        for pid in list(self.children):
+            os.kill(pid, signal.SIGKILL)
+        if self.sock is not None:
+            self.sock.close()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="fork 서버 모드 (모델/인덱스 공유)")
+    parser.add_argument("--host", default="0.0.0.0")
+    parser.add_argument("--port", type=int, default=8000)
+    parser.add_argument("--workers", type=int, default=2)
+    parser.add_argument(
+        "--torch-threads", type=int, default=1,
+        help="워커당 torch 스레드 수 (fork 전에 설정, OpenMP 스레드 풀 fork 문제 방지)"
+    )
+    parser.add_argument("--report-interval", type=float, default=60.0, help="워커별 메모리 출력 주기 (초, 0이면 끔)")
+    parser.add_argument("--log-level", default="info")
+    args = parser.parse_args()
+
+    if args.torch_threads > 0:
+        import torch
+        torch.set_num_threads(args.torch_threads)
+
+    ForkServer(
+        host=args.host,
+        port=args.port,
+        workers=args.workers,
+        report_interval=args.report_interval,
+        log_level=args.log_level,
+    ).run()
+
+
+if __name__ == "__main__":
+    main()
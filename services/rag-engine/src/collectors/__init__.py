@@ -1,6 +1,14 @@
 """법령 수집 모듈"""
 
 from .law_api_client import LawAPIClient, LawInfo
+from .async_law_api_client import AsyncLawAPIClient, TokenBucket, crawl_laws
+from .incremental_collector import (
+    IncrementalCollector,
+    SyncStateStore,
+    SyncReport,
+    article_hash
+)
+from .pdf_cleaner import BoilerplateStripper, BoilerplateReport
 from .law_parser import (
     LawParser,
     ParsedLaw,
@@ -14,6 +22,15 @@ from .law_parser import (
 __all__ = [
     'LawAPIClient',
     'LawInfo',
+    'AsyncLawAPIClient',
+    'TokenBucket',
+    'crawl_laws',
+    'IncrementalCollector',
+    'SyncStateStore',
+    'SyncReport',
+    'article_hash',
+    'BoilerplateStripper',
+    'BoilerplateReport',
     'LawParser',
     'ParsedLaw',
     'LawArticle',
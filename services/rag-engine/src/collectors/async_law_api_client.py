@@ -0,0 +1,321 @@
+"""
+국가법령정보센터 비동기 크롤러
+
+LawAPIClient의 요청 파라미터/XML 파싱을 그대로 재사용하면서
+- httpx.AsyncClient 커넥션 풀 재사용
+- 세마포어 기반 동시 요청 수 제한
+- 토큰 버킷 기반 초당 요청 수 제한 (politeness)
+- tenacity 지수 백오프 재시도 (429/5xx, 네트워크 오류)
+- numOfRows 단위 자동 페이지네이션
+을 제공합니다.
+"""
+
+import asyncio
+import logging
+import math
+import time
+from typing import Dict, Iterable, List, Optional
+
+import httpx
+from tenacity import (
+    AsyncRetrying,
+    retry_if_exception,
+    stop_after_attempt,
+    wait_exponential,
+)
+
+from .law_api_client import LawAPIClient, LawInfo
+
+logger = logging.getLogger(__name__)
+
+# 재시도 대상 HTTP 상태 코드
+RETRYABLE_STATUS = {429, 500, 502, 503, 504}
+
+
+def _is_retryable(exc: BaseException) -> bool:
+    """재시도 가능한 오류 여부"""
+    if isinstance(exc, httpx.HTTPStatusError):
+        return exc.response.status_code in RETRYABLE_STATUS
+    return isinstance(exc, httpx.TransportError)
+
+
+class TokenBucket:
+    """비동기 토큰 버킷 (초당 요청 수 제한)"""
+
+    def __init__(self, rate: float, capacity: Optional[float] = None):
+        """
+        Args:
+            rate: 초당 충전되는 토큰 수 (0 이하이면 제한 없음)
+            capacity: 버킷 용량 (순간 최대 요청 수, 기본값 max(1, rate))
+        """
+        self.rate = rate
+        self.capacity = capacity if capacity is not None else max(1.0, rate)
+        self._tokens = self.capacity
+        self._updated = time.monotonic()
+        self._lock = asyncio.Lock()
+
+    async def acquire(self) -> None:
+        """토큰 1개를 얻을 때까지 대기"""
+        if self.rate <= 0:
+            return
+
+        async with self._lock:
+            while True:
+                now = time.monotonic()
+                self._tokens = min(
+                    self.capacity, self._tokens + (now - self._updated) * self.rate
+                )
+                self._updated = now
+
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+
+                await asyncio.sleep((1 - self._tokens) / self.rate)
+
+
+class AsyncLawAPIClient(LawAPIClient):
+    """국가법령정보센터 비동기 API 클라이언트 (async with 블록 안에서 사용)"""
+
+    def __init__(
+        self,
+        api_key: Optional[str] = None,
+        base_url: Optional[str] = None,
+        max_concurrency: int = 4,
+        requests_per_second: float = 5.0,
+        max_retries: int = 3,
+        backoff_base: float = 0.5,
+        timeout: float = 30.0,
+        transport: Optional[httpx.AsyncBaseTransport] = None,
+    ):
+        """
+        Args:
+            api_key: API 인증키 (환경변수 LAW_API_KEY에서 자동 로드)
+            base_url: API 기본 URL (테스트용 목 서버 지정 시 사용)
+            max_concurrency: 동시 요청 수 상한 (커넥션 풀 크기와 동일)
+            requests_per_second: 초당 요청 수 상한 (0 이하이면 제한 없음)
+            max_retries: 요청당 최대 시도 횟수
+            backoff_base: 지수 백오프 기본 대기 시간 (초)
+            timeout: 요청 타임아웃 (초)
+            transport: httpx 트랜스포트 (테스트용 MockTransport 주입)
+        """
+        super().__init__(api_key=api_key, base_url=base_url)
+
+        self.max_concurrency = max_concurrency
+        self.max_retries = max_retries
+        self.backoff_base = backoff_base
+        self.timeout = timeout
+
+        self._transport = transport
+        self._semaphore = asyncio.Semaphore(max_concurrency)
+        self._bucket = TokenBucket(requests_per_second)
+        self._client: Optional[httpx.AsyncClient] = None
+
+        # 실제 전송된 HTTP 요청 수 (재시도 포함)
+        self.request_count = 0
+
+    async def __aenter__(self) -> "AsyncLawAPIClient":
+        self._client = httpx.AsyncClient(
+            timeout=self.timeout,
+            limits=httpx.Limits(
+                max_connections=self.max_concurrency,
+                max_keepalive_connections=self.max_concurrency,
+            ),
+            transport=self._transport,
+        )
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        await self.aclose()
+
+    async def aclose(self) -> None:
+        """커넥션 풀 종료"""
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
+
+    async def _get(self, url: str, params: Dict) -> str:
+        """동시성/속도 제한과 재시도를 적용한 GET 요청"""
+        if self._client is None:
+            raise RuntimeError("AsyncLawAPIClient는 'async with' 블록 안에서 사용해야 합니다")
+
+        async for attempt in AsyncRetrying(
+            stop=stop_after_attempt(self.max_retries),
+            wait=wait_exponential(multiplier=self.backoff_base, max=10),
+            retry=retry_if_exception(_is_retryable),
+            reraise=True,
+        ):
+            with attempt:
+                async with self._semaphore:
+                    await self._bucket.acquire()
+                    self.request_count += 1
+                    response = await self._client.get(url, params=params)
+                    response.raise_for_status()
+                    return response.text
+
+    async def search_laws(
+        self,
+        keyword: str,
+        law_type: Optional[str] = None,
+        num_of_rows: int = 100,
+        max_pages: Optional[int] = None,
+    ) -> List[LawInfo]:
+        """
+        법령 검색 (전체 페이지 자동 순회)
+
+        Args:
+            keyword: 검색 키워드
+            law_type: 법령 구분 (법률/대통령령/총리령/부령)
+            num_of_rows: 페이지당 결과 수 (최대 100)
+            max_pages: 최대 페이지 수 (None이면 totalCnt 기준 전체)
+
+        Returns:
+            검색된 법령 목록
+        """
+        url = f"{self.base_url}/lawSearchList.do"
+        rows = min(num_of_rows, 100)
+
+        try:
+            first_page = await self._get(url, self._search_params(keyword, law_type, rows, 1))
+        except httpx.HTTPError as e:
+            logger.error(f"Law search failed for keyword '{keyword}': {e}")
+            return []
+
+        laws = self._parse_search_results(first_page)
+
+        total_pages = max(1, math.ceil(self._parse_total_count(first_page) / rows))
+        if max_pages is not None:
+            total_pages = min(total_pages, max_pages)
+
+        if total_pages > 1:
+            pages = await asyncio.gather(
+                *(
+                    self._get(url, self._search_params(keyword, law_type, rows, page_no))
+                    for page_no in range(2, total_pages + 1)
+                ),
+                return_exceptions=True,
+            )
+
+            for page_no, page in enumerate(pages, 2):
+                if isinstance(page, Exception):
+                    logger.error(f"Law search page {page_no} failed for keyword '{keyword}': {page}")
+                    continue
+                laws.extend(self._parse_search_results(page))
+
+        return laws
+
+    async def get_law_detail(self, law_id: str) -> Optional[Dict]:
+        """
+        법령 상세 정보 조회
+
+        Args:
+            law_id: 법령일련번호 (MST)
+
+        Returns:
+            법령 상세 정보 (조문, 부칙 등)
+        """
+        url = f"{self.base_url}/lawService.do"
+
+        try:
+            xml_text = await self._get(url, self._detail_params(law_id))
+        except httpx.HTTPError as e:
+            logger.error(f"Law detail fetch failed (ID: {law_id}): {e}")
+            return None
+
+        return self._parse_law_detail(xml_text)
+
+    async def get_enforcement_rules(self, law_name: str) -> List[LawInfo]:
+        """특정 법률의 시행령, 시행규칙 동시 조회"""
+        decrees, rules = await asyncio.gather(
+            self.search_laws(keyword=law_name, law_type="대통령령"),
+            self.search_laws(keyword=law_name, law_type="부령"),
+        )
+        return decrees + rules
+
+    async def discover(
+        self, law_names: Iterable[str], include_enforcement_rules: bool = True
+    ) -> List[LawInfo]:
+        """
+        대상 법률과 그 시행령/시행규칙 목록을 동시 검색 (상세 조회 없음)
+
+        Args:
+            law_names: 대상 법률명 목록 (예: law_config.yaml의 target_laws)
+            include_enforcement_rules: 시행령/시행규칙 포함 여부
+
+        Returns:
+            law_id 기준으로 중복 제거된 법령 목록
+        """
+        law_names = list(law_names)
+
+        searches = []
+        for law_name in law_names:
+            searches.append(self.search_laws(law_name))
+            if include_enforcement_rules:
+                searches.append(self.get_enforcement_rules(law_name))
+
+        search_results = await asyncio.gather(*searches)
+
+        # 법령명이 대상 법률명으로 시작하는 결과만 law_id 기준으로 중복 제거
+        targets = [self._normalize_name(name) for name in law_names]
+        unique_laws: Dict[str, LawInfo] = {}
+        for laws in search_results:
+            for law in laws:
+                if any(self._normalize_name(law.law_name).startswith(t) for t in targets):
+                    unique_laws.setdefault(law.law_id, law)
+
+        found = [self._normalize_name(law.law_name) for law in unique_laws.values()]
+        for law_name, target in zip(law_names, targets):
+            if not any(name.startswith(target) for name in found):
+                logger.warning(f"No laws found for target '{law_name}' (check the official law name)")
+
+        return list(unique_laws.values())
+
+    async def get_law_details(self, law_ids: Iterable[str]) -> List[Dict]:
+        """여러 법령 상세 정보를 동시 조회 (실패한 항목은 제외)"""
+        details = await asyncio.gather(
+            *(self.get_law_detail(law_id) for law_id in law_ids)
+        )
+        return [detail for detail in details if detail]
+
+    async def crawl(
+        self, law_names: Iterable[str], include_enforcement_rules: bool = True
+    ) -> List[Dict]:
+        """
+        대상 법률과 그 시행령/시행규칙을 하나의 동시 크롤링으로 수집
+
+        Args:
+            law_names: 대상 법률명 목록 (예: law_config.yaml의 target_laws)
+            include_enforcement_rules: 시행령/시행규칙 포함 여부
+
+        Returns:
+            법령 상세 정보 목록 (get_law_detail 반환값)
+        """
+        laws = await self.discover(law_names, include_enforcement_rules)
+
+        logger.info(f"Crawling {len(laws)} laws (concurrency={self.max_concurrency})")
+
+        return await self.get_law_details(law.law_id for law in laws)
+
+    @staticmethod
+    def _normalize_name(name: str) -> str:
+        """법령명 비교용 정규화 (공백 제거)"""
+        return "".join(name.split())
+
+
+def crawl_laws(law_names: Iterable[str], **client_kwargs) -> List[Dict]:
+    """
+    동기 코드에서 사용하는 크롤링 진입점
+
+    Args:
+        law_names: 대상 법률명 목록
+        **client_kwargs: AsyncLawAPIClient 생성 인자
+
+    Returns:
+        법령 상세 정보 목록
+    """
+
+    async def _run() -> List[Dict]:
+        async with AsyncLawAPIClient(**client_kwargs) as client:
+            return await client.crawl(law_names)
+
+    return asyncio.run(_run())
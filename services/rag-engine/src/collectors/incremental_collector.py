@@ -0,0 +1,332 @@
+"""
+증분 법령 수집기
+
+law_config.yaml의 schedule(incremental: daily, full_refresh: monthly)을 구현합니다.
+
+동작 방식:
+1. 검색 API로 대상 법령 목록과 공포일자/시행일자만 조회 (상세 조회 없음)
+2. 저장된 동기화 상태와 날짜를 비교해 변경된 법령만 상세 조회
+3. 변경된 법령을 재청킹하고 조문별 콘텐츠 해시를 비교
+4. 해시가 달라진 조문만 upsert, 사라진 조문만 delete
+5. 검색 결과에서 사라진 법령(폐지, 대상 제외)의 청크와 상태 삭제
+
+조문은 가지번호까지 포함한 번호(제10조 / 제10조의2)로 구분합니다.
+"""
+
+import asyncio
+import hashlib
+import json
+import logging
+import os
+import time
+from dataclasses import dataclass, field, asdict
+from datetime import datetime, timedelta
+from typing import Dict, Iterable, List, Optional
+
+from .law_api_client import LawInfo
+from .law_parser import LawParser, LawArticle
+from ..embeddings.chunker import LawChunker, LawChunk
+
+logger = logging.getLogger(__name__)
+
+# law_config.yaml schedule 값 → 일 단위
+SCHEDULE_DAYS = {"daily": 1, "weekly": 7, "monthly": 30}
+
+
+@dataclass
+class ArticleState:
+    """조문별 동기화 상태"""
+    content_hash: str
+    chunk_ids: List[str] = field(default_factory=list)
+
+
+@dataclass
+class LawSyncState:
+    """법령별 동기화 상태"""
+    law_id: str
+    law_name: str
+    law_type: str
+    promulgation_date: Optional[str] = None
+    enforcement_date: Optional[str] = None
+    articles: Dict[str, ArticleState] = field(default_factory=dict)
+    synced_at: Optional[str] = None
+
+
+@dataclass
+class SyncReport:
+    """동기화 결과 요약"""
+    full_refresh: bool = False
+    laws_checked: int = 0
+    laws_changed: int = 0
+    laws_removed: int = 0
+    articles_upserted: int = 0
+    articles_deleted: int = 0
+    articles_unchanged: int = 0
+    chunks_upserted: int = 0
+    chunks_deleted: int = 0
+    # 검색 결과가 하나도 없는 대상 법률명 (법령명 오기 등)
+    targets_not_found: List[str] = field(default_factory=list)
+    elapsed_seconds: float = 0.0
+
+
+class SyncStateStore:
+    """동기화 상태 JSON 파일 저장소"""
+
+    def __init__(self, path: str = "./sync_state.json"):
+        """
+        Args:
+            path: 상태 파일 경로
+        """
+        self.path = path
+        self.laws: Dict[str, LawSyncState] = {}
+        self.last_full_refresh: Optional[str] = None
+        self.load()
+
+    def load(self) -> None:
+        """상태 파일 로드 (없으면 빈 상태)"""
+        if not os.path.exists(self.path):
+            return
+
+        with open(self.path, "r", encoding="utf-8") as f:
+            data = json.load(f)
+
+        self.last_full_refresh = data.get("last_full_refresh")
+        self.laws = {}
+        for key, law in data.get("laws", {}).items():
+            articles = {
+                number: ArticleState(**article)
+                for number, article in law.pop("articles", {}).items()
+            }
+            self.laws[key] = LawSyncState(**law, articles=articles)
+
+    def save(self) -> None:
+        """상태 파일 저장 (임시 파일에 쓴 뒤 교체)"""
+        data = {
+            "last_full_refresh": self.last_full_refresh,
+            "laws": {key: asdict(law) for key, law in self.laws.items()},
+        }
+
+        tmp_path = f"{self.path}.tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(data, f, ensure_ascii=False, indent=2)
+        os.replace(tmp_path, self.path)
+
+
+def article_hash(article: LawArticle) -> str:
+    """조문 콘텐츠 해시 (번호, 제목, 본문, 항/호/목 내용 기준)"""
+    hasher = hashlib.sha256()
+    parts = [article.full_number, article.title or "", article.content]
+    for paragraph in article.paragraphs:
+        parts.extend([paragraph.number, paragraph.content])
+        for item in paragraph.items:
+            parts.extend([item.number, item.content])
+            for subitem in item.subitems:
+                parts.extend([subitem.number, subitem.content])
+
+    for part in parts:
+        hasher.update(part.encode("utf-8"))
+        hasher.update(b"\x1f")
+
+    return hasher.hexdigest()
+
+
+class IncrementalCollector:
+    """날짜/해시 기반 증분 법령 수집기"""
+
+    def __init__(
+        self,
+        client,
+        vector_store,
+        state_store: Optional[SyncStateStore] = None,
+        chunker: Optional[LawChunker] = None,
+        full_refresh_days: int = SCHEDULE_DAYS["monthly"],
+    ):
+        """
+        Args:
+            client: AsyncLawAPIClient (async with 블록 안에서 전달)
+            vector_store: upsert_chunks/delete_chunks를 제공하는 벡터 스토어
+            state_store: 동기화 상태 저장소
+            chunker: 청킹기 (None이면 기본 설정)
+            full_refresh_days: 전체 재수집 주기 (일)
+        """
+        self.client = client
+        self.vector_store = vector_store
+        self.state = state_store or SyncStateStore()
+        self.chunker = chunker or LawChunker()
+        self.parser = LawParser()
+        self.full_refresh_days = full_refresh_days
+
+    def is_full_refresh_due(self, now: Optional[datetime] = None) -> bool:
+        """전체 재수집 주기 도래 여부"""
+        if not self.state.last_full_refresh:
+            return True
+
+        now = now or datetime.now()
+        last = datetime.fromisoformat(self.state.last_full_refresh)
+        return now - last >= timedelta(days=self.full_refresh_days)
+
+    async def sync(self, law_names: Iterable[str], force_full: bool = False) -> SyncReport:
+        """
+        증분 동기화 실행
+
+        Args:
+            law_names: 대상 법률명 목록
+            force_full: True이면 날짜 비교 없이 모든 법령을 재수집
+
+        Returns:
+            동기화 결과 요약
+        """
+        start = time.perf_counter()
+        now = datetime.now()
+        report = SyncReport(full_refresh=force_full or self.is_full_refresh_due(now))
+
+        # 1. 법령 목록 + 날짜 조회
+        law_names = list(law_names)
+        laws = await self.client.discover(law_names)
+        report.laws_checked = len(laws)
+
+        found = [self._law_key(law.law_name) for law in laws]
+        for law_name in law_names:
+            if not any(key.startswith(self._law_key(law_name)) for key in found):
+                logger.warning(f"No laws discovered for target '{law_name}'")
+                report.targets_not_found.append(law_name)
+
+        # 2. 날짜가 바뀐 법령만 선별
+        changed = [law for law in laws if report.full_refresh or self._dates_changed(law)]
+        report.laws_changed = len(changed)
+
+        if changed:
+            # 3. 변경된 법령만 동시 상세 조회
+            details = await asyncio.gather(
+                *(self.client.get_law_detail(law.law_id) for law in changed)
+            )
+
+            for law, detail in zip(changed, details):
+                if detail is None:
+                    logger.warning(f"Skipping {law.law_name}: detail fetch failed")
+                    continue
+                self._apply_law(law, detail, report, now)
+
+        # 4. 검색 결과에서 사라진 법령 삭제
+        #    (검색 결과가 하나도 없는 대상의 법령은 일시적 검색 실패일 수 있어 유지)
+        current = {self._law_key(law.law_name) for law in laws}
+        unresolved = [self._law_key(name) for name in report.targets_not_found]
+        for key in list(self.state.laws):
+            if key not in current and not any(key.startswith(target) for target in unresolved):
+                self._remove_law(key, report)
+
+        if report.full_refresh:
+            self.state.last_full_refresh = now.isoformat()
+
+        self.state.save()
+
+        report.elapsed_seconds = time.perf_counter() - start
+        logger.info(f"Incremental sync finished: {report}")
+
+        return report
+
+    def _dates_changed(self, law: LawInfo) -> bool:
+        """저장된 공포일자/시행일자와 비교"""
+        previous = self.state.laws.get(self._law_key(law.law_name))
+        if previous is None:
+            return True
+
+        return (
+            previous.enforcement_date != law.enforcement_date
+            or previous.promulgation_date != law.promulgation_date
+        )
+
+    def _apply_law(self, law: LawInfo, detail: Dict, report: SyncReport, now: datetime) -> None:
+        """변경된 법령을 재청킹하고 조문 해시 차이만 벡터 스토어에 반영"""
+        key = self._law_key(law.law_name)
+        previous = self.state.laws.get(key)
+        previous_articles = previous.articles if previous else {}
+
+        parsed = self.parser.parse_from_api_response(detail)
+
+        new_articles: Dict[str, ArticleState] = {}
+        upsert_chunks: List[LawChunk] = []
+        delete_ids: List[str] = []
+
+        for article in parsed.articles:
+            number = article.full_number
+            content_hash = article_hash(article)
+            old = previous_articles.get(number)
+
+            if old is not None and old.content_hash == content_hash:
+                new_articles[number] = old
+                report.articles_unchanged += 1
+                continue
+
+            chunks = self._chunk_article(law, article)
+            chunk_ids = [chunk.chunk_id for chunk in chunks]
+
+            upsert_chunks.extend(chunks)
+            if old is not None:
+                delete_ids.extend(cid for cid in old.chunk_ids if cid not in chunk_ids)
+
+            new_articles[number] = ArticleState(content_hash, chunk_ids)
+            report.articles_upserted += 1
+
+        # 삭제된 조문
+        for number, old in previous_articles.items():
+            if number not in new_articles:
+                delete_ids.extend(old.chunk_ids)
+                report.articles_deleted += 1
+
+        self.vector_store.delete_chunks(delete_ids)
+        self.vector_store.upsert_chunks(upsert_chunks)
+        report.chunks_deleted += len(delete_ids)
+        report.chunks_upserted += len(upsert_chunks)
+
+        self.state.laws[key] = LawSyncState(
+            law_id=law.law_id,
+            law_name=law.law_name,
+            law_type=law.law_type,
+            promulgation_date=law.promulgation_date,
+            enforcement_date=law.enforcement_date,
+            articles=new_articles,
+            synced_at=now.isoformat(),
+        )
+
+    def _remove_law(self, key: str, report: SyncReport) -> None:
+        """법령의 모든 청크와 동기화 상태 삭제"""
+        law = self.state.laws.pop(key)
+        chunk_ids = [cid for article in law.articles.values() for cid in article.chunk_ids]
+
+        logger.info(f"Removing {law.law_name}: no longer returned by discover")
+        self.vector_store.delete_chunks(chunk_ids)
+        report.laws_removed += 1
+        report.articles_deleted += len(law.articles)
+        report.chunks_deleted += len(chunk_ids)
+
+    def _chunk_article(self, law: LawInfo, article: LawArticle) -> List[LawChunk]:
+        """조문 청킹 (항/호 정보 포함, 목은 호 본문에 포함, 청크 ID는 가지번호 포함)"""
+        return self.chunker.chunk_article(
+            law_id=law.law_id,
+            law_name=law.law_name,
+            article_number=article.full_number,
+            title=article.title or "",
+            content=article.content,
+            paragraphs=[
+                {
+                    "number": p.number,
+                    "content": p.content,
+                    "items": [
+                        {
+                            "number": item.number,
+                            "content": " ".join(
+                                [item.content] + [f"{s.number} {s.content}" for s in item.subitems]
+                            ),
+                        }
+                        for item in p.items
+                    ],
+                }
+                for p in article.paragraphs
+            ],
+        )
+
+    @staticmethod
+    def _law_key(law_name: str) -> str:
+        """법령 상태 키 (법령일련번호는 개정마다 바뀌므로 법령명 사용)"""
+        return "".join(law_name.split())
@@ -8,10 +8,12 @@ import logging
 import os
 import requests
 import xml.etree.ElementTree as ET
-from typing import List, Dict, Optional
+from typing import Iterator, List, Dict, Optional
 from dataclasses import dataclass
 from datetime import datetime
 
+from .law_xml_parser import LawXMLStreamParser
+
 logger = logging.getLogger(__name__)
 
 
@@ -31,11 +33,13 @@ class LawAPIClient:
 
     BASE_URL = "https://apis.data.go.kr/1170000/law"
 
-    def __init__(self, api_key: Optional[str] = None):
+    def __init__(self, api_key: Optional[str] = None, base_url: Optional[str] = None):
         """
         Args:
             api_key: API 인증키 (환경변수 LAW_API_KEY에서 자동 로드)
+            base_url: API 기본 URL (테스트용 목 서버 지정 시 사용)
         """
+        self.base_url = (base_url or self.BASE_URL).rstrip("/")
         self.api_key = api_key or os.getenv("LAW_API_KEY")
         if not self.api_key:
             raise ValueError(
@@ -58,18 +62,8 @@ class LawAPIClient:
         Returns:
             검색된 법령 목록
         """
-        url = f"{self.BASE_URL}/lawSearchList.do"
-
-        params = {
-            "serviceKey": self.api_key,
-            "target": "law",
-            "query": keyword,
-            "numOfRows": min(display, 100),
-            "pageNo": 1,
-        }
-
-        if law_type:
-            params["법령구분"] = law_type
+        url = f"{self.base_url}/lawSearchList.do"
+        params = self._search_params(keyword, law_type, display)
 
         try:
             response = requests.get(url, params=params, timeout=30)
@@ -91,9 +85,8 @@ class LawAPIClient:
         Returns:
             법령 상세 정보 (조문, 부칙 등)
         """
-        url = f"{self.BASE_URL}/lawService.do"
-
-        params = {"OC": self.api_key, "target": "law", "MST": law_id, "type": "XML"}
+        url = f"{self.base_url}/lawService.do"
+        params = self._detail_params(law_id)
 
         try:
             response = requests.get(url, params=params, timeout=30)
@@ -123,6 +116,37 @@ class LawAPIClient:
 
         return enforcement_decree + enforcement_rules
 
+    def _search_params(
+        self, keyword: str, law_type: Optional[str], num_of_rows: int, page_no: int = 1
+    ) -> Dict:
+        """법령 검색 요청 파라미터 구성"""
+        params = {
+            "serviceKey": self.api_key,
+            "target": "law",
+            "query": keyword,
+            "numOfRows": min(num_of_rows, 100),
+            "pageNo": page_no,
+        }
+
+        if law_type:
+            params["법령구분"] = law_type
+
+        return params
+
+    def _detail_params(self, law_id: str) -> Dict:
+        """법령 상세 조회 요청 파라미터 구성"""
+        return {"OC": self.api_key, "target": "law", "MST": law_id, "type": "XML"}
+
+    def _parse_total_count(self, xml_text: str) -> int:
+        """검색 결과 XML에서 전체 건수(totalCnt) 추출"""
+        try:
+            root = ET.fromstring(xml_text)
+        except ET.ParseError:
+            return 0
+
+        total = self._get_text(root, "totalCnt")
+        return int(total) if total and total.isdigit() else 0
+
     def _parse_search_results(self, xml_text: str) -> List[LawInfo]:
         """XML 검색 결과 파싱"""
         laws = []
@@ -161,41 +185,36 @@ class LawAPIClient:
 
         return laws
 
-    def _parse_law_detail(self, xml_text: str) -> Optional[Dict]:
-        """XML 법령 상세 파싱"""
+    def stream_law_articles(self, law_id: str) -> Iterator[Dict]:
+        """
+        법령 조문을 HTTP 응답 스트림에서 바로 파싱하며 생성 (대형 법령용)
+
+        Args:
+            law_id: 법령일련번호 (MST)
+
+        Yields:
+            조문 레코드 (get_law_detail()의 articles 항목과 동일 형식)
+        """
+        url = f"{self.base_url}/lawService.do"
+
         try:
-            root = ET.fromstring(xml_text)
+            with requests.get(
+                url, params=self._detail_params(law_id), timeout=30, stream=True
+            ) as response:
+                response.raise_for_status()
+                response.raw.decode_content = True
+
+                yield from LawXMLStreamParser().iter_articles(response.raw)
+
+        except requests.RequestException as e:
+            logger.error(f"Law detail stream failed (ID: {law_id}): {e}")
+        except ET.ParseError as e:
+            logger.error(f"XML parse error: {e}")
 
-            # 기본 정보
-            law_info = {
-                "law_id": self._get_text(root, "법령일련번호"),
-                "law_name": self._get_text(root, "법령명한글"),
-                "law_type": self._get_text(root, "법령구분명"),
-                "promulgation_date": self._get_text(root, "공포일자"),
-                "enforcement_date": self._get_text(root, "시행일자"),
-                "articles": [],
-            }
-
-            # 조문 추출
-            for article in root.findall(".//조문"):
-                article_info = {
-                    "article_number": self._get_text(article, "조문번호"),
-                    "title": self._get_text(article, "조문제목"),
-                    "content": self._get_text(article, "조문내용"),
-                    "paragraphs": [],
-                }
-
-                # 항 추출
-                for paragraph in article.findall(".//항"):
-                    paragraph_info = {
-                        "paragraph_number": self._get_text(paragraph, "항번호"),
-                        "content": self._get_text(paragraph, "항내용"),
-                    }
-                    article_info["paragraphs"].append(paragraph_info)
-
-                law_info["articles"].append(article_info)
-
-            return law_info
+    def _parse_law_detail(self, xml_text: str) -> Optional[Dict]:
+        """XML 법령 상세 파싱 (iterparse 스트리밍 파서 사용)"""
+        try:
+            return LawXMLStreamParser().parse(xml_text)
 
         except ET.ParseError as e:
             logger.error(f"XML parse error: {e}")
@@ -47,6 +47,14 @@ class LawArticle:
     title: Optional[str]  # 조문 제목
     content: str  # 본문
     paragraphs: List[LawParagraph] = field(default_factory=list)
+    branch_number: str = ""  # 조문가지번호 (제10조의2 → '2')
+
+    @property
+    def full_number(self) -> str:
+        """가지번호까지 포함한 조문 번호 (제10조 / 제10조의2 구분)"""
+        if not self.branch_number:
+            return self.article_number
+        return f"{self.article_number}의{self.branch_number}"
 
 
 @dataclass
@@ -125,17 +133,32 @@ class LawParser:
     def _parse_article(self, article_data: Dict) -> LawArticle:
         """API 데이터에서 조문 파싱"""
         article = LawArticle(
-            article_number=article_data.get('article_number', ''),
+            article_number=article_data.get('article_number') or '',
             title=article_data.get('title'),
-            content=article_data.get('content', '')
+            content=article_data.get('content') or '',
+            branch_number=article_data.get('branch_number') or ''
         )
 
         # 항 파싱
         for paragraph_data in article_data.get('paragraphs', []):
             paragraph = LawParagraph(
-                number=paragraph_data.get('paragraph_number', ''),
-                content=paragraph_data.get('content', '')
+                number=paragraph_data.get('paragraph_number') or '',
+                content=paragraph_data.get('content') or ''
             )
+
+            # 호/목 파싱
+            for item_data in paragraph_data.get('items', []):
+                item = LawItem(
+                    number=item_data.get('item_number') or '',
+                    content=item_data.get('content') or ''
+                )
+                for subitem_data in item_data.get('subitems', []):
+                    item.subitems.append(LawSubitem(
+                        number=subitem_data.get('subitem_number') or '',
+                        content=subitem_data.get('content') or ''
+                    ))
+                paragraph.items.append(item)
+
             article.paragraphs.append(paragraph)
 
         return article
@@ -255,11 +278,11 @@ class LawParser:
         chunks = []
 
         # 짧은 조문은 전체를 하나의 청크로
-        full_content = f"{article.article_number} {article.title or ''}\n{article.content}"
+        full_content = f"{article.full_number} {article.title or ''}\n{article.content}"
 
         if len(full_content) < max_chunk_size:
             chunks.append({
-                'article_number': article.article_number,
+                'article_number': article.full_number,
                 'title': article.title,
                 'content': full_content,
                 'chunk_type': 'full_article'
@@ -267,10 +290,10 @@ class LawParser:
         else:
             # 긴 조문은 항 단위로 분할
             for paragraph in article.paragraphs:
-                chunk_content = f"{article.article_number} {paragraph.number}\n{paragraph.content}"
+                chunk_content = f"{article.full_number} {paragraph.number}\n{paragraph.content}"
 
                 chunks.append({
-                    'article_number': article.article_number,
+                    'article_number': article.full_number,
                     'paragraph_number': paragraph.number,
                     'content': chunk_content,
                     'chunk_type': 'paragraph'
@@ -0,0 +1,155 @@
+"""
+스트리밍 법령 XML 파서 (iterparse 기반)
+
+국가법령정보센터 법령 본문 XML을 한 번만 순회하면서
+조문 → 항 → 호 → 목 계층을 직계 자식 기준으로 추출합니다.
+
+- 조문 하나를 다 읽으면 레코드를 yield하고 해당 요소를 트리에서 제거
+- 재귀 탐색(.//tag)을 하지 않으므로 조문 수에 대해 선형 시간
+- 처리한 요소를 즉시 해제하므로 대형 법령도 메모리 사용량이 일정
+
+지원 구조:
+- <조문><조문번호/>...<항/></조문>                 (단순 응답)
+- <조문><조문단위><조문번호/>...<항/></조문단위></조문>  (law.go.kr 본문 응답)
+"""
+
+import io
+import xml.etree.ElementTree as ET
+from typing import BinaryIO, Dict, Iterator, List, Optional, Union
+
+# 조문 레코드를 구성하는 요소
+ARTICLE_TAGS = {"조문단위", "조문"}
+PARAGRAPH_TAG = "항"
+ITEM_TAG = "호"
+SUBITEM_TAG = "목"
+
+# 법령 기본 정보 태그 → law_info 키 (응답 형식별 태그명 모두 허용)
+HEADER_TAGS = {
+    "법령일련번호": "law_id",
+    "법령명한글": "law_name",
+    "법령명_한글": "law_name",
+    "법령구분명": "law_type",
+    "법종구분": "law_type",
+    "공포일자": "promulgation_date",
+    "시행일자": "enforcement_date",
+}
+
+# 조문여부가 "전문"인 조문단위는 장/절 제목이므로 제외
+HEADING_MARKER = "전문"
+
+
+def _child_text(elem: ET.Element, tag: str) -> Optional[str]:
+    """직계 자식 요소의 텍스트 추출"""
+    child = elem.find(tag)
+    if child is None or not child.text:
+        return None
+    text = child.text.strip()
+    return text or None
+
+
+class LawXMLStreamParser:
+    """iterparse 기반 법령 XML 스트리밍 파서"""
+
+    def __init__(self):
+        # 기본 정보는 순회 중 채워짐 (조문보다 앞에 위치)
+        self.law_info: Dict[str, Optional[str]] = {
+            key: None for key in set(HEADER_TAGS.values())
+        }
+
+    def iter_articles(self, source: Union[str, bytes, BinaryIO]) -> Iterator[Dict]:
+        """
+        조문 레코드를 순서대로 생성
+
+        Args:
+            source: XML 문자열/바이트 또는 바이너리 파일 객체 (HTTP 응답 스트림 포함)
+
+        Yields:
+            {"article_number", "branch_number", "title", "content", "paragraphs": [...]}
+
+        Raises:
+            xml.etree.ElementTree.ParseError: XML 형식 오류
+        """
+        if isinstance(source, str):
+            source = io.BytesIO(source.encode("utf-8"))
+        elif isinstance(source, bytes):
+            source = io.BytesIO(source)
+
+        stack: List[ET.Element] = []
+        article_depth = 0
+
+        for event, elem in ET.iterparse(source, events=("start", "end")):
+            if event == "start":
+                stack.append(elem)
+                if self._is_article(elem):
+                    article_depth += 1
+                continue
+
+            stack.pop()
+
+            if article_depth == 0:
+                key = HEADER_TAGS.get(elem.tag)
+                if key and self.law_info[key] is None and elem.text and elem.text.strip():
+                    self.law_info[key] = elem.text.strip()
+                continue
+
+            if not self._is_article(elem):
+                continue
+
+            article_depth -= 1
+
+            # <조문> 컨테이너 안의 <조문단위>는 이미 처리되었으므로 건너뜀
+            if elem.find("조문번호") is not None:
+                if _child_text(elem, "조문여부") != HEADING_MARKER:
+                    yield self._build_article(elem)
+
+            # 처리 완료된 요소를 트리에서 분리해 메모리 해제
+            elem.clear()
+            if stack:
+                stack[-1].remove(elem)
+
+    def parse(self, source: Union[str, bytes, BinaryIO]) -> Dict:
+        """
+        전체 법령을 LawAPIClient.get_law_detail() 형식으로 파싱
+
+        Raises:
+            xml.etree.ElementTree.ParseError: XML 형식 오류
+        """
+        articles = list(self.iter_articles(source))
+        return {**self.law_info, "articles": articles}
+
+    @staticmethod
+    def _is_article(elem: ET.Element) -> bool:
+        return elem.tag in ARTICLE_TAGS
+
+    def _build_article(self, elem: ET.Element) -> Dict:
+        """조문 요소 → 레코드 (직계 자식만 참조)"""
+        return {
+            "article_number": _child_text(elem, "조문번호"),
+            "branch_number": _child_text(elem, "조문가지번호"),
+            "title": _child_text(elem, "조문제목"),
+            "content": _child_text(elem, "조문내용"),
+            "paragraphs": [
+                self._build_paragraph(paragraph)
+                for paragraph in elem.iterfind(PARAGRAPH_TAG)
+            ],
+        }
+
+    def _build_paragraph(self, elem: ET.Element) -> Dict:
+        return {
+            "paragraph_number": _child_text(elem, "항번호"),
+            "content": _child_text(elem, "항내용"),
+            "items": [self._build_item(item) for item in elem.iterfind(ITEM_TAG)],
+        }
+
+    def _build_item(self, elem: ET.Element) -> Dict:
+        return {
+            "item_number": _child_text(elem, "호번호"),
+            "content": _child_text(elem, "호내용"),
+            "subitems": [
+                {
+                    "subitem_number": _child_text(subitem, "목번호"),
+                    "content": _child_text(subitem, "목내용"),
+                }
+                for subitem in elem.iterfind(SUBITEM_TAG)
+            ],
+        }
@@ -0,0 +1,110 @@
+"""
+PDF 반복 머리말/꼬리말 제거
+
+국가법령정보센터 PDF는 매 페이지 상단/하단에
+"법제처 3 국가법령정보센터", "[시행 2026. 1. 2.] [법률 제21065호 ...]",
+소관 부처 연락처 등이 반복됩니다.
+이 줄들이 조문 본문에 섞이면 인덱스 크기와 BM25 통계가 오염되므로
+여러 페이지에 반복되는 줄을 빈도 기반으로 찾아 조문 파싱 전에 제거합니다.
+"""
+
+import re
+from collections import Counter
+from dataclasses import dataclass, field
+from typing import List, Set, Tuple
+
+# 페이지 번호/날짜 등 숫자만 다른 줄을 같은 줄로 취급
+_DIGITS = re.compile(r"\d+")
+_SPACES = re.compile(r"\s+")
+
+
+@dataclass
+class BoilerplateReport:
+    """반복 줄 제거 결과"""
+    pages: int = 0
+    patterns: List[str] = field(default_factory=list)  # 제거된 줄 패턴 (정규화)
+    lines_removed: int = 0
+    chars_before: int = 0
+    chars_after: int = 0
+
+    @property
+    def shrink_ratio(self) -> float:
+        """제거된 문자 비율"""
+        if not self.chars_before:
+            return 0.0
+        return 1 - self.chars_after / self.chars_before
+
+
+class BoilerplateStripper:
+    """페이지 간 반복 줄(머리말/꼬리말) 제거기"""
+
+    def __init__(self, min_page_ratio: float = 0.5, edge_lines: int = 8, min_pages: int = 3):
+        """
+        Args:
+            min_page_ratio: 반복 줄로 판단할 최소 등장 페이지 비율
+            edge_lines: 페이지 상단/하단에서 검사할 줄 수 (본문 오탐 방지)
+            min_pages: 반복 판단에 필요한 최소 페이지 수
+        """
+        self.min_page_ratio = min_page_ratio
+        self.edge_lines = edge_lines
+        self.min_pages = min_pages
+
+    @staticmethod
+    def normalize(line: str) -> str:
+        """줄 정규화 (공백 축약, 숫자 치환)"""
+        return _DIGITS.sub("#", _SPACES.sub(" ", line).strip())
+
+    def _edge_indices(self, lines: List[str]) -> Set[int]:
+        """페이지 상단/하단 edge_lines개 (빈 줄 제외) 줄 위치"""
+        content = [i for i, line in enumerate(lines) if line.strip()]
+        return set(content[:self.edge_lines] + content[-self.edge_lines:])
+
+    def find_patterns(self, pages: List[str]) -> List[str]:
+        """여러 페이지의 상단/하단에 반복되는 줄 패턴 탐지"""
+        if len(pages) < self.min_pages:
+            return []
+
+        page_counts = Counter()
+        for page in pages:
+            lines = page.splitlines()
+            page_counts.update({self.normalize(lines[i]) for i in self._edge_indices(lines)})
+
+        threshold = max(2, self.min_page_ratio * len(pages))
+        return [pattern for pattern, count in page_counts.items() if count >= threshold]
+
+    def strip(self, pages: List[str]) -> Tuple[List[str], BoilerplateReport]:
+        """
+        반복 줄 제거
+
+        제거 대상은 각 페이지 상단/하단 edge_lines 안의 줄뿐입니다.
+        숫자를 "#"로 정규화하므로 본문 중간의 "<개정 2020. 1. 1.>" 같은 줄이
+        패턴과 같아 보여도 남겨 둡니다.
+
+        Args:
+            pages: 페이지별 추출 텍스트
+
+        Returns:
+            (정리된 페이지 목록, 제거 결과)
+        """
+        patterns = set(self.find_patterns(pages))
+        report = BoilerplateReport(
+            pages=len(pages),
+            patterns=sorted(patterns),
+            chars_before=sum(len(page) for page in pages),
+        )
+
+        cleaned_pages = []
+        for page in pages:
+            lines = page.splitlines()
+            edges = self._edge_indices(lines)
+            kept = []
+            for i, line in enumerate(lines):
+                if i in edges and self.normalize(line) in patterns:
+                    report.lines_removed += 1
+                    continue
+                kept.append(line)
+            cleaned_pages.append("\n".join(kept))
+
+        report.chars_after = sum(len(page) for page in cleaned_pages)
+
+        return cleaned_pages, report
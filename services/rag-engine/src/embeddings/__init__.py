@@ -2,11 +2,17 @@
 
 from .embedder import KoreanEmbedder
 from .chunker import LawChunker, LawChunk
-from .vector_store import VectorStore
+from .vector_store import VectorStore, HNSWConfig, IngestionReport, distance_to_similarity
+from .dedup import MinHashDeduplicator, DedupReport
 
 __all__ = [
     'KoreanEmbedder',
     'LawChunker',
     'LawChunk',
-    'VectorStore'
+    'VectorStore',
+    'HNSWConfig',
+    'IngestionReport',
+    'distance_to_similarity',
+    'MinHashDeduplicator',
+    'DedupReport'
 ]
@@ -7,11 +7,20 @@
 3. 별표: 독립된 청크로 처리
 4. 정의 조항: 별도 청크
 5. 중첩: 50 토큰
+
+토큰 모드 (LawChunker.from_embedder):
+- 임베딩 모델 토크나이저로 길이를 배치 측정
+- 조문 본문/항/호 단위를 모델 최대 시퀀스 길이까지 묶어 청크 구성
+- 청크 경계마다 직전 단위의 마지막 overlap 토큰을 중첩
+  (모델이 잘라내는 꼬리 텍스트 없이 긴 조문 전체가 임베딩에 반영됨)
 """
 
-from typing import List, Dict
+from typing import Callable, List, Dict, Optional, Tuple
 from dataclasses import dataclass
 
+# 텍스트 리스트 → 텍스트별 토큰 문자 오프셋 [(start, end), ...]
+TokenOffsetsFn = Callable[[List[str]], List[List[Tuple[int, int]]]]
+
 
 @dataclass
 class LawChunk:
@@ -34,14 +43,45 @@ class LawChunk:
 class LawChunker:
     """법령 문서 청킹"""
 
-    def __init__(self, max_chunk_size: int = 512, overlap: int = 50):
+    def __init__(
+        self,
+        max_chunk_size: int = 512,
+        overlap: int = 50,
+        token_offsets: Optional[TokenOffsetsFn] = None,
+        max_tokens: Optional[int] = None
+    ):
         """
         Args:
             max_chunk_size: 최대 청크 크기 (문자 수)
-            overlap: 중첩 크기 (문자 수)
+            overlap: 중첩 크기 (문자 수, 토큰 모드에서는 토큰 수)
+            token_offsets: 배치 토큰화 함수 (지정 시 토큰 모드)
+            max_tokens: 토큰 모드 청크당 최대 토큰 수 (특수 토큰 제외)
         """
+        if token_offsets is not None and not max_tokens:
+            raise ValueError("토큰 모드에는 max_tokens가 필요합니다")
+
         self.max_chunk_size = max_chunk_size
         self.overlap = overlap
+        self.token_offsets = token_offsets
+        self.max_tokens = max_tokens
+
+    @classmethod
+    def from_embedder(cls, embedder, overlap: int = 16) -> "LawChunker":
+        """
+        임베딩 모델 토크나이저 기준 토큰 모드 청킹기 생성
+
+        Args:
+            embedder: KoreanEmbedder
+            overlap: 중첩 토큰 수
+
+        Returns:
+            토큰 모드 LawChunker
+        """
+        return cls(
+            overlap=overlap,
+            token_offsets=embedder.token_offsets,
+            max_tokens=embedder.max_tokens
+        )
 
     def chunk_article(
         self,
@@ -72,6 +112,12 @@ class LawChunker:
         is_definition = self._is_definition_article(title)
         chunk_type = "definition" if is_definition else "article"
 
+        if self.token_offsets is not None:
+            return self._chunk_article_by_tokens(
+                law_id, law_name, article_number, title, content,
+                paragraphs, is_definition, chunk_type
+            )
+
         # 짧은 조문: 전체를 하나의 청크로
         if len(content) < self.max_chunk_size:
             chunk_id = f"{law_id}_{article_number}"
@@ -136,6 +182,173 @@ class LawChunker:
 
         return chunks
 
+    def _chunk_article_by_tokens(
+        self,
+        law_id: str,
+        law_name: str,
+        article_number: str,
+        title: str,
+        content: str,
+        paragraphs: Optional[List[Dict]],
+        is_definition: bool,
+        chunk_type: str
+    ) -> List[LawChunk]:
+        """토큰 예산 기준 조문 청킹 (본문/항/호 단위 묶음 + 토큰 중첩)"""
+        groups = self._pack_units(self._article_units(content, paragraphs))
+
+        # 예산 안에 모두 들어가면 조문 전체를 하나의 청크로
+        if len(groups) <= 1:
+            texts, numbers, token_count = groups[0] if groups else ([content or ""], [], 0)
+            return [LawChunk(
+                chunk_id=f"{law_id}_{article_number}",
+                law_id=law_id,
+                law_name=law_name,
+                article_number=article_number,
+                title=title,
+                content="\n".join(texts),
+                chunk_type=chunk_type,
+                metadata={
+                    "full_article": True,
+                    "is_definition": is_definition,
+                    "token_count": token_count
+                }
+            )]
+
+        chunks = []
+        for idx, (texts, numbers, token_count) in enumerate(groups):
+            paragraph_numbers = [n for n in dict.fromkeys(numbers) if n]
+
+            chunks.append(LawChunk(
+                chunk_id=f"{law_id}_{article_number}_part{idx}",
+                law_id=law_id,
+                law_name=law_name,
+                article_number=article_number,
+                paragraph_number=paragraph_numbers[0] if paragraph_numbers else "",
+                title=title,
+                content="\n".join(texts),
+                chunk_type="paragraph" if paragraphs else "text_split",
+                metadata={
+                    "full_article": False,
+                    "part_index": idx,
+                    "is_definition": is_definition,
+                    "paragraph_numbers": ",".join(paragraph_numbers),
+                    "token_count": token_count
+                }
+            ))
+
+        return chunks
+
+    def _article_units(
+        self, content: str, paragraphs: Optional[List[Dict]]
+    ) -> List[Tuple[str, str]]:
+        """조문을 (항 번호, 텍스트) 단위로 분해: 본문 → 항 → 호"""
+        units = []
+
+        if content and content.strip():
+            units.append(("", content.strip()))
+
+        for paragraph in paragraphs or []:
+            number = paragraph.get('number', '')
+            head = f"{number} {paragraph.get('content', '')}".strip()
+            if head:
+                units.append((number, head))
+
+            for item in paragraph.get('items', []):
+                item_text = f"{item.get('number', '')} {item.get('content', '')}".strip()
+                if item_text:
+                    units.append((number, item_text))
+
+        return units
+
+    def _pack_units(
+        self, units: List[Tuple[str, str]]
+    ) -> List[Tuple[List[str], List[str], int]]:
+        """
+        단위들을 max_tokens 이내로 묶기
+
+        Returns:
+            [(텍스트 목록, 항 번호 목록, 토큰 수), ...]
+        """
+        if not units:
+            return []
+
+        # 배치 토큰화 (조문당 1회)
+        all_offsets = self.token_offsets([text for _, text in units])
+
+        # (항 번호, 텍스트, 토큰 수, 꼬리 텍스트, 꼬리 토큰 수, 분할 연속 여부)
+        pieces = []
+        for (number, text), offsets in zip(units, all_offsets):
+            if len(offsets) <= self.max_tokens:
+                tail, tail_tokens = self._tail(text, offsets, 0, len(offsets))
+                pieces.append((number, text, len(offsets), tail, tail_tokens, False))
+            else:
+                for window_idx, (window, n_tokens, tail, tail_tokens) in enumerate(
+                    self._token_windows(text, offsets)
+                ):
+                    pieces.append((number, window, n_tokens, tail, tail_tokens, window_idx > 0))
+
+        groups = []
+        texts, numbers, token_count = [], [], 0
+        prev_tail, prev_tail_tokens = None, 0
+
+        for number, text, n_tokens, tail, tail_tokens, is_continuation in pieces:
+            if texts and token_count + n_tokens <= self.max_tokens:
+                texts.append(text)
+                numbers.append(number)
+                token_count += n_tokens
+            else:
+                if texts:
+                    groups.append((texts, numbers, token_count))
+                texts, numbers, token_count = [], [], 0
+
+                # 분할 윈도우 사이에는 이미 중첩이 있으므로 꼬리를 덧붙이지 않음
+                if (prev_tail and not is_continuation
+                        and prev_tail_tokens + n_tokens <= self.max_tokens):
+                    texts.append(prev_tail)
+                    numbers.append("")
+                    token_count += prev_tail_tokens
+
+                texts.append(text)
+                numbers.append(number)
+                token_count += n_tokens
+
+            prev_tail, prev_tail_tokens = tail, tail_tokens
+
+        if texts:
+            groups.append((texts, numbers, token_count))
+
+        return groups
+
+    def _token_windows(
+        self, text: str, offsets: List[Tuple[int, int]]
+    ) -> List[Tuple[str, int, Optional[str], int]]:
+        """예산을 넘는 단위를 토큰 윈도우로 분할 (윈도우 간 overlap 토큰 중첩)"""
+        windows = []
+        step = max(1, self.max_tokens - self.overlap)
+        start = 0
+
+        while start < len(offsets):
+            end = min(start + self.max_tokens, len(offsets))
+            window = text[offsets[start][0]:offsets[end - 1][1]]
+            tail, tail_tokens = self._tail(text, offsets, start, end)
+            windows.append((window, end - start, tail, tail_tokens))
+
+            if end == len(offsets):
+                break
+            start += step
+
+        return windows
+
+    def _tail(
+        self, text: str, offsets: List[Tuple[int, int]], start: int, end: int
+    ) -> Tuple[Optional[str], int]:
+        """offsets[start:end] 구간의 마지막 overlap 토큰 텍스트"""
+        if self.overlap <= 0 or end <= start:
+            return None, 0
+
+        tail_start = max(start, end - self.overlap)
+        return text[offsets[tail_start][0]:offsets[end - 1][1]], end - tail_start
+
     def chunk_table(
         self,
         law_id: str,
@@ -0,0 +1,162 @@
+"""
+MinHash/LSH 기반 근사 중복 청크 제거
+
+- 문자 n-gram(shingle) 집합을 MinHash 서명으로 요약
+- 서명을 band로 나눠 버킷팅(LSH)하여 후보 쌍만 비교
+- 추정 Jaccard 유사도가 임계값 이상이면 나중에 나온 청크를 제거
+
+비교는 같은 법령의 같은 조문 안에서만 합니다. 조문이 다르면 문자열이 거의 같아도
+("300킬로그램" / "500킬로그램", "받아야" / "받지 않아도") 법적 의미가 다르므로 남깁니다.
+"""
+
+import zlib
+from dataclasses import dataclass
+from typing import Callable, Dict, Hashable, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from .chunker import LawChunk
+
+# 2^32보다 큰 소수 (해시 범위보다 커야 함)
+_PRIME = np.uint64(4294967311)
+
+
+@dataclass
+class DedupReport:
+    """근사 중복 제거 결과"""
+    chunks_before: int = 0
+    chunks_after: int = 0
+    chars_before: int = 0
+    chars_after: int = 0
+
+    @property
+    def duplicates_removed(self) -> int:
+        return self.chunks_before - self.chunks_after
+
+    @property
+    def shrink_ratio(self) -> float:
+        """제거된 문자 비율"""
+        if not self.chars_before:
+            return 0.0
+        return 1 - self.chars_after / self.chars_before
+
+
+class MinHashDeduplicator:
+    """MinHash/LSH 근사 중복 탐지기"""
+
+    def __init__(
+        self,
+        num_perm: int = 64,
+        bands: int = 8,
+        shingle_size: int = 5,
+        threshold: float = 0.85,
+        seed: int = 42
+    ):
+        """
+        Args:
+            num_perm: MinHash 순열 수 (서명 길이)
+            bands: LSH band 수 (num_perm의 약수, 후보 임계값 ≈ (1/bands)^(bands/num_perm))
+            shingle_size: 문자 n-gram 크기
+            threshold: 중복으로 판단할 추정 Jaccard 유사도
+            seed: 순열 계수 난수 시드
+        """
+        if num_perm % bands != 0:
+            raise ValueError("num_perm은 bands의 배수여야 합니다")
+
+        self.num_perm = num_perm
+        self.bands = bands
+        self.rows = num_perm // bands
+        self.shingle_size = shingle_size
+        self.threshold = threshold
+
+        rng = np.random.default_rng(seed)
+        # a*x가 uint64를 넘지 않도록 a < 2^31
+        self._a = rng.integers(1, 2**31, size=num_perm, dtype=np.uint64)
+        self._b = rng.integers(0, 2**31, size=num_perm, dtype=np.uint64)
+
+    def _shingles(self, text: str) -> np.ndarray:
+        """공백 정규화 후 문자 n-gram 해시 집합"""
+        text = " ".join(text.split())
+        n = self.shingle_size
+        if len(text) <= n:
+            grams = {text}
+        else:
+            grams = {text[i:i + n] for i in range(len(text) - n + 1)}
+
+        return np.fromiter(
+            (zlib.crc32(gram.encode("utf-8")) for gram in grams),
+            dtype=np.uint64,
+            count=len(grams)
+        )
+
+    def signature(self, text: str) -> np.ndarray:
+        """MinHash 서명 (shape: [num_perm])"""
+        hashes = self._shingles(text)
+        permuted = (np.outer(hashes, self._a) + self._b) % _PRIME
+        return permuted.min(axis=0)
+
+    def find_duplicates(
+        self, texts: Sequence[str], groups: Optional[Sequence[Hashable]] = None
+    ) -> List[int]:
+        """
+        근사 중복 인덱스 탐지 (먼저 나온 텍스트를 남김)
+
+        Args:
+            texts: 텍스트 목록
+            groups: 텍스트별 그룹 키 (같은 그룹 안에서만 비교, 예: (law_id, article_number))
+
+        Returns:
+            제거할 텍스트 인덱스 목록
+        """
+        buckets: Dict[Tuple, List[int]] = {}
+        signatures: Dict[int, np.ndarray] = {}
+        duplicates = []
+
+        for idx, text in enumerate(texts):
+            group = groups[idx] if groups is not None else None
+            sig = self.signature(text)
+            band_keys = [
+                (group, band, sig[band * self.rows:(band + 1) * self.rows].tobytes())
+                for band in range(self.bands)
+            ]
+
+            candidates = {c for key in band_keys for c in buckets.get(key, ())}
+            if any(np.mean(signatures[c] == sig) >= self.threshold for c in candidates):
+                duplicates.append(idx)
+                continue
+
+            signatures[idx] = sig
+            for key in band_keys:
+                buckets.setdefault(key, []).append(idx)
+
+        return duplicates
+
+    def deduplicate(
+        self,
+        chunks: List[LawChunk],
+        group_key: Callable[[LawChunk], Hashable] = lambda chunk: (chunk.law_id, chunk.article_number)
+    ) -> Tuple[List[LawChunk], DedupReport]:
+        """
+        근사 중복 청크 제거
+
+        Args:
+            chunks: 법령 청크 리스트
+            group_key: 비교 범위 키 (기본값: 같은 법령의 같은 조문 안에서만 비교)
+
+        Returns:
+            (중복 제거된 청크 리스트, 제거 결과)
+        """
+        duplicates = set(self.find_duplicates(
+            [chunk.content for chunk in chunks],
+            [group_key(chunk) for chunk in chunks]
+        ))
+        kept = [chunk for idx, chunk in enumerate(chunks) if idx not in duplicates]
+
+        report = DedupReport(
+            chunks_before=len(chunks),
+            chunks_after=len(kept),
+            chars_before=sum(len(chunk.content) for chunk in chunks),
+            chars_after=sum(len(chunk.content) for chunk in kept)
+        )
+
+        return kept, report
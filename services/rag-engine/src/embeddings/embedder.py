@@ -7,7 +7,7 @@
 - 의미 검색에 최적화
 """
 
-from typing import List, Union
+from typing import List, Tuple, Union
 import numpy as np
 from sentence_transformers import SentenceTransformer
 import torch
@@ -82,6 +82,45 @@ class KoreanEmbedder:
         """
         return self.embed(documents)
 
+    @property
+    def max_seq_length(self) -> int:
+        """모델 최대 시퀀스 길이 (특수 토큰 포함, 초과분은 잘림)"""
+        return self.model.max_seq_length
+
+    @property
+    def max_tokens(self) -> int:
+        """특수 토큰([CLS], [SEP])을 제외하고 임베딩에 반영되는 최대 토큰 수"""
+        return self.max_seq_length - self.model.tokenizer.num_special_tokens_to_add()
+
+    def token_offsets(self, texts: List[str]) -> List[List[Tuple[int, int]]]:
+        """
+        토크나이저로 배치 토큰화하여 토큰별 문자 오프셋 반환
+
+        Args:
+            texts: 텍스트 리스트
+
+        Returns:
+            텍스트별 [(start, end), ...] (특수 토큰 제외)
+        """
+        if not texts:
+            return []
+
+        encoded = self.model.tokenizer(
+            texts,
+            add_special_tokens=False,
+            return_offsets_mapping=True,
+            truncation=False,
+        )
+
+        return [
+            [tuple(offset) for offset in offsets]
+            for offsets in encoded["offset_mapping"]
+        ]
+
+    def count_tokens(self, texts: List[str]) -> List[int]:
+        """텍스트별 토큰 수 (특수 토큰 제외, 배치 처리)"""
+        return [len(offsets) for offsets in self.token_offsets(texts)]
+
     def get_embedding_dimension(self) -> int:
         """임베딩 차원 반환"""
         return self.model.get_sentence_embedding_dimension()
@@ -5,7 +5,12 @@ ChromaDB 벡터 스토어
 프로덕션: Pinecone
 """
 
-from typing import List, Dict, Optional
+import itertools
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from collections import deque
+from dataclasses import dataclass, asdict
+from typing import Deque, Dict, Iterable, List, Optional
 import chromadb
 from chromadb.config import Settings
 from chromadb.utils import embedding_functions
@@ -13,6 +18,94 @@ import numpy as np
 
 from .embedder import KoreanEmbedder
 from .chunker import LawChunk
+from ..monitoring import record_ingestion
+
+COLLECTION_DESCRIPTION = "수소 관련 법령 벡터 데이터베이스"
+
+# ChromaDB 컬렉션 메타데이터 키 ↔ HNSWConfig 필드
+_HNSW_KEYS = {
+    "space": "hnsw:space",
+    "M": "hnsw:M",
+    "ef_construction": "hnsw:construction_ef",
+    "ef_search": "hnsw:search_ef",
+}
+
+# 키가 없는 (기존) 컬렉션에 ChromaDB가 적용하는 기본값
+_CHROMA_DEFAULTS = {"space": "l2", "M": 16, "ef_construction": 100, "ef_search": 10}
+
+
+@dataclass(frozen=True)
+class HNSWConfig:
+    """
+    컬렉션별 HNSW 인덱스 설정
+
+    ChromaDB 0.4.x는 컬렉션 생성 시점의 값으로 인덱스 세그먼트를 고정하므로
+    ef_search를 포함한 모든 값은 VectorStore.migrate()로 재구축해야 바뀝니다.
+    """
+    # 거리 공간: cosine / ip / l2 (l2는 제곱 유클리드 거리)
+    space: str = "cosine"
+    # 노드당 이웃 수 (클수록 재현율↑, 메모리/구축 시간↑)
+    M: int = 16
+    # 구축 시 후보 리스트 크기
+    ef_construction: int = 200
+    # 검색 시 후보 리스트 크기 (클수록 재현율↑, 지연시간↑)
+    ef_search: int = 64
+
+    def __post_init__(self):
+        if self.space not in ("cosine", "ip", "l2"):
+            raise ValueError(f"지원하지 않는 거리 공간입니다: {self.space}")
+
+    def to_metadata(self) -> Dict:
+        return {_HNSW_KEYS[name]: value for name, value in asdict(self).items()}
+
+    @classmethod
+    def from_metadata(cls, metadata: Optional[Dict]) -> "HNSWConfig":
+        """컬렉션 메타데이터에서 실제 적용 중인 설정 복원 (키가 없으면 ChromaDB 기본값)"""
+        metadata = metadata or {}
+        return cls(**{
+            name: metadata.get(key, _CHROMA_DEFAULTS[name])
+            for name, key in _HNSW_KEYS.items()
+        })
+
+
+@dataclass
+class IngestionReport:
+    """스트리밍 적재 결과"""
+    chunks: int = 0
+    batches: int = 0
+    # 임베딩 (호출 스레드) / 저장 (writer 스레드) 누적 시간
+    embed_seconds: float = 0.0
+    write_seconds: float = 0.0
+    wall_seconds: float = 0.0
+
+    @property
+    def chunks_per_second(self) -> float:
+        return self.chunks / self.wall_seconds if self.wall_seconds > 0 else 0.0
+
+    @property
+    def overlap_ratio(self) -> float:
+        """임베딩과 저장이 겹친 비율 (0: 완전 직렬, 1: 짧은 쪽이 완전히 가려짐)"""
+        hidden = self.embed_seconds + self.write_seconds - self.wall_seconds
+        shorter = min(self.embed_seconds, self.write_seconds)
+        return max(0.0, min(1.0, hidden / shorter)) if shorter > 0 else 0.0
+
+
+def distance_to_similarity(distance: float, space: str) -> float:
+    """
+    ChromaDB 거리를 유사도로 변환
+
+    Args:
+        distance: 컬렉션 거리 값
+        space: 거리 공간 (cosine / ip / l2)
+
+    Returns:
+        cosine: 코사인 유사도 (1 - distance)
+        ip: 내적 (1 - distance)
+        l2: 1 / (1 + distance) (순서만 보존하는 (0, 1] 점수, 코사인 아님)
+    """
+    if space == "l2":
+        return 1.0 / (1.0 + distance)
+    return 1.0 - distance
 
 
 class VectorStore:
@@ -22,57 +115,268 @@ class VectorStore:
         self,
         collection_name: str = "hydrogen_law",
         persist_directory: str = "./chroma_db",
-        embedder: Optional[KoreanEmbedder] = None
+        embedder: Optional[KoreanEmbedder] = None,
+        hnsw: Optional[HNSWConfig] = None,
+        migrate: bool = False
     ):
         """
         Args:
             collection_name: 컬렉션 이름
             persist_directory: 데이터 저장 경로
             embedder: 임베딩 모델 (None이면 자동 생성)
+            hnsw: HNSW 인덱스 설정 (None이면 기본값, 새 컬렉션에 적용)
+            migrate: 기존 컬렉션 설정이 hnsw와 다르면 저장된 임베딩으로 재구축
+                (False면 기존 설정을 그대로 사용하고 경고만 출력)
         """
         self.collection_name = collection_name
         self.persist_directory = persist_directory
+        self.requested_hnsw = hnsw or HNSWConfig()
+        # 실제 적용 중인 설정 (_connect에서 컬렉션 메타데이터로 결정)
+        self.hnsw = self.requested_hnsw
 
         # 임베딩 모델
         self.embedder = embedder or KoreanEmbedder()
 
         # ChromaDB 클라이언트
         print(f"ChromaDB 초기화 중: {persist_directory}")
+        self._connect()
+
+        if self.hnsw != self.requested_hnsw:
+            if migrate:
+                self.migrate(self.requested_hnsw)
+            else:
+                print(
+                    f"⚠️ 기존 컬렉션 HNSW 설정 {self.hnsw}이 요청 설정 {self.requested_hnsw}과 다릅니다 "
+                    f"(기존 설정 사용, 변경하려면 migrate=True 또는 migrate() 호출)"
+                )
+
+        print(f"컬렉션 '{collection_name}' 준비 완료 ({self.hnsw})")
+        print(f"저장된 문서 수: {self.collection.count()}")
+
+    def _connect(self) -> None:
+        """ChromaDB 클라이언트 및 컬렉션 연결"""
         self.client = chromadb.PersistentClient(
-            path=persist_directory,
+            path=self.persist_directory,
             settings=Settings(
                 anonymized_telemetry=False,
                 allow_reset=True
             )
         )
 
-        # 컬렉션 생성/로드
-        self.collection = self.client.get_or_create_collection(
-            name=collection_name,
-            metadata={"description": "수소 관련 법령 벡터 데이터베이스"}
+        # 컬렉션 로드 (없으면 요청 설정으로 생성)
+        # get_or_create_collection은 기존 컬렉션의 메타데이터만 덮어써서
+        # 실제 인덱스와 다른 설정을 기록하므로 사용하지 않음
+        try:
+            self.collection = self.client.get_collection(name=self.collection_name)
+        except ValueError:
+            self.collection = self._recover_migration() or self._create_collection(
+                self.collection_name, self.requested_hnsw
+            )
+        self.hnsw = HNSWConfig.from_metadata(self.collection.metadata)
+
+    @property
+    def _migration_name(self) -> str:
+        return f"{self.collection_name}_migrating"
+
+    def _create_collection(self, name: str, hnsw: HNSWConfig):
+        return self.client.create_collection(
+            name=name,
+            metadata={"description": COLLECTION_DESCRIPTION, **hnsw.to_metadata()}
         )
 
-        print(f"컬렉션 '{collection_name}' 준비 완료")
-        print(f"저장된 문서 수: {self.collection.count()}")
+    def _recover_migration(self):
+        """원본 삭제 후 이름 변경 전에 중단된 마이그레이션 복구"""
+        try:
+            collection = self.client.get_collection(name=self._migration_name)
+        except ValueError:
+            return None
+        collection.modify(name=self.collection_name)
+        print(f"♻️ 중단된 마이그레이션 복구: '{self._migration_name}' → '{self.collection_name}'")
+        return collection
+
+    def migrate(self, hnsw: Optional[HNSWConfig] = None, batch_size: int = 1000) -> None:
+        """
+        저장된 임베딩을 새 HNSW 설정의 컬렉션으로 옮겨 인덱스 재구축 (재임베딩 없음)
+
+        임시 컬렉션에 복사 → 문서 수 확인 → 원본 삭제 → 이름 변경 순서로 진행하며,
+        원본 삭제 후 중단되면 다음 연결 시 임시 컬렉션을 복구합니다.
+
+        Args:
+            hnsw: 새 HNSW 설정 (None이면 생성 시 요청한 설정)
+            batch_size: 복사 배치 크기
+        """
+        hnsw = hnsw or self.requested_hnsw
+        source = self.collection
+        total = source.count()
+        start = time.perf_counter()
+        print(f"🔧 HNSW 마이그레이션: {self.hnsw} → {hnsw} ({total}개 문서)")
+
+        try:
+            self.client.delete_collection(name=self._migration_name)
+        except ValueError:
+            pass
+        target = self._create_collection(self._migration_name, hnsw)
+
+        batch_size = min(batch_size, self.client.max_batch_size)
+        for offset in range(0, total, batch_size):
+            page = source.get(
+                limit=batch_size,
+                offset=offset,
+                include=["embeddings", "documents", "metadatas"]
+            )
+            if page["ids"]:
+                target.add(
+                    ids=page["ids"],
+                    embeddings=page["embeddings"],
+                    documents=page["documents"],
+                    metadatas=page["metadatas"]
+                )
+
+        if target.count() != total:
+            self.client.delete_collection(name=self._migration_name)
+            raise RuntimeError(
+                f"마이그레이션 문서 수 불일치: 원본 {total}개, 복사 {target.count()}개 (원본 유지)"
+            )
+
+        self.client.delete_collection(name=self.collection_name)
+        target.modify(name=self.collection_name)
+        self.collection = target
+        self.hnsw = hnsw
+        record_ingestion("migrate", total, time.perf_counter() - start)
+        print(f"✅ 마이그레이션 완료 ({time.perf_counter() - start:.2f}s)")
+
+    def reopen(self) -> None:
+        """
+        fork 이후 ChromaDB 연결 재생성
+
+        SQLite 연결과 Chroma 내부 스레드는 fork를 넘어 공유할 수 없으므로
+        자식 프로세스에서 캐시된 시스템을 버리고 새로 연결합니다 (임베딩 모델은 그대로 공유).
+        """
+        from chromadb.api.client import SharedSystemClient
+
+        SharedSystemClient.clear_system_cache()
+        self._connect()
+
+    def add_chunks(self, chunks: Iterable[LawChunk], batch_size: int = 256) -> IngestionReport:
+        """
+        청크를 벡터 DB에 추가 (배치 단위 임베딩/저장 파이프라인, stream_chunks 참고)
 
-    def add_chunks(self, chunks: List[LawChunk]) -> None:
+        Args:
+            chunks: 법령 청크 리스트 또는 이터레이터
+            batch_size: 임베딩/저장 배치 크기
+
+        Returns:
+            적재 결과
+        """
+        report = self.stream_chunks(chunks, batch_size=batch_size)
+        if report.chunks:
+            print(
+                f"✅ {report.chunks}개 청크 추가 완료 "
+                f"({report.chunks_per_second:.1f} chunks/s, {report.batches}개 배치)"
+            )
+        return report
+
+    def upsert_chunks(self, chunks: Iterable[LawChunk], batch_size: int = 256) -> IngestionReport:
+        """
+        청크를 벡터 DB에 추가 또는 갱신 (동일 ID는 덮어쓰기)
+
+        Args:
+            chunks: 법령 청크 리스트 또는 이터레이터
+            batch_size: 임베딩/저장 배치 크기
+
+        Returns:
+            적재 결과
+        """
+        return self.stream_chunks(chunks, batch_size=batch_size, upsert=True)
+
+    def stream_chunks(
+        self,
+        chunks: Iterable[LawChunk],
+        batch_size: int = 256,
+        upsert: bool = False,
+        max_pending: int = 1
+    ) -> IngestionReport:
+        """
+        스트리밍 적재: 고정 크기 배치로 임베딩하고, 이전 배치는 별도 스레드에서 저장
+
+        호출 스레드가 배치 N+1을 임베딩하는 동안 writer 스레드가 배치 N을 ChromaDB에 기록합니다.
+        메모리에는 최대 (max_pending + 1)개 배치만 올라가며, 배치 크기는
+        클라이언트의 max_batch_size를 넘지 않습니다.
+
+        Args:
+            chunks: 법령 청크 이터레이터 (전체를 미리 읽지 않음)
+            batch_size: 임베딩/저장 배치 크기
+            upsert: True면 upsert (동일 ID 덮어쓰기), False면 add
+            max_pending: 저장 대기 중인 최대 배치 수 (초과 시 임베딩이 저장을 기다림)
+
+        Returns:
+            적재 결과 (처리량, 임베딩/저장 시간)
+        """
+        operation = "upsert" if upsert else "add"
+        write = self.collection.upsert if upsert else self.collection.add
+        batch_size = max(1, min(batch_size, self.client.max_batch_size))
+        report = IngestionReport()
+
+        def write_batch(prepared: Dict) -> float:
+            start = time.perf_counter()
+            write(**prepared)
+            return time.perf_counter() - start
+
+        pending: Deque[Future] = deque()
+        iterator = iter(chunks)
+        start = time.perf_counter()
+
+        with ThreadPoolExecutor(max_workers=1, thread_name_prefix="chroma-writer") as writer:
+            try:
+                while True:
+                    batch = list(itertools.islice(iterator, batch_size))
+                    if not batch:
+                        break
+
+                    embed_start = time.perf_counter()
+                    prepared = self._prepare_chunks(batch)
+                    report.embed_seconds += time.perf_counter() - embed_start
+
+                    # 대기 배치가 가득 차면 가장 오래된 저장 완료까지 대기 (메모리 상한)
+                    while len(pending) >= max_pending:
+                        report.write_seconds += pending.popleft().result()
+
+                    pending.append(writer.submit(write_batch, prepared))
+                    report.chunks += len(batch)
+                    report.batches += 1
+
+                while pending:
+                    report.write_seconds += pending.popleft().result()
+            finally:
+                for future in pending:
+                    future.cancel()
+
+        report.wall_seconds = time.perf_counter() - start
+        if report.chunks:
+            record_ingestion(operation, report.chunks, report.wall_seconds)
+        return report
+
+    def delete_chunks(self, chunk_ids: List[str]) -> None:
         """
-        청크를 벡터 DB에 추가
+        청크 ID 목록으로 벡터 DB에서 삭제
 
         Args:
-            chunks: 법령 청크 리스트
+            chunk_ids: 삭제할 청크 ID 리스트
         """
-        if not chunks:
+        if not chunk_ids:
             return
 
-        # 임베딩 생성
+        self.collection.delete(ids=list(chunk_ids))
+
+    def _prepare_chunks(self, chunks: List[LawChunk]) -> Dict:
+        """청크 임베딩 생성 및 ChromaDB 저장 인자 구성"""
         texts = [chunk.content for chunk in chunks]
         embeddings = self.embedder.embed_documents(texts)
 
-        # ChromaDB에 저장
         ids = [chunk.chunk_id for chunk in chunks]
         metadatas = [
             {
+                "chunk_id": chunk.chunk_id,
                 "law_id": chunk.law_id,
                 "law_name": chunk.law_name,
                 "article_number": chunk.article_number,
@@ -84,14 +388,12 @@ class VectorStore:
             for chunk in chunks
         ]
 
-        self.collection.add(
-            ids=ids,
-            embeddings=embeddings.tolist(),
-            documents=texts,
-            metadatas=metadatas
-        )
-
-        print(f"✅ {len(chunks)}개 청크 추가 완료")
+        return {
+            "ids": ids,
+            "embeddings": embeddings.tolist(),
+            "documents": texts,
+            "metadatas": metadatas,
+        }
 
     def search(
         self,
@@ -124,21 +426,88 @@ class VectorStore:
             where=where
         )
 
-        # 결과 포맷팅
+        # 결과 포맷팅 (거리 → 유사도 변환은 컬렉션 거리 공간 기준)
         formatted_results = []
+        distances = results.get('distances')
+        space = self.hnsw.space
 
         if results['ids'] and results['ids'][0]:
             for i in range(len(results['ids'][0])):
+                distance = distances[0][i] if distances else None
                 formatted_results.append({
                     'id': results['ids'][0][i],
                     'content': results['documents'][0][i],
                     'metadata': results['metadatas'][0][i],
-                    'distance': results['distances'][0][i] if 'distances' in results else None,
-                    'similarity_score': 1 - results['distances'][0][i] if 'distances' in results else None
+                    'distance': distance,
+                    'similarity_score': (
+                        distance_to_similarity(distance, space) if distance is not None else None
+                    )
                 })
 
         return formatted_results
 
+    def search_ids(
+        self,
+        query: str,
+        top_k: int = 10,
+        filters: Optional[Dict] = None
+    ) -> List[Dict]:
+        """
+        경량 벡터 검색 (ID + 거리만 조회, 본문/메타데이터는 역직렬화하지 않음)
+
+        본문은 호출 측 문서 저장소(검색 스냅샷)에서 최종 결과에 대해서만 조회합니다.
+
+        Args:
+            query: 검색 쿼리
+            top_k: 반환할 결과 수
+            filters: 메타데이터 필터
+
+        Returns:
+            [{'id', 'distance', 'similarity_score'}, ...] (거리 오름차순)
+        """
+        query_embedding = self.embedder.embed_query(query)
+
+        results = self.collection.query(
+            query_embeddings=[query_embedding.tolist()],
+            n_results=top_k,
+            where=filters or None,
+            include=["distances"]
+        )
+
+        if not results['ids'] or not results['ids'][0]:
+            return []
+
+        space = self.hnsw.space
+        return [
+            {
+                'id': doc_id,
+                'distance': distance,
+                'similarity_score': distance_to_similarity(distance, space),
+            }
+            for doc_id, distance in zip(results['ids'][0], results['distances'][0])
+        ]
+
+    def get_documents(self, ids: List[str]) -> Dict[str, Dict]:
+        """
+        ID 목록으로 본문/메타데이터 조회 (로컬 문서 저장소에 없는 결과 보완용)
+
+        Args:
+            ids: 청크 ID 리스트
+
+        Returns:
+            {id: {'id', 'content', 'metadata'}}
+        """
+        if not ids:
+            return {}
+
+        results = self.collection.get(ids=list(ids), include=["documents", "metadatas"])
+        return {
+            doc_id: {'id': doc_id, 'content': content, 'metadata': metadata or {}}
+            for doc_id, content, metadata in zip(
+                results['ids'], results['documents'], results['metadatas']
+            )
+        }
+
     def delete_collection(self) -> None:
         """컬렉션 삭제"""
         self.client.delete_collection(name=self.collection_name)
@@ -147,10 +516,8 @@ class VectorStore:
     def reset(self) -> None:
         """데이터베이스 초기화"""
         self.delete_collection()
-        self.collection = self.client.get_or_create_collection(
-            name=self.collection_name,
-            metadata={"description": "수소 관련 법령 벡터 데이터베이스"}
-        )
+        self.collection = self._create_collection(self.collection_name, self.requested_hnsw)
+        self.hnsw = self.requested_hnsw
         print("데이터베이스 초기화 완료")
 
     def get_stats(self) -> Dict:
@@ -161,6 +528,7 @@ class VectorStore:
             "collection_name": self.collection_name,
             "total_documents": count,
             "embedding_dimension": self.embedder.get_embedding_dimension(),
+            "hnsw": asdict(self.hnsw),
             "persist_directory": self.persist_directory
         }
 
@@ -0,0 +1,30 @@
+"""모니터링 (메트릭) 모듈"""
+
+from .metrics import (
+    MetricsRegistry,
+    Counter,
+    Gauge,
+    Histogram,
+    REGISTRY,
+    record_search,
+    record_cache,
+    record_index_build,
+    record_corpus_size,
+    record_ingestion
+)
+from .process import process_memory, record_process_memory
+
+__all__ = [
+    'MetricsRegistry',
+    'Counter',
+    'Gauge',
+    'Histogram',
+    'REGISTRY',
+    'record_search',
+    'record_cache',
+    'record_index_build',
+    'record_corpus_size',
+    'record_ingestion',
+    'process_memory',
+    'record_process_memory'
+]
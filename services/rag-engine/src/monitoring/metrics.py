@@ -0,0 +1,315 @@
+"""
+Prometheus 텍스트 형식 메트릭
+
+외부 의존성 없이 Counter / Gauge / Histogram과 텍스트 노출 형식(0.0.4)을 구현합니다.
+기록 비용은 자식 값 dict 조회 + bisect 1회 + 잠금 1회 수준(관측 1회당 1μs 미만)으로
+검색 요청(수 ms) 대비 1%보다 훨씬 작습니다.
+"""
+
+import math
+import threading
+from bisect import bisect_left
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple
+
+# 검색 단계용 기본 버킷 (초)
+LATENCY_BUCKETS = (
+    0.0001, 0.00025, 0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5
+)
+# 인덱스 구축/수집 등 긴 작업용 버킷 (초)
+BUILD_BUCKETS = (0.01, 0.05, 0.1, 0.5, 1.0, 5.0, 10.0, 30.0, 60.0, 300.0)
+
+
+def _format_value(value: float) -> str:
+    if value == math.inf:
+        return "+Inf"
+    if float(value).is_integer():
+        return str(int(value))
+    return repr(float(value))
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _format_labels(names: Sequence[str], values: Sequence[str], extra: str = "") -> str:
+    pairs = [f'{name}="{_escape(str(value))}"' for name, value in zip(names, values)]
+    if extra:
+        pairs.append(extra)
+    return "{" + ",".join(pairs) + "}" if pairs else ""
+
+
+class _CounterChild:
+    __slots__ = ("_lock", "value")
+
+    def __init__(self, lock: threading.Lock):
+        self._lock = lock
+        self.value = 0.0
+
+    def inc(self, amount: float = 1.0) -> None:
+        with self._lock:
+            self.value += amount
+
+
+class _GaugeChild:
+    __slots__ = ("value",)
+
+    def __init__(self, lock: threading.Lock):
+        self.value = 0.0
+
+    def set(self, value: float) -> None:
+        self.value = float(value)
+
+
+class _HistogramChild:
+    __slots__ = ("_lock", "_buckets", "counts", "total")
+
+    def __init__(self, lock: threading.Lock, buckets: Tuple[float, ...]):
+        self._lock = lock
+        self._buckets = buckets
+        # 버킷별(비누적) 개수 — 마지막 칸은 +Inf
+        self.counts = [0] * (len(buckets) + 1)
+        self.total = 0.0
+
+    def observe(self, value: float) -> None:
+        idx = bisect_left(self._buckets, value)
+        with self._lock:
+            self.counts[idx] += 1
+            self.total += value
+
+
+class _Metric:
+    """메트릭 공통 (레이블 값 조합별 자식 값 관리)"""
+
+    type_name = ""
+
+    def __init__(self, name: str, documentation: str, labelnames: Sequence[str] = ()):
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        self._lock = threading.Lock()
+        self._children: Dict[Tuple[str, ...], object] = {}
+
+    def _new_child(self):
+        raise NotImplementedError
+
+    def labels(self, *values: str, **labels: str):
+        """
+        레이블 값 조합의 자식 값 (위치 인자는 labelnames 순서)
+
+        자주 기록하는 경로에서는 반환된 자식을 재사용하면 레이블 검증 비용이 없습니다.
+        """
+        key = values if values else tuple(labels.get(name) for name in self.labelnames)
+        child = self._children.get(key)
+        if child is not None:
+            return child
+
+        if len(key) != len(self.labelnames) or (labels and set(labels) != set(self.labelnames)):
+            raise ValueError(f"{self.name}: 레이블 {self.labelnames} 이 필요합니다 (받음: {tuple(labels) or values})")
+        key = tuple(str(value) for value in key)
+        with self._lock:
+            return self._children.setdefault(key, self._new_child())
+
+    def _samples(self) -> Iterable[str]:
+        raise NotImplementedError
+
+    def render(self) -> List[str]:
+        lines = [
+            f"# HELP {self.name} {self.documentation}",
+            f"# TYPE {self.name} {self.type_name}",
+        ]
+        with self._lock:
+            children = list(self._children.items())
+        lines.extend(self._samples(children))
+        return lines
+
+    def clear(self) -> None:
+        with self._lock:
+            self._children.clear()
+
+
+class Counter(_Metric):
+    """단조 증가 카운터"""
+
+    type_name = "counter"
+
+    def _new_child(self) -> _CounterChild:
+        return _CounterChild(self._lock)
+
+    def inc(self, amount: float = 1.0, **labels) -> None:
+        self.labels(**labels).inc(amount)
+
+    def value(self, **labels) -> float:
+        return self.labels(**labels).value
+
+    def _samples(self, children) -> Iterable[str]:
+        for key, child in children:
+            yield f"{self.name}{_format_labels(self.labelnames, key)} {_format_value(child.value)}"
+
+
+class Gauge(_Metric):
+    """임의 값 게이지"""
+
+    type_name = "gauge"
+
+    def _new_child(self) -> _GaugeChild:
+        return _GaugeChild(self._lock)
+
+    def set(self, value: float, **labels) -> None:
+        self.labels(**labels).set(value)
+
+    def value(self, **labels) -> float:
+        return self.labels(**labels).value
+
+    def _samples(self, children) -> Iterable[str]:
+        for key, child in children:
+            yield f"{self.name}{_format_labels(self.labelnames, key)} {_format_value(child.value)}"
+
+
+class Histogram(_Metric):
+    """누적 버킷 히스토그램"""
+
+    type_name = "histogram"
+
+    def __init__(
+        self,
+        name: str,
+        documentation: str,
+        labelnames: Sequence[str] = (),
+        buckets: Sequence[float] = LATENCY_BUCKETS
+    ):
+        super().__init__(name, documentation, labelnames)
+        self.buckets = tuple(sorted(buckets))
+
+    def _new_child(self) -> _HistogramChild:
+        return _HistogramChild(self._lock, self.buckets)
+
+    def observe(self, value: float, **labels) -> None:
+        self.labels(**labels).observe(value)
+
+    def count(self, **labels) -> int:
+        return sum(self.labels(**labels).counts)
+
+    def _samples(self, children) -> Iterable[str]:
+        for key, child in children:
+            with self._lock:
+                counts, total = list(child.counts), child.total
+            cumulative = 0
+            for bound, count in zip(self.buckets + (math.inf,), counts):
+                cumulative += count
+                le = f'le="{_format_value(bound)}"'
+                yield f"{self.name}_bucket{_format_labels(self.labelnames, key, le)} {cumulative}"
+            labels = _format_labels(self.labelnames, key)
+            yield f"{self.name}_sum{labels} {_format_value(total)}"
+            yield f"{self.name}_count{labels} {cumulative}"
+
+
+class MetricsRegistry:
+    """메트릭 등록 및 텍스트 노출"""
+
+    CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+    def __init__(self):
+        self._metrics: Dict[str, _Metric] = {}
+
+    def _register(self, metric: _Metric) -> _Metric:
+        existing = self._metrics.get(metric.name)
+        if existing is not None:
+            if type(existing) is not type(metric):
+                raise ValueError(f"메트릭 '{metric.name}'이 다른 유형으로 이미 등록되어 있습니다")
+            return existing
+        self._metrics[metric.name] = metric
+        return metric
+
+    def counter(self, name: str, documentation: str, labelnames: Sequence[str] = ()) -> Counter:
+        return self._register(Counter(name, documentation, labelnames))
+
+    def gauge(self, name: str, documentation: str, labelnames: Sequence[str] = ()) -> Gauge:
+        return self._register(Gauge(name, documentation, labelnames))
+
+    def histogram(
+        self,
+        name: str,
+        documentation: str,
+        labelnames: Sequence[str] = (),
+        buckets: Sequence[float] = LATENCY_BUCKETS
+    ) -> Histogram:
+        return self._register(Histogram(name, documentation, labelnames, buckets))
+
+    def get(self, name: str) -> Optional[_Metric]:
+        return self._metrics.get(name)
+
+    def render(self) -> str:
+        """Prometheus 텍스트 노출 형식"""
+        lines = []
+        for metric in self._metrics.values():
+            lines.extend(metric.render())
+        return "\n".join(lines) + "\n"
+
+    def clear(self) -> None:
+        """모든 메트릭 값 초기화 (테스트용)"""
+        for metric in self._metrics.values():
+            metric.clear()
+
+
+# 프로세스 전역 레지스트리
+REGISTRY = MetricsRegistry()
+
+SEARCH_REQUESTS = REGISTRY.counter(
+    "rag_search_requests_total", "검색 요청 수 (검색 방식별)", ["mode"]
+)
+SEARCH_LATENCY = REGISTRY.histogram(
+    "rag_search_duration_seconds", "검색 전체 소요 시간", ["mode"]
+)
+STAGE_LATENCY = REGISTRY.histogram(
+    "rag_search_stage_duration_seconds", "검색 파이프라인 단계별 소요 시간", ["stage"]
+)
+CACHE_REQUESTS = REGISTRY.counter(
+    "rag_cache_requests_total", "캐시 조회 수 (hit/miss)", ["cache", "result"]
+)
+CORPUS_DOCUMENTS = REGISTRY.gauge(
+    "rag_corpus_documents", "검색 인덱스 문서(청크) 수", ["index"]
+)
+INDEX_BUILD_LATENCY = REGISTRY.histogram(
+    "rag_index_build_duration_seconds", "인덱스 구축 소요 시간", ["index"], buckets=BUILD_BUCKETS
+)
+INGESTED_CHUNKS = REGISTRY.counter(
+    "rag_ingested_chunks_total", "적재된 청크 수", ["operation"]
+)
+INGESTION_LATENCY = REGISTRY.histogram(
+    "rag_ingestion_duration_seconds", "청크 적재(임베딩 + 저장) 소요 시간", ["operation"], buckets=BUILD_BUCKETS
+)
+INGESTION_THROUGHPUT = REGISTRY.gauge(
+    "rag_ingestion_chunks_per_second", "최근 적재 처리량", ["operation"]
+)
+
+
+def record_search(mode: str, stage_seconds: Dict[str, float], total_seconds: float) -> None:
+    """검색 1회의 요청 수, 전체/단계별 지연시간 기록"""
+    SEARCH_REQUESTS.labels(mode).inc()
+    SEARCH_LATENCY.labels(mode).observe(total_seconds)
+    for stage, seconds in stage_seconds.items():
+        STAGE_LATENCY.labels(stage).observe(seconds)
+
+
+def record_cache(cache: str, hit: bool) -> None:
+    """캐시 조회 결과 기록"""
+    CACHE_REQUESTS.labels(cache, "hit" if hit else "miss").inc()
+
+
+def record_index_build(index: str, seconds: float, documents: int) -> None:
+    """인덱스 구축 시간 및 문서 수 기록"""
+    INDEX_BUILD_LATENCY.observe(seconds, index=index)
+    CORPUS_DOCUMENTS.set(documents, index=index)
+
+
+def record_corpus_size(index: str, documents: int) -> None:
+    """인덱스 문서 수 기록"""
+    CORPUS_DOCUMENTS.set(documents, index=index)
+
+
+def record_ingestion(operation: str, chunks: int, seconds: float) -> None:
+    """청크 적재 처리량 기록"""
+    INGESTED_CHUNKS.inc(chunks, operation=operation)
+    INGESTION_LATENCY.observe(seconds, operation=operation)
+    if seconds > 0:
+        INGESTION_THROUGHPUT.set(chunks / seconds, operation=operation)
@@ -0,0 +1,69 @@
+"""
+프로세스 메모리 측정 (Linux /proc 기준)
+
+fork 서버 모드에서 워커가 부모의 모델/인덱스 페이지를 얼마나 공유하는지 확인하기 위해
+RSS 외에 PSS(공유 페이지를 나눠 계산한 비례 크기)와 공유/전용 페이지 크기를 읽습니다.
+"""
+
+import os
+from typing import Dict, Union
+
+from .metrics import REGISTRY
+
+PROCESS_MEMORY = REGISTRY.gauge(
+    "rag_process_memory_bytes", "프로세스 메모리 (rss, pss, shared, private)", ["kind"]
+)
+
+_SMAPS_FIELDS = {
+    "Rss": "rss",
+    "Pss": "pss",
+    "Shared_Clean": "shared",
+    "Shared_Dirty": "shared",
+    "Private_Clean": "private",
+    "Private_Dirty": "private",
+}
+
+
+def process_memory(pid: Union[int, str] = "self") -> Dict[str, int]:
+    """
+    프로세스 메모리 (바이트)
+
+    Args:
+        pid: 프로세스 ID (기본값: 현재 프로세스)
+
+    Returns:
+        {"rss": ..., "pss": ..., "shared": ..., "private": ...}
+        smaps_rollup을 읽을 수 없으면 rss만 포함
+    """
+    memory: Dict[str, int] = {}
+    try:
+        with open(f"/proc/{pid}/smaps_rollup", "r") as f:
+            for line in f:
+                parts = line.split()
+                kind = _SMAPS_FIELDS.get(parts[0].rstrip(":"))
+                if kind is not None:
+                    memory[kind] = memory.get(kind, 0) + int(parts[1]) * 1024
+        return memory
+    except (OSError, IndexError, ValueError):
+        pass
+
+    try:
+        with open(f"/proc/{pid}/status", "r") as f:
+            for line in f:
+                if line.startswith("VmRSS:"):
+                    return {"rss": int(line.split()[1]) * 1024}
+    except OSError:
+        pass
+
+    if pid == "self" or pid == os.getpid():
+        import resource
+        return {"rss": resource.getrusage(resource.RUSAGE_SELF).ru_maxrss * 1024}
+    return memory
+
+
+def record_process_memory() -> Dict[str, int]:
+    """현재 프로세스 메모리를 메트릭에 기록"""
+    memory = process_memory()
+    for kind, value in memory.items():
+        PROCESS_MEMORY.set(value, kind=kind)
+    return memory
@@ -1,5 +1,43 @@
 """검색 엔진 모듈"""
 
 from .hybrid_retriever import HybridRetriever
+from .snapshot import IndexSnapshot
+from .bm25f import BM25FIndex, FieldSpec
+from .positional import PositionalIndex
+from .boolean_query import BooleanQuery, QuerySyntaxError
+from .cursor_cache import CursorCache, CursorError
+from .features import RerankFeatures, RerankWeights
+from .router import ArticleIndex, QueryRouter, Route
+from .suggest import SuggestIndex
+from .spelling import SpellingIndex
+from .timing import StageTimer, timed_stage, register_stage_hook, unregister_stage_hook
+from .profiling import profile_call
+from .evaluation import LabeledQuery, EvaluationResult, evaluate_retriever, pareto_front
 
-__all__ = ['HybridRetriever']
+__all__ = [
+    'HybridRetriever',
+    'IndexSnapshot',
+    'BM25FIndex',
+    'FieldSpec',
+    'PositionalIndex',
+    'BooleanQuery',
+    'QuerySyntaxError',
+    'CursorCache',
+    'CursorError',
+    'RerankFeatures',
+    'RerankWeights',
+    'ArticleIndex',
+    'QueryRouter',
+    'Route',
+    'SuggestIndex',
+    'SpellingIndex',
+    'StageTimer',
+    'timed_stage',
+    'register_stage_hook',
+    'unregister_stage_hook',
+    'profile_call',
+    'LabeledQuery',
+    'EvaluationResult',
+    'evaluate_retriever',
+    'pareto_front',
+]
@@ -0,0 +1,149 @@
+"""
+필드 가중 BM25F 키워드 인덱스
+
+제목, 법령명(약칭 포함), 조문 번호, 본문을 필드별로 토큰화하고
+필드 가중치와 필드별 길이 정규화를 적용한 단어 빈도를 합산해 한 번에 점수를 매깁니다.
+
+    tf~(t, d) = Σ_f w_f · tf_f(t, d) / (1 - b_f + b_f · len_f(d) / avglen_f)
+    score(q, d) = Σ_t idf(t) · tf~ · (k1 + 1) / (k1 + tf~)
+
+tf~는 쿼리와 무관하므로 인덱스 구축 시 용어별 (문서 인덱스, 점수 기여) 배열로
+미리 계산해 두고, 검색은 쿼리 용어마다 배열 덧셈 한 번으로 끝납니다.
+"""
+
+from dataclasses import dataclass, field
+from types import MappingProxyType
+from typing import Dict, Mapping, Optional, Sequence, Tuple
+
+import numpy as np
+
+
+@dataclass(frozen=True)
+class FieldSpec:
+    """BM25F 필드 설정"""
+    name: str
+    # 필드 가중치 (본문 1회 출현 대비)
+    weight: float
+    # 길이 정규화 강도 (0: 정규화 없음, 1: 완전 정규화)
+    b: float
+
+
+DEFAULT_FIELDS = (
+    FieldSpec('title', weight=3.0, b=0.5),
+    FieldSpec('law_name', weight=1.0, b=0.0),
+    FieldSpec('article_number', weight=2.0, b=0.0),
+    FieldSpec('content', weight=1.0, b=0.75),
+)
+
+
+@dataclass(frozen=True)
+class BM25FIndex:
+    """필드 가중 BM25 역색인 (스냅샷과 같은 문서 순서)"""
+    # 용어 → (문서 인덱스 오름차순, 문서별 점수 기여 = idf · 포화된 tf~)
+    postings: Mapping[str, Tuple[np.ndarray, np.ndarray]] = field(
+        default_factory=lambda: MappingProxyType({})
+    )
+    corpus_size: int = 0
+    fields: Tuple[FieldSpec, ...] = DEFAULT_FIELDS
+    k1: float = 1.5
+
+    @classmethod
+    def build(
+        cls,
+        field_tokens: Mapping[str, Sequence[Sequence[str]]],
+        fields: Sequence[FieldSpec] = DEFAULT_FIELDS,
+        k1: float = 1.5
+    ) -> "BM25FIndex":
+        """
+        인덱스 구축
+
+        Args:
+            field_tokens: 필드 이름 → 문서별 토큰 목록 (모든 필드의 문서 수가 같아야 함)
+            fields: 필드 설정 (field_tokens에 없는 필드는 건너뜀)
+            k1: 단어 빈도 포화 파라미터
+
+        Returns:
+            BM25F 인덱스
+        """
+        fields = tuple(spec for spec in fields if spec.name in field_tokens)
+        corpus_size = len(field_tokens[fields[0].name]) if fields else 0
+
+        # 용어 → 문서 인덱스 → 가중·정규화된 단어 빈도 합
+        weighted: Dict[str, Dict[int, float]] = {}
+        for spec in fields:
+            documents = field_tokens[spec.name]
+            lengths = np.fromiter((len(tokens) for tokens in documents), dtype=np.float64,
+                                  count=len(documents))
+            average = lengths.mean() if len(lengths) and lengths.mean() > 0 else 1.0
+            norms = spec.weight / (1.0 - spec.b + spec.b * lengths / average)
+
+            for idx, tokens in enumerate(documents):
+                counts: Dict[str, int] = {}
+                for token in tokens:
+                    counts[token] = counts.get(token, 0) + 1
+                for token, count in counts.items():
+                    per_doc = weighted.setdefault(token, {})
+                    per_doc[idx] = per_doc.get(idx, 0.0) + count * norms[idx]
+
+        postings = {}
+        for token, per_doc in weighted.items():
+            indices = np.fromiter(sorted(per_doc), dtype=np.int64, count=len(per_doc))
+            tf = np.fromiter((per_doc[i] for i in indices), dtype=np.float64, count=len(per_doc))
+            idf = np.log(1.0 + (corpus_size - len(indices) + 0.5) / (len(indices) + 0.5))
+            postings[token] = (indices, idf * tf * (k1 + 1.0) / (k1 + tf))
+
+        return cls(
+            postings=MappingProxyType(postings),
+            corpus_size=corpus_size,
+            fields=fields,
+            k1=k1,
+        )
+
+    def documents(self, term: str) -> np.ndarray:
+        """용어가 (어느 필드든) 나오는 문서 인덱스 오름차순 (없으면 빈 배열)"""
+        posting = self.postings.get(term)
+        return posting[0] if posting is not None else np.empty(0, dtype=np.int64)
+
+    def get_scores(
+        self, query_tokens: Sequence[str], documents: Optional[np.ndarray] = None
+    ) -> np.ndarray:
+        """
+        문서별 BM25F 점수
+
+        Args:
+            query_tokens: 쿼리 토큰 (중복 토큰은 중복 횟수만큼 반영)
+            documents: 점수를 계산할 문서 인덱스 오름차순 (None이면 전체 문서)
+
+        Returns:
+            문서 수(documents를 주면 그 길이) 길이의 점수 배열
+        """
+        if documents is None:
+            scores = np.zeros(self.corpus_size, dtype=np.float64)
+            for token in query_tokens:
+                posting = self.postings.get(token)
+                if posting is not None:
+                    indices, impacts = posting
+                    scores[indices] += impacts
+            return scores
+
+        # 후보 집합만: 정렬된 두 배열 중 짧은 쪽을 긴 쪽에서 이진 탐색 (전체 문서 배열 없음)
+        scores = np.zeros(len(documents), dtype=np.float64)
+        if len(documents) == 0:
+            return scores
+        for token in query_tokens:
+            posting = self.postings.get(token)
+            if posting is None:
+                continue
+            indices, impacts = posting
+            if len(indices) <= len(documents):
+                slots = np.minimum(np.searchsorted(documents, indices), len(documents) - 1)
+                hit = documents[slots] == indices
+                scores[slots[hit]] += impacts[hit]
+            else:
+                slots = np.minimum(np.searchsorted(indices, documents), len(indices) - 1)
+                hit = indices[slots] == documents
+                scores[hit] += impacts[slots[hit]]
+        return scores
+
+    def __len__(self) -> int:
+        return self.corpus_size
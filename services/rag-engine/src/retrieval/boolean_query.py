@@ -0,0 +1,253 @@
+"""
+불리언 질의 (AND / OR / NOT, 괄호, 인용 부호 구문)
+
+    수소충전소 AND (허가 OR 신고) NOT 벌칙
+
+연산자는 대문자 AND/OR/NOT만 인식하며, 연산자가 하나라도 있는 쿼리만 불리언 질의로 봅니다
+(그 외 쿼리와 "제5조(허가)" 같은 괄호는 기존 검색 그대로). 연산자 없이 나란한 피연산자는 AND,
+"A NOT B"는 A AND NOT B입니다. 우선순위는 NOT > AND > OR.
+
+평가는 키워드 색인의 정렬된 문서 인덱스 배열에 대한 집합 연산입니다.
+AND는 작은 배열부터 교집합(빈 집합이면 즉시 종료), NOT은 차집합이므로
+조건이 많을수록 후보 집합이 작아지고 이후 점수 계산도 후보에 대해서만 합니다.
+"""
+
+import re
+from dataclasses import dataclass
+from typing import Callable, List, Optional, Sequence, Tuple, Union
+
+import numpy as np
+
+OPERATORS = ('AND', 'OR', 'NOT')
+
+_OPERATOR_PATTERN = re.compile(r'(?<![^\s(])(?:AND|OR|NOT)(?![^\s)])')
+_TOKEN_PATTERN = re.compile(r'\s*(?:(?P<phrase>["“”][^"“”]*["“”])|(?P<paren>[()])|(?P<word>[^\s()"“”]+))')
+
+
+class QuerySyntaxError(ValueError):
+    """불리언 질의 문법 오류 (괄호 불일치, 피연산자 없는 연산자 등)"""
+
+
+@dataclass(frozen=True)
+class Term:
+    """단어 (키워드 색인의 원형/어간과 입력 그대로 일치)"""
+    text: str
+
+
+@dataclass(frozen=True)
+class Phrase:
+    """인용 부호 구문 (본문 위치 색인)"""
+    words: Tuple[str, ...]
+
+
+@dataclass(frozen=True)
+class And:
+    operands: Tuple["Node", ...]
+
+
+@dataclass(frozen=True)
+class Or:
+    operands: Tuple["Node", ...]
+
+
+@dataclass(frozen=True)
+class Not:
+    operand: "Node"
+
+
+Node = Union[Term, Phrase, And, Or, Not]
+
+
+def is_boolean_query(query: str) -> bool:
+    """대문자 AND/OR/NOT 연산자가 단어로 들어 있는지 여부"""
+    return _OPERATOR_PATTERN.search(query) is not None
+
+
+def _lex(query: str) -> List[Tuple[str, str]]:
+    """(종류, 값) 토큰 목록 (종류: phrase, paren, op, word)"""
+    tokens = []
+    position = 0
+    while position < len(query):
+        match = _TOKEN_PATTERN.match(query, position)
+        if match is None or match.end() == position:
+            if query[position:].strip():
+                raise QuerySyntaxError(f"닫히지 않은 인용 부호가 있습니다: {query[position:].strip()}")
+            break
+        position = match.end()
+        if match.group('phrase'):
+            words = tuple(match.group('phrase')[1:-1].split())
+            if not words:
+                raise QuerySyntaxError("빈 구문(\"\")은 검색할 수 없습니다")
+            tokens.append(('phrase', words))
+        elif match.group('paren'):
+            tokens.append(('paren', match.group('paren')))
+        elif match.group('word') in OPERATORS:
+            tokens.append(('op', match.group('word')))
+        else:
+            tokens.append(('word', match.group('word')))
+    return tokens
+
+
+class _Parser:
+    """재귀 하강 파서 (or → and → not → primary)"""
+
+    def __init__(self, tokens: List[Tuple[str, str]]):
+        self.tokens = tokens
+        self.position = 0
+
+    def peek(self) -> Optional[Tuple[str, str]]:
+        return self.tokens[self.position] if self.position < len(self.tokens) else None
+
+    def take(self) -> Tuple[str, str]:
+        token = self.tokens[self.position]
+        self.position += 1
+        return token
+
+    def parse(self) -> "Node":
+        node = self.parse_or()
+        if self.peek() is not None:
+            raise QuerySyntaxError(f"예상하지 못한 '{self.peek()[1]}'")
+        return node
+
+    def parse_or(self) -> "Node":
+        operands = [self.parse_and()]
+        while self.peek() == ('op', 'OR'):
+            self.take()
+            operands.append(self.parse_and())
+        return _flatten(Or, operands)
+
+    def parse_and(self) -> "Node":
+        operands = [self.parse_not()]
+        while True:
+            token = self.peek()
+            if token == ('op', 'AND'):
+                self.take()
+            elif token is None or token == ('op', 'OR') or token == ('paren', ')'):
+                break
+            # 연산자 없이 나란한 피연산자와 "A NOT B"는 AND
+            operands.append(self.parse_not())
+        return _flatten(And, operands)
+
+    def parse_not(self) -> "Node":
+        if self.peek() == ('op', 'NOT'):
+            self.take()
+            operand = self.parse_not()
+            return operand.operand if isinstance(operand, Not) else Not(operand)
+        return self.parse_primary()
+
+    def parse_primary(self) -> "Node":
+        token = self.peek()
+        if token is None:
+            raise QuerySyntaxError("연산자 뒤에 검색어가 필요합니다")
+        kind, value = self.take()
+        if kind == 'word':
+            return Term(value)
+        if kind == 'phrase':
+            return Phrase(value)
+        if token == ('paren', '('):
+            node = self.parse_or()
+            if self.peek() != ('paren', ')'):
+                raise QuerySyntaxError("닫는 괄호가 없습니다")
+            self.take()
+            return node
+        raise QuerySyntaxError(f"'{value}' 앞에 검색어가 필요합니다")
+
+
+def _flatten(kind, operands: Sequence["Node"]) -> "Node":
+    """같은 종류의 중첩 연산을 펼침 (피연산자가 하나면 그대로)"""
+    if len(operands) == 1:
+        return operands[0]
+    flat = []
+    for operand in operands:
+        flat.extend(operand.operands if isinstance(operand, kind) else (operand,))
+    return kind(tuple(flat))
+
+
+@dataclass(frozen=True)
+class BooleanQuery:
+    """파싱된 불리언 질의"""
+    root: "Node"
+
+    @classmethod
+    def parse(cls, query: str) -> Optional["BooleanQuery"]:
+        """
+        불리언 질의 파싱
+
+        Returns:
+            연산자가 없으면 None (일반 검색)
+
+        Raises:
+            QuerySyntaxError: 문법 오류
+        """
+        if not is_boolean_query(query):
+            return None
+        tokens = _lex(query)
+        return cls(_Parser(tokens).parse())
+
+    def scoring_terms(self) -> List[str]:
+        """점수 계산에 쓸 단어 (NOT 아래 단어 제외, 구문은 단어로 풀어서)"""
+        terms: List[str] = []
+
+        def collect(node: "Node", negated: bool) -> None:
+            if isinstance(node, Not):
+                collect(node.operand, not negated)
+            elif isinstance(node, (And, Or)):
+                for operand in node.operands:
+                    collect(operand, negated)
+            elif not negated:
+                terms.extend((node.text,) if isinstance(node, Term) else node.words)
+
+        collect(self.root, False)
+        return list(dict.fromkeys(terms))
+
+    def evaluate(
+        self,
+        term_documents: Callable[[str], np.ndarray],
+        phrase_documents: Callable[[Sequence[str]], np.ndarray],
+        document_count: int
+    ) -> np.ndarray:
+        """
+        조건을 만족하는 문서 집합
+
+        Args:
+            term_documents: 단어 → 문서 인덱스 오름차순 배열
+            phrase_documents: 구문 단어 → 문서 인덱스 오름차순 배열
+            document_count: 전체 문서 수 (NOT만 있는 조건의 전체 집합)
+
+        Returns:
+            문서 인덱스 오름차순 배열
+        """
+        def evaluate(node: "Node") -> np.ndarray:
+            if isinstance(node, Term):
+                return term_documents(node.text)
+            if isinstance(node, Phrase):
+                return phrase_documents(node.words)
+            if isinstance(node, Or):
+                return np.unique(np.concatenate([evaluate(operand) for operand in node.operands]))
+            if isinstance(node, Not):
+                return np.setdiff1d(
+                    np.arange(document_count, dtype=np.int64), evaluate(node.operand), assume_unique=True
+                )
+
+            # AND: 긍정 조건 교집합(작은 배열부터) → 부정 조건 차집합
+            positives = [operand for operand in node.operands if not isinstance(operand, Not)]
+            negatives = [operand.operand for operand in node.operands if isinstance(operand, Not)]
+            sets = []
+            for operand in positives:
+                documents = evaluate(operand)
+                if len(documents) == 0:
+                    return documents
+                sets.append(documents)
+            sets.sort(key=len)
+            result = sets[0] if sets else np.arange(document_count, dtype=np.int64)
+            for documents in sets[1:]:
+                result = np.intersect1d(result, documents, assume_unique=True)
+                if len(result) == 0:
+                    return result
+            for operand in negatives:
+                if len(result) == 0:
+                    break
+                result = np.setdiff1d(result, evaluate(operand), assume_unique=True)
+            return result
+
+        return evaluate(self.root).astype(np.int64, copy=False)
@@ -0,0 +1,112 @@
+"""
+검색 후보 (문서 인덱스 + 점수 병렬 배열)
+
+BM25 → 융합 → 재랭킹 단계 사이에서는 스냅샷 문서 위치(int)와 점수만 NumPy 배열로 전달하고,
+본문/메타데이터를 담은 결과 dict는 응답 포맷팅 시 반환되는 행에 대해서만 만듭니다.
+"""
+
+from dataclasses import dataclass, field
+from types import MappingProxyType
+from typing import Dict, List, Mapping, Optional, Tuple
+
+import numpy as np
+
+from .snapshot import IndexSnapshot
+
+
+@dataclass(frozen=True)
+class Candidates:
+    """
+    순위 후보
+
+    indices가 스냅샷 문서 수(n) 이상이면 external_ids[index - n]을 가리킵니다
+    (스냅샷에 없는 벡터 검색 결과, 본문은 external_docs 또는 벡터 스토어에서 조회).
+    """
+    indices: np.ndarray
+    scores: np.ndarray
+    external_ids: Tuple[str, ...] = ()
+    # 본문을 함께 반환하는 벡터 스토어의 외부 결과 (id → 문서)
+    external_docs: Mapping[str, Dict] = field(default_factory=lambda: MappingProxyType({}))
+
+    @classmethod
+    def empty(cls) -> "Candidates":
+        return cls(np.empty(0, dtype=np.int64), np.empty(0, dtype=np.float64))
+
+    @classmethod
+    def from_results(cls, results: List[Dict], snapshot: IndexSnapshot, score_key: str) -> "Candidates":
+        """
+        검색 결과 dict 목록(id + 점수)을 후보로 변환
+
+        Args:
+            results: [{'id', score_key, (선택) 'content', 'metadata'}]
+            snapshot: 문서 위치 조회용 스냅샷
+            score_key: 점수 키
+
+        Returns:
+            후보 (스냅샷에 없는 id는 외부 후보)
+        """
+        n_docs = len(snapshot)
+        indices = np.empty(len(results), dtype=np.int64)
+        scores = np.empty(len(results), dtype=np.float64)
+        external_ids: List[str] = []
+        external_docs: Dict[str, Dict] = {}
+
+        for i, result in enumerate(results):
+            doc_id = result['id']
+            idx = snapshot.id_to_index.get(doc_id)
+            if idx is None:
+                idx = n_docs + len(external_ids)
+                external_ids.append(doc_id)
+                if 'content' in result:
+                    external_docs[doc_id] = result
+            indices[i] = idx
+            scores[i] = result.get(score_key) or 0.0
+
+        return cls(indices, scores, tuple(external_ids), MappingProxyType(external_docs))
+
+    def __len__(self) -> int:
+        return len(self.indices)
+
+    def take(self, positions) -> "Candidates":
+        """위치 배열/슬라이스로 재정렬 또는 절단 (외부 후보 정보는 공유)"""
+        return Candidates(
+            self.indices[positions], self.scores[positions], self.external_ids, self.external_docs
+        )
+
+    def head(self, count: int) -> "Candidates":
+        return self.take(slice(0, count))
+
+    def doc_id(self, idx: int, snapshot: IndexSnapshot) -> str:
+        n_docs = len(snapshot)
+        return snapshot.document_ids[idx] if idx < n_docs else self.external_ids[idx - n_docs]
+
+    def metadata(self, idx: int, snapshot: IndexSnapshot) -> Dict:
+        """후보 메타데이터 (스냅샷 문서 참조, 외부 후보는 함께 받은 메타데이터 또는 {})"""
+        n_docs = len(snapshot)
+        if idx < n_docs:
+            return snapshot.documents[idx].get('metadata', {})
+        doc: Optional[Dict] = self.external_docs.get(self.external_ids[idx - n_docs])
+        return doc.get('metadata', {}) if doc is not None else {}
+
+
+def top_k_desc(scores: np.ndarray, top_k: int) -> np.ndarray:
+    """
+    점수 내림차순 상위 top_k 위치 (동점은 위치 오름차순, 전체 정렬 없이 O(n))
+
+    Args:
+        scores: 점수 배열
+        top_k: 개수
+
+    Returns:
+        위치 배열
+    """
+    top_k = min(top_k, len(scores))
+    if top_k <= 0:
+        return np.empty(0, dtype=np.int64)
+
+    # k번째 점수보다 큰 위치 + 경계 동점 중 앞쪽 위치
+    kth = -np.partition(-scores, top_k - 1)[top_k - 1]
+    above = np.flatnonzero(scores > kth)
+    ties = np.flatnonzero(scores == kth)[:top_k - len(above)]
+    positions = np.concatenate([above, ties])
+    return positions[np.argsort(-scores[positions], kind='stable')]
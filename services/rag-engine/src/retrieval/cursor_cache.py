@@ -0,0 +1,109 @@
+"""
+검색 결과 커서 캐시 (페이지네이션)
+
+첫 요청에서 깊게 순위를 매긴 문서 ID 목록을 서버에 저장하고 불투명 커서로 돌려줍니다.
+다음 페이지 요청은 파이프라인을 다시 실행하지 않고 저장된 목록의 해당 구간만
+스냅샷에서 조회(hydrate)하여 포맷팅하므로 페이지 크기에 비례하는 비용만 듭니다.
+"""
+
+import base64
+import binascii
+import secrets
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from typing import List, Tuple
+
+from .candidates import Candidates
+from .snapshot import IndexSnapshot
+
+
+@dataclass
+class RankedList:
+    """캐시된 순위 목록 (문서 인덱스 + 최종 점수 배열)"""
+    query: str
+    keywords: List[str]
+    candidates: Candidates
+    # 순위를 매길 때 사용한 스냅샷 (교체 후에도 같은 문서로 조회)
+    snapshot: IndexSnapshot
+    # 첫 페이지의 검색 경로 (exact / bm25_only / hybrid)
+    search_method: str = 'hybrid'
+    # 스니펫 매칭 용어 (토큰화된 쿼리 + 철자 교정어)
+    snippet_terms: List[str] = field(default_factory=list)
+    created_at: float = field(default_factory=time.monotonic)
+
+    def __len__(self) -> int:
+        return len(self.candidates)
+
+
+class CursorError(KeyError):
+    """잘못되었거나 만료된 커서"""
+
+
+class CursorCache:
+    """TTL + 최대 항목 수 제한 LRU 커서 캐시 (스레드 안전)"""
+
+    def __init__(self, ttl_seconds: float = 600.0, max_entries: int = 1000):
+        """
+        Args:
+            ttl_seconds: 커서 유효 시간 (초)
+            max_entries: 최대 캐시 항목 수 (초과 시 가장 오래 쓰이지 않은 항목 제거)
+        """
+        self.ttl_seconds = ttl_seconds
+        self.max_entries = max_entries
+        self._entries: "OrderedDict[str, RankedList]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def encode(token: str, offset: int) -> str:
+        return base64.urlsafe_b64encode(f"{token}:{offset}".encode()).decode().rstrip("=")
+
+    @staticmethod
+    def decode(cursor: str) -> Tuple[str, int]:
+        try:
+            padded = cursor + "=" * (-len(cursor) % 4)
+            token, offset = base64.urlsafe_b64decode(padded.encode()).decode().rsplit(":", 1)
+            return token, int(offset)
+        except (binascii.Error, UnicodeDecodeError, ValueError) as e:
+            raise CursorError("잘못된 커서입니다") from e
+
+    def put(self, ranked: RankedList) -> str:
+        """순위 목록 저장 후 토큰 반환"""
+        token = secrets.token_urlsafe(12)
+        with self._lock:
+            self._evict_expired()
+            self._entries[token] = ranked
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+        return token
+
+    def get(self, cursor: str) -> Tuple[RankedList, int]:
+        """
+        커서로 순위 목록과 시작 위치 조회
+
+        Raises:
+            CursorError: 잘못되었거나 만료된 커서
+        """
+        token, offset = self.decode(cursor)
+        with self._lock:
+            ranked = self._entries.get(token)
+            if ranked is not None and time.monotonic() - ranked.created_at > self.ttl_seconds:
+                del self._entries[token]
+                ranked = None
+            if ranked is None:
+                raise CursorError("만료되었거나 존재하지 않는 커서입니다")
+            self._entries.move_to_end(token)
+
+        if offset < 0 or offset > len(ranked):
+            raise CursorError("잘못된 커서 위치입니다")
+        return ranked, offset
+
+    def _evict_expired(self) -> None:
+        now = time.monotonic()
+        expired = [t for t, r in self._entries.items() if now - r.created_at > self.ttl_seconds]
+        for token in expired:
+            del self._entries[token]
+
+    def __len__(self) -> int:
+        return len(self._entries)
@@ -0,0 +1,213 @@
+"""
+검색 품질 평가 (오프라인)
+
+레이블된 쿼리 → 관련 조문 집합에 대해 recall@k, MRR, nDCG@k를 계산합니다.
+청크 분할 방식과 무관하도록 조문 단위 (법령명, 조번호) 키로 비교합니다.
+"""
+
+import json
+import math
+from dataclasses import dataclass, field
+from typing import Dict, Iterable, List, Optional, Sequence, Set, Tuple
+
+ArticleKey = Tuple[str, str]
+
+
+def article_key(law_name: str, article_number: str) -> ArticleKey:
+    """조문 키 (법령명 공백 제거)"""
+    return ("".join((law_name or "").split()), (article_number or "").strip())
+
+
+@dataclass
+class LabeledQuery:
+    """레이블된 평가 쿼리"""
+    query: str
+    # 조문 키 → 관련도 등급 (2: 핵심 조문, 1: 관련 조문)
+    relevant: Dict[ArticleKey, int] = field(default_factory=dict)
+    note: str = ""
+
+
+def load_labeled_queries(path: str) -> List[LabeledQuery]:
+    """
+    평가 쿼리 파일 로드
+
+    형식: [{"query": ..., "relevant": [{"law_name": ..., "article_number": ..., "grade": 2}]}]
+    """
+    with open(path, "r", encoding="utf-8") as f:
+        items = json.load(f)
+
+    return [
+        LabeledQuery(
+            query=item["query"],
+            relevant={
+                article_key(rel["law_name"], rel["article_number"]): int(rel.get("grade", 1))
+                for rel in item["relevant"]
+            },
+            note=item.get("note", ""),
+        )
+        for item in items
+    ]
+
+
+def ranked_article_keys(articles: Iterable[Dict]) -> List[ArticleKey]:
+    """검색 결과를 조문 키 순위로 변환 (같은 조문의 청크는 첫 순위만 유지)"""
+    keys = []
+    seen: Set[ArticleKey] = set()
+    for article in articles:
+        key = article_key(article.get("law_name", ""), article.get("article_number", ""))
+        if key not in seen:
+            seen.add(key)
+            keys.append(key)
+    return keys
+
+
+def recall_at_k(ranked: Sequence[ArticleKey], relevant: Dict[ArticleKey, int], k: int) -> float:
+    """상위 k개에 포함된 관련 조문 비율"""
+    if not relevant:
+        return 0.0
+    hits = sum(1 for key in ranked[:k] if key in relevant)
+    return hits / len(relevant)
+
+
+def reciprocal_rank(ranked: Sequence[ArticleKey], relevant: Dict[ArticleKey, int]) -> float:
+    """첫 관련 조문 순위의 역수 (없으면 0)"""
+    for rank, key in enumerate(ranked, 1):
+        if key in relevant:
+            return 1.0 / rank
+    return 0.0
+
+
+def ndcg_at_k(ranked: Sequence[ArticleKey], relevant: Dict[ArticleKey, int], k: int) -> float:
+    """등급 관련도 기반 nDCG@k (gain = 2^grade - 1)"""
+    dcg = sum(
+        (2 ** relevant[key] - 1) / math.log2(rank + 1)
+        for rank, key in enumerate(ranked[:k], 1)
+        if key in relevant
+    )
+    ideal = sorted(relevant.values(), reverse=True)[:k]
+    idcg = sum((2 ** grade - 1) / math.log2(rank + 1) for rank, grade in enumerate(ideal, 1))
+    return dcg / idcg if idcg > 0 else 0.0
+
+
+@dataclass
+class EvaluationResult:
+    """검색기 설정 1개의 평가 결과"""
+    name: str
+    k: int
+    queries: int = 0
+    skipped: int = 0
+    recall: float = 0.0
+    mrr: float = 0.0
+    ndcg: float = 0.0
+    latency_ms: List[float] = field(default_factory=list)
+    per_query: List[Dict] = field(default_factory=list)
+
+    def latency_percentile(self, q: float) -> float:
+        if not self.latency_ms:
+            return 0.0
+        ordered = sorted(self.latency_ms)
+        idx = min(len(ordered) - 1, max(0, math.ceil(q / 100 * len(ordered)) - 1))
+        return ordered[idx]
+
+    def summary(self) -> Dict:
+        return {
+            "name": self.name,
+            "queries": self.queries,
+            "skipped": self.skipped,
+            f"recall@{self.k}": self.recall,
+            "mrr": self.mrr,
+            f"ndcg@{self.k}": self.ndcg,
+            "p50_ms": self.latency_percentile(50),
+            "p95_ms": self.latency_percentile(95),
+        }
+
+
+def evaluate_retriever(
+    name: str,
+    retriever,
+    labeled_queries: List[LabeledQuery],
+    k: int = 10,
+    corpus_keys: Optional[Set[ArticleKey]] = None,
+    warmup: int = 2
+) -> EvaluationResult:
+    """
+    검색기 1개 평가
+
+    Args:
+        name: 설정 이름
+        retriever: search(query, top_k) → 응답 dict 를 제공하는 검색기
+        labeled_queries: 평가 쿼리
+        k: 평가 컷오프
+        corpus_keys: 코퍼스에 존재하는 조문 키 (주어지면 코퍼스에 없는 레이블은 제외)
+        warmup: 측정 전 워밍업 쿼리 수
+
+    Returns:
+        평가 결과
+    """
+    result = EvaluationResult(name=name, k=k)
+
+    for labeled in labeled_queries[:warmup]:
+        retriever.search(labeled.query, top_k=k)
+
+    recall_sum = mrr_sum = ndcg_sum = 0.0
+    for labeled in labeled_queries:
+        relevant = labeled.relevant
+        if corpus_keys is not None:
+            relevant = {key: grade for key, grade in relevant.items() if key in corpus_keys}
+        if not relevant:
+            # 관련 조문이 코퍼스에 없으면 판정 불가
+            result.skipped += 1
+            continue
+
+        response = retriever.search(labeled.query, top_k=k)
+        ranked = ranked_article_keys(response["articles"])
+
+        recall = recall_at_k(ranked, relevant, k)
+        rr = reciprocal_rank(ranked, relevant)
+        ndcg = ndcg_at_k(ranked, relevant, k)
+
+        recall_sum += recall
+        mrr_sum += rr
+        ndcg_sum += ndcg
+        result.queries += 1
+        result.latency_ms.append(response["metadata"]["search_time_ms"])
+        result.per_query.append({
+            "query": labeled.query,
+            "recall": recall,
+            "rr": rr,
+            "ndcg": ndcg,
+            "latency_ms": response["metadata"]["search_time_ms"],
+        })
+
+    if result.queries:
+        result.recall = recall_sum / result.queries
+        result.mrr = mrr_sum / result.queries
+        result.ndcg = ndcg_sum / result.queries
+
+    return result
+
+
+def pareto_front(
+    results: List[EvaluationResult],
+    quality: str = "ndcg",
+    latency_percentile: float = 95
+) -> List[EvaluationResult]:
+    """
+    품질-지연시간 파레토 최적 설정
+
+    다른 설정보다 품질이 낮지 않으면서 더 빠르지도 않은(둘 중 하나는 엄격히 나쁜) 설정을 제외합니다.
+    """
+    front = []
+    for candidate in results:
+        cq = getattr(candidate, quality)
+        cl = candidate.latency_percentile(latency_percentile)
+        dominated = any(
+            getattr(other, quality) >= cq
+            and other.latency_percentile(latency_percentile) <= cl
+            and (getattr(other, quality) > cq or other.latency_percentile(latency_percentile) < cl)
+            for other in results
+            if other is not candidate
+        )
+        if not dominated:
+            front.append(candidate)
+    return front
@@ -0,0 +1,172 @@
+"""
+재랭킹 특징 테이블
+
+스냅샷 구축 시 문서별로 한 번 계산하여, 검색 시 재랭킹을 후보 인덱스에 대한
+벡터화된 가중합으로 수행합니다.
+제목 일치는 별도 가산점 대신 BM25F 점수(bm25f.py, 제목 필드 가중)로 반영합니다.
+- 법령 위계 (law_type 메타데이터 또는 law_name에서 추출: 법률/시행령/시행규칙/별표)
+- 정의/벌칙 조항 여부 (LawParser.is_definition_article / is_penalty_article)
+"""
+
+from dataclasses import dataclass, field
+from typing import Dict, Optional, Sequence, Tuple
+
+import numpy as np
+
+from ..collectors.law_parser import LawArticle, LawParser
+
+# 법령 위계 (값이 작을수록 상위법)
+LEVEL_LAW = 0
+LEVEL_DECREE = 1
+LEVEL_RULE = 2
+LEVEL_APPENDIX = 3
+LEVEL_UNKNOWN = 4
+
+HIERARCHY_LABELS = ('법률', '시행령', '시행규칙', '별표', '')
+
+# law_type 메타데이터 값 → 위계 (법제처 법령구분명 포함)
+_LAW_TYPE_LEVELS = {
+    '법률': LEVEL_LAW,
+    '시행령': LEVEL_DECREE,
+    '대통령령': LEVEL_DECREE,
+    '시행규칙': LEVEL_RULE,
+    '총리령': LEVEL_RULE,
+    '부령': LEVEL_RULE,
+    '별표': LEVEL_APPENDIX,
+}
+
+# 쿼리가 벌칙을 묻는지 판단하는 단어
+PENALTY_QUERY_TERMS = ('벌칙', '과태료', '징역', '벌금', '처벌')
+
+_parser = LawParser()
+
+
+def hierarchy_level(metadata: Dict) -> int:
+    """
+    문서 메타데이터에서 법령 위계 추출
+
+    Args:
+        metadata: 문서 메타데이터 (law_type, law_name, chunk_type, title)
+
+    Returns:
+        LEVEL_* 값
+    """
+    if metadata.get('chunk_type') == 'table' or '별표' in (metadata.get('title') or ''):
+        return LEVEL_APPENDIX
+
+    law_type = (metadata.get('law_type') or '').strip()
+    if law_type in _LAW_TYPE_LEVELS:
+        return _LAW_TYPE_LEVELS[law_type]
+    if law_type.endswith('부령'):  # 산업통상자원부령 등
+        return LEVEL_RULE
+
+    law_name = (metadata.get('law_name') or '').strip()
+    if not law_name:
+        return LEVEL_UNKNOWN
+    if law_name.endswith('시행규칙'):
+        return LEVEL_RULE
+    if law_name.endswith('시행령'):
+        return LEVEL_DECREE
+    return LEVEL_LAW
+
+
+@dataclass(frozen=True)
+class RerankFeatures:
+    """문서별 재랭킹 특징 (스냅샷과 같은 문서 순서)"""
+    hierarchy: np.ndarray = field(default_factory=lambda: np.empty(0, dtype=np.int8))
+    is_definition: np.ndarray = field(default_factory=lambda: np.empty(0, dtype=bool))
+    is_penalty: np.ndarray = field(default_factory=lambda: np.empty(0, dtype=bool))
+
+    @classmethod
+    def build(cls, documents: Sequence[Dict]) -> "RerankFeatures":
+        """
+        특징 테이블 구축
+
+        Args:
+            documents: 스냅샷 문서 목록
+
+        Returns:
+            특징 테이블
+        """
+        hierarchy = np.empty(len(documents), dtype=np.int8)
+        is_definition = np.zeros(len(documents), dtype=bool)
+        is_penalty = np.zeros(len(documents), dtype=bool)
+
+        for idx, doc in enumerate(documents):
+            metadata = doc.get('metadata', {})
+            title = metadata.get('title') or ''
+            hierarchy[idx] = hierarchy_level(metadata)
+
+            article = LawArticle(
+                article_number=metadata.get('article_number', ''),
+                title=title,
+                content=''
+            )
+            is_definition[idx] = bool(metadata.get('is_definition')) or _parser.is_definition_article(article)
+            is_penalty[idx] = _parser.is_penalty_article(article)
+
+        return cls(
+            hierarchy=hierarchy,
+            is_definition=is_definition,
+            is_penalty=is_penalty,
+        )
+
+    def __len__(self) -> int:
+        return len(self.hierarchy)
+
+
+@dataclass(frozen=True)
+class RerankWeights:
+    """
+    재랭킹 가중치 (융합 점수에 더함)
+
+    융합 점수는 RRF 단위(1위 ≈ 1/61 ≈ 0.016, 인접 순위 간 차이 ≈ 0.0003)이므로
+    위계/정의/벌칙 가산점은 순위를 뒤집지 않는 동점 해소 크기로 둡니다.
+    라벨 평가셋(benchmarks/eval_retrieval.py)에서 0.003 이상이면 MRR이 크게 떨어졌습니다.
+
+    키워드 가중치는 기존 제목 일치 +10 가산점을 대체합니다. 융합 1위 점수보다 작게 두어
+    융합 순위를 덮어쓰지 않고, 벡터 검색으로만 들어온 후보도 필드 가중 키워드 근거를 받습니다.
+    평가셋에서 0.6일 때 모든 설정(RRF k=10/60, 가중치 7:3~3:7)의 MRR이 기존보다 높았습니다.
+    """
+    # BM25F 점수 (키워드 1위 대비 비율 × 융합 1위 점수에 곱함)
+    keyword: float = 0.6
+    # 법령 위계별 가산점 (법률, 시행령, 시행규칙, 별표, 미상)
+    hierarchy: Tuple[float, ...] = (4e-5, 3e-5, 2e-5, 1e-5, 0.0)
+    # 정의 조항
+    definition: float = 4e-5
+    # 벌칙 조항 (쿼리가 벌칙/과태료 등을 물을 때만)
+    penalty: float = 4e-5
+
+
+def rerank_scores(
+    base_scores: np.ndarray,
+    indices: np.ndarray,
+    features: RerankFeatures,
+    query_tokens: Sequence[str],
+    weights: Optional[RerankWeights] = None,
+    keyword_scores: Optional[np.ndarray] = None
+) -> np.ndarray:
+    """
+    특징 테이블 기반 재랭킹 점수 (후보 인덱스에 대한 벡터화 가중합)
+
+    Args:
+        base_scores: 후보 융합 점수
+        indices: 후보 문서 인덱스 (스냅샷 범위)
+        features: 특징 테이블
+        query_tokens: 쿼리 토큰
+        weights: 가중치 (None이면 기본값)
+        keyword_scores: 후보별 BM25F 점수 (융합 점수 단위로 환산, None이면 생략)
+
+    Returns:
+        최종 점수 배열
+    """
+    weights = weights or RerankWeights()
+    hierarchy_boost = np.asarray(weights.hierarchy, dtype=np.float64)
+
+    scores = base_scores + hierarchy_boost[features.hierarchy[indices]]
+    if keyword_scores is not None:
+        scores += weights.keyword * keyword_scores
+    scores += weights.definition * features.is_definition[indices]
+    if any(term in token for token in query_tokens for term in PENALTY_QUERY_TERMS):
+        scores += weights.penalty * features.is_penalty[indices]
+    return scores
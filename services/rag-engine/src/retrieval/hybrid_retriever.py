@@ -6,15 +6,55 @@
 2. BM25 검색 (키워드 기반) - 30%
 3. Reciprocal Rank Fusion으로 결과 융합
 4. 규칙 기반 재랭킹
+
+BM25는 제목/법령명/조문 번호/본문 필드 가중 BM25F(bm25f.py)로 계산합니다.
+AND/OR/NOT 불리언 질의(boolean_query.py)는 색인 집합 연산으로 만든 후보만 점수를 매깁니다.
+
+단계 사이에는 문서 인덱스/점수 배열(Candidates)만 전달하고,
+결과 dict는 응답 포맷팅 시 반환되는 행에 대해서만 만듭니다.
 """
 
-from typing import List, Dict, Optional
+from typing import List, Dict, Mapping, Optional, Sequence, Tuple
+import itertools
+from types import MappingProxyType
 import numpy as np
-from rank_bm25 import BM25Okapi
-from datetime import datetime
 import re
+import time
 
 from ..embeddings import VectorStore, KoreanEmbedder
+from .timing import StageTimer
+from .snapshot import IndexSnapshot
+from .bm25f import BM25FIndex, FieldSpec, DEFAULT_FIELDS
+from .candidates import Candidates, top_k_desc
+from .features import RerankFeatures, RerankWeights, rerank_scores
+from .cursor_cache import CursorCache, RankedList
+from .router import (
+    ArticleIndex, QueryRouter, Route, ROUTE_BOOLEAN, ROUTE_EXACT, ROUTE_HYBRID, parse_article_refs
+)
+from .suggest import SuggestIndex
+from .spelling import SpellingIndex
+from .snippets import extract_snippets
+from .positional import PositionalIndex, PositionalMatch, match_positions, parse_phrases
+from .boolean_query import BooleanQuery
+from ..monitoring import record_cache, record_index_build, record_search
+
+# 검색 결과 항목 필드 (fields 프로젝션으로 선택, id는 항상 포함)
+ARTICLE_FIELDS = (
+    'id', 'law_name', 'article_number', 'title', 'content', 'highlighted_content',
+    'snippets', 'related_articles', 'relevance_score'
+)
+# fields를 생략했을 때의 필드 (기존 응답 형태, 스니펫은 요청 시에만 생성)
+DEFAULT_ARTICLE_FIELDS = tuple(f for f in ARTICLE_FIELDS if f != 'snippets')
+
+# 법률 용어 사전 (쿼리 용어 → 확장 용어)
+LEGAL_DICT = {
+    '설치': '설치기준',
+    '운영': '운영기준',
+    '검사': '안전검사',
+    '인증': '인증기준',
+    '충전소': '수소충전소',
+    '저장소': '수소저장소'
+}
 
 
 class HybridRetriever:
@@ -22,128 +62,658 @@ class HybridRetriever:
 
     def __init__(
         self,
-        vector_store: VectorStore,
+        vector_store: Optional[VectorStore],
         vector_weight: float = 0.7,
-        bm25_weight: float = 0.3
+        bm25_weight: float = 0.3,
+        rrf_k: int = 60,
+        candidate_multiplier: int = 2,
+        max_ranked_results: int = 500,
+        cursor_cache: Optional[CursorCache] = None,
+        rerank_weights: Optional[RerankWeights] = None,
+        law_aliases: Optional[Mapping[str, str]] = None,
+        router: Optional[QueryRouter] = None,
+        snippet_count: int = 2,
+        snippet_window: int = 120,
+        bm25_fields: Optional[Sequence[FieldSpec]] = None,
+        proximity_window: int = 4,
+        proximity_weight: float = 0.3
     ):
         """
         Args:
-            vector_store: 벡터 스토어
+            vector_store: 벡터 스토어 (None이면 BM25 전용)
             vector_weight: 벡터 검색 가중치
             bm25_weight: BM25 가중치
+            rrf_k: Reciprocal Rank Fusion 파라미터
+            candidate_multiplier: 각 검색기에서 가져올 후보 수 (top_k의 배수)
+            max_ranked_results: 페이지네이션 시 커서에 저장할 순위 목록 깊이
+            cursor_cache: 페이지네이션 커서 캐시 (None이면 기본 설정으로 생성)
+            rerank_weights: 재랭킹 가중치 (None이면 기본값)
+            law_aliases: 법령 약칭 → 법령명 (law_config.yaml의 short_name, 조문 정확 조회용)
+            router: 쿼리 라우터 (None이면 기본 설정으로 생성)
+            snippet_count: 결과별 스니펫(매칭 윈도우) 수
+            snippet_window: 스니펫 길이 (문자 수)
+            bm25_fields: BM25F 필드별 가중치/길이 정규화 (None이면 DEFAULT_FIELDS)
+            proximity_window: 근접 가산점을 주는 쿼리 단어 간 최대 거리 (단어 수)
+            proximity_weight: 인접 쿼리 단어가 모두 근접할 때 BM25F 점수 배율 증가분 (0이면 끔)
         """
         self.vector_store = vector_store
         self.vector_weight = vector_weight
         self.bm25_weight = bm25_weight
-
-        # BM25 인덱스 (초기화 시 빌드)
-        self.bm25_index = None
-        self.documents = []
-        self.document_ids = []
+        self.rrf_k = rrf_k
+        self.candidate_multiplier = candidate_multiplier
+        self.max_ranked_results = max_ranked_results
+        self.cursor_cache = cursor_cache if cursor_cache is not None else CursorCache()
+        self.rerank_weights = rerank_weights or RerankWeights()
+        self.law_aliases = dict(law_aliases or {})
+        self.router = router or QueryRouter()
+        self.snippet_count = snippet_count
+        self.snippet_window = snippet_window
+        self.bm25_fields = tuple(bm25_fields or DEFAULT_FIELDS)
+        self.proximity_window = proximity_window
+        self.proximity_weight = proximity_weight
+
+        # 문서 + BM25 인덱스 불변 스냅샷 (교체는 참조 1회 대입)
+        self._snapshot = IndexSnapshot()
+        # 코퍼스 세대 번호 발급기 (스냅샷을 구축할 때마다 1 증가)
+        self._generations = itertools.count(1)
 
         print("하이브리드 검색 엔진 초기화")
 
-    def build_bm25_index(self, documents: List[Dict]) -> None:
+    @property
+    def snapshot(self) -> IndexSnapshot:
+        """현재 서비스 중인 인덱스 스냅샷"""
+        return self._snapshot
+
+    @property
+    def documents(self):
+        return self._snapshot.documents
+
+    @property
+    def document_ids(self):
+        return self._snapshot.document_ids
+
+    @property
+    def bm25_index(self) -> Optional[BM25FIndex]:
+        return self._snapshot.bm25_index
+
+    @property
+    def generation(self) -> int:
+        """코퍼스 세대 (0: 아직 구축되지 않음)"""
+        return self._snapshot.generation
+
+    @property
+    def search_mode(self) -> str:
+        """기본 검색 방식 ('hybrid' 또는 'bm25_only', 쿼리별 경로는 metadata.search_method)"""
+        return 'hybrid' if self.vector_store is not None else 'bm25_only'
+
+    def build_snapshot(self, documents: List[Dict]) -> IndexSnapshot:
         """
-        BM25 인덱스 구축
+        새 인덱스 스냅샷 구축 (서비스 중인 스냅샷은 건드리지 않음)
 
         Args:
             documents: 문서 리스트 [{"id": ..., "content": ...}]
+
+        Returns:
+            불변 인덱스 스냅샷
         """
         print(f"BM25 인덱스 구축 중 ({len(documents)}개 문서)...")
+        start = time.perf_counter()
+
+        documents = tuple(documents)
+        document_ids = tuple(doc['id'] for doc in documents)
+
+        bm25_index = None
+        positional_index = PositionalIndex()
+        spelling_index = SpellingIndex()
+        if documents:
+            # 필드별 토큰화 + BM25F 인덱스 생성
+            tokenized_corpus = [
+                self._tokenize(doc['content'])
+                for doc in documents
+            ]
+            bm25_index = BM25FIndex.build(
+                self._field_tokens(documents, tokenized_corpus), self.bm25_fields
+            )
+            positional_index = PositionalIndex.build(
+                [doc['content'] for doc in documents], self._tokenize
+            )
+            spelling_index = SpellingIndex.build(tokenized_corpus)
+            print("BM25 인덱스 구축 완료")
+        else:
+            print("⚠️ 문서가 없어 BM25 인덱스를 생성하지 않습니다")
 
-        self.documents = documents
-        self.document_ids = [doc['id'] for doc in documents]
+        features = RerankFeatures.build(documents)
+        snapshot = IndexSnapshot(
+            documents=documents,
+            document_ids=document_ids,
+            bm25_index=bm25_index,
+            positional_index=positional_index,
+            id_to_index=MappingProxyType({doc_id: i for i, doc_id in enumerate(document_ids)}),
+            features=features,
+            article_index=ArticleIndex.build(documents, self.law_aliases),
+            suggest_index=SuggestIndex.build(
+                documents,
+                is_definition=features.is_definition,
+                law_names=[*self.law_aliases, *self.law_aliases.values()],
+                legal_terms=[*LEGAL_DICT, *LEGAL_DICT.values()]
+            ),
+            spelling_index=spelling_index,
+            generation=next(self._generations)
+        )
+        record_index_build('bm25', time.perf_counter() - start, len(documents))
 
-        if not documents:
-            print("⚠️ 문서가 없어 BM25 인덱스를 생성하지 않습니다")
-            self.bm25_index = None
-            return
+        return snapshot
 
-        # 토큰화
-        tokenized_corpus = [
-            self._tokenize(doc['content'])
-            for doc in documents
-        ]
+    def _field_tokens(
+        self, documents: Sequence[Dict], tokenized_corpus: List[List[str]]
+    ) -> Dict[str, List[List[str]]]:
+        """
+        BM25F 필드별 문서 토큰
 
-        # BM25 인덱스 생성
-        self.bm25_index = BM25Okapi(tokenized_corpus)
+        법령명 필드에는 law_config.yaml 약칭도 넣어 "고압가스법 시행규칙"처럼
+        약칭으로 검색해도 법령명이 일치하도록 합니다.
+        """
+        fields: Dict[str, List[List[str]]] = {
+            'title': [], 'law_name': [], 'article_number': [], 'content': tokenized_corpus
+        }
+        for doc in documents:
+            metadata = doc.get('metadata', {})
+            law_name = metadata.get('law_name') or ''
+            short_names = [
+                short for short, name in self.law_aliases.items()
+                if name and law_name.startswith(name)
+            ]
+            fields['title'].append(self._tokenize(metadata.get('title') or ''))
+            fields['law_name'].append(self._tokenize(' '.join([law_name, *short_names])))
+            fields['article_number'].append(self._tokenize(metadata.get('article_number') or ''))
+        return fields
+
+    def swap_snapshot(self, snapshot: IndexSnapshot) -> IndexSnapshot:
+        """
+        서비스 스냅샷 교체 (참조 1회 대입 — 진행 중인 검색은 이전 스냅샷으로 완료)
+
+        Returns:
+            이전 스냅샷
+        """
+        previous, self._snapshot = self._snapshot, snapshot
+        return previous
 
-        print("BM25 인덱스 구축 완료")
+    def build_bm25_index(self, documents: List[Dict]) -> None:
+        """
+        BM25 인덱스 구축 후 즉시 교체
+
+        Args:
+            documents: 문서 리스트 [{"id": ..., "content": ...}]
+        """
+        self.swap_snapshot(self.build_snapshot(documents))
 
     def search(
         self,
         query: str,
         top_k: int = 10,
-        filters: Optional[Dict] = None
+        filters: Optional[Dict] = None,
+        profile: bool = False,
+        paginate: bool = False,
+        fields: Optional[Sequence[str]] = None
     ) -> Dict:
         """
         하이브리드 검색 (LLM 없음)
 
         Args:
             query: 검색 쿼리
-            top_k: 결과 수
+            top_k: 결과 수 (paginate=True면 페이지 크기)
             filters: 메타데이터 필터
+            profile: True면 metadata.profile에 단계 트리와 후보 수 포함
+            paginate: True면 max_ranked_results까지 순위를 매겨 캐시하고
+                metadata.next_cursor로 다음 페이지 커서 반환 (page() 참고)
+            fields: 결과 항목에 포함할 필드 (None이면 DEFAULT_ARTICLE_FIELDS)
 
         Returns:
             검색 결과
         """
-        start_time = datetime.now()
+        start_time = time.perf_counter()
+        timer = StageTimer()
+
+        # 검색 시작 시점의 스냅샷을 끝까지 사용 (도중 교체되어도 일관성 유지)
+        snapshot = self._snapshot
+
+        with timer.activate():
+            if paginate:
+                response = self._run_paginated(query, top_k, filters, timer, snapshot, fields)
+            else:
+                response = self._run_pipeline(query, top_k, filters, timer, snapshot, fields)
+
+        total_seconds = time.perf_counter() - start_time
+        response['metadata']['search_time_ms'] = total_seconds * 1000
+        response['metadata']['stage_times_ms'] = timer.as_ms()
+        response['metadata']['corpus_generation'] = snapshot.generation
+        record_search(response['metadata']['search_method'], timer.durations, total_seconds)
+
+        if profile:
+            response['metadata']['profile'] = {
+                'timing_tree': timer.tree(),
+                'candidates': dict(timer.counts),
+            }
 
-        # 1. 쿼리 전처리
-        processed_query = self._preprocess_query(query)
-
-        # 2. 벡터 검색 (vector_store가 있을 때만)
-        vector_results = []
-        if self.vector_store is not None:
-            vector_results = self.vector_store.search(
-                query=processed_query['original'],
-                top_k=top_k * 2,  # 더 많이 가져와서 융합
-                filters=filters
-            )
+        return response
 
-        # 3. BM25 검색
-        bm25_results = self._bm25_search(
-            query=processed_query['original'],
-            top_k=top_k * 2
+    def _run_pipeline(
+        self,
+        query: str,
+        top_k: int,
+        filters: Optional[Dict],
+        timer: StageTimer,
+        snapshot: IndexSnapshot,
+        fields: Optional[Sequence[str]] = None
+    ) -> Dict:
+        """검색 파이프라인 (단계별 시간/후보 수를 timer에 기록)"""
+        final, processed_query = self._rank(query, top_k, filters, timer, snapshot)
+        response = self._format_page(
+            query, final, processed_query['tokens'], timer, snapshot,
+            fields, self._snippet_terms(processed_query)
         )
+        self._add_query_metadata(response, processed_query)
+        return response
+
+    def _run_paginated(
+        self,
+        query: str,
+        page_size: int,
+        filters: Optional[Dict],
+        timer: StageTimer,
+        snapshot: IndexSnapshot,
+        fields: Optional[Sequence[str]] = None
+    ) -> Dict:
+        """깊은 순위 목록을 커서 캐시에 저장하고 첫 페이지 반환"""
+        depth = max(page_size, self.max_ranked_results)
+        ranked_candidates, processed_query = self._rank(query, depth, filters, timer, snapshot)
+
+        with timer.stage('cursor'):
+            ranked = RankedList(
+                query=query,
+                keywords=processed_query['tokens'],
+                candidates=ranked_candidates,
+                snapshot=snapshot,
+                search_method=processed_query['route'].method,
+                snippet_terms=self._snippet_terms(processed_query)
+            )
+            token = self.cursor_cache.put(ranked)
 
-        # 4. 결과 융합 (Reciprocal Rank Fusion)
-        merged_results = self._reciprocal_rank_fusion(
-            vector_results,
-            bm25_results
+        response = self._format_page(
+            query, ranked_candidates.head(page_size), processed_query['tokens'], timer, snapshot,
+            fields, ranked.snippet_terms
         )
+        self._add_query_metadata(response, processed_query)
+        self._add_page_metadata(response, token, ranked, 0, page_size)
+        return response
 
-        # 5. 규칙 기반 재랭킹
-        ranked_results = self._rule_based_ranking(
-            query=query,
-            results=merged_results
+    def suggest(self, prefix: str, limit: int = 10) -> List[Dict]:
+        """
+        검색어 자동완성 (서비스 중인 스냅샷의 접두사 색인 조회, 모델/BM25 미사용)
+
+        Args:
+            prefix: 입력 중인 검색어
+            limit: 최대 후보 수
+
+        Returns:
+            [{"term", "source", "frequency"}] 빈도순
+        """
+        return [
+            {'term': s.term, 'source': s.source, 'frequency': s.frequency}
+            for s in self._snapshot.suggest_index.suggest(prefix, limit)
+        ]
+
+    def page(
+        self, cursor: str, page_size: int = 10, fields: Optional[Sequence[str]] = None
+    ) -> Dict:
+        """
+        커서 다음 페이지 (파이프라인 재실행 없이 저장된 순위 목록 구간만 조회/포맷팅)
+
+        Args:
+            cursor: 이전 응답의 metadata.next_cursor
+            page_size: 페이지 크기
+            fields: 결과 항목에 포함할 필드 (None이면 DEFAULT_ARTICLE_FIELDS)
+
+        Returns:
+            검색 결과 (search()와 같은 형식)
+
+        Raises:
+            CursorError: 잘못되었거나 만료된 커서
+        """
+        start_time = time.perf_counter()
+        timer = StageTimer()
+
+        with timer.activate():
+            with timer.stage('cursor'):
+                try:
+                    ranked, offset = self.cursor_cache.get(cursor)
+                except KeyError:
+                    record_cache('search_cursor', False)
+                    raise
+                record_cache('search_cursor', True)
+
+            response = self._format_page(
+                ranked.query,
+                ranked.candidates.take(slice(offset, offset + page_size)),
+                ranked.keywords,
+                timer,
+                ranked.snapshot,
+                fields,
+                ranked.snippet_terms
+            )
+            response['metadata']['search_method'] = ranked.search_method
+            token = self.cursor_cache.decode(cursor)[0]
+            self._add_page_metadata(response, token, ranked, offset, page_size)
+
+        total_seconds = time.perf_counter() - start_time
+        response['metadata']['search_time_ms'] = total_seconds * 1000
+        response['metadata']['stage_times_ms'] = timer.as_ms()
+        response['metadata']['corpus_generation'] = ranked.snapshot.generation
+        record_search('cursor_page', timer.durations, total_seconds)
+
+        return response
+
+    @staticmethod
+    def _add_query_metadata(response: Dict, processed_query: Dict) -> None:
+        """검색 경로와 철자 교정 제안 기록"""
+        response['metadata']['search_method'] = processed_query['route'].method
+        response['metadata']['did_you_mean'] = processed_query.get('did_you_mean')
+
+    def _add_page_metadata(
+        self, response: Dict, token: str, ranked: RankedList, offset: int, page_size: int
+    ) -> None:
+        """페이지 위치와 다음 커서 기록"""
+        next_offset = offset + page_size
+        response['metadata']['offset'] = offset
+        response['metadata']['total_ranked'] = len(ranked)
+        response['metadata']['next_cursor'] = (
+            self.cursor_cache.encode(token, next_offset) if next_offset < len(ranked) else None
         )
 
-        # 6. 상위 k개 선택
-        final_results = ranked_results[:top_k]
+    def _format_page(
+        self,
+        query: str,
+        candidates: Candidates,
+        keywords: List[str],
+        timer: StageTimer,
+        snapshot: IndexSnapshot,
+        fields: Optional[Sequence[str]] = None,
+        snippet_terms: Optional[List[str]] = None
+    ) -> Dict:
+        """반환할 행만 문서 조회 + 참조 조항 조회 + 응답 포맷팅"""
+        with timer.stage('hydrate'):
+            rows = self._hydrate(candidates, snapshot)
+
+        related = None
+        if fields is None or 'related_articles' in fields:
+            related = [self._find_related_articles(doc) for doc, _ in rows]
+
+        with timer.stage('format'):
+            return self._format_response(
+                query=query,
+                rows=rows,
+                search_time_ms=0.0,  # 전체 소요 시간은 포맷팅 후 기록
+                keywords=keywords,
+                related=related,
+                fields=fields,
+                snippet_terms=snippet_terms
+            )
+
+    def _snippet_terms(self, processed_query: Dict) -> List[str]:
+        """스니펫 매칭 용어 (BM25 쿼리의 원형 + 어간, 철자 교정어 포함, 한 글자 어간 제외)"""
+        tokens = self._tokenize(processed_query.get('bm25_query', processed_query['text']))
+        return [t for t in tokens if len(t) >= 2] or tokens
+
+    def _hydrate(self, candidates: Candidates, snapshot: IndexSnapshot) -> List[Tuple[Dict, float]]:
+        """
+        반환할 후보의 문서 조회 (새 dict를 만들지 않고 스냅샷 문서 참조 반환)
+
+        스냅샷에 없는 외부 후보(벡터 스토어에만 있는 청크)는 함께 받은 문서 또는
+        벡터 스토어에서 한 번에 가져오며, 어디에도 없는 후보는 제외합니다.
 
-        # 7. 참조 조항 찾기
-        for result in final_results:
-            result['related_articles'] = self._find_related_articles(result)
+        Args:
+            candidates: 반환할 후보 (최종 점수 순)
+            snapshot: 순위를 매길 때 사용한 스냅샷
+
+        Returns:
+            [(문서, 최종 점수)]
+        """
+        n_docs = len(snapshot)
+        indices = candidates.indices.tolist()
+        scores = candidates.scores.tolist()
+
+        fetched: Dict[str, Dict] = {}
+        missing = [
+            candidates.external_ids[idx - n_docs] for idx in indices
+            if idx >= n_docs and candidates.external_ids[idx - n_docs] not in candidates.external_docs
+        ]
+        if missing and hasattr(self.vector_store, 'get_documents'):
+            fetched = self.vector_store.get_documents(missing)
+
+        rows = []
+        for idx, score in zip(indices, scores):
+            if idx < n_docs:
+                rows.append((snapshot.documents[idx], score))
+                continue
+            doc_id = candidates.external_ids[idx - n_docs]
+            doc = candidates.external_docs.get(doc_id) or fetched.get(doc_id)
+            if doc is not None:
+                rows.append((doc, score))
+        return rows
+
+    def _vector_search(
+        self, query: str, top_k: int, filters: Optional[Dict], snapshot: IndexSnapshot
+    ) -> Candidates:
+        """벡터 검색 (search_ids를 제공하면 ID + 점수만 조회)"""
+        if hasattr(self.vector_store, 'search_ids'):
+            results = self.vector_store.search_ids(query=query, top_k=top_k, filters=filters)
+        else:
+            results = self.vector_store.search(query=query, top_k=top_k, filters=filters)
+        return Candidates.from_results(results, snapshot, 'similarity_score')
+
+    def _rank(
+        self,
+        query: str,
+        top_k: int,
+        filters: Optional[Dict],
+        timer: StageTimer,
+        snapshot: IndexSnapshot
+    ) -> Tuple[Candidates, Dict]:
+        """
+        전처리 → 라우팅 → 벡터/BM25F 검색 (+ 구문 조건/근접 가산점) → 융합 → 재랭킹
+
+        라우팅 결과(processed_query['route'])에 따라 필요한 단계만 실행합니다.
+        - exact: 조문 해시 조회 결과만 반환 (검색/융합/재랭킹 생략)
+        - bm25_only: 벡터 검색(쿼리 임베딩) 생략
+        - hybrid: 전체 파이프라인
+        - boolean: 불리언 후보 집합 → 후보만 BM25F 점수 → 재랭킹 (_rank_boolean)
+
+        Returns:
+            (상위 top_k 후보, 전처리된 쿼리)
+        """
+        candidate_k = top_k * self.candidate_multiplier
+
+        # 1. 쿼리 전처리
+        with timer.stage('preprocess'):
+            processed_query = self._preprocess_query(query)
+
+        # 2. 검색 경로 선택
+        with timer.stage('route'):
+            route = self.router.route(
+                processed_query['text'],
+                processed_query['article_refs'],
+                snapshot.article_index,
+                has_vector=self.vector_store is not None,
+                has_bm25=self.bm25_weight > 0,
+                boolean=processed_query['boolean'] is not None
+            )
+        processed_query['route'] = route
+
+        if route.method == ROUTE_EXACT:
+            final = self._exact_candidates(route, top_k)
+            timer.count('exact', len(final))
+            timer.count('final', len(final))
+            return final, processed_query
+
+        if route.method == ROUTE_BOOLEAN:
+            return self._rank_boolean(processed_query, candidate_k, top_k, timer, snapshot), processed_query
+
+        # 3. 벡터 검색 (하이브리드 경로에서만)
+        vector_candidates = Candidates.empty()
+        if route.method == ROUTE_HYBRID:
+            with timer.stage('vector'):
+                vector_candidates = self._vector_search(
+                    processed_query['text'],
+                    candidate_k,  # 더 많이 가져와서 융합
+                    filters,
+                    snapshot
+                )
+            timer.count('vector', len(vector_candidates))
+
+        # 4. 철자 교정 (어휘에 없는 단어가 있으면 교정어를 BM25 쿼리에 추가)
+        with timer.stage('spelling'):
+            bm25_query = self._expand_with_corrections(processed_query, snapshot)
+        processed_query['bm25_query'] = bm25_query
+
+        # 5. 구문 조건 + 근접 가산점 (위치 색인 병합, 본문 스캔 없음)
+        with timer.stage('positional'):
+            positional = self._match_positions(processed_query, snapshot)
+        if positional.phrase_documents is not None:
+            timer.count('phrase', len(positional.phrase_documents))
+
+        # 6. BM25F 검색 (부분문자열 폴백은 'substring' 단계로 별도 측정, 구문 쿼리는 폴백 없음)
+        with timer.stage('bm25'):
+            keyword_scores = positional.apply(self._keyword_scores(bm25_query, snapshot))
+            bm25_candidates = self._bm25_search(
+                query=bm25_query,
+                top_k=candidate_k,
+                timer=timer,
+                snapshot=snapshot,
+                scores=keyword_scores,
+                substring_fallback=positional.phrase_documents is None
+            )
+        timer.count('bm25', len(bm25_candidates))
+
+        # 7. 결과 융합 (Reciprocal Rank Fusion, 구문이 없는 벡터 후보 제외)
+        with timer.stage('fusion'):
+            merged = self._reciprocal_rank_fusion(
+                vector_candidates,
+                bm25_candidates,
+                k=self.rrf_k
+            )
+            if positional.phrase_documents is not None:
+                merged = merged.take(np.flatnonzero(positional.allows(merged.indices)))
+        timer.count('fused', len(merged))
+
+        # 8. 규칙 기반 재랭킹
+        with timer.stage('rerank'):
+            ranked = self._rule_based_ranking(query, merged, snapshot, keyword_scores)
+
+        # 9. 상위 k개 선택
+        final = ranked.head(top_k)
+        timer.count('final', len(final))
 
-        # 8. 응답 포맷팅
-        search_time = (datetime.now() - start_time).total_seconds() * 1000  # ms
+        return final, processed_query
 
-        response = self._format_response(
-            query=query,
-            results=final_results,
-            search_time_ms=search_time,
-            keywords=processed_query['tokens']
+    def _rank_boolean(
+        self,
+        processed_query: Dict,
+        candidate_k: int,
+        top_k: int,
+        timer: StageTimer,
+        snapshot: IndexSnapshot
+    ) -> Candidates:
+        """
+        불리언 질의: 색인 집합 연산으로 후보 집합 → 후보만 BM25F 점수 → 재랭킹
+
+        단어는 BM25F 역색인(모든 필드), 인용 부호 구문은 위치 색인(본문)으로 찾습니다.
+        조건이 명시적이므로 벡터 검색, 철자 교정, 근접 가산점, 부분문자열 폴백은 생략합니다.
+        """
+        index = snapshot.bm25_index or BM25FIndex()
+        processed_query['bm25_query'] = processed_query['text']
+
+        # 1. 후보 집합 (정렬된 문서 인덱스 배열 교집합/합집합/차집합)
+        with timer.stage('boolean'):
+            allowed = processed_query['boolean'].evaluate(
+                index.documents,
+                lambda words: snapshot.positional_index.phrase_documents(words)[0],
+                len(snapshot)
+            )
+        timer.count('boolean', len(allowed))
+
+        # 2. 후보만 BM25F 점수 (NOT 아래 단어 제외)
+        with timer.stage('bm25'):
+            scores = index.get_scores(self._tokenize(processed_query['text']), documents=allowed)
+            top = top_k_desc(scores, candidate_k)
+            candidates = Candidates(allowed[top], scores[top])
+            keyword_scores = np.zeros(len(snapshot), dtype=np.float64)
+            keyword_scores[allowed] = scores
+        timer.count('bm25', len(candidates))
+
+        # 3. 규칙 기반 재랭킹
+        with timer.stage('rerank'):
+            ranked = self._rule_based_ranking(processed_query['text'], candidates, snapshot, keyword_scores)
+
+        final = ranked.head(top_k)
+        timer.count('final', len(final))
+        return final
+
+    def _expand_with_corrections(self, processed_query: Dict, snapshot: IndexSnapshot) -> str:
+        """
+        철자 교정 제안을 processed_query['did_you_mean']에 기록하고 BM25 쿼리 반환
+
+        어휘에 없는 단어는 BM25 점수에 기여하지 못하므로(빈 결과 → 부분문자열 스캔)
+        교정된 단어를 원본 쿼리 뒤에 덧붙여 검색합니다.
+        """
+        query = processed_query['text']
+        suggestions = snapshot.spelling_index.suggest_queries(query, self._tokenize, limit=1)
+        if not suggestions:
+            return query
+
+        processed_query['did_you_mean'] = suggestions[0]
+        corrected = [
+            word for word, original in zip(suggestions[0].split(), query.split())
+            if word != original
+        ]
+        return ' '.join([query, *corrected])
+
+    def _match_positions(self, processed_query: Dict, snapshot: IndexSnapshot) -> PositionalMatch:
+        """
+        인용 부호 구문 조건과 인접 쿼리 단어 근접 가산점
+
+        구문 단어는 입력 그대로(본문 쪽은 원형/어간 모두 색인), 근접은 단어별 어간으로 찾습니다.
+        """
+        return match_positions(
+            snapshot.positional_index,
+            phrases=[phrase.split() for phrase in processed_query['phrases']],
+            word_terms=[self._tokenize(word)[-1] for word in processed_query['tokens']],
+            window=self.proximity_window,
+            weight=self.proximity_weight
         )
 
-        return response
+    @staticmethod
+    def _exact_candidates(route: Route, top_k: int) -> Candidates:
+        """조문 정확 조회 결과 (문서 순서 = 조문 분할 순서, 점수 1.0)"""
+        indices = route.indices[:top_k]
+        return Candidates(indices, np.ones(len(indices), dtype=np.float64))
 
     def _preprocess_query(self, query: str) -> Dict:
-        """쿼리 전처리 (LLM 없음)"""
+        """
+        쿼리 전처리 (LLM 없음)
+
+        Raises:
+            QuerySyntaxError: 불리언 질의 문법 오류
+        """
+        # 불리언 질의면 NOT 아래를 제외한 단어로 점수 계산, 아니면 인용 부호 구문 분리
+        boolean = BooleanQuery.parse(query)
+        if boolean is not None:
+            phrases, text = [], ' '.join(boolean.scoring_terms())
+        else:
+            phrases, text = parse_phrases(query)
+
         # 불용어 제거
         stopwords = ['은', '는', '이', '가', '을', '를', '의', '에', '와', '과']
-        tokens = [t for t in query.split() if t not in stopwords]
+        tokens = [t for t in text.split() if t not in stopwords]
 
         # 법률 용어 인식
         legal_terms = self._extract_legal_terms(query)
@@ -153,6 +723,9 @@ class HybridRetriever:
 
         return {
             'original': query,
+            'text': text,
+            'phrases': phrases,
+            'boolean': boolean,
             'tokens': tokens,
             'legal_terms': legal_terms,
             'article_refs': article_refs
@@ -188,9 +761,11 @@ class HybridRetriever:
                     parts.append(sub)
         return parts
 
-    def _substring_search(self, query: str, top_k: int) -> List[Dict]:
+    def _substring_search(
+        self, query: str, top_k: int, snapshot: Optional[IndexSnapshot] = None
+    ) -> Candidates:
         """단순 부분문자열 검색 (BM25 보완용)"""
-        results = []
+        snapshot = snapshot if snapshot is not None else self._snapshot
         # 원본 키워드 + 복합어 분리 키워드
         raw_keywords = query.split()
         keywords = []
@@ -198,192 +773,193 @@ class HybridRetriever:
             keywords.extend(self._split_korean_compound(kw))
         # 중복 제거, 길이 1 이하 제외
         keywords = list(dict.fromkeys(kw for kw in keywords if len(kw) >= 2))
+        # 원본 키워드 매칭에 가중치 부여
+        weights = [3.0 if kw in raw_keywords else 1.0 for kw in keywords]
 
-        for doc in self.documents:
+        indices = []
+        scores = []
+        for idx, doc in enumerate(snapshot.documents):
             content = doc['content']
-            match_count = sum(1 for kw in keywords if kw in content)
-            if match_count > 0:
-                # 원본 키워드 매칭에 가중치 부여
-                score = 0
-                for kw in keywords:
-                    cnt = content.count(kw)
-                    if cnt > 0:
-                        weight = 3.0 if kw in raw_keywords else 1.0
-                        score += cnt * weight
-                results.append({
-                    'id': doc['id'],
-                    'content': content,
-                    'metadata': doc.get('metadata', {}),
-                    'bm25_score': float(score),
-                })
-        results.sort(key=lambda x: x['bm25_score'], reverse=True)
-        return results[:top_k]
-
-    def _bm25_search(self, query: str, top_k: int) -> List[Dict]:
-        """BM25 검색 (결과 없으면 부분문자열 검색으로 폴백)"""
-        if not self.bm25_index:
-            return self._substring_search(query, top_k)
-
-        # 쿼리 토큰화
-        tokenized_query = self._tokenize(query)
-
-        # BM25 스코어 계산
-        scores = self.bm25_index.get_scores(tokenized_query)
-
-        # 상위 k개 인덱스
-        top_indices = np.argsort(scores)[::-1][:top_k]
-
-        # 결과 포맷팅
-        results = []
-        for idx in top_indices:
-            if scores[idx] > 0:  # 0보다 큰 스코어만
-                results.append({
-                    'id': self.document_ids[idx],
-                    'content': self.documents[idx]['content'],
-                    'metadata': self.documents[idx].get('metadata', {}),
-                    'bm25_score': float(scores[idx])
-                })
+            score = 0.0
+            for kw, weight in zip(keywords, weights):
+                if kw in content:
+                    score += content.count(kw) * weight
+            if score > 0:
+                indices.append(idx)
+                scores.append(score)
+
+        indices = np.asarray(indices, dtype=np.int64)
+        scores = np.asarray(scores, dtype=np.float64)
+        top = top_k_desc(scores, top_k)
+        return Candidates(indices[top], scores[top])
+
+    def _keyword_scores(self, query: str, snapshot: IndexSnapshot) -> np.ndarray:
+        """전체 문서 BM25F 점수 (제목/법령명/조문 번호/본문 한 번에, 인덱스가 없으면 0)"""
+        if not snapshot.bm25_index:
+            return np.zeros(len(snapshot), dtype=np.float64)
+        return snapshot.bm25_index.get_scores(self._tokenize(query))
+
+    def _bm25_search(
+        self,
+        query: str,
+        top_k: int,
+        timer: Optional[StageTimer] = None,
+        snapshot: Optional[IndexSnapshot] = None,
+        scores: Optional[np.ndarray] = None,
+        substring_fallback: bool = True
+    ) -> Candidates:
+        """
+        BM25F 검색 (결과가 부족하면 부분문자열 검색으로 보완)
+
+        Args:
+            scores: 미리 계산한 전체 문서 BM25F 점수 (None이면 여기서 계산)
+            substring_fallback: 결과가 부족할 때 부분문자열 검색으로 보완할지 여부
+        """
+        timer = timer or StageTimer()
+        snapshot = snapshot if snapshot is not None else self._snapshot
+
+        if not snapshot.bm25_index:
+            with timer.stage('substring'):
+                candidates = self._substring_search(query, top_k, snapshot)
+            timer.count('substring', len(candidates))
+            return candidates
+
+        if scores is None:
+            scores = self._keyword_scores(query, snapshot)
+
+        # 상위 k개 (0보다 큰 스코어만)
+        top = top_k_desc(scores, top_k)
+        top = top[scores[top] > 0]
+        candidates = Candidates(top.astype(np.int64), scores[top].astype(np.float64))
 
         # BM25 결과가 부족하면 부분문자열 검색으로 보완
-        if len(results) < top_k:
-            substr_results = self._substring_search(query, top_k)
-            existing_ids = {r['id'] for r in results}
-            for sr in substr_results:
-                if sr['id'] not in existing_ids:
-                    results.append(sr)
-                    existing_ids.add(sr['id'])
-                if len(results) >= top_k:
-                    break
-
-        return results
+        if substring_fallback and len(candidates) < top_k:
+            with timer.stage('substring'):
+                substr = self._substring_search(query, top_k, snapshot)
+            timer.count('substring', len(substr))
+            extra = ~np.isin(substr.indices, candidates.indices)
+            fill = top_k - len(candidates)
+            candidates = Candidates(
+                np.concatenate([candidates.indices, substr.indices[extra][:fill]]),
+                np.concatenate([candidates.scores, substr.scores[extra][:fill]])
+            )
+
+        return candidates
 
     def _reciprocal_rank_fusion(
         self,
-        vector_results: List[Dict],
-        bm25_results: List[Dict],
+        vector_candidates: Candidates,
+        bm25_candidates: Candidates,
         k: int = 60
-    ) -> List[Dict]:
+    ) -> Candidates:
         """
-        Reciprocal Rank Fusion으로 결과 융합
+        Reciprocal Rank Fusion으로 결과 융합 (벡터화)
 
         Args:
-            vector_results: 벡터 검색 결과
-            bm25_results: BM25 검색 결과
+            vector_candidates: 벡터 검색 후보 (순위 순)
+            bm25_candidates: BM25 검색 후보 (순위 순)
             k: RRF 파라미터
 
         Returns:
-            융합된 결과
-        """
-        # 결과 병합
-        doc_scores = {}
-
-        # 벡터 검색 결과
-        for rank, result in enumerate(vector_results, 1):
-            doc_id = result['id']
-
-            if doc_id not in doc_scores:
-                doc_scores[doc_id] = {
-                    'content': result['content'],
-                    'metadata': result['metadata'],
-                    'vector_score': 0,
-                    'bm25_score': 0,
-                    'fusion_score': 0
-                }
-
-            # RRF 스코어
-            doc_scores[doc_id]['vector_score'] = self.vector_weight / (k + rank)
-            doc_scores[doc_id]['fusion_score'] += self.vector_weight / (k + rank)
-
-        # BM25 검색 결과
-        for rank, result in enumerate(bm25_results, 1):
-            doc_id = result['id']
-
-            if doc_id not in doc_scores:
-                # BM25에만 있는 결과
-                for doc in self.documents:
-                    if doc['id'] == doc_id:
-                        doc_scores[doc_id] = {
-                            'content': doc['content'],
-                            'metadata': doc.get('metadata', {}),
-                            'vector_score': 0,
-                            'bm25_score': 0,
-                            'fusion_score': 0
-                        }
-                        break
-
-            # RRF 스코어
-            doc_scores[doc_id]['bm25_score'] = self.bm25_weight / (k + rank)
-            doc_scores[doc_id]['fusion_score'] += self.bm25_weight / (k + rank)
-
-        # 스코어 순으로 정렬
-        merged = [
-            {
-                'id': doc_id,
-                'content': info['content'],
-                'metadata': info['metadata'],
-                'similarity_score': info['fusion_score']
-            }
-            for doc_id, info in doc_scores.items()
-        ]
-
-        merged.sort(key=lambda x: x['similarity_score'], reverse=True)
-
-        return merged
-
-    def _rule_based_ranking(self, query: str, results: List[Dict]) -> List[Dict]:
-        """규칙 기반 재랭킹"""
-        for result in results:
-            score = result['similarity_score']
-            metadata = result['metadata']
-
-            # 규칙 1: 제목에 쿼리 단어 포함
-            title = metadata.get('title', '')
-            if any(word in title for word in query.split()):
-                score += 10
+            융합 점수 내림차순 후보 (동점은 처음 등장한 순서: 벡터 → BM25)
+        """
+        indices = np.concatenate([vector_candidates.indices, bm25_candidates.indices])
+        if len(indices) == 0:
+            return Candidates.empty()
+
+        # RRF 스코어: weight / (k + rank)
+        contributions = np.concatenate([
+            self.vector_weight / (k + np.arange(1, len(vector_candidates) + 1)),
+            self.bm25_weight / (k + np.arange(1, len(bm25_candidates) + 1)),
+        ])
+
+        unique, first_seen, inverse = np.unique(indices, return_index=True, return_inverse=True)
+        fused = np.bincount(inverse, weights=contributions, minlength=len(unique))
+
+        appearance = np.argsort(first_seen, kind='stable')
+        order = appearance[np.argsort(-fused[appearance], kind='stable')]
+
+        return Candidates(
+            unique[order],
+            fused[order],
+            vector_candidates.external_ids,
+            vector_candidates.external_docs
+        )
 
-            # 규칙 2: 법령 타입 우선순위
-            type_boost = {
-                '법률': 5,
-                '시행령': 3,
-                '시행규칙': 2,
-                '별표': 1
-            }
-            law_type = metadata.get('chunk_type', '')
-            score += type_boost.get(law_type, 0)
+    def _rule_based_ranking(
+        self,
+        query: str,
+        candidates: Candidates,
+        snapshot: Optional[IndexSnapshot] = None,
+        keyword_scores: Optional[np.ndarray] = None
+    ) -> Candidates:
+        """
+        규칙 기반 재랭킹 (스냅샷 특징 테이블에 대한 벡터화 가중합)
 
-            # 규칙 3: 정의 조항 우선
-            if metadata.get('is_definition'):
-                score += 3
+        융합 점수 + BM25F 점수(키워드 1위 대비 비율 × 융합 1위 점수) + 법령 위계 + 정의 조항
+        (+ 벌칙을 묻는 쿼리면 벌칙 조항)
 
-            result['final_score'] = score
+        Args:
+            keyword_scores: 전체 문서 BM25F 점수 (None이면 query로 계산)
+        """
+        snapshot = snapshot if snapshot is not None else self._snapshot
+        if len(candidates) == 0:
+            return candidates
+
+        query_tokens = self._tokenize(query)
+        indices = candidates.indices
+        in_snapshot = indices < len(snapshot)
+
+        if keyword_scores is None:
+            keyword_scores = self._keyword_scores(query, snapshot)
+        # 키워드 근거를 융합 점수 단위로 환산 (RRF k, 가중치와 무관하게 같은 비중)
+        top_keyword = keyword_scores.max() if len(keyword_scores) else 0.0
+        keyword = None
+        if top_keyword > 0:
+            keyword = keyword_scores[indices[in_snapshot]] / top_keyword * candidates.scores.max()
+
+        final_scores = candidates.scores.copy()
+        final_scores[in_snapshot] = rerank_scores(
+            candidates.scores[in_snapshot],
+            indices[in_snapshot],
+            snapshot.features,
+            query_tokens,
+            self.rerank_weights,
+            keyword
+        )
 
-        # 재정렬
-        results.sort(key=lambda x: x['final_score'], reverse=True)
+        # 스냅샷에 없는 외부 후보는 메타데이터로 특징을 즉석 계산
+        external = np.flatnonzero(~in_snapshot)
+        if len(external):
+            external_features = RerankFeatures.build(
+                [{'metadata': candidates.metadata(int(indices[p]), snapshot)} for p in external]
+            )
+            final_scores[external] = rerank_scores(
+                candidates.scores[external],
+                np.arange(len(external)),
+                external_features,
+                query_tokens,
+                self.rerank_weights
+            )
 
-        return results
+        # 재정렬 (동점은 융합 순서 유지)
+        order = np.argsort(-final_scores, kind='stable')
+        return Candidates(
+            indices[order], final_scores[order], candidates.external_ids, candidates.external_docs
+        )
 
     def _extract_legal_terms(self, text: str) -> List[str]:
         """법률 용어 사전 기반 추출"""
-        legal_dict = {
-            '설치': '설치기준',
-            '운영': '운영기준',
-            '검사': '안전검사',
-            '인증': '인증기준',
-            '충전소': '수소충전소',
-            '저장소': '수소저장소'
-        }
-
         terms = []
-        for key, value in legal_dict.items():
+        for key, value in LEGAL_DICT.items():
             if key in text:
                 terms.append(value)
 
         return terms
 
-    def _extract_article_numbers(self, text: str) -> List[str]:
-        """조항 번호 추출"""
-        pattern = re.compile(r'제\d+조(?:제\d+항)?(?:제\d+호)?')
-        return pattern.findall(text)
+    def _extract_article_numbers(self, text: str) -> List[Tuple[str, str]]:
+        """조항 번호 추출 ([(조 번호, 항 번호)], 공백/조의N 허용)"""
+        return parse_article_refs(text)
 
     def _find_related_articles(self, result: Dict) -> List[Dict]:
         """참조 조항 찾기 (간단 버전)"""
@@ -393,40 +969,68 @@ class HybridRetriever:
     def _format_response(
         self,
         query: str,
-        results: List[Dict],
+        rows: List[Tuple[Dict, float]],
         search_time_ms: float,
-        keywords: List[str]
+        keywords: List[str],
+        related: Optional[List[List[Dict]]] = None,
+        fields: Optional[Sequence[str]] = None,
+        snippet_terms: Optional[List[str]] = None
     ) -> Dict:
-        """응답 포맷팅"""
+        """
+        응답 포맷팅 (반환할 행에 대해서만, 요청한 필드만 생성)
+
+        Args:
+            fields: 결과 항목 필드 (None이면 DEFAULT_ARTICLE_FIELDS, id는 항상 포함)
+            snippet_terms: 스니펫 매칭 용어 (None이면 쿼리 토큰)
+        """
+        related = related or [[] for _ in rows]
+        wanted = set(DEFAULT_ARTICLE_FIELDS if fields is None else fields) | {'id'}
+        if 'snippets' in wanted and snippet_terms is None:
+            snippet_terms = self._tokenize(query)
+
         # 관련 법령 추출
         laws = list(set([
-            r['metadata'].get('law_name', '')
-            for r in results
-            if r['metadata'].get('law_name')
+            doc.get('metadata', {}).get('law_name', '')
+            for doc, _ in rows
+            if doc.get('metadata', {}).get('law_name')
         ]))
 
+        articles = []
+        for (doc, score), related_articles in zip(rows, related):
+            metadata = doc.get('metadata', {})
+            article = {'id': doc['id']}
+            if 'law_name' in wanted:
+                article['law_name'] = metadata.get('law_name', '')
+            if 'article_number' in wanted:
+                article['article_number'] = metadata.get('article_number', '')
+            if 'title' in wanted:
+                article['title'] = metadata.get('title', '')
+            if 'content' in wanted:
+                article['content'] = doc['content']
+            if 'highlighted_content' in wanted:
+                article['highlighted_content'] = self._highlight(doc['content'], keywords)
+            if 'snippets' in wanted:
+                article['snippets'] = [
+                    snippet.to_dict() for snippet in extract_snippets(
+                        doc['content'], snippet_terms, self.snippet_count, self.snippet_window
+                    )
+                ]
+            if 'related_articles' in wanted:
+                article['related_articles'] = related_articles
+            if 'relevance_score' in wanted:
+                article['relevance_score'] = score
+            articles.append(article)
+
         return {
             'query': query,
-            'total_found': len(results),
+            'total_found': len(rows),
             'keywords': keywords,
             'relevant_laws': laws,
-            'articles': [
-                {
-                    'id': r['id'],
-                    'law_name': r['metadata'].get('law_name', ''),
-                    'article_number': r['metadata'].get('article_number', ''),
-                    'title': r['metadata'].get('title', ''),
-                    'content': r['content'],
-                    'highlighted_content': self._highlight(r['content'], keywords),
-                    'related_articles': r.get('related_articles', []),
-                    'relevance_score': r['final_score']
-                }
-                for r in results
-            ],
+            'articles': articles,
             'metadata': {
                 'search_time_ms': search_time_ms,
                 'llm_used': False,  # LLM 미사용
-                'search_method': 'hybrid',
+                'search_method': self.search_mode,
                 'vector_weight': self.vector_weight,
                 'bm25_weight': self.bm25_weight
             }
@@ -0,0 +1,199 @@
+"""
+위치 색인 (구문 검색 + 근접 가산점)
+
+본문을 공백 단위 단어로 나누고 단어 위치를 BM25와 같은 토큰(원형 + 조사 제거 어간)별로
+색인합니다. 위치는 (문서 인덱스 << 32 | 단어 위치) 정수 하나로 인코딩해 용어별로 정렬해 두므로
+- 구문 "시·도지사의 허가": 용어 k의 위치 배열에서 k를 빼 교집합 (정렬 배열 병합)
+- 근접: 두 용어 위치 배열의 searchsorted로 N 단어 이내 출현 확인
+모두 해당 용어의 출현 수에만 비례하며 코퍼스 크기나 본문 길이와 무관합니다.
+
+문서 쪽은 원형과 어간을 모두 색인하고 쿼리 쪽 구문 단어는 입력 그대로 찾으므로,
+"허가"는 본문의 "허가를"과 일치하지만 "정하는"은 "정한다"와 일치하지 않습니다.
+"""
+
+import re
+from dataclasses import dataclass, field
+from types import MappingProxyType
+from typing import Callable, Dict, List, Mapping, Optional, Sequence, Tuple
+
+import numpy as np
+
+# 구문 인용 부호 ("...", “...”)
+PHRASE_PATTERN = re.compile(r'["“”]([^"“”]+)["“”]')
+_QUOTES = re.compile(r'["“”]')
+
+_POSITION_BITS = 32
+_POSITION_MASK = (1 << _POSITION_BITS) - 1
+
+
+def parse_phrases(query: str) -> Tuple[List[str], str]:
+    """
+    쿼리에서 인용 부호로 묶인 구문 추출
+
+    Returns:
+        (구문 목록, 인용 부호를 제거한 쿼리)
+    """
+    phrases = [p.strip() for p in PHRASE_PATTERN.findall(query) if p.strip()]
+    text = ' '.join(_QUOTES.sub(' ', query).split())
+    return phrases, text
+
+
+@dataclass(frozen=True)
+class PositionalIndex:
+    """용어 → 출현 위치 키(문서 << 32 | 단어 위치) 정렬 배열"""
+    postings: Mapping[str, np.ndarray] = field(default_factory=lambda: MappingProxyType({}))
+    document_count: int = 0
+
+    @classmethod
+    def build(
+        cls, contents: Sequence[str], tokenize: Callable[[str], List[str]]
+    ) -> "PositionalIndex":
+        """
+        색인 구축
+
+        Args:
+            contents: 문서 본문 (스냅샷 문서 순서)
+            tokenize: 단어 토큰화 함수 (BM25와 같은 토큰화, 단어 하나 → 원형/어간)
+
+        Returns:
+            위치 색인
+        """
+        word_tokens: Dict[str, Tuple[str, ...]] = {}
+        keys: Dict[str, List[int]] = {}
+        for doc_idx, content in enumerate(contents):
+            base = doc_idx << _POSITION_BITS
+            for position, word in enumerate(content.split()):
+                tokens = word_tokens.get(word)
+                if tokens is None:
+                    tokens = word_tokens[word] = tuple(dict.fromkeys(tokenize(word)))
+                for token in tokens:
+                    keys.setdefault(token, []).append(base | position)
+
+        # 문서 → 위치 순으로 추가했으므로 이미 정렬되어 있음
+        return cls(
+            postings=MappingProxyType({
+                token: np.asarray(values, dtype=np.int64) for token, values in keys.items()
+            }),
+            document_count=len(contents),
+        )
+
+    def positions(self, term: str) -> np.ndarray:
+        """용어 출현 위치 키 (없으면 빈 배열)"""
+        return self.postings.get(term, np.empty(0, dtype=np.int64))
+
+    def phrase_documents(self, terms: Sequence[str]) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        구문(연속 단어)이 나오는 문서
+
+        Args:
+            terms: 구문 단어 (순서대로)
+
+        Returns:
+            (문서 인덱스 오름차순, 문서별 구문 출현 수)
+        """
+        if not terms:
+            return np.empty(0, dtype=np.int64), np.empty(0, dtype=np.int64)
+
+        # 시작 위치 기준으로 맞춘 뒤 출현 수가 적은 용어부터 교집합
+        shifted = sorted(
+            (self.positions(term) - offset for offset, term in enumerate(terms)), key=len
+        )
+        starts = shifted[0]
+        for keys in shifted[1:]:
+            if len(starts) == 0:
+                break
+            starts = np.intersect1d(starts, keys, assume_unique=True)
+
+        return np.unique(starts >> _POSITION_BITS, return_counts=True)
+
+    def near_documents(self, first: str, second: str, window: int) -> np.ndarray:
+        """
+        두 용어가 window 단어 이내(순서 무관)에 함께 나오는 문서
+
+        Returns:
+            문서 인덱스 오름차순
+        """
+        a, b = self.positions(first), self.positions(second)
+        if len(a) == 0 or len(b) == 0:
+            return np.empty(0, dtype=np.int64)
+        if len(a) < len(b):
+            a, b = b, a
+
+        # b의 각 출현에서 가장 가까운 앞/뒤 a 출현까지의 거리 (다른 문서면 2^32 이상)
+        idx = np.searchsorted(a, b)
+        before = b - a[np.maximum(idx - 1, 0)]
+        after = a[np.minimum(idx, len(a) - 1)] - b
+        near = ((idx > 0) & (before >= 1) & (before <= window)) | (
+            (idx < len(a)) & (after >= 1) & (after <= window)
+        )
+        return np.unique(b[near] >> _POSITION_BITS)
+
+    def __len__(self) -> int:
+        return self.document_count
+
+
+@dataclass(frozen=True)
+class PositionalMatch:
+    """쿼리별 위치 색인 조회 결과 (BM25F 점수 배열에 적용)"""
+    # 모든 구문을 포함하는 문서 (구문이 없으면 None = 제한 없음)
+    phrase_documents: Optional[np.ndarray] = None
+    # 근접 가산 문서와 점수 배율
+    boost_documents: np.ndarray = field(default_factory=lambda: np.empty(0, dtype=np.int64))
+    boost: np.ndarray = field(default_factory=lambda: np.empty(0, dtype=np.float64))
+
+    def apply(self, scores: np.ndarray) -> np.ndarray:
+        """키워드 점수에 근접 배율을 곱하고 구문이 없는 문서는 0으로 (새 배열 반환)"""
+        scores = scores.copy()
+        scores[self.boost_documents] *= self.boost
+        if self.phrase_documents is not None:
+            allowed = np.zeros(len(scores), dtype=bool)
+            allowed[self.phrase_documents] = True
+            scores[~allowed] = 0.0
+        return scores
+
+    def allows(self, indices: np.ndarray) -> np.ndarray:
+        """후보별 구문 조건 충족 여부 (스냅샷 밖 외부 후보는 확인할 수 없어 제외)"""
+        if self.phrase_documents is None:
+            return np.ones(len(indices), dtype=bool)
+        return np.isin(indices, self.phrase_documents)
+
+
+def match_positions(
+    index: PositionalIndex,
+    phrases: Sequence[Sequence[str]],
+    word_terms: Sequence[str],
+    window: int,
+    weight: float
+) -> PositionalMatch:
+    """
+    구문 조건 + 근접 가산점 계산
+
+    Args:
+        index: 위치 색인
+        phrases: 구문별 단어 목록 (모두 포함해야 함)
+        word_terms: 쿼리 단어별 검색 용어 (어간), 인접한 두 단어마다 근접 여부 확인
+        window: 근접으로 보는 최대 단어 거리
+        weight: 모든 인접 단어 쌍이 근접할 때의 점수 배율 증가분
+
+    Returns:
+        위치 조회 결과
+    """
+    phrase_documents = None
+    for terms in phrases:
+        documents, _ = index.phrase_documents(terms)
+        phrase_documents = (
+            documents if phrase_documents is None
+            else np.intersect1d(phrase_documents, documents, assume_unique=True)
+        )
+
+    pairs = [(a, b) for a, b in zip(word_terms, word_terms[1:]) if a != b]
+    if not pairs or weight <= 0:
+        return PositionalMatch(phrase_documents)
+
+    near = np.concatenate([index.near_documents(a, b, window) for a, b in pairs])
+    documents, hits = np.unique(near, return_counts=True)
+    return PositionalMatch(
+        phrase_documents,
+        boost_documents=documents,
+        boost=1.0 + weight * hits / len(pairs),
+    )
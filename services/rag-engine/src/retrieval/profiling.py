@@ -0,0 +1,63 @@
+"""
+요청 단위 cProfile 프로파일링
+
+관리자용 /search 프로파일 모드에서 HybridRetriever.search 호출 1회를
+cProfile로 측정하고 pstats 상위 함수 요약을 반환합니다.
+"""
+
+import cProfile
+import os
+import pstats
+from typing import Any, Callable, Dict, List, Tuple
+
+
+def _function_label(func: Tuple[str, int, str]) -> str:
+    filename, line, name = func
+    if filename == "~":
+        return name
+    return f"{os.path.basename(filename)}:{line}({name})"
+
+
+def profile_call(
+    fn: Callable[..., Any],
+    *args,
+    top: int = 25,
+    sort_by: str = "cumulative",
+    **kwargs
+) -> Tuple[Any, Dict]:
+    """
+    함수 1회 호출을 cProfile로 측정
+
+    Args:
+        fn: 측정할 함수
+        top: 요약에 포함할 상위 함수 수
+        sort_by: 정렬 기준 ('cumulative', 'tottime', 'ncalls')
+
+    Returns:
+        (함수 반환값, pstats 요약)
+    """
+    profiler = cProfile.Profile()
+    result = profiler.runcall(fn, *args, **kwargs)
+
+    stats = pstats.Stats(profiler)
+    stats.sort_stats(sort_by)
+
+    functions: List[Dict] = []
+    for func in stats.fcn_list[:top]:
+        primitive_calls, total_calls, tottime, cumtime, _ = stats.stats[func]
+        functions.append({
+            "function": _function_label(func),
+            "ncalls": total_calls,
+            "primitive_calls": primitive_calls,
+            "tottime_ms": tottime * 1000,
+            "cumtime_ms": cumtime * 1000,
+        })
+
+    summary = {
+        "sort_by": sort_by,
+        "total_calls": stats.total_calls,
+        "total_time_ms": stats.total_tt * 1000,
+        "functions": functions,
+    }
+
+    return result, summary
@@ -0,0 +1,255 @@
+"""
+쿼리 라우터
+
+쿼리마다 충분한 가장 저렴한 검색 경로를 선택합니다.
+- exact: 법령명 + 조(항) 참조 ("고압가스법 시행규칙 제2조", "수소법 제36조제1항")
+  → (법령, 조, 항) 해시 조회, 임베딩/BM25 전체 점수 계산 생략
+- bm25_only: 짧은 단일 키워드 ("수소충전소") → 임베딩 생략
+- hybrid: 자연어 질의 → 벡터 + BM25
+- boolean: AND/OR/NOT 불리언 질의 ("수소충전소 AND (허가 OR 신고) NOT 벌칙")
+  → 키워드 색인 집합 연산으로 후보 집합을 만든 뒤 그 후보만 점수 계산
+"""
+
+import os
+import re
+from dataclasses import dataclass, field
+from types import MappingProxyType
+from typing import Dict, List, Mapping, Optional, Sequence, Tuple
+
+import numpy as np
+
+ROUTE_EXACT = 'exact'
+ROUTE_BM25 = 'bm25_only'
+ROUTE_HYBRID = 'hybrid'
+ROUTE_BOOLEAN = 'boolean'
+
+# 조문 참조: 제18조, 제2조의2, 제18조제2항, 제18조 제2항
+ARTICLE_REF_PATTERN = re.compile(
+    r'제\s*(\d+)\s*조(?:\s*의\s*(\d+))?(?:\s*제\s*(\d+)\s*항)?'
+)
+
+_CIRCLED_DIGITS = {chr(0x2460 + i): str(i + 1) for i in range(20)}  # ①~⑳
+
+# 하위 법령 접미사 (약칭 + 접미사 조합 별칭 생성)
+_LAW_SUFFIXES = ('시행령', '시행규칙')
+
+
+def _compact(text: str) -> str:
+    return re.sub(r'\s+', '', text)
+
+
+def normalize_paragraph(value: str) -> str:
+    """항 번호 정규화 (①, '1', '제1항' → '1')"""
+    value = (value or '').strip()
+    if value in _CIRCLED_DIGITS:
+        return _CIRCLED_DIGITS[value]
+    match = re.search(r'\d+', value)
+    return match.group() if match else ''
+
+
+def parse_article_refs(text: str) -> List[Tuple[str, str]]:
+    """
+    조문 참조 추출
+
+    Args:
+        text: 쿼리
+
+    Returns:
+        [(조 번호 '제2조' 또는 '제2조의2', 정규화된 항 번호 또는 '')]
+    """
+    refs = []
+    for article, branch, paragraph in ARTICLE_REF_PATTERN.findall(text):
+        number = f"제{article}조" + (f"의{branch}" if branch else "")
+        refs.append((number, paragraph or ''))
+    return refs
+
+
+def load_law_aliases(path: str) -> Dict[str, str]:
+    """
+    law_config.yaml에서 약칭 → 법령명 매핑 로드
+
+    Args:
+        path: 설정 파일 경로
+
+    Returns:
+        {약칭: 법령명} (파일이 없으면 빈 dict)
+    """
+    if not os.path.exists(path):
+        return {}
+
+    import yaml
+
+    with open(path, 'r', encoding='utf-8') as f:
+        config = yaml.safe_load(f) or {}
+
+    return {
+        law['short_name']: law['law_name']
+        for law in config.get('target_laws', [])
+        if law.get('short_name') and law.get('law_name')
+    }
+
+
+@dataclass(frozen=True)
+class ArticleIndex:
+    """(법령, 조, 항) → 문서 인덱스 해시 색인 + 법령명 별칭"""
+    # (법령명, 조 번호, 항 번호 또는 '') → 문서 인덱스 (문서 순서)
+    entries: Mapping[Tuple[str, str, str], Tuple[int, ...]] = field(
+        default_factory=lambda: MappingProxyType({})
+    )
+    # 공백 제거 별칭 → 법령명 (긴 별칭부터 매칭)
+    aliases: Tuple[Tuple[str, str], ...] = ()
+
+    @classmethod
+    def build(
+        cls, documents: Sequence[Dict], law_aliases: Optional[Mapping[str, str]] = None
+    ) -> "ArticleIndex":
+        """
+        색인 구축
+
+        Args:
+            documents: 스냅샷 문서 목록
+            law_aliases: 약칭 → 법령명 (law_config.yaml의 short_name)
+
+        Returns:
+            조문 색인
+        """
+        entries: Dict[Tuple[str, str, str], List[int]] = {}
+        law_names = []
+
+        for idx, doc in enumerate(documents):
+            metadata = doc.get('metadata', {})
+            law_name = metadata.get('law_name') or ''
+            article = _compact(metadata.get('article_number') or '')
+            if not law_name or not article:
+                continue
+            law_names.append(law_name)
+
+            entries.setdefault((law_name, article, ''), []).append(idx)
+            paragraphs = {normalize_paragraph(metadata.get('paragraph_number', ''))}
+            paragraphs.update(
+                normalize_paragraph(p) for p in (metadata.get('paragraph_numbers') or '').split(',')
+            )
+            for paragraph in paragraphs - {''}:
+                entries.setdefault((law_name, article, paragraph), []).append(idx)
+
+        return cls(
+            entries=MappingProxyType({key: tuple(value) for key, value in entries.items()}),
+            aliases=cls._build_aliases(set(law_names), law_aliases or {}),
+        )
+
+    @staticmethod
+    def _build_aliases(
+        law_names: set, law_aliases: Mapping[str, str]
+    ) -> Tuple[Tuple[str, str], ...]:
+        """코퍼스 법령명별 별칭 (전체 이름, 설정 약칭, 첫 단어 + '법') + 하위 법령 접미사 조합"""
+        configured = {_compact(name): short for short, name in law_aliases.items()}
+        aliases: Dict[str, str] = {}
+
+        for law_name in law_names:
+            base, suffix = law_name, ''
+            for candidate in _LAW_SUFFIXES:
+                if law_name.endswith(candidate):
+                    base, suffix = law_name[:-len(candidate)].strip(), candidate
+                    break
+
+            names = {_compact(base)}
+            if _compact(base) in configured:
+                names.add(configured[_compact(base)])
+            first_word = base.split()[0] if base.split() else ''
+            if first_word and not first_word.endswith('법'):
+                names.add(first_word + '법')
+
+            for name in names:
+                aliases.setdefault(_compact(name) + suffix, law_name)
+
+        return tuple(sorted(aliases.items(), key=lambda item: -len(item[0])))
+
+    def resolve_law(self, query: str) -> Optional[str]:
+        """쿼리에 언급된 법령명 (가장 긴 별칭 우선, 하위 법령 접미사 포함)"""
+        compact = _compact(query)
+        for alias, law_name in self.aliases:
+            if alias in compact:
+                return law_name
+        return None
+
+    def lookup(self, law_name: str, article: str, paragraph: str = '') -> np.ndarray:
+        """
+        (법령, 조, 항) 조회 (항 청크가 없으면 조 전체)
+
+        Returns:
+            문서 인덱스 배열 (없으면 빈 배열)
+        """
+        indices = ()
+        if paragraph:
+            indices = self.entries.get((law_name, article, paragraph), ())
+        if not indices:
+            indices = self.entries.get((law_name, article, ''), ())
+        return np.asarray(indices, dtype=np.int64)
+
+
+@dataclass(frozen=True)
+class Route:
+    """라우팅 결과"""
+    method: str
+    law_name: Optional[str] = None
+    article_number: Optional[str] = None
+    paragraph_number: str = ''
+    # exact 경로의 문서 인덱스
+    indices: Optional[np.ndarray] = None
+
+
+class QueryRouter:
+    """규칙 기반 쿼리 라우터"""
+
+    def __init__(self, max_keyword_length: int = 12):
+        """
+        Args:
+            max_keyword_length: bm25_only로 보낼 단일 키워드 최대 길이 (문자 수)
+        """
+        self.max_keyword_length = max_keyword_length
+
+    def route(
+        self,
+        query: str,
+        article_refs: Sequence[Tuple[str, str]],
+        article_index: ArticleIndex,
+        has_vector: bool,
+        has_bm25: bool = True,
+        boolean: bool = False
+    ) -> Route:
+        """
+        검색 경로 선택
+
+        Args:
+            query: 원본 쿼리
+            article_refs: parse_article_refs 결과
+            article_index: 조문 색인
+            has_vector: 벡터 검색 사용 가능 여부
+            has_bm25: BM25 가중치가 있는지 여부 (없으면 키워드 경로로 보내지 않음)
+            boolean: 불리언 질의인지 여부 (조건이 명시적이므로 다른 경로보다 우선)
+
+        Returns:
+            라우팅 결과
+        """
+        if boolean:
+            return Route(ROUTE_BOOLEAN)
+
+        # 1. 법령명 + 조문 참조 → 해시 조회 (조회 결과가 있을 때만)
+        if article_refs:
+            law_name = article_index.resolve_law(query)
+            if law_name is not None:
+                article, paragraph = article_refs[0]
+                indices = article_index.lookup(law_name, article, paragraph)
+                if len(indices):
+                    return Route(ROUTE_EXACT, law_name, article, paragraph, indices)
+
+        if not has_vector:
+            return Route(ROUTE_BM25)
+
+        # 2. 짧은 단일 키워드 → BM25 전용
+        tokens = query.split()
+        if has_bm25 and len(tokens) == 1 and len(tokens[0]) <= self.max_keyword_length:
+            return Route(ROUTE_BM25)
+
+        # 3. 자연어 질의 → 하이브리드
+        return Route(ROUTE_HYBRID)
@@ -0,0 +1,48 @@
+"""
+검색 인덱스 스냅샷
+
+문서 목록과 BM25 인덱스를 하나의 불변 객체로 묶습니다.
+새 스냅샷은 서비스 경로 밖에서 구축한 뒤 참조 1회 대입으로 교체하므로
+진행 중인 검색은 시작 시점의 스냅샷(문서 ↔ 인덱스가 항상 일치)으로 끝까지 수행됩니다.
+"""
+
+from dataclasses import dataclass, field
+from types import MappingProxyType
+from typing import Dict, Mapping, Optional, Tuple
+
+from .bm25f import BM25FIndex
+from .features import RerankFeatures
+from .positional import PositionalIndex
+from .router import ArticleIndex
+from .suggest import SuggestIndex
+from .spelling import SpellingIndex
+
+
+@dataclass(frozen=True)
+class IndexSnapshot:
+    """문서 + BM25 인덱스 불변 스냅샷"""
+    documents: Tuple[Dict, ...] = ()
+    document_ids: Tuple[str, ...] = ()
+    bm25_index: Optional[BM25FIndex] = None
+    # 토큰 → 출현 위치 (구문 검색, 근접 가산점)
+    positional_index: PositionalIndex = field(default_factory=PositionalIndex)
+    # 문서 ID → 위치 (융합 단계에서 BM25 전용 결과의 문서 조회용)
+    id_to_index: Mapping[str, int] = field(default_factory=lambda: MappingProxyType({}))
+    # 문서별 재랭킹 특징 (제목 토큰, 법령 위계, 정의/벌칙 여부)
+    features: RerankFeatures = field(default_factory=RerankFeatures)
+    # (법령, 조, 항) → 문서 인덱스 (조문 참조 쿼리의 정확 조회용)
+    article_index: ArticleIndex = field(default_factory=ArticleIndex)
+    # 검색어 자동완성 접두사 색인
+    suggest_index: SuggestIndex = field(default_factory=SuggestIndex)
+    # BM25 어휘 자모 삭제 색인 (철자 교정)
+    spelling_index: SpellingIndex = field(default_factory=SpellingIndex)
+    # 코퍼스 세대 (0: 아직 구축되지 않음)
+    generation: int = 0
+
+    def get(self, doc_id: str) -> Optional[Dict]:
+        """문서 ID로 문서 조회"""
+        idx = self.id_to_index.get(doc_id)
+        return self.documents[idx] if idx is not None else None
+
+    def __len__(self) -> int:
+        return len(self.documents)
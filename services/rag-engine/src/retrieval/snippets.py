@@ -0,0 +1,138 @@
+"""
+검색 결과 스니펫
+
+본문 전체 대신 쿼리 용어가 가장 많이 모인 구간(매칭 윈도우) N개와
+본문 내 오프셋, 윈도우 안의 하이라이트 위치를 반환합니다.
+"""
+
+from dataclasses import dataclass
+from typing import Dict, List, Sequence, Tuple
+
+# 윈도우 경계를 공백으로 맞출 때 허용하는 최대 이동 거리 (문자 수)
+_SNAP_DISTANCE = 12
+
+
+@dataclass(frozen=True)
+class Snippet:
+    """본문 매칭 윈도우 (start/end, highlights는 본문 기준 문자 오프셋)"""
+    text: str
+    start: int
+    end: int
+    highlights: Tuple[Tuple[int, int], ...]
+
+    def to_dict(self) -> Dict:
+        return {
+            'text': self.text,
+            'start': self.start,
+            'end': self.end,
+            'highlights': [list(span) for span in self.highlights],
+        }
+
+
+def find_hits(content: str, terms: Sequence[str]) -> List[Tuple[int, int, str]]:
+    """
+    본문에서 용어 출현 위치 (같은 위치면 긴 용어 우선, 겹치지 않음)
+
+    용어 수가 적으므로 정규식 alternation보다 용어별 str.find가 빠릅니다.
+
+    Returns:
+        [(시작, 끝, 용어)] 위치 순
+    """
+    found = []
+    for term in set(terms):
+        if not term:
+            continue
+        position = content.find(term)
+        while position != -1:
+            found.append((position, position + len(term), term))
+            position = content.find(term, position + len(term))
+
+    found.sort(key=lambda hit: (hit[0], -hit[1]))
+    hits = []
+    last_end = 0
+    for hit in found:
+        if hit[0] >= last_end:
+            hits.append(hit)
+            last_end = hit[1]
+    return hits
+
+
+def _snap(content: str, position: int, forward: bool) -> int:
+    """윈도우 경계를 바깥쪽 가까운 공백으로 이동 (단어 중간에서 잘리지 않도록)"""
+    if position <= 0 or position >= len(content):
+        return max(0, min(position, len(content)))
+    step = 1 if forward else -1
+    for offset in range(_SNAP_DISTANCE):
+        candidate = position + step * offset
+        if candidate <= 0 or candidate >= len(content):
+            break
+        if content[candidate].isspace():
+            return candidate if forward else candidate + 1
+    return position
+
+
+def extract_snippets(
+    content: str,
+    terms: Sequence[str],
+    max_snippets: int = 2,
+    window: int = 120
+) -> List[Snippet]:
+    """
+    매칭 윈도우 스니펫 추출
+
+    각 출현 위치에서 시작하는 윈도우를 (서로 다른 용어 수, 출현 수, 앞선 위치) 순으로
+    평가해 겹치지 않게 최대 max_snippets개를 고른 뒤 본문 순서로 반환합니다.
+
+    Args:
+        content: 본문
+        terms: 쿼리 용어 (원형 + 어간)
+        max_snippets: 최대 스니펫 수
+        window: 윈도우 길이 (문자 수)
+
+    Returns:
+        스니펫 목록 (용어가 없으면 본문 앞부분 1개)
+    """
+    if not content:
+        return []
+
+    hits = find_hits(content, terms)
+    if not hits:
+        end = _snap(content, min(window, len(content)), forward=True)
+        return [Snippet(content[:end], 0, end, ())]
+
+    # 후보 윈도우: 출현 위치 앞에 약간의 문맥을 두고 시작
+    lead = window // 4
+    candidates = []
+    right = 0
+    for left, (hit_start, _, _) in enumerate(hits):
+        start = max(0, hit_start - lead)
+        end = min(len(content), start + window)
+        right = max(right, left)
+        while right + 1 < len(hits) and hits[right + 1][1] <= end:
+            right += 1
+        covered = hits[left:right + 1]
+        score = (len({term for _, _, term in covered}), len(covered), -start)
+        candidates.append((score, start, end))
+
+    candidates.sort(reverse=True)
+    chosen: List[Tuple[int, int]] = []
+    for _, start, end in candidates:
+        if len(chosen) >= max_snippets:
+            break
+        if all(end <= s or start >= e for s, e in chosen):
+            chosen.append((start, end))
+
+    snippets = []
+    previous_end = 0
+    for start, end in sorted(chosen):
+        # 경계를 바깥쪽 공백으로 넓히되 앞 스니펫과 겹치지 않게
+        snapped_start = max(_snap(content, start, forward=False), previous_end)
+        snapped_end = _snap(content, end, forward=True)
+        previous_end = snapped_end
+        highlights = tuple(
+            (hit_start, hit_end) for hit_start, hit_end, _ in hits
+            if hit_start >= snapped_start and hit_end <= snapped_end
+        )
+        snippets.append(Snippet(content[snapped_start:snapped_end], snapped_start, snapped_end, highlights))
+
+    return snippets
@@ -0,0 +1,259 @@
+"""
+자모 단위 철자 교정 ("이것을 찾으셨나요?")
+
+BM25 토크나이저가 만든 코퍼스 어휘를 자모(NFD 조합형 자모)로 분해하고
+SymSpell 방식의 대칭 삭제 색인을 인덱스 구축 시 만들어 둡니다.
+조회는 입력의 삭제 변형만 만들어 해시로 후보를 찾은 뒤 실제 편집 거리로
+검증하므로 어휘 크기와 무관하게 마이크로초 단위로 끝납니다.
+
+받침 하나가 틀리거나(설치기줌 → 설치기준) 자모가 뒤바뀐 경우(저장탱그 → 저장탱크)
+음절 단위로는 거리 1이지만 자모 단위로 보면 어느 자모가 틀렸는지까지 구분됩니다.
+"""
+
+import unicodedata
+from collections import Counter
+from dataclasses import dataclass, field
+from types import MappingProxyType
+from typing import Callable, Dict, Iterable, List, Mapping, Sequence, Set, Tuple
+
+
+def to_jamo(text: str) -> str:
+    """한글 음절을 초성/중성/종성 자모로 분해 (그 외 문자는 그대로)"""
+    return unicodedata.normalize('NFD', text)
+
+
+def edit_distance(a: str, b: str, max_distance: int) -> int:
+    """
+    제한된 Damerau-Levenshtein 거리 (인접 전치 1회 = 1)
+
+    Returns:
+        거리 (max_distance 초과면 max_distance + 1)
+    """
+    if abs(len(a) - len(b)) > max_distance:
+        return max_distance + 1
+
+    # 공통 접두사/접미사는 거리에 영향이 없으므로 잘라내고 남은 부분만 계산
+    start = 0
+    while start < len(a) and start < len(b) and a[start] == b[start]:
+        start += 1
+    end = 0
+    while end < len(a) - start and end < len(b) - start and a[-1 - end] == b[-1 - end]:
+        end += 1
+    a, b = a[start:len(a) - end], b[start:len(b) - end]
+    if not a or not b:
+        return min(max(len(a), len(b)), max_distance + 1)
+
+    # 대각선 ±max_distance 띠 안의 칸만 계산 (띠 밖은 거리가 max_distance를 넘음)
+    limit = max_distance + 1
+    previous_previous: List[int] = []
+    previous = [j if j <= max_distance else limit for j in range(len(b) + 1)]
+    for i in range(1, len(a) + 1):
+        current = [limit] * (len(b) + 1)
+        current[0] = i if i <= max_distance else limit
+        row_min = current[0]
+        for j in range(max(1, i - max_distance), min(len(b), i + max_distance) + 1):
+            value = previous[j - 1] if a[i - 1] == b[j - 1] else previous[j - 1] + 1
+            if previous[j] + 1 < value:
+                value = previous[j] + 1
+            if current[j - 1] + 1 < value:
+                value = current[j - 1] + 1
+            if (i > 1 and j > 1 and a[i - 1] == b[j - 2] and a[i - 2] == b[j - 1]
+                    and previous_previous[j - 2] + 1 < value):
+                value = previous_previous[j - 2] + 1
+            if value > limit:
+                value = limit
+            current[j] = value
+            if value < row_min:
+                row_min = value
+        if row_min > max_distance:
+            return limit
+        previous_previous, previous = previous, current
+
+    return min(previous[-1], max_distance + 1)
+
+
+def _deletes(word: str, max_distance: int) -> Set[str]:
+    """word에서 자모를 최대 max_distance개 지운 변형 (word 자신 포함)"""
+    variants = {word}
+    frontier = {word}
+    for _ in range(max_distance):
+        frontier = {
+            variant[:i] + variant[i + 1:]
+            for variant in frontier if len(variant) > 1
+            for i in range(len(variant))
+        }
+        variants |= frontier
+    return variants
+
+
+@dataclass(frozen=True)
+class Correction:
+    """교정 후보"""
+    term: str
+    distance: int
+    frequency: int
+
+
+@dataclass(frozen=True)
+class SpellingIndex:
+    """자모 대칭 삭제 색인"""
+    words: Tuple[str, ...] = ()
+    jamo: Tuple[str, ...] = ()
+    frequencies: Tuple[int, ...] = ()
+    # 자모 삭제 변형 → 단어 ID
+    deletes: Mapping[str, Tuple[int, ...]] = field(default_factory=lambda: MappingProxyType({}))
+    vocabulary: frozenset = frozenset()
+    max_edit_distance: int = 2
+    # 삭제 변형을 만들 자모 접두사 길이 (긴 단어의 색인 크기 제한)
+    prefix_length: int = 10
+
+    @classmethod
+    def build(
+        cls,
+        tokenized_corpus: Iterable[Sequence[str]],
+        max_edit_distance: int = 2,
+        prefix_length: int = 10,
+        min_length: int = 2
+    ) -> "SpellingIndex":
+        """
+        색인 구축
+
+        Args:
+            tokenized_corpus: BM25 토크나이저로 토큰화한 문서들
+            max_edit_distance: 최대 자모 편집 거리
+            prefix_length: 삭제 변형을 만들 자모 접두사 길이
+            min_length: 교정 대상으로 색인할 최소 음절 수
+
+        Returns:
+            철자 교정 색인
+        """
+        counts = Counter(token for tokens in tokenized_corpus for token in tokens)
+        words = tuple(sorted(w for w in counts if len(w) >= min_length and _is_correctable(w)))
+        jamo = tuple(to_jamo(w) for w in words)
+
+        deletes: Dict[str, List[int]] = {}
+        for word_id, decomposed in enumerate(jamo):
+            for variant in _deletes(decomposed[:prefix_length], max_edit_distance):
+                deletes.setdefault(variant, []).append(word_id)
+
+        return cls(
+            words=words,
+            jamo=jamo,
+            frequencies=tuple(counts[w] for w in words),
+            deletes=MappingProxyType({key: tuple(ids) for key, ids in deletes.items()}),
+            vocabulary=frozenset(counts),
+            max_edit_distance=max_edit_distance,
+            prefix_length=prefix_length,
+        )
+
+    def allowed_distance(self, term: str) -> int:
+        """
+        단어 길이별 허용 거리
+
+        자모 6개 미만(받침 없는 두 음절 등)은 이웃 단어가 너무 많아 교정하지 않고
+        (이행 → 시행, 수립 → 수리), 자모 10개 미만은 1, 그 이상은 max_edit_distance까지 허용합니다.
+        """
+        length = len(to_jamo(term))
+        if length < 6:
+            return 0
+        return min(self.max_edit_distance, 1 if length < 10 else 2)
+
+    def lookup(self, term: str, limit: int = 3) -> List[Correction]:
+        """
+        단어 교정 후보
+
+        Args:
+            term: 교정할 단어
+            limit: 최대 후보 수
+
+        Returns:
+            거리 오름차순 → 빈도 내림차순 후보 (어휘에 있는 단어면 빈 목록)
+        """
+        if term in self.vocabulary or not self.deletes:
+            return []
+        max_distance = self.allowed_distance(term)
+        if max_distance == 0:
+            return []
+
+        decomposed = to_jamo(term)
+        seen: Set[int] = set()
+        corrections = []
+        for variant in _deletes(decomposed[:self.prefix_length], max_distance):
+            for word_id in self.deletes.get(variant, ()):
+                if word_id in seen:
+                    continue
+                seen.add(word_id)
+                distance = edit_distance(decomposed, self.jamo[word_id], max_distance)
+                if distance <= max_distance:
+                    corrections.append(
+                        Correction(self.words[word_id], distance, self.frequencies[word_id])
+                    )
+
+        corrections.sort(key=lambda c: (c.distance, -c.frequency, c.term))
+        return corrections[:limit]
+
+    def suggest_queries(
+        self,
+        query: str,
+        tokenize: Callable[[str], List[str]],
+        limit: int = 3,
+        max_corrections: int = 4
+    ) -> List[str]:
+        """
+        교정된 쿼리 후보 ("이것을 찾으셨나요?")
+
+        공백 단위 단어의 토큰(원형, 조사 제거 어간)이 모두 어휘에 없을 때만 교정합니다.
+        단어 조합은 전부 만들지 않고 (총 거리, -총 빈도) 상위 limit개만 남기며 한 단어씩 확장합니다
+        (두 키 모두 단어별 합이므로 전체 조합을 정렬한 결과와 같음).
+
+        Args:
+            query: 원본 쿼리
+            tokenize: BM25 토크나이저
+            limit: 최대 쿼리 후보 수
+            max_corrections: 교정을 시도할 최대 단어 수 (이후 어휘에 없는 단어는 그대로)
+
+        Returns:
+            총 편집 거리 오름차순 교정 쿼리 (교정할 단어가 없으면 빈 목록)
+        """
+        # (단어 목록, 총 거리, 총 빈도) 상위 limit개
+        beam: List[Tuple[Tuple[str, ...], int, int]] = [((), 0, 0)]
+        corrected = 0
+        for word in query.split():
+            corrections = self._correct_word(word, tokenize) if corrected < max_corrections else []
+            if not corrections:
+                beam = [(terms + (word,), distance, frequency) for terms, distance, frequency in beam]
+                continue
+            corrected += 1
+            extended = [
+                (terms + (c.term,), distance + c.distance, frequency + c.frequency)
+                for terms, distance, frequency in beam
+                for c in corrections
+            ]
+            extended.sort(key=lambda item: (item[1], -item[2]))
+            beam = extended[:limit]
+        if not corrected:
+            return []
+
+        return [' '.join(terms) for terms, _, _ in beam]
+
+    def _correct_word(self, word: str, tokenize: Callable[[str], List[str]]) -> List[Correction]:
+        """공백 단위 단어 교정 (원형/어간 중 더 가까운 교정)"""
+        tokens = tokenize(word)
+        if any(token in self.vocabulary for token in tokens):
+            return []
+
+        best: Dict[str, Correction] = {}
+        for token in tokens:
+            for correction in self.lookup(token):
+                current = best.get(correction.term)
+                if current is None or correction.distance < current.distance:
+                    best[correction.term] = correction
+        return sorted(best.values(), key=lambda c: (c.distance, -c.frequency, c.term))[:2]
+
+    def __len__(self) -> int:
+        return len(self.words)
+
+
+def _is_correctable(token: str) -> bool:
+    """한글 음절(과 숫자/영문)로만 된 토큰만 교정어로 사용 (문장부호가 붙은 토큰 제외)"""
+    return any('가' <= ch <= '힣' for ch in token) and token.isalnum()
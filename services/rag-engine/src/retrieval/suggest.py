@@ -0,0 +1,194 @@
+"""
+검색어 자동완성 색인
+
+인덱스 구축 시 조문 제목, 법령명/약칭, 법률 용어 사전, 정의 조항의 정의어로
+접두사 트라이를 만듭니다. 트라이 노드는 접두사 문자열 → 빈도순 상위 용어 ID로
+평탄화해 두므로 조회는 해시 1회 + 슬라이스이며 모델/BM25를 사용하지 않습니다.
+"""
+
+import re
+from dataclasses import dataclass, field
+from types import MappingProxyType
+from typing import Dict, Iterable, List, Mapping, Sequence, Tuple
+
+import numpy as np
+
+SOURCE_DEFINITION = 'definition'
+SOURCE_LAW = 'law'
+SOURCE_TITLE = 'title'
+SOURCE_TERM = 'term'
+
+# 같은 용어가 여러 출처에 있으면 앞선 출처로 표시
+_SOURCE_PRIORITY = (SOURCE_DEFINITION, SOURCE_LAW, SOURCE_TITLE, SOURCE_TERM)
+
+# 정의 조항의 정의어: 1. “저장탱크”란 ...
+DEFINED_TERM_PATTERN = re.compile(r'[“"]([^”"\n]{1,30})[”"]\s*(?:이)?란')
+
+# 제목으로 쓰기에 너무 긴 값(파싱 오류로 본문이 들어간 경우)은 제외
+_MAX_TITLE_LENGTH = 30
+
+# 출현 횟수 계산용 다항 해시 기수
+_HASH_BASE = np.uint64(1_000_003)
+
+
+def normalize_prefix(text: str) -> str:
+    """자동완성 키 정규화 (공백 제거 + 소문자)"""
+    return re.sub(r'\s+', '', text).lower()
+
+
+def _polynomial_hash(text: str) -> np.uint64:
+    """_corpus_frequencies의 창 해시와 같은 다항 해시 (2^64 나머지)"""
+    value = 0
+    for char in text:
+        value = (value * int(_HASH_BASE) + ord(char)) & 0xFFFFFFFFFFFFFFFF
+    return np.uint64(value)
+
+
+def extract_defined_terms(content: str) -> List[str]:
+    """정의 조항 본문에서 정의어 추출"""
+    return [term.strip() for term in DEFINED_TERM_PATTERN.findall(content) if term.strip()]
+
+
+@dataclass(frozen=True)
+class Suggestion:
+    """자동완성 후보"""
+    term: str
+    source: str
+    frequency: int
+
+
+@dataclass(frozen=True)
+class SuggestIndex:
+    """평탄화된 접두사 트라이 (접두사 → 빈도순 상위 용어 ID)"""
+    terms: Tuple[str, ...] = ()
+    sources: Tuple[str, ...] = ()
+    frequencies: Tuple[int, ...] = ()
+    nodes: Mapping[str, Tuple[int, ...]] = field(default_factory=lambda: MappingProxyType({}))
+    # 노드별 저장 후보 수 (요청 limit 상한)
+    max_suggestions: int = 20
+
+    @classmethod
+    def build(
+        cls,
+        documents: Sequence[Dict],
+        is_definition: Iterable[bool] = (),
+        law_names: Iterable[str] = (),
+        legal_terms: Iterable[str] = (),
+        max_suggestions: int = 20
+    ) -> "SuggestIndex":
+        """
+        자동완성 색인 구축
+
+        Args:
+            documents: 스냅샷 문서 목록
+            is_definition: 문서별 정의 조항 여부 (RerankFeatures.is_definition)
+            law_names: 추가 법령명/약칭 (law_config.yaml)
+            legal_terms: 법률 용어 사전 용어
+            max_suggestions: 접두사마다 저장할 최대 후보 수
+
+        Returns:
+            자동완성 색인
+        """
+        candidates: Dict[str, str] = {}
+
+        def add(term: str, source: str) -> None:
+            term = ' '.join(term.split())
+            if not term:
+                return
+            current = candidates.get(term)
+            if current is None or _SOURCE_PRIORITY.index(source) < _SOURCE_PRIORITY.index(current):
+                candidates[term] = source
+
+        definition_flags = np.asarray(list(is_definition), dtype=bool)
+        for idx, doc in enumerate(documents):
+            metadata = doc.get('metadata', {})
+            add(metadata.get('law_name') or '', SOURCE_LAW)
+            title = metadata.get('title') or ''
+            if len(title) <= _MAX_TITLE_LENGTH and '\n' not in title:
+                add(title, SOURCE_TITLE)
+            if idx < len(definition_flags) and definition_flags[idx]:
+                for term in extract_defined_terms(doc.get('content', '')):
+                    add(term, SOURCE_DEFINITION)
+        for name in law_names:
+            add(name, SOURCE_LAW)
+        for term in legal_terms:
+            add(term, SOURCE_TERM)
+
+        terms = list(candidates)
+        frequencies = cls._corpus_frequencies(terms, documents)
+
+        # 빈도 내림차순 → 짧은 용어 → 가나다순으로 삽입하면 노드 목록이 곧 순위
+        order = sorted(range(len(terms)), key=lambda i: (-frequencies[i], len(terms[i]), terms[i]))
+        nodes: Dict[str, List[int]] = {}
+        for rank, term_id in enumerate(order):
+            key = normalize_prefix(terms[term_id])
+            for end in range(1, len(key) + 1):
+                bucket = nodes.setdefault(key[:end], [])
+                if len(bucket) < max_suggestions:
+                    bucket.append(rank)
+
+        return cls(
+            terms=tuple(terms[i] for i in order),
+            sources=tuple(candidates[terms[i]] for i in order),
+            frequencies=tuple(frequencies[i] for i in order),
+            nodes=MappingProxyType({prefix: tuple(ids) for prefix, ids in nodes.items()}),
+            max_suggestions=max_suggestions,
+        )
+
+    @staticmethod
+    def _corpus_frequencies(terms: Sequence[str], documents: Sequence[Dict]) -> List[int]:
+        """
+        용어별 코퍼스 출현 횟수 (공백 무시, 겹치는 출현 포함, 코퍼스에 없는 용어도 1)
+
+        용어마다 코퍼스를 훑으면 용어 수 × 코퍼스 길이로 늘어나므로(둘 다 문서 수에 비례)
+        용어 길이별로 코퍼스 전체 창의 다항 해시를 numpy로 한 번에 계산해 용어 해시와 대조합니다.
+        """
+        keys = [normalize_prefix(term) for term in terms]
+        corpus = normalize_prefix('\0'.join(doc.get('content', '') for doc in documents))
+        codes = np.frombuffer(corpus.encode('utf-32-le'), dtype=np.uint32).astype(np.uint64)
+
+        by_length: Dict[int, List[int]] = {}
+        for term_id, key in enumerate(keys):
+            if 0 < len(key) <= len(codes):
+                by_length.setdefault(len(key), []).append(term_id)
+
+        counts = [0] * len(terms)
+        hashes = np.zeros(len(codes), dtype=np.uint64)
+        for length in range(1, max(by_length, default=0) + 1):
+            # 길이 length 창의 해시 (2^64 나머지 연산, 이전 길이 해시에서 한 글자씩 확장)
+            hashes = hashes[:len(codes) - length + 1] * _HASH_BASE + codes[length - 1:]
+            term_ids = by_length.get(length)
+            if not term_ids:
+                continue
+            term_hashes = np.asarray([_polynomial_hash(keys[i]) for i in term_ids], dtype=np.uint64)
+            unique_hashes, slots = np.unique(term_hashes, return_inverse=True)
+            positions = np.minimum(np.searchsorted(unique_hashes, hashes), len(unique_hashes) - 1)
+            hits = np.bincount(
+                positions[unique_hashes[positions] == hashes], minlength=len(unique_hashes)
+            )
+            for term_id, slot in zip(term_ids, slots):
+                counts[term_id] = int(hits[slot])
+
+        return [max(count, 1) for count in counts]
+
+    def suggest(self, prefix: str, limit: int = 10) -> List[Suggestion]:
+        """
+        접두사 자동완성
+
+        Args:
+            prefix: 입력 중인 검색어
+            limit: 최대 후보 수 (max_suggestions 이하)
+
+        Returns:
+            빈도순 후보
+        """
+        key = normalize_prefix(prefix)
+        if not key:
+            return []
+        return [
+            Suggestion(self.terms[i], self.sources[i], self.frequencies[i])
+            for i in self.nodes.get(key, ())[:limit]
+        ]
+
+    def __len__(self) -> int:
+        return len(self.terms)
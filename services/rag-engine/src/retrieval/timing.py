@@ -0,0 +1,123 @@
+"""
+검색 파이프라인 단계별 시간 측정
+
+중첩된 단계(예: BM25 안의 부분문자열 폴백)는 부모 단계 시간에서 제외하여
+각 단계의 순수(exclusive) 소요 시간을 기록하고, 프로파일링용 단계 트리도 함께 유지합니다.
+
+사용자 정의 단계 등록:
+- 검색 호출 경로 어디서든 ``with timed_stage("my_stage"):`` 로 감싸면
+  현재 검색 요청의 타이머(단계 트리, /metrics)에 기록됩니다 (검색 밖에서는 no-op).
+- ``register_stage_hook(callback)`` 으로 모든 단계 종료 시 (단계명, 소요 초)를 받을 수 있습니다.
+"""
+
+import time
+from contextlib import contextmanager, nullcontext
+from contextvars import ContextVar
+from typing import Callable, ContextManager, Dict, Iterator, List, Optional
+
+StageHook = Callable[[str, float], None]
+
+_STAGE_HOOKS: List[StageHook] = []
+_CURRENT_TIMER: ContextVar[Optional["StageTimer"]] = ContextVar("current_stage_timer", default=None)
+
+
+def register_stage_hook(hook: StageHook) -> None:
+    """단계 종료 콜백 등록 (hook(단계명, 소요 초))"""
+    if hook not in _STAGE_HOOKS:
+        _STAGE_HOOKS.append(hook)
+
+
+def unregister_stage_hook(hook: StageHook) -> None:
+    """단계 종료 콜백 해제"""
+    if hook in _STAGE_HOOKS:
+        _STAGE_HOOKS.remove(hook)
+
+
+def timed_stage(name: str) -> ContextManager[None]:
+    """현재 검색 요청의 타이머에 사용자 정의 단계 기록 (활성 타이머가 없으면 no-op)"""
+    timer = _CURRENT_TIMER.get()
+    if timer is None:
+        return nullcontext()
+    return timer.stage(name)
+
+
+class _StageNode:
+    """단계 트리 노드 (같은 부모 아래 같은 이름의 단계는 합산)"""
+
+    __slots__ = ("name", "seconds", "self_seconds", "calls", "children")
+
+    def __init__(self, name: str):
+        self.name = name
+        self.seconds = 0.0
+        self.self_seconds = 0.0
+        self.calls = 0
+        self.children: Dict[str, "_StageNode"] = {}
+
+    def as_dict(self) -> Dict:
+        return {
+            "stage": self.name,
+            "ms": self.seconds * 1000,
+            "self_ms": self.self_seconds * 1000,
+            "calls": self.calls,
+            "children": [child.as_dict() for child in self.children.values()],
+        }
+
+
+class StageTimer:
+    """단계별 소요 시간 기록기 (검색 1회당 1개 생성)"""
+
+    def __init__(self):
+        # 단계명 → 누적 소요 시간 (초, 하위 단계 제외)
+        self.durations: Dict[str, float] = {}
+        # 단계/검색기별 후보 수 (예: vector, bm25, substring, fused)
+        self.counts: Dict[str, int] = {}
+        self._root = _StageNode("search")
+        # [노드, 시작 시각, 하위 단계 소요 시간]
+        self._stack: List[list] = [[self._root, 0.0, 0.0]]
+
+    @contextmanager
+    def stage(self, name: str) -> Iterator[None]:
+        """단계 구간 측정"""
+        parent = self._stack[-1][0]
+        node = parent.children.get(name)
+        if node is None:
+            node = parent.children[name] = _StageNode(name)
+
+        frame = [node, time.perf_counter(), 0.0]
+        self._stack.append(frame)
+        try:
+            yield
+        finally:
+            elapsed = time.perf_counter() - frame[1]
+            self._stack.pop()
+
+            exclusive = elapsed - frame[2]
+            node.seconds += elapsed
+            node.self_seconds += exclusive
+            node.calls += 1
+            self.durations[name] = self.durations.get(name, 0.0) + exclusive
+            self._stack[-1][2] += elapsed
+
+            for hook in _STAGE_HOOKS:
+                hook(name, elapsed)
+
+    def count(self, name: str, value: int) -> None:
+        """후보 수 기록"""
+        self.counts[name] = value
+
+    @contextmanager
+    def activate(self) -> Iterator["StageTimer"]:
+        """이 타이머를 현재 요청 타이머로 지정 (timed_stage 대상)"""
+        token = _CURRENT_TIMER.set(self)
+        try:
+            yield self
+        finally:
+            _CURRENT_TIMER.reset(token)
+
+    def as_ms(self) -> Dict[str, float]:
+        """단계별 소요 시간 (ms)"""
+        return {name: seconds * 1000 for name, seconds in self.durations.items()}
+
+    def tree(self) -> List[Dict]:
+        """단계 트리 (포함/순수 소요 시간, 호출 수)"""
+        return [child.as_dict() for child in self._root.children.values()]
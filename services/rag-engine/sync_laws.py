@@ -0,0 +1,83 @@
+"""
+증분 법령 동기화 스크립트 (야간 배치용)
+
+law_config.yaml의 target_laws와 schedule 설정을 읽어
+날짜가 바뀐 법령과 해시가 바뀐 조문만 벡터 DB에 반영합니다.
+
+사용법:
+    python sync_laws.py          # 증분 동기화 (전체 재수집 주기 도래 시 자동 전체 재수집)
+    python sync_laws.py --full   # 강제 전체 재수집
+"""
+
+import argparse
+import asyncio
+import os
+import sys
+
+import yaml
+
+sys.path.insert(0, os.path.dirname(__file__))
+
+from src.collectors import AsyncLawAPIClient, IncrementalCollector, SyncStateStore
+from src.collectors.incremental_collector import SCHEDULE_DAYS
+from src.embeddings import KoreanEmbedder, LawChunker, VectorStore
+
+BASE_DIR = os.path.dirname(__file__)
+
+
+def load_config(path: str = os.path.join(BASE_DIR, "law_config.yaml")) -> dict:
+    """법령 수집 설정 로드"""
+    with open(path, "r", encoding="utf-8") as f:
+        return yaml.safe_load(f)
+
+
+async def run_sync(force_full: bool = False):
+    """증분 동기화 실행"""
+    config = load_config()
+    settings = config["collection_settings"]
+    schedule = settings.get("schedule", {})
+    law_names = [law["law_name"] for law in config["target_laws"]]
+
+    embedder = KoreanEmbedder()
+    vector_store = VectorStore(
+        collection_name=config["storage"]["vector_db"]["collection_name"],
+        embedder=embedder
+    )
+
+    async with AsyncLawAPIClient() as client:
+        collector = IncrementalCollector(
+            client=client,
+            vector_store=vector_store,
+            state_store=SyncStateStore(os.path.join(BASE_DIR, "sync_state.json")),
+            chunker=LawChunker.from_embedder(embedder),
+            full_refresh_days=SCHEDULE_DAYS.get(schedule.get("full_refresh"), 30),
+        )
+        return await collector.sync(law_names, force_full=force_full)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="증분 법령 동기화")
+    parser.add_argument("--full", action="store_true", help="강제 전체 재수집")
+    args = parser.parse_args()
+
+    print("=" * 60)
+    print("증분 법령 동기화")
+    print("=" * 60)
+
+    try:
+        report = asyncio.run(run_sync(force_full=args.full))
+    except ValueError as e:
+        print(f"\n❌ {e}")
+        return
+
+    print(f"\n✅ 동기화 완료 ({report.elapsed_seconds:.1f}초)")
+    print(f"   전체 재수집: {'예' if report.full_refresh else '아니오'}")
+    print(f"   확인한 법령: {report.laws_checked}개 / 변경: {report.laws_changed}개 / 삭제: {report.laws_removed}개")
+    print(f"   조문 갱신: {report.articles_upserted}개 / 삭제: {report.articles_deleted}개 / 유지: {report.articles_unchanged}개")
+    print(f"   청크 갱신: {report.chunks_upserted}개 / 삭제: {report.chunks_deleted}개")
+    if report.targets_not_found:
+        print(f"   ⚠️ 검색 결과 없는 대상 법령: {', '.join(report.targets_not_found)} (law_config.yaml 법령명 확인)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,170 @@
+"""AsyncLawAPIClient tests against an in-process mock law.go.kr server"""
+
+import sys
+import os
+import asyncio
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+import httpx
+import pytest
+
+from src.collectors.async_law_api_client import AsyncLawAPIClient, TokenBucket
+
+
+def _search_xml(total, entries):
+    laws = "".join(
+        f"<law><법령일련번호>{law_id}</법령일련번호>"
+        f"<법령명한글>{name}</법령명한글><법령구분명>{law_type}</법령구분명></law>"
+        for law_id, name, law_type in entries
+    )
+    return f"<response><totalCnt>{total}</totalCnt>{laws}</response>"
+
+
+def _detail_xml(law_id, name):
+    return (
+        f"<law><법령일련번호>{law_id}</법령일련번호><법령명한글>{name}</법령명한글>"
+        "<조문><조문번호>제1조</조문번호><조문제목>목적</조문제목>"
+        "<조문내용>목적 조문</조문내용></조문></law>"
+    )
+
+
+class MockLawServer:
+    """Minimal law.go.kr stand-in that records concurrency and request params"""
+
+    LAWS = {
+        None: [("1", "수소경제 육성 및 수소 안전관리에 관한 법률", "법률")],
+        "대통령령": [("2", "수소경제 육성 및 수소 안전관리에 관한 법률 시행령", "대통령령")],
+        "부령": [
+            ("3", "수소경제 육성 및 수소 안전관리에 관한 법률 시행규칙", "산업통상자원부령"),
+            ("9", "무관한 법률 시행규칙", "부령"),
+        ],
+    }
+
+    def __init__(self, fail_first=0, paged_total=0):
+        self.fail_first = fail_first
+        self.paged_total = paged_total
+        self.requests = []
+        self.in_flight = 0
+        self.max_in_flight = 0
+
+    async def handler(self, request: httpx.Request) -> httpx.Response:
+        self.requests.append(request)
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        try:
+            await asyncio.sleep(0.01)
+            if self.fail_first > 0:
+                self.fail_first -= 1
+                return httpx.Response(503)
+
+            params = request.url.params
+            if request.url.path.endswith("lawService.do"):
+                law_id = params["MST"]
+                return httpx.Response(200, text=_detail_xml(law_id, f"법령{law_id}"))
+
+            if self.paged_total:
+                page = int(params["pageNo"])
+                rows = int(params["numOfRows"])
+                start = (page - 1) * rows
+                end = min(start + rows, self.paged_total)
+                entries = [(str(i), f"법령{i}", "법률") for i in range(start, end)]
+                return httpx.Response(200, text=_search_xml(self.paged_total, entries))
+
+            entries = self.LAWS[params.get("법령구분")]
+            return httpx.Response(200, text=_search_xml(len(entries), entries))
+        finally:
+            self.in_flight -= 1
+
+
+def _client(server, **kwargs):
+    kwargs.setdefault("requests_per_second", 0)
+    kwargs.setdefault("backoff_base", 0)
+    return AsyncLawAPIClient(
+        api_key="test-key",
+        base_url="http://mock.law.go.kr",
+        transport=httpx.MockTransport(server.handler),
+        **kwargs,
+    )
+
+
+class TestAsyncSearch:
+    async def test_paginates_over_total_count(self):
+        """Should request every page implied by totalCnt"""
+        server = MockLawServer(paged_total=250)
+        async with _client(server) as client:
+            laws = await client.search_laws("수소", num_of_rows=100)
+
+        assert len(laws) == 250
+        assert sorted(int(r.url.params["pageNo"]) for r in server.requests) == [1, 2, 3]
+
+    async def test_max_pages_limits_requests(self):
+        """max_pages should cap the number of pages fetched"""
+        server = MockLawServer(paged_total=250)
+        async with _client(server) as client:
+            laws = await client.search_laws("수소", num_of_rows=100, max_pages=2)
+
+        assert len(laws) == 200
+        assert len(server.requests) == 2
+
+    async def test_retries_transient_errors(self):
+        """503 responses should be retried with backoff"""
+        server = MockLawServer(fail_first=2)
+        async with _client(server, max_retries=3) as client:
+            laws = await client.search_laws("수소")
+
+        assert len(laws) == 1
+        assert client.request_count == 3
+
+    async def test_gives_up_after_max_retries(self):
+        """Persistent failures should return an empty list, not raise"""
+        server = MockLawServer(fail_first=10)
+        async with _client(server, max_retries=2) as client:
+            laws = await client.search_laws("수소")
+
+        assert laws == []
+        assert client.request_count == 2
+
+    async def test_requires_context_manager(self):
+        """Using the client outside 'async with' should fail loudly"""
+        client = _client(MockLawServer())
+        with pytest.raises(RuntimeError):
+            await client._get("http://mock.law.go.kr/lawService.do", {})
+
+
+class TestAsyncCrawl:
+    async def test_crawl_collects_law_and_enforcement_rules(self):
+        """Crawl should fetch the law plus its decree/rule, skipping unrelated results"""
+        server = MockLawServer()
+        async with _client(server) as client:
+            details = await client.crawl(["수소경제 육성 및 수소 안전관리에 관한 법률"])
+
+        assert sorted(d["law_id"] for d in details) == ["1", "2", "3"]
+        assert all(len(d["articles"]) == 1 for d in details)
+
+    async def test_concurrency_is_bounded(self):
+        """No more than max_concurrency requests should be in flight"""
+        server = MockLawServer(paged_total=1000)
+        async with _client(server, max_concurrency=3) as client:
+            await client.search_laws("수소", num_of_rows=50)
+
+        assert len(server.requests) == 20
+        assert server.max_in_flight <= 3
+
+
+class TestTokenBucket:
+    async def test_rate_limits_requests(self):
+        """Acquiring beyond capacity should wait for refill"""
+        bucket = TokenBucket(rate=50, capacity=1)
+        loop = asyncio.get_running_loop()
+        start = loop.time()
+        for _ in range(6):
+            await bucket.acquire()
+        # 1 token up front, 5 more at 50/s -> ~0.1s
+        assert loop.time() - start >= 0.08
+
+    async def test_zero_rate_is_unlimited(self):
+        """rate <= 0 should never block"""
+        bucket = TokenBucket(rate=0)
+        for _ in range(100):
+            await bucket.acquire()
@@ -0,0 +1,113 @@
+"""Field-weighted BM25F index tests"""
+
+import sys
+import os
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+import math
+
+import numpy as np
+import pytest
+
+from src.retrieval import HybridRetriever
+from src.retrieval.bm25f import BM25FIndex, FieldSpec
+
+
+def _doc(doc_id, content, title="", law_name="수소법", article_number=""):
+    return {
+        "id": doc_id,
+        "content": content,
+        "metadata": {"law_name": law_name, "title": title, "article_number": article_number or doc_id},
+    }
+
+
+class TestBM25FIndex:
+    def test_single_field_matches_okapi_formula(self):
+        corpus = [["수소", "수소", "충전소"], ["고압가스", "제조"], ["수소", "저장"]]
+        index = BM25FIndex.build({"content": corpus}, [FieldSpec("content", weight=1.0, b=0.75)])
+
+        k1, b, avg = 1.5, 0.75, 7 / 3
+        idf = math.log(1 + (3 - 2 + 0.5) / (2 + 0.5))
+        expected = [
+            idf * 2 * (k1 + 1) / (2 + k1 * (1 - b + b * 3 / avg)),
+            0.0,
+            idf * 1 * (k1 + 1) / (1 + k1 * (1 - b + b * 2 / avg)),
+        ]
+
+        assert index.get_scores(["수소"]) == pytest.approx(expected)
+
+    def test_field_weight_scales_term_frequency(self):
+        fields = {"title": [["설치"], ["목적"]], "content": [["기준"], ["설치"]]}
+        index = BM25FIndex.build(
+            fields, [FieldSpec("title", weight=3.0, b=0.0), FieldSpec("content", weight=1.0, b=0.0)]
+        )
+
+        scores = index.get_scores(["설치"])
+
+        assert scores[0] > scores[1] > 0
+
+    def test_length_normalisation_per_field(self):
+        corpus = [["충전소"] + ["기타"] * 9, ["충전소", "기타"]]
+        normalised = BM25FIndex.build({"content": corpus}, [FieldSpec("content", 1.0, b=0.75)])
+        flat = BM25FIndex.build({"content": corpus}, [FieldSpec("content", 1.0, b=0.0)])
+
+        assert normalised.get_scores(["충전소"])[1] > normalised.get_scores(["충전소"])[0]
+        assert flat.get_scores(["충전소"])[0] == pytest.approx(flat.get_scores(["충전소"])[1])
+
+    def test_unknown_terms_and_empty_index(self):
+        index = BM25FIndex.build({"content": [["수소"]]})
+
+        assert index.get_scores(["없음"]).tolist() == [0.0]
+        assert BM25FIndex().get_scores(["수소"]).shape == (0,)
+
+
+class TestRetrieverFields:
+    def test_title_only_match_is_a_candidate(self):
+        retriever = HybridRetriever(vector_store=None, vector_weight=0.0, bm25_weight=1.0)
+        retriever.build_bm25_index([
+            _doc("a", "이 조에서 사용하는 용어의 뜻은 다음과 같다", title="정의"),
+            _doc("b", "충전소 설치 기준"),
+        ])
+
+        candidates = retriever._bm25_search("정의", 5)
+
+        assert retriever.snapshot.document_ids[candidates.indices[0]] == "a"
+        assert candidates.scores[0] > 0
+
+    def test_title_match_outranks_body_mention(self):
+        retriever = HybridRetriever(vector_store=None, vector_weight=0.0, bm25_weight=1.0)
+        retriever.build_bm25_index([
+            _doc("body", "수소충전소 설치 시 허가를 받아야 한다"),
+            _doc("title", "시설 기준은 별표와 같다", title="수소충전소의 설치"),
+        ])
+
+        response = retriever.search("수소충전소 설치", top_k=2)
+
+        assert [a["id"] for a in response["articles"]] == ["title", "body"]
+
+    def test_law_short_name_matches_law_name_field(self):
+        retriever = HybridRetriever(
+            vector_store=None, vector_weight=0.0, bm25_weight=1.0,
+            law_aliases={"고압가스법": "고압가스 안전관리법"},
+        )
+        retriever.build_bm25_index([
+            _doc("rule", "저장탱크 기준", law_name="고압가스 안전관리법 시행규칙"),
+            _doc("other", "저장탱크 기준", law_name="수소법"),
+        ])
+
+        scores = retriever.snapshot.bm25_index.get_scores(retriever._tokenize("고압가스법 저장탱크"))
+
+        assert scores[0] > scores[1] > 0
+
+    def test_field_weights_are_configurable(self):
+        content_only = HybridRetriever(
+            vector_store=None, vector_weight=0.0, bm25_weight=1.0,
+            bm25_fields=[FieldSpec("content", weight=1.0, b=0.75)],
+        )
+        content_only.build_bm25_index([_doc("a", "충전소 기준", title="정의"), _doc("b", "정의 규정")])
+
+        scores = content_only.snapshot.bm25_index.get_scores(["정의"])
+
+        assert scores[0] == 0 and scores[1] > 0
+        assert isinstance(scores, np.ndarray)
@@ -0,0 +1,176 @@
+"""Boolean query language: parser, posting-list evaluation and retriever route tests"""
+
+import sys
+import os
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+import numpy as np
+import pytest
+
+from src.retrieval import BM25FIndex, HybridRetriever
+from src.retrieval.boolean_query import (
+    And, BooleanQuery, Not, Or, Phrase, QuerySyntaxError, Term, is_boolean_query
+)
+
+DOCUMENTS = [
+    {
+        "id": "permit",
+        "content": "수소충전소를 설치하려는 자는 시·도지사의 허가를 받아야 한다",
+        "metadata": {"law_name": "수소법", "article_number": "제36조"},
+    },
+    {
+        "id": "report",
+        "content": "수소충전소의 변경은 시장에게 신고를 하여야 한다",
+        "metadata": {"law_name": "수소법", "article_number": "제37조"},
+    },
+    {
+        "id": "penalty",
+        "content": "허가 없이 수소충전소를 설치한 자에 대한 벌칙",
+        "metadata": {"law_name": "수소법", "article_number": "제60조"},
+    },
+    {
+        "id": "storage",
+        "content": "저장소 설치 허가 기준은 대통령령으로 정한다",
+        "metadata": {"law_name": "수소법", "article_number": "제40조"},
+    },
+]
+
+
+@pytest.fixture
+def retriever():
+    retriever = HybridRetriever(vector_store=None, vector_weight=0.0, bm25_weight=1.0)
+    retriever.build_bm25_index(DOCUMENTS)
+    return retriever
+
+
+def _ids(response):
+    return [article["id"] for article in response["articles"]]
+
+
+class TestParser:
+    def test_plain_queries_are_not_boolean(self):
+        """Lowercase words and parentheses alone keep the ordinary search path"""
+        assert BooleanQuery.parse("수소충전소 허가") is None
+        assert BooleanQuery.parse("제5조(허가) and 신고") is None
+        assert not is_boolean_query("ANDROID 충전")
+
+    def test_precedence_not_and_or(self):
+        query = BooleanQuery.parse("수소충전소 AND (허가 OR 신고) NOT 벌칙")
+
+        assert query.root == And((
+            Term("수소충전소"), Or((Term("허가"), Term("신고"))), Not(Term("벌칙"))
+        ))
+
+    def test_and_binds_tighter_than_or(self):
+        query = BooleanQuery.parse("허가 신고 OR 벌칙")
+
+        assert query.root == Or((And((Term("허가"), Term("신고"))), Term("벌칙")))
+
+    def test_quoted_phrase_operand(self):
+        query = BooleanQuery.parse('"시·도지사의 허가" OR 신고')
+
+        assert query.root == Or((Phrase(("시·도지사의", "허가")), Term("신고")))
+
+    def test_scoring_terms_skip_negated_words(self):
+        query = BooleanQuery.parse('수소충전소 AND (허가 OR "시장에게 신고") NOT 벌칙')
+
+        assert query.scoring_terms() == ["수소충전소", "허가", "시장에게", "신고"]
+
+    @pytest.mark.parametrize("query", [
+        "허가 AND", "OR 신고", "(허가 OR 신고", "허가 OR 신고)", 'NOT "허가', '허가 AND ""',
+    ])
+    def test_syntax_errors(self, query):
+        with pytest.raises(QuerySyntaxError):
+            BooleanQuery.parse(query)
+
+
+class TestEvaluate:
+    @pytest.fixture
+    def postings(self):
+        sets = {"a": [0, 1, 2], "b": [1, 3], "c": [2], "d": []}
+        return lambda term: np.asarray(sets.get(term, []), dtype=np.int64)
+
+    def _evaluate(self, query, postings):
+        return BooleanQuery.parse(query).evaluate(postings, lambda words: postings(words[0]), 5).tolist()
+
+    def test_set_operations(self, postings):
+        assert self._evaluate("a AND b", postings) == [1]
+        assert self._evaluate("a OR b", postings) == [0, 1, 2, 3]
+        assert self._evaluate("a NOT c", postings) == [0, 1]
+        assert self._evaluate("a AND (b OR c)", postings) == [1, 2]
+
+    def test_pure_negation_uses_whole_corpus(self, postings):
+        assert self._evaluate("NOT a", postings) == [3, 4]
+        assert self._evaluate("NOT a NOT b", postings) == [4]
+
+    def test_empty_operand_short_circuits(self, postings):
+        """An empty AND operand ends evaluation before the remaining postings are fetched"""
+        fetched = []
+
+        def tracking(term):
+            fetched.append(term)
+            return postings(term)
+
+        assert BooleanQuery.parse("d AND a").evaluate(tracking, tracking, 5).tolist() == []
+        assert fetched == ["d"]
+
+
+class TestRestrictedScoring:
+    def test_matches_dense_scores(self):
+        index = BM25FIndex.build({"content": [["가", "나"], ["나"], ["가", "다"], ["다"]]})
+        documents = np.asarray([0, 2, 3], dtype=np.int64)
+
+        for tokens in (["가"], ["나", "다"], ["없음"]):
+            expected = index.get_scores(tokens)[documents]
+            np.testing.assert_allclose(index.get_scores(tokens, documents=documents), expected)
+
+
+class TestBooleanSearch:
+    def test_compliance_query(self, retriever):
+        response = retriever.search("수소충전소 AND (허가 OR 신고) NOT 벌칙", top_k=10, profile=True)
+
+        assert sorted(_ids(response)) == ["permit", "report"]
+        assert response["metadata"]["search_method"] == "boolean"
+        assert response["metadata"]["profile"]["candidates"]["boolean"] == 2
+        assert "vector" not in response["metadata"]["stage_times_ms"]
+
+    def test_phrase_operand(self, retriever):
+        response = retriever.search('"시·도지사의 허가" OR 신고', top_k=10)
+
+        assert sorted(_ids(response)) == ["permit", "report"]
+
+    def test_no_match_returns_nothing(self, retriever):
+        """No substring fallback: an unsatisfiable condition must not return loose matches"""
+        assert retriever.search("허가 AND 없는단어", top_k=10)["articles"] == []
+
+    def test_plain_query_keeps_existing_route(self, retriever):
+        response = retriever.search("수소충전소 허가", top_k=10)
+
+        assert response["metadata"]["search_method"] == "bm25_only"
+        assert "penalty" in _ids(response)
+
+
+class TestSearchEndpoint:
+    @pytest.fixture
+    def client(self, retriever, monkeypatch):
+        from fastapi.testclient import TestClient
+        from src.monitoring.health import EngineState, PHASE_READY
+        import main
+
+        monkeypatch.setattr(main, "retriever", retriever)
+        monkeypatch.setattr(main, "engine_state", EngineState(phase=PHASE_READY, warmed_up=True))
+        with TestClient(main.app) as client:
+            yield client
+
+    def test_syntax_error_is_bad_request(self, client):
+        response = client.post("/search", json={"query": "(허가 OR 신고"})
+
+        assert response.status_code == 400
+        assert "괄호" in response.json()["detail"]
+
+    def test_boolean_query_over_http(self, client):
+        response = client.post("/search", json={"query": "허가 NOT 벌칙", "top_k": 10})
+
+        assert response.status_code == 200
+        assert {a["id"] for a in response.json()["articles"]} == {"permit", "storage"}
@@ -120,3 +120,97 @@ class TestLawChunker:
         assert self.chunker._is_definition_article("벌칙") is False
         assert self.chunker._is_definition_article("") is False
         assert self.chunker._is_definition_article(None) is False
+
+
+def whitespace_offsets(texts):
+    """Stand-in tokenizer: one token per whitespace-separated word"""
+    import re
+
+    return [[m.span() for m in re.finditer(r"\S+", text)] for text in texts]
+
+
+class TestTokenBudgetChunking:
+    def setup_method(self):
+        self.calls = []
+
+        def offsets(texts):
+            self.calls.append(len(texts))
+            return whitespace_offsets(texts)
+
+        self.chunker = LawChunker(overlap=2, token_offsets=offsets, max_tokens=10)
+
+    def _chunk(self, content, paragraphs=None, title="허가"):
+        return self.chunker.chunk_article(
+            law_id="001",
+            law_name="Test Law",
+            article_number="제5조",
+            title=title,
+            content=content,
+            paragraphs=paragraphs,
+        )
+
+    def test_requires_max_tokens(self):
+        """Token mode without a budget should be rejected"""
+        import pytest
+
+        with pytest.raises(ValueError):
+            LawChunker(token_offsets=whitespace_offsets)
+
+    def test_article_within_budget_is_single_chunk(self):
+        """Content, paragraphs and items that fit should become one chunk"""
+        chunks = self._chunk(
+            "본문 한줄",
+            paragraphs=[{"number": "①", "content": "첫 항", "items": [{"number": "1.", "content": "호"}]}],
+            title="정의",
+        )
+        assert len(chunks) == 1
+        assert chunks[0].chunk_id == "001_제5조"
+        assert chunks[0].chunk_type == "definition"
+        assert chunks[0].content == "본문 한줄\n① 첫 항\n1. 호"
+        assert chunks[0].metadata["token_count"] == 7
+
+    def test_units_are_packed_up_to_budget(self):
+        """Paragraphs should be packed greedily and never exceed max_tokens"""
+        paragraphs = [
+            {"number": n, "content": "가 나 다 라"} for n in ["①", "②", "③", "④"]
+        ]
+        chunks = self._chunk("", paragraphs=paragraphs)
+
+        # each paragraph is 5 tokens -> two per chunk
+        assert len(chunks) == 3
+        assert all(c.metadata["token_count"] <= 10 for c in chunks)
+        assert chunks[0].paragraph_number == "①"
+        assert chunks[0].metadata["paragraph_numbers"] == "①,②"
+        assert [c.chunk_id for c in chunks] == ["001_제5조_part0", "001_제5조_part1", "001_제5조_part2"]
+
+    def test_overlap_carries_previous_tail(self):
+        """A new chunk should start with the last overlap tokens of the previous unit"""
+        paragraphs = [
+            {"number": "①", "content": "a b c d e f g h"},
+            {"number": "②", "content": "i j k l m n"},
+        ]
+        chunks = self._chunk("", paragraphs=paragraphs)
+
+        assert len(chunks) == 2
+        assert chunks[1].content.startswith("g h\n② i")
+
+    def test_long_text_is_fully_covered(self):
+        """Oversized units are windowed so no token is lost to model truncation"""
+        words = [f"w{i}" for i in range(35)]
+        chunks = self._chunk(" ".join(words))
+
+        assert len(chunks) > 1
+        assert all(c.chunk_type == "text_split" for c in chunks)
+        assert all(c.metadata["token_count"] <= 10 for c in chunks)
+        covered = set(" ".join(c.content for c in chunks).split())
+        assert covered == set(words)
+
+    def test_tokenizer_called_once_per_article(self):
+        """Lengths should be measured in a single batch call"""
+        paragraphs = [{"number": str(i), "content": "가 나"} for i in range(20)]
+        self._chunk("본문", paragraphs=paragraphs)
+        assert self.calls == [21]
+
+    def test_empty_content_single_chunk(self):
+        """Empty content should still produce a single chunk"""
+        assert len(self._chunk("")) == 1
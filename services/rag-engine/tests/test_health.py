@@ -0,0 +1,84 @@
+"""Liveness/readiness probe tests"""
+
+import sys
+import os
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+import pytest
+
+from src.monitoring.health import EngineState, PHASE_FAILED, PHASE_READY
+from src.retrieval import HybridRetriever
+
+DOCUMENTS = [
+    {"id": "a", "content": "수소충전소 설치 허가", "metadata": {"law_name": "수소법", "article_number": "제1조"}},
+]
+
+
+def _retriever(documents=DOCUMENTS):
+    retriever = HybridRetriever(vector_store=None, vector_weight=0.0, bm25_weight=1.0)
+    retriever.build_bm25_index(documents)
+    return retriever
+
+
+class TestEngineState:
+    def test_not_ready_while_starting(self):
+        readiness = EngineState().readiness(retriever=None)
+
+        assert readiness["ready"] is False
+        assert readiness["checks"]["index_built"] is False
+
+    def test_ready_after_index_and_warmup(self):
+        state = EngineState(phase=PHASE_READY, warmed_up=True)
+        readiness = state.readiness(_retriever())
+
+        assert readiness["ready"] is True
+        assert readiness["search_mode"] == "bm25_only"
+        assert readiness["index"]["bm25_documents"] == 1
+        assert readiness["index"]["corpus_generation"] == 1
+
+    def test_empty_corpus_counts_as_built(self):
+        state = EngineState(phase=PHASE_READY, warmed_up=True)
+        assert state.readiness(_retriever(documents=[]))["checks"]["index_built"] is True
+
+    def test_not_ready_without_warmup(self):
+        state = EngineState(phase=PHASE_READY, warmed_up=False)
+        assert state.readiness(_retriever())["ready"] is False
+
+    def test_failure_is_reported(self):
+        state = EngineState()
+        state.fail(RuntimeError("boom"))
+
+        assert state.phase == PHASE_FAILED
+        assert "boom" in state.readiness()["error"]
+
+
+class TestProbeEndpoints:
+    @pytest.fixture
+    def app_module(self, monkeypatch):
+        import main
+
+        monkeypatch.setattr(main, "retriever", None)
+        monkeypatch.setattr(main, "vector_store", None)
+        monkeypatch.setattr(main, "engine_state", EngineState())
+        return main
+
+    def test_liveness_passes_during_initialization(self, app_module):
+        from fastapi.testclient import TestClient
+
+        response = TestClient(app_module.app).get("/health/live")
+        assert response.status_code == 200
+        assert response.json()["phase"] == "starting"
+
+    def test_readiness_503_until_ready(self, app_module, monkeypatch):
+        from fastapi.testclient import TestClient
+
+        client = TestClient(app_module.app)
+        assert client.get("/health/ready").status_code == 503
+
+        monkeypatch.setattr(app_module, "retriever", _retriever())
+        monkeypatch.setattr(app_module, "engine_state", EngineState(phase=PHASE_READY, warmed_up=True))
+        response = client.get("/health/ready")
+
+        assert response.status_code == 200
+        assert response.json()["index"]["bm25_documents"] == 1
@@ -0,0 +1,173 @@
+"""HybridRetriever tests (BM25-only, no embedding model required)"""
+
+import sys
+import os
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+import numpy as np
+import pytest
+
+from src.retrieval import HybridRetriever, StageTimer
+
+DOCUMENTS = [
+    {
+        "id": "H001_제1조",
+        "content": "제1조(목적) 이 법은 수소경제 이행을 촉진하고 수소의 안전관리에 관한 사항을 정한다.",
+        "metadata": {"law_name": "수소법", "article_number": "제1조", "title": "목적"},
+    },
+    {
+        "id": "H001_제36조",
+        "content": "제36조(수소충전소의 설치) 수소충전소를 설치하려는 자는 허가를 받아야 한다.",
+        "metadata": {"law_name": "수소법", "article_number": "제36조", "title": "수소충전소의 설치"},
+    },
+    {
+        "id": "G001_제4조",
+        "content": "제4조(고압가스 제조 허가) 고압가스를 제조하려는 자는 시장·군수의 허가를 받아야 한다.",
+        "metadata": {"law_name": "고압가스법", "article_number": "제4조", "title": "고압가스 제조 허가"},
+    },
+]
+
+
+@pytest.fixture
+def retriever():
+    retriever = HybridRetriever(vector_store=None, vector_weight=0.0, bm25_weight=1.0)
+    retriever.build_bm25_index(DOCUMENTS)
+    return retriever
+
+
+class TestStageTimer:
+    def test_nested_stage_time_is_exclusive(self):
+        """Time spent in a nested stage should not be counted twice"""
+        timer = StageTimer()
+        with timer.stage("outer"):
+            with timer.stage("inner"):
+                time.sleep(0.02)
+
+        times = timer.as_ms()
+        assert times["inner"] >= 15
+        assert times["outer"] < times["inner"]
+
+
+class TestHybridRetrieverStages:
+    def test_bm25_only_search(self, retriever):
+        response = retriever.search("수소충전소 설치", top_k=2)
+
+        assert response["articles"][0]["id"] == "H001_제36조"
+
+    def test_stage_times_reported(self, retriever):
+        """Every executed stage should appear in metadata.stage_times_ms"""
+        metadata = retriever.search("수소충전소 설치", top_k=2)["metadata"]
+        stages = metadata["stage_times_ms"]
+
+        assert {"preprocess", "bm25", "fusion", "rerank", "format"} <= set(stages)
+        assert "vector" not in stages
+        assert sum(stages.values()) <= metadata["search_time_ms"]
+
+    def test_substring_fallback_timed_separately(self, retriever):
+        """Queries BM25 cannot satisfy should record the substring fallback stage"""
+        stages = retriever.search("충전", top_k=2)["metadata"]["stage_times_ms"]
+
+        assert "substring" in stages
+
+
+class LeanVectorStore:
+    """Vector store stub exposing the id/score-only query path"""
+
+    def __init__(self, ranked_ids, extra_docs=None):
+        self.ranked_ids = ranked_ids
+        self.extra_docs = extra_docs or {}
+        self.fetched = []
+
+    def search_ids(self, query, top_k=10, filters=None):
+        return [
+            {"id": doc_id, "distance": 0.1 * i, "similarity_score": 1 - 0.1 * i}
+            for i, doc_id in enumerate(self.ranked_ids[:top_k])
+        ]
+
+    def search(self, query, top_k=10, filters=None):
+        raise AssertionError("full vector search must not be used when search_ids exists")
+
+    def get_documents(self, ids):
+        self.fetched.extend(ids)
+        return {doc_id: self.extra_docs[doc_id] for doc_id in ids if doc_id in self.extra_docs}
+
+
+class TestVectorisedStages:
+    def test_top_k_desc_breaks_ties_by_position(self):
+        from src.retrieval.candidates import top_k_desc
+
+        scores = np.array([1.0, 3.0, 2.0, 3.0, 2.0, 0.5])
+        assert top_k_desc(scores, 3).tolist() == [1, 3, 2]
+        assert top_k_desc(scores, 10).tolist() == [1, 3, 2, 4, 0, 5]
+
+    def test_fusion_matches_reference_rrf(self, retriever):
+        from src.retrieval.candidates import Candidates
+
+        retriever.vector_weight, retriever.bm25_weight = 0.7, 0.3
+        vector = Candidates(np.array([2, 0, 1]), np.zeros(3))
+        bm25 = Candidates(np.array([1, 2]), np.zeros(2))
+
+        fused = retriever._reciprocal_rank_fusion(vector, bm25, k=60)
+
+        expected = {2: 0.7 / 61 + 0.3 / 62, 0: 0.7 / 62, 1: 0.7 / 63 + 0.3 / 61}
+        assert fused.indices.tolist() == sorted(expected, key=expected.get, reverse=True)
+        assert fused.scores == pytest.approx(sorted(expected.values(), reverse=True))
+
+    def test_result_dicts_built_only_for_returned_rows(self, retriever, monkeypatch):
+        built = []
+        original = retriever._format_response
+
+        def spy(query, rows, *args, **kwargs):
+            built.append(len(rows))
+            return original(query, rows, *args, **kwargs)
+
+        monkeypatch.setattr(retriever, "_format_response", spy)
+        retriever.search("허가 수소", top_k=1)
+
+        assert built == [1]
+
+
+class TestLeanVectorPath:
+    def _retriever(self, store):
+        retriever = HybridRetriever(vector_store=store, vector_weight=0.7, bm25_weight=0.3)
+        retriever.build_bm25_index(DOCUMENTS)
+        return retriever
+
+    def test_content_hydrated_from_snapshot(self):
+        store = LeanVectorStore(["G001_제4조", "H001_제36조"])
+        response = self._retriever(store).search("허가 받는 절차", top_k=2)
+
+        contents = {a["id"]: a["content"] for a in response["articles"]}
+        assert contents["G001_제4조"] == DOCUMENTS[2]["content"]
+        assert store.fetched == []
+        assert "hydrate" in response["metadata"]["stage_times_ms"]
+
+    def test_stages_pass_index_arrays(self):
+        store = LeanVectorStore(["G001_제4조", "H001_제36조", "H001_제1조"])
+        retriever = self._retriever(store)
+
+        ranked, _ = retriever._rank("허가 받는 절차", 3, None, StageTimer(), retriever.snapshot)
+
+        assert ranked.indices.dtype.kind == "i" and ranked.scores.dtype.kind == "f"
+        assert [retriever.snapshot.document_ids[i] for i in ranked.indices][0] == "G001_제4조"
+        assert list(ranked.scores) == sorted(ranked.scores, reverse=True)
+
+    def test_vector_only_results_fetched_for_final_page_only(self):
+        extra = {
+            f"V{i}": {"id": f"V{i}", "content": f"벡터 전용 문서 {i}", "metadata": {"law_name": "수소법"}}
+            for i in range(6)
+        }
+        store = LeanVectorStore([f"V{i}" for i in range(6)], extra)
+        response = self._retriever(store).search("전혀 없는 단어", top_k=2)
+
+        assert [a["id"] for a in response["articles"]] == ["V0", "V1"]
+        assert store.fetched == ["V0", "V1"]
+        assert response["articles"][0]["content"] == "벡터 전용 문서 0"
+
+    def test_vanished_results_are_dropped(self):
+        store = LeanVectorStore(["gone", "H001_제36조"])
+        response = self._retriever(store).search("수소충전소 설치 기준", top_k=2)
+
+        assert "gone" not in [a["id"] for a in response["articles"]]
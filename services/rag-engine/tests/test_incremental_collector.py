@@ -0,0 +1,199 @@
+"""IncrementalCollector unit tests (fake API client and vector store)"""
+
+import sys
+import os
+from datetime import datetime, timedelta
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from src.collectors.law_api_client import LawInfo
+from src.collectors.incremental_collector import IncrementalCollector, SyncStateStore
+
+LAW_NAME = "수소경제 육성 및 수소 안전관리에 관한 법률"
+
+
+class FakeClient:
+    """Serves a mutable law catalogue and records detail fetches"""
+
+    def __init__(self):
+        self.enforcement_date = "20240101"
+        self.articles = {
+            "제1조": ("목적", "이 법은 수소경제를 육성한다."),
+            "제2조": ("정의", "수소란 수소 원소를 말한다."),
+            "제3조": ("책무", "국가는 수소 안전을 확보한다."),
+        }
+        self.detail_calls = []
+        self.extra_laws = []
+
+    async def discover(self, law_names):
+        return [LawInfo("100", LAW_NAME, "법률", "20231201", self.enforcement_date), *self.extra_laws]
+
+    async def get_law_detail(self, law_id):
+        self.detail_calls.append(law_id)
+        return {
+            "law_id": law_id,
+            "law_name": LAW_NAME,
+            # "제3조의2" → 조문번호 "제3조" + 조문가지번호 "2" (API 응답 형식)
+            "articles": [
+                {
+                    "article_number": number.split("의")[0],
+                    "branch_number": number.split("의")[1] if "의" in number else None,
+                    "title": title,
+                    "content": content,
+                    "paragraphs": [],
+                }
+                for number, (title, content) in self.articles.items()
+            ],
+        }
+
+
+class FakeVectorStore:
+    def __init__(self):
+        self.chunks = {}
+        self.upserts = 0
+        self.deletes = 0
+
+    def upsert_chunks(self, chunks):
+        self.upserts += len(chunks)
+        for chunk in chunks:
+            self.chunks[chunk.chunk_id] = chunk
+
+    def delete_chunks(self, chunk_ids):
+        self.deletes += len(chunk_ids)
+        for chunk_id in chunk_ids:
+            self.chunks.pop(chunk_id, None)
+
+
+class TestIncrementalCollector:
+    def setup_method(self, method):
+        self.client = FakeClient()
+        self.store = FakeVectorStore()
+
+    def _collector(self, tmp_path):
+        return IncrementalCollector(
+            client=self.client,
+            vector_store=self.store,
+            state_store=SyncStateStore(str(tmp_path / "state.json")),
+        )
+
+    async def test_first_run_collects_everything(self, tmp_path):
+        """Empty state should trigger a full collection"""
+        report = await self._collector(tmp_path).sync([LAW_NAME])
+
+        assert report.full_refresh is True
+        assert report.articles_upserted == 3
+        assert len(self.store.chunks) == 3
+
+    async def test_unchanged_dates_skip_detail_fetch(self, tmp_path):
+        """A second run with the same dates should not fetch details"""
+        await self._collector(tmp_path).sync([LAW_NAME])
+        self.client.detail_calls.clear()
+
+        report = await self._collector(tmp_path).sync([LAW_NAME])
+
+        assert report.laws_changed == 0
+        assert self.client.detail_calls == []
+
+    async def test_only_changed_articles_are_written(self, tmp_path):
+        """Date change should upsert modified articles and delete removed ones"""
+        await self._collector(tmp_path).sync([LAW_NAME])
+        self.store.upserts = 0
+
+        self.client.enforcement_date = "20250101"
+        self.client.articles["제2조"] = ("정의", "수소란 개정된 정의를 말한다.")
+        del self.client.articles["제3조"]
+
+        report = await self._collector(tmp_path).sync([LAW_NAME])
+
+        assert report.laws_changed == 1
+        assert report.articles_upserted == 1
+        assert report.articles_unchanged == 1
+        assert report.articles_deleted == 1
+        assert self.store.upserts == 1
+        assert sorted(self.store.chunks) == ["100_제1조", "100_제2조"]
+        assert "개정된" in self.store.chunks["100_제2조"].content
+
+    async def test_full_refresh_after_interval(self, tmp_path):
+        """Full refresh should be due once the interval has elapsed"""
+        collector = self._collector(tmp_path)
+        await collector.sync([LAW_NAME])
+
+        assert collector.is_full_refresh_due() is False
+        assert collector.is_full_refresh_due(datetime.now() + timedelta(days=31)) is True
+
+    async def test_state_persists_across_instances(self, tmp_path):
+        """State saved to disk should round-trip"""
+        await self._collector(tmp_path).sync([LAW_NAME])
+
+        state = SyncStateStore(str(tmp_path / "state.json"))
+        law = next(iter(state.laws.values()))
+
+        assert law.enforcement_date == "20240101"
+        assert set(law.articles) == {"제1조", "제2조", "제3조"}
+        assert law.articles["제1조"].chunk_ids == ["100_제1조"]
+
+    async def test_target_without_results_is_reported(self, tmp_path):
+        """A target name the search cannot match is surfaced instead of silently syncing nothing"""
+        report = await self._collector(tmp_path).sync([LAW_NAME, "고압가스 안전관리에 관한 법률"])
+
+        assert report.targets_not_found == ["고압가스 안전관리에 관한 법률"]
+        assert report.articles_upserted == 3
+
+    async def test_branch_articles_are_distinct(self, tmp_path):
+        """제3조 and 제3조의2 keep separate state and chunks, so reruns see no spurious changes"""
+        self.client.articles["제3조의2"] = ("특례", "국가는 수소 특례를 둔다.")
+        await self._collector(tmp_path).sync([LAW_NAME])
+
+        assert sorted(self.store.chunks) == ["100_제1조", "100_제2조", "100_제3조", "100_제3조의2"]
+
+        self.client.enforcement_date = "20250101"
+        report = await self._collector(tmp_path).sync([LAW_NAME])
+
+        assert report.articles_unchanged == 4
+        assert report.articles_upserted == 0
+
+    async def test_laws_missing_from_discover_are_removed(self, tmp_path):
+        """A repealed law's chunks and state are deleted once discover stops returning it"""
+        enforcement = LAW_NAME + " 시행령"
+        self.client.extra_laws = [LawInfo("200", enforcement, "대통령령", "20231201", "20240101")]
+        await self._collector(tmp_path).sync([LAW_NAME])
+        assert len(self.store.chunks) == 6
+
+        self.client.extra_laws = []
+        report = await self._collector(tmp_path).sync([LAW_NAME])
+
+        assert report.laws_removed == 1
+        assert report.chunks_deleted == 3
+        assert sorted(self.store.chunks) == ["100_제1조", "100_제2조", "100_제3조"]
+        assert list(SyncStateStore(str(tmp_path / "state.json")).laws) == ["".join(LAW_NAME.split())]
+
+    async def test_laws_of_unresolved_target_are_kept(self, tmp_path):
+        """If a target returns nothing (e.g. search failure), its stored laws are not deleted"""
+        await self._collector(tmp_path).sync([LAW_NAME])
+        self.client.discover = lambda law_names: _no_laws()
+
+        report = await self._collector(tmp_path).sync([LAW_NAME])
+
+        assert report.targets_not_found == [LAW_NAME]
+        assert report.laws_removed == 0
+        assert len(self.store.chunks) == 3
+
+
+async def _no_laws():
+    return []
+
+
+def test_config_targets_match_official_law_names():
+    """Every law in the shipped corpus starts with a law_config.yaml target name (discover's filter)"""
+    import json
+    import yaml
+
+    base = os.path.join(os.path.dirname(__file__), "..")
+    with open(os.path.join(base, "law_config.yaml"), encoding="utf-8") as f:
+        targets = ["".join(law["law_name"].split()) for law in yaml.safe_load(f)["target_laws"]]
+    with open(os.path.join(base, "law_documents.json"), encoding="utf-8") as f:
+        data = json.load(f)
+    documents = data["documents"] if isinstance(data, dict) else data
+
+    for law_name in {doc["metadata"]["law_name"] for doc in documents}:
+        assert any("".join(law_name.split()).startswith(t) for t in targets), law_name
@@ -0,0 +1,219 @@
+"""Immutable index snapshot and hot-swap concurrency tests"""
+
+import sys
+import os
+import threading
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+import pytest
+
+from src.retrieval import HybridRetriever
+
+
+def _corpus(batch, size=30):
+    return [
+        {
+            "id": f"b{batch}_{i}",
+            "content": f"제{i}조 수소충전소 설치 기준 배치{batch} 문서{i}",
+            "metadata": {"law_name": "수소법", "article_number": f"제{i}조", "batch": batch},
+        }
+        for i in range(size)
+    ]
+
+
+def _bm25_retriever():
+    return HybridRetriever(vector_store=None, vector_weight=0.0, bm25_weight=1.0)
+
+
+class TestIndexSnapshot:
+    def test_build_snapshot_does_not_touch_serving_index(self):
+        retriever = _bm25_retriever()
+        retriever.build_bm25_index(_corpus(0))
+
+        snapshot = retriever.build_snapshot(_corpus(1))
+
+        assert retriever.generation == 1
+        assert retriever.documents[0]["metadata"]["batch"] == 0
+        assert snapshot.generation == 2
+
+        previous = retriever.swap_snapshot(snapshot)
+        assert previous.generation == 1
+        assert retriever.documents[0]["metadata"]["batch"] == 1
+
+    def test_snapshot_is_immutable(self):
+        retriever = _bm25_retriever()
+        retriever.build_bm25_index(_corpus(0))
+
+        with pytest.raises(Exception):
+            retriever.snapshot.documents = ()
+        with pytest.raises(TypeError):
+            retriever.snapshot.id_to_index["x"] = 1
+
+    def test_snapshot_lookup_by_id(self):
+        retriever = _bm25_retriever()
+        retriever.build_bm25_index(_corpus(0, size=3))
+
+        assert retriever.snapshot.get("b0_2")["content"].endswith("문서2")
+        assert retriever.snapshot.get("missing") is None
+
+    def test_response_reports_corpus_generation(self):
+        retriever = _bm25_retriever()
+        retriever.build_bm25_index(_corpus(0))
+
+        assert retriever.search("수소충전소")["metadata"]["corpus_generation"] == 1
+
+
+class TestConcurrentSwap:
+    def test_searches_stay_consistent_during_rebuilds(self):
+        """Continuous searches during repeated rebuilds must never mix two corpora"""
+        retriever = _bm25_retriever()
+        retriever.build_bm25_index(_corpus(0))
+
+        stop = threading.Event()
+        errors = []
+        searches = [0]
+
+        def search_loop():
+            while not stop.is_set():
+                try:
+                    response = retriever.search("수소충전소 설치", top_k=5)
+                    batches = {
+                        int(article["id"].split("_")[0][1:]) for article in response["articles"]
+                    }
+                    if len(batches) != 1 or response["total_found"] != 5:
+                        errors.append(("mixed", batches, response["total_found"]))
+                    searches[0] += 1
+                except Exception as e:
+                    errors.append(e)
+
+        threads = [threading.Thread(target=search_loop) for _ in range(4)]
+        for thread in threads:
+            thread.start()
+        try:
+            for batch in range(1, 21):
+                retriever.swap_snapshot(retriever.build_snapshot(_corpus(batch)))
+        finally:
+            stop.set()
+            for thread in threads:
+                thread.join()
+
+        assert not errors
+        assert searches[0] > 0
+        assert retriever.generation == 21
+
+
+class FakeEmbedder:
+    max_tokens = 128
+
+    def token_offsets(self, texts):
+        import re
+        return [[m.span() for m in re.finditer(r"\S+", text)] for text in texts]
+
+    def embed_documents(self, texts):
+        return [[0.0] for _ in texts]
+
+
+class FakeCollection:
+    def __init__(self):
+        self.items = []
+
+    def count(self):
+        return len(self.items)
+
+    def get(self, limit, offset, include):
+        page = self.items[offset:offset + limit]
+        return {
+            "documents": [content for content, _ in page],
+            "metadatas": [metadata for _, metadata in page],
+        }
+
+
+class FakeVectorStore:
+    def __init__(self):
+        self.collection = FakeCollection()
+
+    def add_chunks(self, chunks):
+        for chunk in chunks:
+            self.collection.items.append(
+                (chunk.content, {"chunk_id": chunk.chunk_id, "law_name": chunk.law_name})
+            )
+
+
+class TestUploadHotSwap:
+    def test_search_during_uploads(self, monkeypatch):
+        """/search keeps answering with a consistent index while /upload rebuilds it"""
+        from fastapi.testclient import TestClient
+        from src.monitoring.health import EngineState, PHASE_READY
+        import main
+
+        retriever = _bm25_retriever()
+        retriever.build_bm25_index([])
+        uploads = [0]
+
+        def fake_pages(path):
+            uploads[0] += 1
+            return [f"제1조(목적) 수소충전소 설치 기준 업로드{uploads[0]} 본문입니다"]
+
+        monkeypatch.setattr(main, "retriever", retriever)
+        monkeypatch.setattr(main, "embedder", FakeEmbedder())
+        monkeypatch.setattr(main, "vector_store", FakeVectorStore())
+        monkeypatch.setattr(main, "engine_state", EngineState(phase=PHASE_READY, warmed_up=True))
+        monkeypatch.setattr(main, "_extract_pages_from_pdf", fake_pages)
+
+        stop = threading.Event()
+        errors = []
+
+        with TestClient(main.app) as client:
+            def search_loop():
+                while not stop.is_set():
+                    response = client.post("/search", json={"query": "수소충전소", "top_k": 50})
+                    if response.status_code != 200:
+                        errors.append(response.status_code)
+                        continue
+                    body = response.json()
+                    # 세대 N의 코퍼스는 업로드 N-1개의 청크로 구성
+                    expected = body["metadata"]["corpus_generation"] - 1
+                    if body["total_found"] != expected:
+                        errors.append((expected, body["total_found"]))
+
+            threads = [threading.Thread(target=search_loop) for _ in range(3)]
+            for thread in threads:
+                thread.start()
+            try:
+                for n in range(5):
+                    response = client.post(
+                        "/upload",
+                        files={"file": ("law.pdf", b"%PDF-fake", "application/pdf")},
+                        data={"law_name": "수소법", "law_id": f"L{n}"},
+                    )
+                    assert response.status_code == 200
+                    assert response.json()["corpus_generation"] == n + 2
+            finally:
+                stop.set()
+                for thread in threads:
+                    thread.join()
+
+        assert not errors
+        assert retriever.generation == 6
+
+    def test_upload_rejected_in_fork_worker(self, monkeypatch):
+        """Fork-server workers cannot propagate a snapshot swap, so /upload must refuse"""
+        from fastapi.testclient import TestClient
+        from src.monitoring.health import EngineState, PHASE_READY
+        import main
+
+        monkeypatch.setattr(main, "_fork_worker", False)
+        monkeypatch.setattr(main, "vector_store", None)
+        monkeypatch.setattr(main, "engine_state", EngineState(phase=PHASE_READY, warmed_up=True))
+        main.reopen_after_fork()
+
+        with TestClient(main.app) as client:
+            response = client.post(
+                "/upload",
+                files={"file": ("law.pdf", b"%PDF-fake", "application/pdf")},
+                data={"law_name": "수소법"},
+            )
+
+        assert response.status_code == 409
+        assert "load_pdfs_to_rag.py" in response.json()["detail"]
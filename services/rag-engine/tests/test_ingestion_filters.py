@@ -0,0 +1,120 @@
+"""Boilerplate stripping and near-duplicate chunk elimination tests"""
+
+import sys
+import os
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from src.collectors.pdf_cleaner import BoilerplateStripper
+from src.embeddings.chunker import LawChunk
+from src.embeddings.dedup import MinHashDeduplicator
+
+
+def _page(number, body):
+    return "\n".join([
+        f"법제처                            {number}                   국가법령정보센터",
+        "고압가스 안전관리법",
+        body,
+        "산업통상부 (에너지안전과-수소) 044-203-3985",
+    ])
+
+
+class TestBoilerplateStripper:
+    def test_removes_lines_repeated_across_pages(self):
+        """Header/footer lines that differ only in page number should be removed"""
+        titles = ["목적", "정의", "허가", "검사", "벌칙"]
+        pages = [_page(n, f"제{n}조({titles[n - 1]}) 본문") for n in range(1, 6)]
+        cleaned, report = BoilerplateStripper().strip(pages)
+
+        assert cleaned[0] == "제1조(목적) 본문"
+        assert report.lines_removed == 15
+        assert report.chars_after < report.chars_before
+        assert 0 < report.shrink_ratio < 1
+
+    def test_keeps_body_lines(self):
+        """Lines that appear on few pages should be kept"""
+        pages = [_page(n, "삭제 <2014. 1. 21.>" if n == 1 else f"본문 {n}") for n in range(1, 6)]
+        cleaned, _ = BoilerplateStripper().strip(pages)
+
+        assert "삭제 <2014. 1. 21.>" in cleaned[0]
+
+    def test_keeps_repeated_line_in_page_body(self):
+        """A pattern learned from page edges is not stripped from the middle of another page"""
+        note = "<개정 2020. 1. 1.>"
+        short = [_page(n, f"제{n}조 본문\n{note}") for n in range(1, 4)]
+        body = "\n".join([f"본문 {i}" for i in range(10)] + [note] + [f"본문 {i}" for i in range(10, 20)])
+        long = [_page(n, body) for n in range(4, 6)]
+        cleaned, report = BoilerplateStripper().strip(short + long)
+
+        assert "<개정 #. #. #.>" in report.patterns
+        assert cleaned[3].splitlines().count(note) == 1
+        assert cleaned[4].splitlines()[10] == note
+
+    def test_too_few_pages_is_noop(self):
+        """Frequency detection needs enough pages to be meaningful"""
+        pages = [_page(1, "본문"), _page(2, "본문")]
+        cleaned, report = BoilerplateStripper().strip(pages)
+
+        assert report.lines_removed == 0
+        assert cleaned == pages
+
+
+def _chunk(chunk_id, content, law_id="001", article_number="제1조"):
+    return LawChunk(
+        chunk_id=chunk_id, law_id=law_id, law_name="T", article_number=article_number, content=content
+    )
+
+
+class TestMinHashDeduplicator:
+    BASE = "수소충전소를 설치하려는 자는 산업통상자원부령으로 정하는 바에 따라 시·도지사의 허가를 받아야 한다."
+
+    def test_identical_signatures_for_identical_text(self):
+        dedup = MinHashDeduplicator()
+        assert (dedup.signature(self.BASE) == dedup.signature(self.BASE)).all()
+
+    def test_drops_near_duplicates_keeps_first(self):
+        """Whitespace-only variants should be dropped, distinct text kept"""
+        chunks = [
+            _chunk("a", self.BASE),
+            _chunk("b", self.BASE.replace(" ", "  ")),
+            _chunk("c", "고압가스 제조자는 안전관리자를 선임하여야 하며 그 기준은 대통령령으로 정한다."),
+        ]
+        kept, report = MinHashDeduplicator().deduplicate(chunks)
+
+        assert [c.chunk_id for c in kept] == ["a", "c"]
+        assert report.duplicates_removed == 1
+        assert report.chunks_after == 2
+
+    def test_comparison_is_scoped_by_law(self):
+        """Identical text from different laws should both survive"""
+        chunks = [_chunk("a", self.BASE, law_id="1"), _chunk("b", self.BASE, law_id="2")]
+        kept, _ = MinHashDeduplicator().deduplicate(chunks)
+
+        assert len(kept) == 2
+
+    def test_near_identical_articles_both_kept(self):
+        """Articles differing only in a threshold or a negation are distinct law, not duplicates"""
+        tail = (
+            " 이 경우 허가의 기준, 절차 및 그 밖에 필요한 사항은 산업통상자원부령으로 정하며,"
+            " 허가를 받은 자가 허가받은 사항 중 중요한 사항을 변경하려는 경우에도 또한 같다."
+        )
+        storage = "저장능력이 {}킬로그램 이상인 수소저장소를 설치하려는 자는 구청장의 허가를 받아야 한다." + tail
+        permit = "수소충전소를 설치하려는 자는 산업통상자원부령으로 정하는 바에 따라 시·도지사의 허가를 {}." + tail
+        assert MinHashDeduplicator().find_duplicates([storage.format(300), storage.format(500)]) == [1]
+
+        chunks = [
+            _chunk("a", storage.format(300), article_number="제10조"),
+            _chunk("b", storage.format(500), article_number="제11조"),
+            _chunk("c", permit.format("받아야 한다"), article_number="제12조"),
+            _chunk("d", permit.format("받지 않아도 된다"), article_number="제13조"),
+        ]
+        kept, report = MinHashDeduplicator().deduplicate(chunks)
+
+        assert [c.chunk_id for c in kept] == ["a", "b", "c", "d"]
+        assert report.duplicates_removed == 0
+
+    def test_invalid_band_configuration(self):
+        import pytest
+
+        with pytest.raises(ValueError):
+            MinHashDeduplicator(num_perm=64, bands=7)
@@ -137,3 +137,110 @@ class TestGetText:
 
         root = ET.fromstring("<root></root>")
         assert self.client._get_text(root, "missing") is None
+
+
+class TestLawXMLStreamParser:
+    XML = """<?xml version="1.0" encoding="UTF-8"?>
+    <법령>
+        <기본정보>
+            <법령일련번호>555</법령일련번호>
+            <법령명_한글>수소경제법</법령명_한글>
+            <공포일자>20240101</공포일자>
+            <시행일자>20240301</시행일자>
+        </기본정보>
+        <조문>
+            <조문단위>
+                <조문번호>1</조문번호>
+                <조문여부>전문</조문여부>
+                <조문내용>제1장 총칙</조문내용>
+            </조문단위>
+            <조문단위>
+                <조문번호>2</조문번호>
+                <조문여부>조문</조문여부>
+                <조문제목>정의</조문제목>
+                <조문내용>이 법에서 사용하는 용어의 뜻은 다음과 같다.</조문내용>
+                <항>
+                    <항번호>①</항번호>
+                    <항내용>용어의 뜻</항내용>
+                    <호>
+                        <호번호>1.</호번호>
+                        <호내용>"수소"란 다음 각 목의 것을 말한다.</호내용>
+                        <목><목번호>가.</목번호><목내용>청정수소</목내용></목>
+                        <목><목번호>나.</목번호><목내용>그 밖의 수소</목내용></목>
+                    </호>
+                </항>
+                <항>
+                    <항번호>②</항번호>
+                    <항내용>두번째 항</항내용>
+                </항>
+            </조문단위>
+        </조문>
+    </법령>"""
+
+    def test_extracts_header_and_nested_structure(self):
+        """Should extract law info and the full 조→항→호→목 hierarchy"""
+        from src.collectors.law_xml_parser import LawXMLStreamParser
+
+        result = LawXMLStreamParser().parse(self.XML)
+
+        assert result["law_id"] == "555"
+        assert result["law_name"] == "수소경제법"
+        assert result["enforcement_date"] == "20240301"
+        assert len(result["articles"]) == 1
+
+        article = result["articles"][0]
+        assert article["article_number"] == "2"
+        assert article["title"] == "정의"
+        assert [p["paragraph_number"] for p in article["paragraphs"]] == ["①", "②"]
+
+        item = article["paragraphs"][0]["items"][0]
+        assert item["item_number"] == "1."
+        assert [s["content"] for s in item["subitems"]] == ["청정수소", "그 밖의 수소"]
+        assert article["paragraphs"][1]["items"] == []
+
+    def test_paragraph_content_not_taken_from_nested_elements(self):
+        """Article content must come from direct children only"""
+        from src.collectors.law_xml_parser import LawXMLStreamParser
+
+        xml = """<law><조문><조문번호>제3조</조문번호>
+            <항><항번호>①</항번호><항내용>항 본문</항내용></항></조문></law>"""
+        article = LawXMLStreamParser().parse(xml)["articles"][0]
+
+        assert article["content"] is None
+        assert article["paragraphs"][0]["content"] == "항 본문"
+
+    def test_branch_number_kept_apart(self):
+        """조문가지번호 distinguishes 제10조 from 제10조의2"""
+        from src.collectors.law_parser import LawParser
+        from src.collectors.law_xml_parser import LawXMLStreamParser
+
+        xml = """<law>
+            <조문><조문번호>제10조</조문번호><조문내용>본조</조문내용></조문>
+            <조문><조문번호>제10조</조문번호><조문가지번호>2</조문가지번호><조문내용>가지조</조문내용></조문>
+        </law>"""
+        parsed = LawParser().parse_from_api_response(LawXMLStreamParser().parse(xml))
+
+        assert [a.full_number for a in parsed.articles] == ["제10조", "제10조의2"]
+
+    def test_iter_articles_is_lazy(self):
+        """Articles should be yielded one at a time"""
+        from src.collectors.law_xml_parser import LawXMLStreamParser
+
+        xml = "<law>" + "".join(
+            f"<조문><조문번호>제{i}조</조문번호><조문내용>내용{i}</조문내용></조문>"
+            for i in range(1, 4)
+        ) + "</law>"
+        articles = LawXMLStreamParser().iter_articles(xml)
+
+        assert next(articles)["article_number"] == "제1조"
+        assert [a["article_number"] for a in articles] == ["제2조", "제3조"]
+
+    def test_parse_law_detail_feeds_law_parser(self):
+        """Items/subitems should flow through LawParser into dataclasses"""
+        from src.collectors.law_parser import LawParser
+
+        detail = LawAPIClient(api_key="test-key")._parse_law_detail(self.XML)
+        parsed = LawParser().parse_from_api_response(detail)
+
+        items = parsed.articles[0].paragraphs[0].items
+        assert items[0].subitems[1].number == "나."
@@ -0,0 +1,110 @@
+"""Prometheus metrics registry and instrumentation tests"""
+
+import sys
+import os
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+import pytest
+
+from src.monitoring import REGISTRY, MetricsRegistry, record_search
+from src.retrieval import HybridRetriever
+
+DOCUMENTS = [
+    {"id": "a", "content": "수소충전소 설치 허가", "metadata": {"law_name": "수소법", "article_number": "제1조"}},
+    {"id": "b", "content": "고압가스 제조 허가", "metadata": {"law_name": "고압가스법", "article_number": "제2조"}},
+]
+
+
+@pytest.fixture(autouse=True)
+def clear_registry():
+    REGISTRY.clear()
+    yield
+    REGISTRY.clear()
+
+
+class TestMetricsRegistry:
+    def test_histogram_buckets_are_cumulative(self):
+        registry = MetricsRegistry()
+        hist = registry.histogram("test_seconds", "test", ["stage"], buckets=(0.1, 1.0))
+        for value in (0.05, 0.5, 5.0):
+            hist.observe(value, stage="bm25")
+
+        text = registry.render()
+        assert '# TYPE test_seconds histogram' in text
+        assert 'test_seconds_bucket{stage="bm25",le="0.1"} 1' in text
+        assert 'test_seconds_bucket{stage="bm25",le="1"} 2' in text
+        assert 'test_seconds_bucket{stage="bm25",le="+Inf"} 3' in text
+        assert 'test_seconds_count{stage="bm25"} 3' in text
+
+    def test_counter_and_gauge_render(self):
+        registry = MetricsRegistry()
+        registry.counter("test_total", "test", ["mode"]).inc(mode="hybrid")
+        registry.gauge("test_docs", "test").set(42)
+
+        text = registry.render()
+        assert 'test_total{mode="hybrid"} 1' in text
+        assert "test_docs 42" in text
+
+    def test_label_mismatch_raises(self):
+        counter = MetricsRegistry().counter("test_total", "test", ["mode"])
+        with pytest.raises(ValueError):
+            counter.inc(stage="bm25")
+
+    def test_label_values_are_escaped(self):
+        registry = MetricsRegistry()
+        registry.counter("test_total", "test", ["cache"]).inc(cache='a"b')
+
+        assert 'cache="a\\"b"' in registry.render()
+
+
+class TestRetrieverInstrumentation:
+    def test_search_records_mode_and_stages(self):
+        retriever = HybridRetriever(vector_store=None, vector_weight=0.0, bm25_weight=1.0)
+        retriever.build_bm25_index(DOCUMENTS)
+        retriever.search("수소충전소", top_k=1)
+
+        assert REGISTRY.get("rag_search_requests_total").value(mode="bm25_only") == 1
+        assert REGISTRY.get("rag_search_stage_duration_seconds").count(stage="bm25") == 1
+        assert REGISTRY.get("rag_corpus_documents").value(index="bm25") == 2
+        assert REGISTRY.get("rag_index_build_duration_seconds").count(index="bm25") == 1
+
+    def test_recording_overhead_is_small(self):
+        """Recording one search (total + ~7 stages) should cost only a few microseconds"""
+        stages = {name: 0.001 for name in ("preprocess", "vector", "bm25", "fusion", "rerank", "format")}
+        runs = 2000
+        start = time.perf_counter()
+        for _ in range(runs):
+            record_search("hybrid", stages, 0.006)
+        per_call = (time.perf_counter() - start) / runs
+
+        # 1ms 검색 기준 1% 미만
+        assert per_call < 10e-6 * 5
+
+
+class TestMetricsEndpoint:
+    def test_metrics_endpoint_exposes_search_metrics(self, monkeypatch):
+        from fastapi.testclient import TestClient
+        import main
+
+        retriever = HybridRetriever(vector_store=None, vector_weight=0.0, bm25_weight=1.0)
+        retriever.build_bm25_index(DOCUMENTS)
+        monkeypatch.setattr(main, "retriever", retriever)
+
+        client = TestClient(main.app)
+        assert client.post("/search", json={"query": "수소충전소"}).status_code == 200
+
+        response = client.get("/metrics")
+        assert response.status_code == 200
+        assert response.headers["content-type"].startswith("text/plain; version=0.0.4")
+        assert 'rag_search_requests_total{mode="bm25_only"} 1' in response.text
+
+
+class TestProcessMemory:
+    def test_reports_rss_for_current_process(self):
+        from src.monitoring import process_memory, record_process_memory
+
+        assert process_memory()["rss"] > 0
+        record_process_memory()
+        assert REGISTRY.get("rag_process_memory_bytes").value(kind="rss") > 0
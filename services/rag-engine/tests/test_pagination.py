@@ -0,0 +1,136 @@
+"""Cursor pagination tests"""
+
+import sys
+import os
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+import pytest
+
+from src.retrieval import HybridRetriever, CursorCache, CursorError
+
+
+def _corpus(size=45, tag="a"):
+    return [
+        {
+            "id": f"{tag}_{i}",
+            "content": f"제{i}조 수소충전소 설치 기준 {'안전 ' * (i % 5)}문서{tag}{i}",
+            "metadata": {"law_name": "수소법", "article_number": f"제{i}조"},
+        }
+        for i in range(size)
+    ]
+
+
+def _retriever(**kwargs):
+    retriever = HybridRetriever(vector_store=None, vector_weight=0.0, bm25_weight=1.0, **kwargs)
+    retriever.build_bm25_index(_corpus())
+    return retriever
+
+
+def _collect_pages(retriever, query, page_size):
+    response = retriever.search(query, top_k=page_size, paginate=True)
+    pages = [response]
+    while response["metadata"]["next_cursor"]:
+        response = retriever.page(response["metadata"]["next_cursor"], page_size=page_size)
+        pages.append(response)
+    return pages
+
+
+class TestCursorCache:
+    def test_encode_decode_roundtrip(self):
+        cursor = CursorCache.encode("tok_en-1", 40)
+        assert CursorCache.decode(cursor) == ("tok_en-1", 40)
+
+    def test_invalid_cursor(self):
+        cache = CursorCache()
+        with pytest.raises(CursorError):
+            cache.get("not a cursor!!")
+        with pytest.raises(CursorError):
+            cache.get(CursorCache.encode("unknown", 0))
+
+    def test_expired_cursor(self, monkeypatch):
+        retriever = _retriever(cursor_cache=CursorCache(ttl_seconds=0.0))
+        response = retriever.search("수소충전소", top_k=5, paginate=True)
+
+        with pytest.raises(CursorError):
+            retriever.page(response["metadata"]["next_cursor"], page_size=5)
+
+    def test_max_entries_evicts_oldest(self):
+        retriever = _retriever(cursor_cache=CursorCache(max_entries=2))
+        first = retriever.search("수소충전소", top_k=5, paginate=True)
+        retriever.search("설치", top_k=5, paginate=True)
+        retriever.search("안전", top_k=5, paginate=True)
+
+        assert len(retriever.cursor_cache) == 2
+        with pytest.raises(CursorError):
+            retriever.page(first["metadata"]["next_cursor"], page_size=5)
+
+
+class TestPagination:
+    def test_pages_cover_ranking_without_overlap(self):
+        retriever = _retriever()
+        full = retriever.search("수소충전소 안전", top_k=45)
+        pages = _collect_pages(retriever, "수소충전소 안전", page_size=10)
+
+        paged_ids = [r["id"] for page in pages for r in page["articles"]]
+        assert paged_ids == [r["id"] for r in full["articles"]]
+        assert len(paged_ids) == len(set(paged_ids))
+        assert [page["metadata"]["offset"] for page in pages] == [0, 10, 20, 30, 40]
+        assert pages[-1]["metadata"]["next_cursor"] is None
+
+    def test_page_does_not_rerun_pipeline(self, monkeypatch):
+        retriever = _retriever()
+        response = retriever.search("수소충전소", top_k=10, paginate=True)
+
+        def fail(*args, **kwargs):
+            raise AssertionError("page() must not re-rank")
+
+        monkeypatch.setattr(retriever, "_rank", fail)
+        page = retriever.page(response["metadata"]["next_cursor"], page_size=10)
+
+        assert len(page["articles"]) == 10
+        assert "hydrate" in page["metadata"]["stage_times_ms"]
+
+    def test_ranking_depth_is_bounded(self):
+        retriever = _retriever(max_ranked_results=20)
+        response = retriever.search("수소충전소", top_k=5, paginate=True)
+
+        assert response["metadata"]["total_ranked"] == 20
+
+    def test_cursor_survives_snapshot_swap(self):
+        retriever = _retriever()
+        response = retriever.search("수소충전소", top_k=10, paginate=True)
+
+        retriever.build_bm25_index(_corpus(tag="b"))
+        page = retriever.page(response["metadata"]["next_cursor"], page_size=10)
+
+        assert all(r["id"].startswith("a_") for r in page["articles"])
+        assert page["metadata"]["corpus_generation"] == 1
+
+
+class TestPaginationEndpoint:
+    def test_search_then_cursor(self, monkeypatch):
+        from fastapi.testclient import TestClient
+        from src.monitoring.health import EngineState, PHASE_READY
+        import main
+
+        monkeypatch.setattr(main, "retriever", _retriever())
+        monkeypatch.setattr(main, "engine_state", EngineState(phase=PHASE_READY, warmed_up=True))
+
+        with TestClient(main.app) as client:
+            first = client.post("/search", json={"query": "수소충전소", "top_k": 10, "paginate": True})
+            assert first.status_code == 200
+            cursor = first.json()["next_cursor"]
+            assert cursor
+
+            second = client.post("/search", json={"cursor": cursor, "top_k": 10})
+            assert second.status_code == 200
+            first_ids = {a["id"] for a in first.json()["articles"]}
+            second_ids = {a["id"] for a in second.json()["articles"]}
+            assert first_ids and second_ids and not first_ids & second_ids
+
+            expired = client.post("/search", json={"cursor": CursorCache.encode("gone", 10)})
+            assert expired.status_code == 410
+
+            empty = client.post("/search", json={"query": "  "})
+            assert empty.status_code == 422
@@ -0,0 +1,120 @@
+"""Positional index: phrase queries and proximity boost tests"""
+
+import sys
+import os
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+import numpy as np
+import pytest
+
+from src.retrieval import HybridRetriever
+from src.retrieval.positional import PositionalIndex, match_positions, parse_phrases
+
+DOCUMENTS = [
+    {
+        "id": "adjacent",
+        "content": "시·도지사의 허가를 받아야 한다. 시·도지사의 허가 없이 설치할 수 없다",
+        "metadata": {"law_name": "고압가스 안전관리법", "article_number": "제4조"},
+    },
+    {
+        "id": "apart",
+        "content": "허가 신청은 관할 시·도지사의 확인을 거쳐야 한다",
+        "metadata": {"law_name": "고압가스 안전관리법", "article_number": "제5조"},
+    },
+    {
+        "id": "ordinance",
+        "content": "그 밖에 필요한 사항은 산업통상자원부령으로 정하는 바에 따른다",
+        "metadata": {"law_name": "고압가스 안전관리법", "article_number": "제6조"},
+    },
+    {
+        "id": "other",
+        "content": "대통령령으로 정한다. 산업통상자원부령으로 위임한 사항",
+        "metadata": {"law_name": "고압가스 안전관리법", "article_number": "제7조"},
+    },
+]
+
+
+@pytest.fixture
+def retriever():
+    retriever = HybridRetriever(vector_store=None, vector_weight=0.0, bm25_weight=1.0)
+    retriever.build_bm25_index(DOCUMENTS)
+    return retriever
+
+
+def _ids(response):
+    return [article["id"] for article in response["articles"]]
+
+
+class TestParsePhrases:
+    def test_straight_and_curly_quotes(self):
+        phrases, text = parse_phrases('“시·도지사의 허가” 요건 "정하는 바"')
+
+        assert phrases == ["시·도지사의 허가", "정하는 바"]
+        assert text == "시·도지사의 허가 요건 정하는 바"
+
+    def test_no_quotes(self):
+        assert parse_phrases("저장탱크 기준") == ([], "저장탱크 기준")
+
+
+class TestPositionalIndex:
+    @pytest.fixture
+    def index(self, retriever):
+        return retriever.snapshot.positional_index
+
+    def test_phrase_requires_adjacency(self, index):
+        documents, counts = index.phrase_documents(["시·도지사의", "허가"])
+
+        assert documents.tolist() == [0]
+        assert counts.tolist() == [2]
+
+    def test_phrase_word_matches_document_stem(self, index):
+        """허가 matches 허가를 (particle in the document) but 정하는 does not match 정한다"""
+        assert index.phrase_documents(["산업통상자원부령으로", "정하는"])[0].tolist() == [2]
+        assert index.phrase_documents(["정하는"])[0].tolist() == [2]
+
+    def test_missing_term_matches_nothing(self, index):
+        assert len(index.phrase_documents(["시·도지사의", "없는단어"])[0]) == 0
+
+    def test_near_documents_within_window(self, index):
+        assert index.near_documents("허가", "시·도지사", window=1).tolist() == [0]
+        assert index.near_documents("허가", "시·도지사", window=4).tolist() == [0, 1]
+
+    def test_positions_do_not_cross_documents(self):
+        index = PositionalIndex.build(["가 나", "다 라"], lambda word: [word])
+
+        assert len(index.phrase_documents(["나", "다"])[0]) == 0
+        assert len(index.near_documents("나", "다", window=3)) == 0
+
+    def test_proximity_boost_multiplies_scores(self, index):
+        match = match_positions(index, [], ["시·도지사", "허가"], window=1, weight=0.5)
+
+        scores = match.apply(np.ones(len(DOCUMENTS)))
+
+        assert scores.tolist() == [1.5, 1.0, 1.0, 1.0]
+
+
+class TestPhraseSearch:
+    def test_quoted_phrase_filters_results(self, retriever):
+        response = retriever.search('"시·도지사의 허가"', top_k=4, profile=True)
+
+        assert _ids(response) == ["adjacent"]
+        assert response["metadata"]["profile"]["candidates"]["phrase"] == 1
+
+    def test_phrase_excludes_partial_word_matches(self, retriever):
+        response = retriever.search('"산업통상자원부령으로 정하는"', top_k=4)
+
+        assert _ids(response) == ["ordinance"]
+
+    def test_unmatched_phrase_returns_nothing(self, retriever):
+        """No substring fallback: an absent phrase must not return loose matches"""
+        response = retriever.search('"허가 신청은 없다"', top_k=4)
+
+        assert response["articles"] == []
+
+    def test_unquoted_query_prefers_nearby_terms(self, retriever):
+        retriever.proximity_window = 1
+        response = retriever.search("시·도지사 허가", top_k=2)
+
+        assert _ids(response)[0] == "adjacent"
+        assert "positional" in response["metadata"]["stage_times_ms"]
@@ -0,0 +1,130 @@
+"""Per-request profiling (/search profile mode) tests"""
+
+import sys
+import os
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+import pytest
+
+from src.retrieval import (
+    HybridRetriever,
+    StageTimer,
+    profile_call,
+    register_stage_hook,
+    timed_stage,
+    unregister_stage_hook,
+)
+
+DOCUMENTS = [
+    {"id": "a", "content": "수소충전소 설치 허가", "metadata": {"law_name": "수소법", "article_number": "제1조"}},
+    {"id": "b", "content": "고압가스 제조 허가", "metadata": {"law_name": "고압가스법", "article_number": "제2조"}},
+]
+
+
+@pytest.fixture
+def retriever():
+    retriever = HybridRetriever(vector_store=None, vector_weight=0.0, bm25_weight=1.0)
+    retriever.build_bm25_index(DOCUMENTS)
+    return retriever
+
+
+class TestStageTree:
+    def test_tree_nests_child_stages(self):
+        timer = StageTimer()
+        with timer.stage("bm25"):
+            with timer.stage("substring"):
+                pass
+
+        [bm25] = timer.tree()
+        assert bm25["stage"] == "bm25"
+        assert [child["stage"] for child in bm25["children"]] == ["substring"]
+        assert bm25["ms"] >= bm25["children"][0]["ms"]
+
+    def test_timed_stage_is_noop_outside_search(self):
+        with timed_stage("custom"):
+            pass
+
+
+class TestSearchProfile:
+    def test_profile_includes_tree_and_candidate_counts(self, retriever):
+        metadata = retriever.search("수소충전소", top_k=1, profile=True)["metadata"]
+        profile = metadata["profile"]
+
+        assert [node["stage"] for node in profile["timing_tree"]][0] == "preprocess"
+        assert profile["candidates"]["bm25"] >= 1
+        assert profile["candidates"]["final"] == 1
+
+    def test_profile_omitted_by_default(self, retriever):
+        assert "profile" not in retriever.search("수소충전소", top_k=1)["metadata"]
+
+    def test_custom_stage_registers_into_tree(self, retriever, monkeypatch):
+        """Stages opened with timed_stage inside the pipeline join the request's tree"""
+        original = retriever._rule_based_ranking
+
+        def ranking_with_custom_stage(*args):
+            with timed_stage("custom_boost"):
+                return original(*args)
+
+        monkeypatch.setattr(retriever, "_rule_based_ranking", ranking_with_custom_stage)
+        metadata = retriever.search("수소충전소", top_k=1, profile=True)["metadata"]
+
+        [rerank] = [n for n in metadata["profile"]["timing_tree"] if n["stage"] == "rerank"]
+        assert [child["stage"] for child in rerank["children"]] == ["custom_boost"]
+        assert "custom_boost" in metadata["stage_times_ms"]
+
+    def test_stage_hook_receives_every_stage(self, retriever):
+        seen = []
+        hook = lambda name, seconds: seen.append(name)
+        register_stage_hook(hook)
+        try:
+            retriever.search("수소충전소", top_k=1)
+        finally:
+            unregister_stage_hook(hook)
+
+        assert {"preprocess", "bm25", "fusion", "rerank", "format"} <= set(seen)
+
+    def test_profile_call_summarises_functions(self, retriever):
+        result, summary = profile_call(retriever.search, "수소충전소", top_k=1, top=5)
+
+        assert result["total_found"] == 1
+        assert len(summary["functions"]) == 5
+        assert summary["total_calls"] > 0
+
+
+class TestSearchProfileEndpoint:
+    @pytest.fixture
+    def client(self, retriever, monkeypatch):
+        from fastapi.testclient import TestClient
+        import main
+
+        monkeypatch.setattr(main, "retriever", retriever)
+        monkeypatch.setenv("ADMIN_API_KEY", "secret")
+        return TestClient(main.app)
+
+    def test_profile_requires_admin_token(self, client):
+        response = client.post("/search", json={"query": "수소충전소", "profile": True})
+        assert response.status_code == 403
+
+    def test_profile_with_admin_token(self, client):
+        response = client.post(
+            "/search",
+            json={"query": "수소충전소", "cprofile": True},
+            headers={"X-Admin-Token": "secret"},
+        )
+
+        profile = response.json()["metadata"]["profile"]
+        assert response.status_code == 200
+        assert profile["timing_tree"]
+        assert profile["cprofile"]["functions"]
+
+    @pytest.mark.parametrize("pagination", [{"paginate": True}, {"cursor": "abc"}])
+    def test_cprofile_rejects_pagination(self, client, pagination):
+        """cprofile only profiles a plain search, so it must not silently drop the cursor"""
+        response = client.post(
+            "/search",
+            json={"query": "수소충전소", "cprofile": True, **pagination},
+            headers={"X-Admin-Token": "secret"},
+        )
+
+        assert response.status_code == 400
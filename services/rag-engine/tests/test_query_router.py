@@ -0,0 +1,149 @@
+"""Query router tests (exact article lookup, BM25-only keyword, hybrid)"""
+
+import sys
+import os
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+import pytest
+
+from src.retrieval import HybridRetriever
+from src.retrieval.router import (
+    ArticleIndex,
+    QueryRouter,
+    load_law_aliases,
+    normalize_paragraph,
+    parse_article_refs,
+)
+
+
+def _doc(doc_id, law_name, article, content, **metadata):
+    return {
+        "id": doc_id,
+        "content": content,
+        "metadata": {"law_name": law_name, "article_number": article, **metadata},
+    }
+
+
+DOCUMENTS = [
+    _doc("H_1", "수소경제 육성 및 수소 안전관리에 관한 법률", "제1조", "제1조(목적) 수소경제 이행 촉진"),
+    _doc("H_36_p0", "수소경제 육성 및 수소 안전관리에 관한 법률", "제36조",
+         "제36조(수소충전소의 설치) ① 수소충전소를 설치하려는 자는 허가를 받아야 한다.",
+         paragraph_number="①"),
+    _doc("H_36_p1", "수소경제 육성 및 수소 안전관리에 관한 법률", "제36조",
+         "② 허가의 기준은 대통령령으로 정한다.", paragraph_number="②"),
+    _doc("G_4", "고압가스 안전관리법", "제4조", "제4조(고압가스 제조 허가) 고압가스 제조 허가 기준"),
+    _doc("G_R_4", "고압가스 안전관리법 시행규칙", "제4조", "제4조(허가 신청) 제조 허가 신청서 제출"),
+    _doc("G_R_4_2", "고압가스 안전관리법 시행규칙", "제4조의2", "제4조의2(변경 허가) 변경 허가 신청"),
+]
+
+ALIASES = {"수소법": "수소경제 육성 및 수소 안전관리에 관한 법률"}
+
+
+class RecordingVectorStore:
+    def __init__(self):
+        self.queries = []
+
+    def search_ids(self, query, top_k=10, filters=None):
+        self.queries.append(query)
+        return [{"id": "G_4", "similarity_score": 0.9}]
+
+
+@pytest.fixture
+def store():
+    return RecordingVectorStore()
+
+
+@pytest.fixture
+def retriever(store):
+    retriever = HybridRetriever(store, law_aliases=ALIASES)
+    retriever.build_bm25_index(DOCUMENTS)
+    return retriever
+
+
+class TestArticleRefs:
+    def test_parses_spacing_branch_and_paragraph(self):
+        assert parse_article_refs("제36조제2항") == [("제36조", "2")]
+        assert parse_article_refs("제 36 조 제 2 항") == [("제36조", "2")]
+        assert parse_article_refs("제4조의2 변경") == [("제4조의2", "")]
+
+    def test_normalize_paragraph(self):
+        assert normalize_paragraph("②") == "2"
+        assert normalize_paragraph("제2항") == "2"
+        assert normalize_paragraph("") == ""
+
+
+class TestArticleIndex:
+    def test_aliases_resolve_longest_name_first(self):
+        index = ArticleIndex.build(DOCUMENTS, ALIASES)
+
+        assert index.resolve_law("고압가스법 시행규칙 제4조") == "고압가스 안전관리법 시행규칙"
+        assert index.resolve_law("고압가스 안전관리법 제4조") == "고압가스 안전관리법"
+        assert index.resolve_law("수소법 제36조") == "수소경제 육성 및 수소 안전관리에 관한 법률"
+        assert index.resolve_law("수소충전소 설치") is None
+
+    def test_paragraph_lookup_falls_back_to_article(self):
+        index = ArticleIndex.build(DOCUMENTS, ALIASES)
+        law = ALIASES["수소법"]
+
+        assert index.lookup(law, "제36조", "2").tolist() == [2]
+        assert index.lookup(law, "제36조", "9").tolist() == [1, 2]
+        assert len(index.lookup(law, "제99조")) == 0
+
+    def test_load_law_aliases(self):
+        config = os.path.join(os.path.dirname(__file__), "..", "law_config.yaml")
+
+        aliases = load_law_aliases(config)
+
+        assert aliases["수소법"].startswith("수소경제")
+        assert load_law_aliases("missing.yaml") == {}
+
+
+class TestQueryRouting:
+    def test_explicit_reference_uses_exact_lookup(self, retriever, store):
+        response = retriever.search("수소법 제36조", top_k=5)
+
+        assert response["metadata"]["search_method"] == "exact"
+        assert [a["id"] for a in response["articles"]] == ["H_36_p0", "H_36_p1"]
+        assert store.queries == []
+        assert "bm25" not in response["metadata"]["stage_times_ms"]
+
+    def test_exact_lookup_by_paragraph_and_subordinate_law(self, retriever):
+        assert [a["id"] for a in retriever.search("수소법 제36조 제2항")["articles"]] == ["H_36_p1"]
+        assert [a["id"] for a in retriever.search("고압가스법 시행규칙 제4조의2")["articles"]] == ["G_R_4_2"]
+
+    def test_unknown_article_falls_back_to_search(self, retriever):
+        response = retriever.search("고압가스법 제99조 허가", top_k=3)
+
+        assert response["metadata"]["search_method"] == "hybrid"
+
+    def test_single_keyword_skips_vector_search(self, retriever, store):
+        response = retriever.search("허가", top_k=3)
+
+        assert response["metadata"]["search_method"] == "bm25_only"
+        assert store.queries == []
+        assert "vector" not in response["metadata"]["stage_times_ms"]
+        assert response["articles"]
+
+    def test_natural_language_uses_hybrid(self, retriever, store):
+        response = retriever.search("수소충전소를 설치하려면 허가가 필요한가", top_k=3)
+
+        assert response["metadata"]["search_method"] == "hybrid"
+        assert store.queries == ["수소충전소를 설치하려면 허가가 필요한가"]
+
+    def test_long_single_token_stays_hybrid(self):
+        router = QueryRouter(max_keyword_length=4)
+
+        assert router.route("수소충전소설치기준", [], ArticleIndex(), has_vector=True).method == "hybrid"
+        assert router.route("수소충전소설치기준", [], ArticleIndex(), has_vector=False).method == "bm25_only"
+
+    def test_vector_only_configuration_never_routes_to_keywords(self):
+        route = QueryRouter().route("허가", [], ArticleIndex(), has_vector=True, has_bm25=False)
+
+        assert route.method == "hybrid"
+
+    def test_paginated_pages_keep_route(self, retriever):
+        first = retriever.search("허가", top_k=1, paginate=True)
+        second = retriever.page(first["metadata"]["next_cursor"], page_size=1)
+
+        assert second["metadata"]["search_method"] == "bm25_only"
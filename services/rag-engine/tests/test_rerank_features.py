@@ -0,0 +1,132 @@
+"""Re-ranking feature table tests"""
+
+import sys
+import os
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+import numpy as np
+import pytest
+
+from src.retrieval import HybridRetriever, RerankFeatures, RerankWeights
+from src.retrieval.features import (
+    LEVEL_APPENDIX,
+    LEVEL_DECREE,
+    LEVEL_LAW,
+    LEVEL_RULE,
+    LEVEL_UNKNOWN,
+    hierarchy_level,
+    rerank_scores,
+)
+
+
+def _doc(doc_id, law_name, title="", content="수소충전소 설치 기준", **metadata):
+    return {
+        "id": doc_id,
+        "content": content,
+        "metadata": {"law_name": law_name, "title": title, "article_number": doc_id, **metadata},
+    }
+
+
+class TestHierarchyLevel:
+    @pytest.mark.parametrize("metadata, level", [
+        ({"law_name": "고압가스 안전관리법"}, LEVEL_LAW),
+        ({"law_name": "고압가스 안전관리법 시행령"}, LEVEL_DECREE),
+        ({"law_name": "고압가스 안전관리법 시행규칙"}, LEVEL_RULE),
+        ({"law_name": "수소법", "law_type": "대통령령"}, LEVEL_DECREE),
+        ({"law_name": "수소법", "law_type": "산업통상자원부령"}, LEVEL_RULE),
+        ({"law_name": "수소법", "title": "[별표 1] 시설기준"}, LEVEL_APPENDIX),
+        ({"law_name": "수소법", "chunk_type": "table"}, LEVEL_APPENDIX),
+        ({}, LEVEL_UNKNOWN),
+    ])
+    def test_levels(self, metadata, level):
+        assert hierarchy_level(metadata) == level
+
+    def test_chunk_type_is_not_law_type(self):
+        """chunk_type values (article/paragraph) must not decide the hierarchy"""
+        assert hierarchy_level({"law_name": "수소법 시행규칙", "chunk_type": "article"}) == LEVEL_RULE
+
+
+class TestRerankFeatures:
+    def test_build(self):
+        features = RerankFeatures.build([
+            _doc("a", "수소법", title="정의"),
+            _doc("b", "수소법 시행령", title="과태료의 부과기준"),
+            _doc("c", "수소법 시행규칙", title="수소충전소의 설치"),
+        ])
+
+        assert features.hierarchy.tolist() == [LEVEL_LAW, LEVEL_DECREE, LEVEL_RULE]
+        assert features.is_definition.tolist() == [True, False, False]
+        assert features.is_penalty.tolist() == [False, True, False]
+
+    def test_penalty_boost_only_for_penalty_queries(self):
+        features = RerankFeatures(
+            hierarchy=np.array([LEVEL_UNKNOWN] * 2, dtype=np.int8),
+            is_definition=np.zeros(2, dtype=bool),
+            is_penalty=np.array([False, True]),
+        )
+        weights = RerankWeights(penalty=1.0)
+        base = np.zeros(2)
+
+        assert rerank_scores(base, np.arange(2), features, ["설치"], weights).tolist() == [0.0, 0.0]
+        assert rerank_scores(base, np.arange(2), features, ["과태료"], weights).tolist() == [0.0, 1.0]
+
+    def test_keyword_score_replaces_title_bonus(self):
+        """A vector-only candidate with field-weighted keyword evidence overtakes one without"""
+        features = RerankFeatures(
+            hierarchy=np.array([LEVEL_UNKNOWN] * 2, dtype=np.int8),
+            is_definition=np.zeros(2, dtype=bool),
+            is_penalty=np.zeros(2, dtype=bool),
+        )
+        base = np.array([1 / 61, 1 / 62])
+
+        keyword = np.array([0.0, 1.0]) * base.max()
+
+        scores = rerank_scores(base, np.arange(2), features, ["정의"], RerankWeights(), keyword)
+
+        assert scores[1] > scores[0]
+        assert scores[1] - base[1] < base.max()
+
+
+class TestHierarchyBoost:
+    def test_law_outranks_rule_on_tie(self):
+        """With identical fusion scores the 법률 article wins over the 시행규칙 one"""
+
+        class ReversedVectorStore:
+            def search_ids(self, query, top_k=10, filters=None):
+                return [{"id": "rule", "similarity_score": 0.9}, {"id": "law", "similarity_score": 0.8}]
+
+        retriever = HybridRetriever(
+            ReversedVectorStore(), vector_weight=0.5, bm25_weight=0.5,
+            rerank_weights=RerankWeights(keyword=0.0),
+        )
+        retriever.build_bm25_index([
+            _doc("rule", "수소법 시행규칙", content="수소충전소 설치"),
+            _doc("law", "수소법", content="수소충전소 수소충전소 설치"),
+            _doc("other", "고압가스법", content="고압가스 제조 허가"),
+        ])
+        bm25_order = [
+            retriever.snapshot.document_ids[i]
+            for i in retriever._bm25_search("수소충전소 설치", 2).indices
+        ]
+        assert bm25_order == ["law", "rule"]
+
+        response = retriever.search("수소충전소 설치", top_k=2)
+
+        assert [a["id"] for a in response["articles"]] == ["law", "rule"]
+
+        # 위계 가산점이 없으면 처음 등장한 순서(벡터 1위)로 동점 처리
+        retriever.rerank_weights = RerankWeights(hierarchy=(0.0, 0.0, 0.0, 0.0, 0.0), keyword=0.0)
+        assert retriever.search("수소충전소 설치", top_k=2)["articles"][0]["id"] == "rule"
+
+    def test_boost_does_not_override_relevance(self):
+        retriever = HybridRetriever(vector_store=None, vector_weight=0.0, bm25_weight=1.0)
+        retriever.build_bm25_index([
+            _doc("law", "수소법", content="수소 일반 사항"),
+            _doc("rule", "수소법 시행규칙", content="수소충전소 설치 수소충전소 기준"),
+            _doc("other", "고압가스법", content="고압가스 제조 허가"),
+        ])
+
+        response = retriever.search("수소충전소 설치", top_k=2)
+
+        assert response["articles"][0]["id"] == "rule"
@@ -0,0 +1,94 @@
+"""Retrieval quality metric and Pareto front tests"""
+
+import sys
+import os
+import json
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+import pytest
+
+from src.retrieval.evaluation import (
+    EvaluationResult,
+    LabeledQuery,
+    article_key,
+    evaluate_retriever,
+    load_labeled_queries,
+    ndcg_at_k,
+    pareto_front,
+    ranked_article_keys,
+    recall_at_k,
+    reciprocal_rank,
+)
+
+A = article_key("고압가스 안전관리법", "제1조")
+B = article_key("고압가스 안전관리법", "제2조")
+C = article_key("고압가스 안전관리법", "제3조")
+
+
+class TestMetrics:
+    def test_article_key_ignores_whitespace(self):
+        assert article_key("고압가스  안전관리법", " 제1조") == article_key("고압가스안전관리법", "제1조")
+
+    def test_chunks_of_same_article_collapse(self):
+        articles = [
+            {"law_name": "고압가스 안전관리법", "article_number": "제2조"},
+            {"law_name": "고압가스 안전관리법", "article_number": "제2조"},
+            {"law_name": "고압가스 안전관리법", "article_number": "제1조"},
+        ]
+        assert ranked_article_keys(articles) == [B, A]
+
+    def test_recall_and_reciprocal_rank(self):
+        relevant = {A: 2, C: 1}
+        assert recall_at_k([B, A], relevant, k=2) == 0.5
+        assert reciprocal_rank([B, A], relevant) == 0.5
+        assert reciprocal_rank([B], relevant) == 0.0
+
+    def test_ndcg_perfect_and_swapped(self):
+        relevant = {A: 2, B: 1}
+        assert ndcg_at_k([A, B], relevant, k=10) == pytest.approx(1.0)
+        assert ndcg_at_k([B, A], relevant, k=10) < 1.0
+        assert ndcg_at_k([C], relevant, k=10) == 0.0
+
+    def test_load_labeled_queries(self, tmp_path):
+        path = tmp_path / "queries.json"
+        path.write_text(json.dumps([{
+            "query": "독성가스 정의",
+            "relevant": [{"law_name": "고압가스 안전관리법", "article_number": "제1조", "grade": 2}],
+        }], ensure_ascii=False), encoding="utf-8")
+
+        [labeled] = load_labeled_queries(str(path))
+        assert labeled.relevant == {A: 2}
+
+
+class FakeRetriever:
+    def __init__(self, ranking):
+        self.ranking = ranking
+
+    def search(self, query, top_k=10):
+        return {
+            "articles": [{"law_name": law, "article_number": number} for law, number in self.ranking[:top_k]],
+            "metadata": {"search_time_ms": 1.0},
+        }
+
+
+class TestEvaluateRetriever:
+    def test_skips_queries_without_relevant_articles_in_corpus(self):
+        queries = [
+            LabeledQuery("q1", {A: 2}),
+            LabeledQuery("q2", {article_key("수소법", "제1조"): 2}),
+        ]
+        result = evaluate_retriever(
+            "fake", FakeRetriever([("고압가스안전관리법", "제1조")]), queries, corpus_keys={A, B}
+        )
+
+        assert result.queries == 1
+        assert result.skipped == 1
+        assert result.mrr == 1.0
+
+    def test_pareto_front_drops_dominated_configs(self):
+        fast = EvaluationResult("fast", k=10, ndcg=0.6, latency_ms=[1.0])
+        good = EvaluationResult("good", k=10, ndcg=0.9, latency_ms=[3.0])
+        worse = EvaluationResult("worse", k=10, ndcg=0.5, latency_ms=[2.0])
+
+        assert [r.name for r in pareto_front([fast, good, worse])] == ["fast", "good"]
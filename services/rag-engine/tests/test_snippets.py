@@ -0,0 +1,122 @@
+"""Match-window snippets and /search field projection tests"""
+
+import sys
+import os
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+import pytest
+
+from src.retrieval import HybridRetriever
+from src.retrieval.snippets import extract_snippets, find_hits
+
+FILLER = "이 조문은 시험용 문장으로 채워져 있다. " * 8
+CONTENT = (
+    f"제10조(저장탱크) 저장탱크는 지하에 둔다. {FILLER}"
+    f"가연성가스 저장탱크는 방류둑을 설치하고 가연성가스 누출을 감지한다. {FILLER}"
+    "끝."
+)
+
+DOCUMENTS = [
+    {
+        "id": "G_10",
+        "content": CONTENT,
+        "metadata": {"law_name": "고압가스 안전관리법", "article_number": "제10조", "title": "저장탱크"},
+    },
+    {
+        "id": "G_11",
+        "content": "제11조(용기) 용기는 검사를 받아야 한다.",
+        "metadata": {"law_name": "고압가스 안전관리법", "article_number": "제11조", "title": "용기"},
+    },
+]
+
+
+@pytest.fixture
+def retriever():
+    retriever = HybridRetriever(vector_store=None, vector_weight=0.0, bm25_weight=1.0)
+    retriever.build_bm25_index(DOCUMENTS)
+    return retriever
+
+
+class TestExtractSnippets:
+    def test_offsets_point_into_content(self):
+        for snippet in extract_snippets(CONTENT, ["저장탱크", "가연성가스"], max_snippets=2, window=60):
+            assert CONTENT[snippet.start:snippet.end] == snippet.text
+            for start, end in snippet.highlights:
+                assert CONTENT[start:end] in ("저장탱크", "가연성가스")
+
+    def test_best_window_covers_most_distinct_terms(self):
+        best = extract_snippets(CONTENT, ["저장탱크", "가연성가스"], max_snippets=1, window=60)[0]
+
+        assert "가연성가스 저장탱크" in best.text
+
+    def test_windows_do_not_overlap_and_keep_document_order(self):
+        snippets = extract_snippets(CONTENT, ["저장탱크", "가연성가스"], max_snippets=3, window=60)
+
+        assert len(snippets) >= 2
+        for previous, current in zip(snippets, snippets[1:]):
+            assert previous.end <= current.start
+
+    def test_no_hits_returns_leading_window(self):
+        snippet, = extract_snippets(CONTENT, ["수소"], window=30)
+
+        assert snippet.start == 0 and snippet.highlights == ()
+        assert len(snippet.text) <= 30 + 12
+
+    def test_hits_prefer_longer_term_at_same_position(self):
+        assert find_hits("저장탱크를", ["저장", "저장탱크"]) == [(0, 4, "저장탱크")]
+
+
+class TestFieldProjection:
+    def test_default_response_shape_unchanged(self, retriever):
+        article = retriever.search("저장탱크", top_k=1)["articles"][0]
+
+        assert "content" in article and "highlighted_content" in article
+        assert "snippets" not in article
+
+    def test_projection_skips_unrequested_work(self, retriever, monkeypatch):
+        monkeypatch.setattr(retriever, "_highlight", lambda *a: pytest.fail("highlight not requested"))
+
+        article = retriever.search("저장탱크", top_k=1, fields=["title", "snippets"])["articles"][0]
+
+        assert set(article) == {"id", "title", "snippets"}
+        assert article["snippets"][0]["highlights"]
+
+    def test_cursor_pages_use_projection(self, retriever):
+        first = retriever.search("저장탱크 용기", top_k=1, paginate=True, fields=["snippets"])
+        second = retriever.page(first["metadata"]["next_cursor"], page_size=1, fields=["snippets"])
+
+        assert set(second["articles"][0]) == {"id", "snippets"}
+
+
+class TestSearchEndpointProjection:
+    @pytest.fixture
+    def client(self, retriever, monkeypatch):
+        from fastapi.testclient import TestClient
+        from src.monitoring.health import EngineState, PHASE_READY
+        import main
+
+        monkeypatch.setattr(main, "retriever", retriever)
+        monkeypatch.setattr(main, "engine_state", EngineState(phase=PHASE_READY, warmed_up=True))
+        with TestClient(main.app) as client:
+            yield client
+
+    def test_omitted_fields_absent_from_payload(self, client):
+        response = client.post(
+            "/search", json={"query": "저장탱크", "top_k": 1, "fields": ["title", "snippets"]}
+        )
+
+        assert response.status_code == 200
+        article = response.json()["articles"][0]
+        assert set(article) == {"id", "title", "snippets"}
+        assert set(article["snippets"][0]) == {"text", "start", "end", "highlights"}
+
+    def test_default_payload_keeps_all_fields(self, client):
+        article = client.post("/search", json={"query": "저장탱크", "top_k": 1}).json()["articles"][0]
+
+        assert {"content", "highlighted_content", "related_articles", "relevance_score"} <= set(article)
+
+    def test_unknown_field_rejected(self, client):
+        response = client.post("/search", json={"query": "저장탱크", "fields": ["embedding"]})
+
+        assert response.status_code == 422
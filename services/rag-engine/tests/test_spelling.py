@@ -0,0 +1,110 @@
+"""Jamo-level symmetric-delete spelling correction tests"""
+
+import sys
+import os
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+import pytest
+
+from src.retrieval import HybridRetriever
+from src.retrieval.spelling import SpellingIndex, edit_distance, to_jamo
+
+DOCUMENTS = [
+    {
+        "id": "G_2",
+        "content": "“저장탱크”란 고압가스를 저장하기 위한 탱크를 말한다. 저장탱크 가연성가스 독성가스",
+        "metadata": {"law_name": "고압가스 안전관리법", "article_number": "제2조"},
+    },
+    {
+        "id": "G_8",
+        "content": "저장탱크의 설치 기준 및 가연성가스 저장설비 기준",
+        "metadata": {"law_name": "고압가스 안전관리법", "article_number": "제8조"},
+    },
+    {
+        "id": "G_9",
+        "content": "독성가스 충전용기보관설비 안전관리 기준",
+        "metadata": {"law_name": "고압가스 안전관리법", "article_number": "제9조"},
+    },
+]
+
+
+@pytest.fixture
+def retriever():
+    retriever = HybridRetriever(vector_store=None, vector_weight=0.0, bm25_weight=1.0)
+    retriever.build_bm25_index(DOCUMENTS)
+    return retriever
+
+
+class TestJamoDistance:
+    def test_jamo_decomposition(self):
+        assert to_jamo("탱크") == "탱크"
+
+    def test_wrong_final_consonant_is_one_jamo_edit(self):
+        assert edit_distance(to_jamo("설치기줌"), to_jamo("설치기준"), 2) == 1
+
+    def test_transposition_counts_once(self):
+        assert edit_distance("abdc", "abcd", 2) == 1
+
+    def test_distance_capped_above_limit(self):
+        assert edit_distance("저장", "가스관리", 1) == 2
+
+
+class TestSpellingIndex:
+    def test_corrects_misspelled_word(self, retriever):
+        index = retriever.snapshot.spelling_index
+
+        assert index.lookup("저장탱그")[0].term == "저장탱크"
+        assert index.suggest_queries("독성가쓰 기준", retriever._tokenize) == ["독성가스 기준"]
+
+    def test_known_words_are_left_alone(self, retriever):
+        index = retriever.snapshot.spelling_index
+
+        assert index.lookup("저장탱크") == []
+        assert index.suggest_queries("저장탱크의 설치 기준", retriever._tokenize) == []
+
+    def test_long_typo_query_is_bounded(self, retriever, monkeypatch):
+        """Only max_corrections words are looked up and combinations never grow as 2^n"""
+        index = retriever.snapshot.spelling_index
+        calls = []
+        original = SpellingIndex._correct_word
+        monkeypatch.setattr(
+            SpellingIndex, "_correct_word",
+            lambda self, word, tokenize: calls.append(word) or original(self, word, tokenize)
+        )
+        query = " ".join(["저장탱그"] * 100)
+
+        start = time.perf_counter()
+        suggestions = index.suggest_queries(query, retriever._tokenize, limit=3, max_corrections=4)
+
+        assert time.perf_counter() - start < 1.0
+        assert len(calls) == 4
+        assert suggestions[0].split()[:5] == ["저장탱크"] * 4 + ["저장탱그"]
+
+    def test_short_words_not_corrected(self, retriever):
+        assert retriever.snapshot.spelling_index.lookup("기즌") == []
+
+    def test_vocabulary_excludes_punctuated_tokens(self, retriever):
+        assert "“저장탱크”란" not in retriever.snapshot.spelling_index.words
+
+    def test_prefix_limits_index_size(self):
+        short = SpellingIndex.build([["충전용기보관설비"]], prefix_length=6)
+        full = SpellingIndex.build([["충전용기보관설비"]], prefix_length=30)
+
+        assert len(short.deletes) < len(full.deletes)
+        assert short.lookup("충전용기보관설바")[0].term == "충전용기보관설비"
+
+
+class TestRetrieverCorrection:
+    def test_misspelled_query_searches_correction(self, retriever):
+        response = retriever.search("가연성가수", top_k=2)
+
+        assert response["metadata"]["did_you_mean"] == "가연성가스"
+        assert {a["id"] for a in response["articles"]} == {"G_2", "G_8"}
+
+    def test_correct_query_has_no_suggestion(self, retriever):
+        response = retriever.search("가연성가스 기준", top_k=2)
+
+        assert response["metadata"]["did_you_mean"] is None
+        assert "spelling" in response["metadata"]["stage_times_ms"]
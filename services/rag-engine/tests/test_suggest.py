@@ -0,0 +1,107 @@
+"""Autocomplete prefix index and /suggest endpoint tests"""
+
+import sys
+import os
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from src.retrieval import HybridRetriever
+from src.retrieval.suggest import SuggestIndex, extract_defined_terms
+
+
+def _doc(doc_id, content, law_name="고압가스 안전관리법 시행규칙", title="", **metadata):
+    return {
+        "id": doc_id,
+        "content": content,
+        "metadata": {"law_name": law_name, "article_number": doc_id, "title": title, **metadata},
+    }
+
+
+DOCUMENTS = [
+    _doc("제2조", "1. “저장탱크”란 고정 설치된 탱크를 말한다. 2. “저장설비”란 저장탱크 등을 말한다.",
+         title="정의"),
+    _doc("제8조", "저장탱크의 설치 기준. 저장탱크는 지하에 둔다. 저장탱크와 저장설비 검사.", title="저장탱크의 기준"),
+    _doc("제9조", "수소충전소 설치 허가", law_name="수소법", title="수소충전소의 설치"),
+]
+
+
+def _retriever():
+    retriever = HybridRetriever(
+        vector_store=None, vector_weight=0.0, bm25_weight=1.0,
+        law_aliases={"고압가스법": "고압가스 안전관리에 관한 법률"}
+    )
+    retriever.build_bm25_index(DOCUMENTS)
+    return retriever
+
+
+class TestSuggestIndex:
+    def test_defined_terms_extracted(self):
+        assert extract_defined_terms(DOCUMENTS[0]["content"]) == ["저장탱크", "저장설비"]
+
+    def test_prefix_ranked_by_corpus_frequency(self):
+        suggestions = _retriever().suggest("저장")
+
+        assert [s["term"] for s in suggestions][:3] == ["저장탱크", "저장설비", "저장소"]
+        assert suggestions[0]["source"] == "definition"
+        assert suggestions[0]["frequency"] == 5
+
+    def test_sources_cover_titles_laws_and_legal_terms(self):
+        retriever = _retriever()
+
+        assert {"수소충전소의 설치", "수소충전소", "수소법"} <= {s["term"] for s in retriever.suggest("수소")}
+        assert [s["term"] for s in retriever.suggest("고압가스법")] == ["고압가스법"]
+        assert retriever.suggest("인증")[0]["source"] == "term"
+
+    def test_prefix_ignores_whitespace_and_limit(self):
+        retriever = _retriever()
+
+        assert retriever.suggest("고압가스 안전관리에")[0]["term"] == "고압가스 안전관리에 관한 법률"
+        assert len(retriever.suggest("저", limit=1)) == 1
+        assert retriever.suggest("") == []
+        assert retriever.suggest("없는접두사") == []
+
+    def test_lookup_latency_stays_under_a_millisecond(self):
+        """p99 lookup on a 5k-term vocabulary stays sub-millisecond"""
+        documents = [
+            _doc(f"제{i}조", f"용어{i} 본문", title=f"{chr(0xAC00 + i % 400)}{chr(0xAC00 + i)}조문 제목 {i}")
+            for i in range(5000)
+        ]
+        index = SuggestIndex.build(documents)
+        prefixes = [term[:n] for term in index.terms[:1000] for n in (1, 2, 4)]
+
+        latencies = []
+        for prefix in prefixes:
+            start = time.perf_counter()
+            index.suggest(prefix, 10)
+            latencies.append(time.perf_counter() - start)
+
+        latencies.sort()
+        assert latencies[int(len(latencies) * 0.99)] < 0.001
+
+
+class TestSuggestEndpoint:
+    def test_suggest_endpoint(self, monkeypatch):
+        from fastapi.testclient import TestClient
+        from src.monitoring.health import EngineState, PHASE_READY
+        import main
+
+        monkeypatch.setattr(main, "retriever", _retriever())
+        monkeypatch.setattr(main, "engine_state", EngineState(phase=PHASE_READY, warmed_up=True))
+
+        with TestClient(main.app) as client:
+            response = client.get("/suggest", params={"q": "저장", "limit": 2})
+
+        assert response.status_code == 200
+        body = response.json()
+        assert [s["term"] for s in body["suggestions"]] == ["저장탱크", "저장설비"]
+        assert body["took_ms"] < 1.0
+
+    def test_suggest_before_initialization(self, monkeypatch):
+        from fastapi.testclient import TestClient
+        import main
+
+        monkeypatch.setattr(main, "retriever", None)
+
+        client = TestClient(main.app)
+        assert client.get("/suggest", params={"q": "저장"}).status_code == 503
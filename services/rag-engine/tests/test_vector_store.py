@@ -0,0 +1,282 @@
+"""VectorStore HNSW configuration and migration tests"""
+
+import sys
+import os
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+import chromadb
+import numpy as np
+import pytest
+from chromadb.config import Settings
+
+from src.embeddings import HNSWConfig, VectorStore, distance_to_similarity
+from src.embeddings.chunker import LawChunk
+
+
+class UnnormalizedEmbedder:
+    """Deterministic embedder whose vectors are deliberately not unit length"""
+
+    def embed(self, texts):
+        vectors = []
+        for text in texts:
+            rng = np.random.default_rng(sum(map(ord, text)))
+            vectors.append(rng.normal(size=8) * (1 + len(text) % 7))
+        return np.asarray(vectors, dtype=np.float32)
+
+    def embed_query(self, query):
+        return self.embed([query])[0]
+
+    def embed_documents(self, texts):
+        return self.embed(texts)
+
+    def get_embedding_dimension(self):
+        return 8
+
+
+def _chunks(count=12):
+    return [
+        LawChunk(
+            chunk_id=f"c{i}",
+            law_id="001",
+            law_name="수소법",
+            article_number=f"제{i}조",
+            paragraph_number="",
+            title="목적",
+            content=f"제{i}조 수소충전소 설치 기준 문서 {i}",
+            chunk_type="article",
+            metadata={},
+        )
+        for i in range(count)
+    ]
+
+
+def _store(path, **kwargs):
+    return VectorStore(
+        collection_name="hnsw_test",
+        persist_directory=str(path),
+        embedder=UnnormalizedEmbedder(),
+        **kwargs
+    )
+
+
+def _legacy_collection(path):
+    """Collection created the old way: no HNSW metadata, so Chroma's L2 defaults"""
+    client = chromadb.PersistentClient(path=str(path), settings=Settings(anonymized_telemetry=False))
+    collection = client.create_collection("hnsw_test", metadata={"description": "legacy"})
+    embedder = UnnormalizedEmbedder()
+    chunks = _chunks()
+    collection.add(
+        ids=[c.chunk_id for c in chunks],
+        embeddings=embedder.embed_documents([c.content for c in chunks]).tolist(),
+        documents=[c.content for c in chunks],
+        metadatas=[{"law_name": c.law_name} for c in chunks],
+    )
+    from chromadb.api.client import SharedSystemClient
+    SharedSystemClient.clear_system_cache()
+
+
+class TestHNSWConfig:
+    def test_metadata_roundtrip(self):
+        config = HNSWConfig(space="ip", M=32, ef_construction=300, ef_search=128)
+        assert HNSWConfig.from_metadata(config.to_metadata()) == config
+
+    def test_missing_metadata_means_chroma_defaults(self):
+        assert HNSWConfig.from_metadata({"description": "x"}) == HNSWConfig(
+            space="l2", M=16, ef_construction=100, ef_search=10
+        )
+
+    def test_rejects_unknown_space(self):
+        with pytest.raises(ValueError):
+            HNSWConfig(space="hamming")
+
+    def test_distance_to_similarity(self):
+        assert distance_to_similarity(0.25, "cosine") == 0.75
+        assert distance_to_similarity(0.0, "l2") == 1.0
+        assert 0 < distance_to_similarity(50.0, "l2") < distance_to_similarity(1.0, "l2")
+
+
+class TestVectorStore:
+    def test_new_collection_uses_requested_config(self, tmp_path):
+        config = HNSWConfig(ef_search=32, M=8)
+        store = _store(tmp_path, hnsw=config)
+
+        assert store.hnsw == config
+        assert store.collection.metadata["hnsw:space"] == "cosine"
+        assert store.get_stats()["hnsw"]["ef_search"] == 32
+
+    def test_cosine_similarity_on_unnormalized_embeddings(self, tmp_path):
+        store = _store(tmp_path)
+        store.add_chunks(_chunks())
+
+        query = "제3조 수소충전소 설치 기준 문서 3"
+        q = store.embedder.embed_query(query)
+        docs = store.embedder.embed_documents([c.content for c in _chunks()])
+        expected = docs @ q / (np.linalg.norm(docs, axis=1) * np.linalg.norm(q))
+
+        results = store.search(query, top_k=3)
+        assert results[0]["id"] == "c3"
+        for result in results:
+            i = int(result["id"][1:])
+            assert result["similarity_score"] == pytest.approx(expected[i], abs=1e-4)
+
+    def test_legacy_collection_kept_without_migrate(self, tmp_path):
+        _legacy_collection(tmp_path)
+        store = _store(tmp_path)
+
+        assert store.hnsw.space == "l2"
+        results = store.search("수소충전소", top_k=3)
+        assert all(0 < r["similarity_score"] <= 1 for r in results)
+
+    def test_migrate_rebuilds_with_requested_config(self, tmp_path):
+        _legacy_collection(tmp_path)
+        config = HNSWConfig(ef_search=50)
+        store = _store(tmp_path, hnsw=config, migrate=True)
+
+        assert store.hnsw == config
+        assert store.collection.count() == 12
+        assert HNSWConfig.from_metadata(store.collection.metadata) == config
+        assert [c.name for c in store.client.list_collections()] == ["hnsw_test"]
+        assert store.search("제5조 수소충전소 설치 기준 문서 5", top_k=1)[0]["id"] == "c5"
+
+    def test_interrupted_migration_is_recovered(self, tmp_path):
+        store = _store(tmp_path)
+        store.add_chunks(_chunks())
+        # 원본 삭제 후 이름 변경 전에 중단된 상태 재현
+        migrating = store._create_collection(store._migration_name, store.hnsw)
+        page = store.collection.get(include=["embeddings", "documents", "metadatas"])
+        migrating.add(**{k: page[k] for k in ("ids", "embeddings", "documents", "metadatas")})
+        store.client.delete_collection(name="hnsw_test")
+
+        store.reopen()
+
+        assert store.collection.name == "hnsw_test"
+        assert store.collection.count() == 12
+
+
+class SlowEmbedder(UnnormalizedEmbedder):
+    def __init__(self, delay):
+        self.delay = delay
+
+    def embed_documents(self, texts):
+        import time
+        time.sleep(self.delay)
+        return super().embed_documents(texts)
+
+
+class CollectionProxy:
+    """Wraps a Chroma collection (a pydantic model, not patchable) with a custom add()"""
+
+    def __init__(self, collection, add):
+        self._collection = collection
+        self.add = add
+
+    def __getattr__(self, name):
+        return getattr(self._collection, name)
+
+
+class TestStreamingIngestion:
+    def test_streams_iterator_in_batches(self, tmp_path):
+        store = _store(tmp_path)
+        sizes = []
+        add = store.collection.add
+        store.collection = CollectionProxy(
+            store.collection, lambda **kw: (sizes.append(len(kw["ids"])), add(**kw))
+        )
+
+        report = store.add_chunks(iter(_chunks(25)), batch_size=10)
+
+        assert store.collection.count() == 25
+        assert sizes == [10, 10, 5]
+        assert (report.chunks, report.batches) == (25, 3)
+        assert report.chunks_per_second > 0
+
+    def test_batch_size_capped_by_client_limit(self, tmp_path, monkeypatch):
+        store = _store(tmp_path)
+        monkeypatch.setattr(type(store.client), "max_batch_size", property(lambda self: 4))
+
+        report = store.add_chunks(_chunks(10), batch_size=100)
+
+        assert report.batches == 3
+        assert store.collection.count() == 10
+
+    def test_memory_bounded_by_pending_batches(self, tmp_path):
+        store = _store(tmp_path)
+        written = [0]
+        add = store.collection.add
+
+        def slow_add(**kw):
+            import time
+            time.sleep(0.02)
+            add(**kw)
+            written[0] += len(kw["ids"])
+
+        store.collection = CollectionProxy(store.collection, slow_add)
+        in_flight = []
+
+        def source():
+            for i, chunk in enumerate(_chunks(40)):
+                in_flight.append(i - written[0])
+                yield chunk
+
+        store.stream_chunks(source(), batch_size=5, max_pending=1)
+
+        # 저장 대기 1개 + 임베딩 중 1개 배치 이상은 메모리에 올라가지 않음
+        assert max(in_flight) < 5 * 2
+
+    def test_embedding_overlaps_writes(self, tmp_path):
+        import time
+
+        store = _store(tmp_path)
+        store.embedder = SlowEmbedder(0.03)
+        add = store.collection.add
+
+        def slow_add(**kw):
+            time.sleep(0.03)
+            add(**kw)
+
+        store.collection = CollectionProxy(store.collection, slow_add)
+        report = store.add_chunks(_chunks(40), batch_size=5)
+
+        assert report.wall_seconds < report.embed_seconds + report.write_seconds
+        assert report.overlap_ratio > 0.5
+
+    def test_writer_error_propagates(self, tmp_path):
+        store = _store(tmp_path)
+
+        def broken_add(**kw):
+            raise RuntimeError("disk full")
+
+        store.collection = CollectionProxy(store.collection, broken_add)
+        with pytest.raises(RuntimeError, match="disk full"):
+            store.add_chunks(_chunks(20), batch_size=5)
+
+    def test_upsert_overwrites(self, tmp_path):
+        store = _store(tmp_path)
+        store.add_chunks(_chunks(6))
+        store.upsert_chunks(_chunks(8), batch_size=3)
+
+        assert store.collection.count() == 8
+
+
+class TestLeanQuery:
+    def test_search_ids_matches_full_search(self, tmp_path):
+        store = _store(tmp_path)
+        store.add_chunks(_chunks())
+
+        full = store.search("제4조 수소충전소 설치 기준 문서 4", top_k=5)
+        lean = store.search_ids("제4조 수소충전소 설치 기준 문서 4", top_k=5)
+
+        assert [r["id"] for r in lean] == [r["id"] for r in full]
+        assert set(lean[0]) == {"id", "distance", "similarity_score"}
+        assert lean[0]["similarity_score"] == pytest.approx(full[0]["similarity_score"])
+
+    def test_get_documents(self, tmp_path):
+        store = _store(tmp_path)
+        store.add_chunks(_chunks())
+
+        docs = store.get_documents(["c2", "missing"])
+
+        assert list(docs) == ["c2"]
+        assert docs["c2"]["content"] == "제2조 수소충전소 설치 기준 문서 2"
+        assert docs["c2"]["metadata"]["law_name"] == "수소법"